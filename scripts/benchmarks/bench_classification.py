@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark market routing in the fair value engine, probe chain vs one classification.
+
+The baseline reproduces the routing as it was before market_classifier:
+calculate_fair_value probes the family checks for a domain model,
+_get_base_probability probes them again for a base rate, and
+_determine_market_type a third time for evidence weighting; each check
+lowers the question through a fresh MarketFeatures. The new path is
+FairValueEngine's classification, timed on a cold cache (first run)
+and a warm one (a later run over the same markets). All paths must give
+the same domain models, base-rate rule and market type per market.
+
+Usage:
+    python scripts/benchmarks/bench_classification.py [--markets 2000,20000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.fair_value_engine import FairValueEngine
+from src.analyzers.market_classifier import (
+    BASE_RATE_ORDER,
+    CONSTITUTIONAL_ACTIONS,
+    CONSTITUTIONAL_TERMS,
+    CORPORATE_TERMS,
+    CRYPTO_TERMS,
+    DOMAIN_MODEL_ORDER,
+    ENTERTAINMENT_TERMS,
+    MULTI_PARTY_PHRASES,
+    PARTY_TERMS,
+    POLITICAL_TERMS,
+    RARE_EVENT_TERMS,
+    SPORTS_TERMS,
+    TECHNOLOGY_TERMS,
+    TERM_LIMIT_TERMS,
+    WEATHER_TERMS,
+    MarketFamily,
+)
+from src.clients.polymarket.market_features import MarketFeatures
+
+from synthetic_markets import make_markets
+
+
+def _question(market):
+    return MarketFeatures.from_market(market).question
+
+
+def _has_terms(terms):
+    return lambda market: any(term in _question(market) for term in terms)
+
+
+def _multi_party(market):
+    question = _question(market)
+    return (
+        any(phrase in question for phrase in MULTI_PARTY_PHRASES)
+        and any(party in question for party in PARTY_TERMS)
+    )
+
+
+def _constitutional(market):
+    features = MarketFeatures.from_market(market)
+    full_text = f"{features.question} {features.description}"
+    has_constitutional = any(indicator in full_text for indicator in CONSTITUTIONAL_TERMS)
+    has_action = any(indicator in full_text for indicator in CONSTITUTIONAL_ACTIONS)
+    is_trump_term_limits = "trump" in full_text and any(term in full_text for term in TERM_LIMIT_TERMS)
+    return (has_constitutional and has_action) or is_trump_term_limits
+
+
+LEGACY_CHECKS = {
+    MarketFamily.MULTI_PARTY: _multi_party,
+    MarketFamily.CONSTITUTIONAL: _constitutional,
+    MarketFamily.POLITICAL: _has_terms(POLITICAL_TERMS),
+    MarketFamily.CRYPTO: _has_terms(CRYPTO_TERMS),
+    MarketFamily.SPORTS: _has_terms(SPORTS_TERMS),
+    MarketFamily.ENTERTAINMENT: _has_terms(ENTERTAINMENT_TERMS),
+    MarketFamily.WEATHER: _has_terms(WEATHER_TERMS),
+    MarketFamily.TECHNOLOGY: _has_terms(TECHNOLOGY_TERMS),
+    MarketFamily.CORPORATE: _has_terms(CORPORATE_TERMS),
+    MarketFamily.RARE_EVENT: _has_terms(RARE_EVENT_TERMS),
+}
+
+
+def legacy_routes(market):
+    """Routes found by probing the checks in each router's order."""
+    models = []
+    for family in DOMAIN_MODEL_ORDER:
+        if family is MarketFamily.POLITICAL:
+            if LEGACY_CHECKS[family](market) and not LEGACY_CHECKS[MarketFamily.CONSTITUTIONAL](market):
+                models.append(family)
+        elif LEGACY_CHECKS[family](market):
+            models.append(family)
+    subtype = next((family for family in BASE_RATE_ORDER if LEGACY_CHECKS[family](market)), None)
+    market_type = next(
+        (family.value for family in DOMAIN_MODEL_ORDER if LEGACY_CHECKS[family](market)), "general"
+    )
+    return tuple(models), subtype, market_type
+
+
+def engine_routes(engine):
+    """Routes read from the engine's classification."""
+    def routes(market):
+        classification = engine._classify(market)
+        return classification.domain_models, classification.subtype, engine._determine_market_type(market)
+    return routes
+
+
+def timed(route, markets, repeat, setup=None):
+    """Best-of-repeat time for one pass over the markets."""
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        results = [route(market) for market in markets]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(market_counts, repeat):
+    """Run the benchmark and print a table."""
+    engine = FairValueEngine()
+    print(f"{'markets':>8} {'probe s':>8} {'cold s':>8} {'warm s':>8} {'cold x':>7} {'warm x':>7}")
+    
+    for count in market_counts:
+        markets, _ = make_markets(count)
+        expected, probe_elapsed = timed(legacy_routes, markets, repeat)
+        cold, cold_elapsed = timed(engine_routes(engine), markets, repeat, setup=engine.classifier.clear)
+        warm, warm_elapsed = timed(engine_routes(engine), markets, repeat)
+        
+        assert cold == expected
+        assert warm == expected
+        print(
+            f"{count:>8} {probe_elapsed:>8.3f} {cold_elapsed:>8.3f} {warm_elapsed:>8.3f} "
+            f"{probe_elapsed / cold_elapsed:>6.1f}x {probe_elapsed / warm_elapsed:>6.1f}x"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", default="2000,20000", help="Comma-separated market counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.markets.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark bounded-concurrency MarketAnalyzer.analyze_markets.
+
+Each market's analysis is given simulated I/O latency (standing in for
+LLM-backed news analysis) and the run is timed sequentially and with
+increasing concurrency limits.
+
+Usage:
+    python scripts/benchmarks/bench_concurrent_analysis.py [--latency 0.005]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.market_analyzer import MarketAnalyzer
+
+from synthetic_markets import make_markets
+
+
+class LatentMarketAnalyzer(MarketAnalyzer):
+    """MarketAnalyzer whose per-market analysis waits on simulated I/O."""
+    
+    def __init__(self, latency: float, data_dir: str):
+        super().__init__()
+        self.latency = latency
+        self.backtesting_engine = BacktestingEngine(data_dir=data_dir)
+        
+    async def _build_opportunity(self, market, price, simple_opportunity, score, news_articles):
+        await asyncio.sleep(self.latency)
+        return await super()._build_opportunity(
+            market, price, simple_opportunity, score, news_articles
+        )
+
+
+async def run(sizes, concurrency_levels, latency):
+    """Run the benchmark matrix and print a table."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        analyzer = LatentMarketAnalyzer(latency, data_dir)
+        
+        print(f"Simulated I/O latency per market: {latency * 1000:.1f} ms")
+        print(f"{'markets':>8} {'concurrency':>12} {'seconds':>9} {'speedup':>8} {'opps':>6}")
+        
+        for size in sizes:
+            markets, prices = make_markets(size)
+            baseline = None
+            
+            for concurrency in concurrency_levels:
+                start = time.perf_counter()
+                result = await analyzer.analyze_markets(
+                    markets, prices, [], max_concurrency=concurrency
+                )
+                elapsed = time.perf_counter() - start
+                baseline = baseline or elapsed
+                
+                print(
+                    f"{size:>8} {concurrency:>12} {elapsed:>9.3f} "
+                    f"{baseline / elapsed:>7.1f}x {len(result.opportunities):>6}"
+                )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100,500,5000", help="Comma-separated market counts")
+    parser.add_argument("--concurrency", default="1,8,32,128", help="Comma-separated concurrency limits")
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated I/O seconds per market")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    
+    asyncio.run(run(
+        [int(size) for size in args.sizes.split(",")],
+        [int(level) for level in args.concurrency.split(",")],
+        args.latency
+    ))
+
+
+if __name__ == "__main__":
+    main()
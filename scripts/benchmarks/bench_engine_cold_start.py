@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark FairValueEngine cold start, lazy sub-models vs building them all.
+
+Each sample runs in a fresh interpreter, so module imports are part of
+the cost. The lazy path imports fair_value_engine and constructs the
+engine, then computes a fair value for one crypto market, which builds
+only the sub-models that market needs. The eager path does the same
+after touching every sub-model, as the engine's constructor used to.
+The table shows import, construction and first-fair-value times and the
+number of src modules loaded.
+
+Usage:
+    python scripts/benchmarks/bench_engine_cold_start.py [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+SAMPLE = """
+import asyncio, json, sys, time
+from datetime import datetime, timedelta, timezone
+start = time.perf_counter()
+from src.analyzers.fair_value_engine import FairValueEngine
+from src.clients.polymarket.models import Market, Token
+imported = time.perf_counter()
+engine = FairValueEngine()
+if {eager}:
+    for name in ("llm_news_analyzer", "categorizer", "political_model", "crypto_model", "sports_model",
+                 "entertainment_model", "weather_model", "technology_model", "sanity_checker",
+                 "kelly_criterion", "backtesting_engine"):
+        getattr(engine, name)
+built = time.perf_counter()
+market = Market(
+    condition_id="btc", question="Will Bitcoin reach $150,000 by December?", active=True, closed=False,
+    volume=50000, end_date_iso=datetime.now(timezone.utc) + timedelta(days=60), minimum_order_size=1.0,
+    tokens=[Token(token_id="y", outcome="Yes", price=0.3), Token(token_id="n", outcome="No", price=0.7)]
+)
+asyncio.run(engine.calculate_fair_value(market, []))
+valued = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start, "construct": built - imported, "first": valued - built,
+    "modules": sum(name.startswith("src.") for name in sys.modules)
+}}))
+"""
+
+
+def sample(eager, workdir):
+    """Run one cold start in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT), NEWS_API_KEY=os.environ.get("NEWS_API_KEY", "benchmark"))
+    output = subprocess.run(
+        [sys.executable, "-c", SAMPLE.format(eager=eager)],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat):
+    """Run the benchmark and print a table."""
+    print(f"{'path':>6} {'import ms':>10} {'construct ms':>13} {'first fv ms':>12} {'total ms':>9} {'modules':>8}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, eager in (("eager", True), ("lazy", False)):
+            samples = [sample(eager, workdir) for _ in range(repeat)]
+            median = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+            total = median["import"] + median["construct"] + median["first"]
+            print(
+                f"{name:>6} {median['import'] * 1000:>10.1f} {median['construct'] * 1000:>13.1f} "
+                f"{median['first'] * 1000:>12.1f} {total * 1000:>9.1f} {median['modules']:>8.0f}"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per path (median is kept)")
+    args = parser.parse_args()
+    
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch fair values against a per-market loop, with simulated LLM latency.
+
+The LLM client is replaced by one that sleeps for the given latency on a
+worker thread, as the blocking Anthropic client does. Three schedules are
+timed over the same markets and related news:
+
+- sequential: calculate_fair_value per market with one LLM call in flight,
+  the schedule before calls were capped globally instead of serialized
+- per-market: calculate_fair_value per market, its articles analyzed
+  concurrently
+- batch: calculate_fair_values over all markets, every market's calls
+  sharing the llm_max_concurrency cap
+
+All schedules must give the same fair values.
+
+Usage:
+    python scripts/benchmarks/bench_fair_value_batch.py [--markets 200] [--articles 400] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.fair_value_engine import FairValueEngine
+from src.analyzers.news_index import NewsKeywordIndex
+from src.config.settings import settings
+
+from synthetic_markets import make_articles, make_markets
+
+
+class SleepingClient:
+    """Blocking stand-in for the Anthropic client."""
+    
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.messages = SimpleNamespace(create=self.create)
+        
+    def create(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+        text = json.dumps({"sentiment_score": 0.4, "relevance_score": 0.8, "confidence_level": 0.7})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def make_engine(latency: float) -> FairValueEngine:
+    """Build an engine whose news analyzer calls the sleeping client."""
+    engine = FairValueEngine()
+    engine.llm_news_analyzer.claude_available = True
+    engine.llm_news_analyzer._client = SleepingClient(latency)
+    return engine
+
+
+async def per_market(engine, markets, index):
+    """calculate_fair_value for one market after another."""
+    results = []
+    for market in markets:
+        keywords = engine.llm_news_analyzer._extract_market_keywords(market)
+        results.append(await engine.calculate_fair_value(market, index.find(keywords)))
+    return results
+
+
+async def run(market_count, article_count, latency, concurrency):
+    """Run the benchmark and print a table."""
+    markets, _ = make_markets(market_count)
+    # The relevance score compares against a naive now()
+    articles = [
+        article.model_copy(update={"published_at": article.published_at.replace(tzinfo=None)})
+        for article in make_articles(article_count)
+    ]
+    index = NewsKeywordIndex(articles)
+    
+    schedules = [
+        ("sequential", 1, per_market),
+        ("per-market", concurrency, per_market),
+        ("batch", concurrency, lambda engine, markets, index: engine.calculate_fair_values(markets, index)),
+    ]
+    print(f"Simulated LLM latency per call: {latency * 1000:.1f} ms, cap {concurrency}")
+    print(f"{'schedule':>12} {'markets':>8} {'llm calls':>10} {'seconds':>9} {'speedup':>8}")
+    
+    expected = None
+    baseline = None
+    for name, cap, schedule in schedules:
+        settings.llm_max_concurrency = cap
+        engine = make_engine(latency)
+        start = time.perf_counter()
+        results = await schedule(engine, markets, index)
+        elapsed = time.perf_counter() - start
+        
+        if expected is None:
+            expected, baseline = results, elapsed
+        assert results == expected
+        calls = engine.llm_news_analyzer._client.calls
+        print(f"{name:>12} {market_count:>8} {calls:>10} {elapsed:>9.2f} {baseline / elapsed:>7.1f}x")
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=200, help="Markets per pass")
+    parser.add_argument("--articles", type=int, default=400, help="Articles in the news index")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per simulated LLM call")
+    parser.add_argument("--concurrency", type=int, default=settings.llm_max_concurrency, help="LLM calls in flight")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(args.markets, args.articles, args.latency, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Benchmark FlexibleAnalyzer pattern evaluation, eager checks vs compiled rules.
+
+The baseline is the pre-rule analyzer: eight check methods evaluated for
+every market, each lowering the question, reading the clock and scanning
+its own keyword list, then a sort by edge x confidence. The compiled
+path is FlexibleAnalyzer.analyze_market on FLEXIBLE_RULE_SET. Markets
+come from the synthetic universe plus a remix with short horizons and
+prices on band edges, and both paths must return the same opportunity.
+
+Usage:
+    python scripts/benchmarks/bench_flexible_rules.py [--markets 2000,20000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.flexible_analyzer import FlexibleAnalyzer, IMPOSSIBLE_PATTERNS
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
+
+from synthetic_markets import make_markets
+
+LONGSHOT = [
+    'reach $1 million', '1000x', 'break all-time high', 'world record', 'unanimous',
+    'sweep all', 'perfect season', '100% accuracy', 'hottest year', 'coldest year',
+    'most ever', 'least ever', 'highest ever', 'lowest ever', 'record-breaking',
+    'win every', 'lose every', 'zero', 'nobody', 'everyone', 'all countries',
+    'every state', '100 million', '1 billion', 'trillion', 'double', 'triple', 'quadruple'
+]
+STABLE = ['remain', 'continue', 'stay', 'maintain', 'will still', 'keep', 'hold']
+BINARY = ['coin flip', 'coin toss', 'heads or tails', 'odd or even', 'red or black']
+DRAMATIC = [
+    'impeach', 'resign', 'quit', 'step down', 'fired', 'collapse', 'crash', 'default',
+    'bankrupt', 'war', 'attack', 'terrorist', 'pandemic', 'revolution', 'overthrow',
+    'coup', 'death', 'die', 'assassin'
+]
+CERTAIN = [
+    'will the sun rise', 'will continue to exist', 'at least one', 'at least 1', 'any',
+    'more than zero', 'more than 0', 'less than 100%', 'less than 100 percent',
+    'between', 'range'
+]
+SHORT_TERM = ['announce', 'release', 'launch', 'debut', 'happen', 'occur', 'take place']
+
+
+class EagerFlexibleAnalyzer(FlexibleAnalyzer):
+    """The pre-rule analyzer: every check runs, then the best is sorted out."""
+    
+    def analyze_market(self, market, price):
+        if not self._basic_filters(market, price):
+            return None
+        patterns = [
+            self._longshot(market, price), self._stability(market, price),
+            self._impossibility(market, price), self._binary(market, price),
+            self._moderate(market, price), self._high(market, price),
+            self._time_sensitive(market, price), self._categorical(market, price),
+        ]
+        opportunities = [p for p in patterns if p is not None]
+        if opportunities:
+            opportunities.sort(key=lambda x: x.edge * x.confidence, reverse=True)
+            return opportunities[0]
+        return None
+        
+    @staticmethod
+    def _opportunity(market, price, action, edge, confidence, reason, pattern_type):
+        return SimpleOpportunity(
+            market=market, current_price=price.yes_price, recommended_action=action,
+            edge=edge, confidence=confidence, reason=reason, pattern_type=pattern_type
+        )
+        
+    def _longshot(self, market, price):
+        if 0.05 < price.yes_price < 0.15:
+            question = market.question.lower()
+            if any(pattern in question for pattern in LONGSHOT):
+                return self._opportunity(
+                    market, price, "BUY_NO", price.yes_price - 0.02, 0.8,
+                    f"Extreme longshot overpriced at {price.yes_price:.0%}", "EXTREME_LONGSHOT"
+                )
+        return None
+        
+    def _stability(self, market, price):
+        if not market.end_date_iso:
+            return None
+        days_left = (market.end_date_iso - datetime.now(timezone.utc)).days
+        if 10 <= days_left <= 30:
+            question = market.question.lower()
+            if any(pattern in question for pattern in STABLE) and 0.70 < price.yes_price < 0.90:
+                return self._opportunity(
+                    market, price, "BUY_YES", 0.92 - price.yes_price, 0.7,
+                    f"Stable continuation event underpriced at {price.yes_price:.0%}",
+                    "STABLE_CONTINUATION"
+                )
+        return None
+        
+    def _impossibility(self, market, price):
+        question = market.question.lower()
+        for pattern, fair_value in IMPOSSIBLE_PATTERNS:
+            if pattern in question and price.yes_price > fair_value + 0.05:
+                return self._opportunity(
+                    market, price, "BUY_NO", price.yes_price - fair_value, 0.9,
+                    f"Near impossibility overpriced (fair value ~{fair_value:.0%})", "IMPOSSIBILITY"
+                )
+        return None
+        
+    def _binary(self, market, price):
+        question = market.question.lower()
+        if any(pattern in question for pattern in BINARY) and abs(price.yes_price - 0.5) > 0.10:
+            if price.yes_price > 0.5:
+                edge, action = price.yes_price - 0.52, "BUY_NO"
+            else:
+                edge, action = 0.48 - price.yes_price, "BUY_YES"
+            return self._opportunity(
+                market, price, action, edge, 0.9,
+                f"True 50/50 event mispriced at {price.yes_price:.0%}", "BINARY_MISPRICING"
+            )
+        return None
+        
+    def _moderate(self, market, price):
+        if 0.10 < price.yes_price < 0.25:
+            question = market.question.lower()
+            if any(pattern in question for pattern in DRAMATIC):
+                edge = price.yes_price - 0.05
+                if edge >= self.min_edge:
+                    return self._opportunity(
+                        market, price, "BUY_NO", edge, 0.75,
+                        f"Dramatic event overpriced at {price.yes_price:.0%}", "OVERPRICED_MODERATE"
+                    )
+        return None
+        
+    def _high(self, market, price):
+        if 0.60 < price.yes_price < 0.80:
+            question = market.question.lower()
+            if any(pattern in question for pattern in CERTAIN):
+                edge = 0.95 - price.yes_price
+                if edge >= self.min_edge:
+                    return self._opportunity(
+                        market, price, "BUY_YES", edge, 0.85,
+                        f"Near certainty underpriced at {price.yes_price:.0%}", "UNDERPRICED_HIGH"
+                    )
+        return None
+        
+    def _time_sensitive(self, market, price):
+        if not market.end_date_iso:
+            return None
+        days_left = (market.end_date_iso - datetime.now(timezone.utc)).days
+        if 0 < days_left < 7 and 0.15 < price.yes_price < 0.40:
+            question = market.question.lower()
+            if any(pattern in question for pattern in SHORT_TERM):
+                edge = price.yes_price - 0.10
+                if edge >= self.min_edge:
+                    return self._opportunity(
+                        market, price, "BUY_NO", edge, 0.70,
+                        f"Unlikely in {days_left} days", "TIME_SENSITIVE"
+                    )
+        return None
+        
+    def _categorical(self, market, price):
+        question = market.question.lower()
+        if 'bitcoin' in question or 'btc' in question:
+            if ('reach' in question and '$' in question
+                    and ('200,000' in question or '200k' in question) and price.yes_price > 0.20):
+                edge = price.yes_price - 0.15
+                if edge >= self.min_edge:
+                    return self._opportunity(
+                        market, price, "BUY_NO", edge, 0.70,
+                        "BTC $200k unlikely in timeframe", "CRYPTO_OVERPRICED"
+                    )
+        elif any(sport in question for sport in ['nfl', 'nba', 'championship', 'super bowl']):
+            if ('undefeated' in question or 'perfect season' in question) and price.yes_price > 0.05:
+                edge = price.yes_price - 0.02
+                if edge >= self.min_edge:
+                    return self._opportunity(
+                        market, price, "BUY_NO", edge, 0.85,
+                        "Perfect seasons extremely rare", "SPORTS_LONGSHOT"
+                    )
+        return None
+
+
+def remix(markets, prices, seed=7):
+    """Reuse the questions with short horizons and prices on band edges."""
+    rng = random.Random(seed)
+    edges = [0.05, 0.06, 0.07, 0.1, 0.15, 0.2, 0.25, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+    now = datetime.now(timezone.utc)
+    mixed_markets, mixed_prices = [], []
+    for market, price in zip(markets, prices, strict=True):
+        yes_price = rng.choice(edges) if rng.random() < 0.2 else round(rng.uniform(0.02, 0.98), 3)
+        days = rng.randint(-1, 40)
+        mixed_markets.append(market.model_copy(update={
+            "end_date_iso": now + timedelta(days=days, hours=12) if days >= 0 else None
+        }))
+        mixed_prices.append(price.model_copy(update={"yes_price": yes_price}))
+    return mixed_markets, mixed_prices
+
+
+def describe(opportunity):
+    """Comparable summary of an analyzer result."""
+    if opportunity is None:
+        return None
+    return (
+        opportunity.pattern_type, opportunity.recommended_action,
+        opportunity.edge, opportunity.confidence, opportunity.reason
+    )
+
+
+def timed(analyzer, markets, prices, repeat):
+    """Best-of-repeat time for one pass over the markets."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [analyzer.analyze_market(market, price) for market, price in zip(markets, prices, strict=True)]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(market_counts, repeat):
+    """Run the benchmark and print a table."""
+    eager = EagerFlexibleAnalyzer()
+    compiled = FlexibleAnalyzer()
+    print(compiled.rules.stats())
+    print(f"{'universe':>9} {'markets':>8} {'matches':>8} {'eager s':>8} {'rules s':>8} {'speedup':>8}")
+    
+    for count in market_counts:
+        markets, prices = make_markets(count)
+        for name, (universe, universe_prices) in (
+            ("synthetic", (markets, prices)),
+            ("remix", remix(markets, prices)),
+        ):
+            expected, eager_elapsed = timed(eager, universe, universe_prices, repeat)
+            actual, rules_elapsed = timed(compiled, universe, universe_prices, repeat)
+            
+            assert [describe(opp) for opp in actual] == [describe(opp) for opp in expected]
+            matches = sum(opp is not None for opp in actual)
+            print(
+                f"{name:>9} {count:>8} {matches:>8} {eager_elapsed:>8.3f} "
+                f"{rules_elapsed:>8.3f} {eager_elapsed / rules_elapsed:>7.1f}x"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", default="2000,20000", help="Comma-separated market counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.markets.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
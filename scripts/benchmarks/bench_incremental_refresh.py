@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental refresh against a full re-analysis.
+
+Runs a full analysis, moves the prices of a fraction of markets, then times
+a full re-run and an incremental refresh of the same inputs.
+
+Usage:
+    python scripts/benchmarks/bench_incremental_refresh.py [--markets 20000] [--changed 0.01]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.clients.polymarket.models import MarketPrice
+
+from synthetic_markets import make_articles, make_markets
+
+
+async def run(market_count, changed_fraction):
+    """Run the benchmark and print a comparison."""
+    markets, prices = make_markets(market_count)
+    news = make_articles(100)
+    rng = random.Random(7)
+    
+    moved = list(prices)
+    for i in rng.sample(range(len(prices)), int(len(prices) * changed_fraction)):
+        yes_price = min(0.98, max(0.02, prices[i].yes_price + rng.choice([-0.05, 0.05])))
+        moved[i] = MarketPrice(
+            condition_id=prices[i].condition_id,
+            yes_price=yes_price,
+            no_price=round(1 - yes_price, 3),
+            spread=prices[i].spread
+        )
+        
+    with tempfile.TemporaryDirectory() as data_dir:
+        analyzer = MarketAnalyzer()
+        analyzer.backtesting_engine = BacktestingEngine(data_dir=data_dir)
+        analyzer.record_predictions = False
+        
+        await analyzer.analyze_markets(markets, prices, news)
+        
+        start = time.perf_counter()
+        full = await analyzer.analyze_markets(markets, moved, news)
+        full_elapsed = time.perf_counter() - start
+        
+        await analyzer.analyze_markets(markets, prices, news)
+        start = time.perf_counter()
+        refreshed = await analyzer.analyze_markets(markets, moved, news, incremental=True)
+        incremental_elapsed = time.perf_counter() - start
+        
+    assert [o.condition_id for o in full.opportunities] == [o.condition_id for o in refreshed.opportunities]
+    print(f"{market_count} markets, {changed_fraction:.1%} moved")
+    print(f"{'mode':>12} {'seconds':>8} {'re-analyzed':>12} {'skipped':>8}")
+    print(f"{'full':>12} {full_elapsed:>8.3f} {market_count:>12} {'0%':>8}")
+    print(
+        f"{'incremental':>12} {incremental_elapsed:>8.3f} {refreshed.markets_reanalyzed:>12} "
+        f"{refreshed.skipped_work_ratio:>8.1%}"
+    )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=20000, help="Number of markets")
+    parser.add_argument("--changed", type=float, default=0.01, help="Fraction of markets whose price moves")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args.markets, args.changed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-tick market data updates, rolling windows vs recomputation.
+
+A stream of daily closes is fed for several assets. The baseline keeps
+each asset's full history and, per tick, recomputes 7d/30d returns,
+30-day volatility and the all-time high from it with NumPy, as a
+provider without rolling state would. The rolling path is
+MarketDataProvider.update, which keeps ring buffers and running moments
+and refreshes a snapshot in O(1). Final snapshots must agree; reads
+(get) are timed against rebuilding the old hard-coded market data dict.
+
+Usage:
+    python scripts/benchmarks/bench_market_data.py [--ticks 1000,10000] [--assets 10] [--repeat 3]
+"""
+
+import argparse
+import logging
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.clients.market_data.models import CryptoMarketData
+from src.clients.market_data.provider import PERIODS_PER_YEAR, MarketDataProvider
+
+
+def make_ticks(count, assets, seed=42):
+    """Build reproducible (symbol, price) ticks, one close per asset per day."""
+    rng = random.Random(seed)
+    prices = {f"A{i}": rng.uniform(1, 1000) for i in range(assets)}
+    ticks = []
+    for _ in range(count):
+        for symbol in prices:
+            prices[symbol] *= math.exp(rng.gauss(0.0, 0.04))
+            ticks.append((symbol, prices[symbol]))
+    return ticks
+
+
+def recompute(history, symbol):
+    """Snapshot recomputed from an asset's full history."""
+    closes = np.array(history)
+    log_returns = np.diff(np.log(closes[-31:]))
+    price = closes[-1]
+    ath = closes.max()
+    return CryptoMarketData(
+        symbol=symbol,
+        current_price=price,
+        market_cap=0.0,
+        volume_24h=0.0,
+        price_change_7d=price / closes[-8] - 1 if len(closes) > 7 else 0.0,
+        price_change_30d=price / closes[-31] - 1 if len(closes) > 30 else 0.0,
+        volatility_30d=float(np.std(log_returns, ddof=1)) * math.sqrt(PERIODS_PER_YEAR) if len(log_returns) > 1 else 0.0,
+        all_time_high=ath,
+        distance_from_ath=price / ath - 1
+    )
+
+
+def recompute_all(ticks):
+    """Feed ticks, recomputing each snapshot from history."""
+    histories, snapshots = {}, {}
+    for symbol, price in ticks:
+        history = histories.setdefault(symbol, [])
+        history.append(price)
+        snapshots[symbol] = recompute(history, symbol)
+    return snapshots
+
+
+def rolling_all(ticks):
+    """Feed ticks through a provider."""
+    provider = MarketDataProvider()
+    for symbol, price in ticks:
+        provider.update(symbol, price)
+    return {symbol: provider.get(symbol) for symbol, _ in ticks}
+
+
+def legacy_get(asset):
+    """The hard-coded lookup the crypto model used to rebuild per call."""
+    market_data = {
+        "BTC": CryptoMarketData("BTC", 67000.0, 1.3e12, 25e9, 0.05, 0.12, 0.65, 73000.0, -0.08),
+        "ETH": CryptoMarketData("ETH", 3500.0, 420e9, 12e9, 0.03, 0.08, 0.70, 4800.0, -0.27),
+    }
+    return market_data.get(asset)
+
+
+def timed(feed, repeat):
+    """Best-of-repeat time for one call."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = feed()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(tick_counts, assets, repeat):
+    """Run the benchmark and print a table."""
+    print(f"{'ticks':>8} {'recompute s':>12} {'rolling s':>10} {'us/tick':>8} {'speedup':>8}")
+    for count in tick_counts:
+        ticks = make_ticks(count, assets)
+        expected, recompute_elapsed = timed(lambda ticks=ticks: recompute_all(ticks), repeat)
+        actual, rolling_elapsed = timed(lambda ticks=ticks: rolling_all(ticks), repeat)
+        
+        for symbol, snapshot in expected.items():
+            for field in ("price_change_7d", "price_change_30d", "volatility_30d", "distance_from_ath"):
+                assert math.isclose(getattr(actual[symbol], field), getattr(snapshot, field), abs_tol=1e-9)
+        print(
+            f"{len(ticks):>8} {recompute_elapsed:>12.3f} {rolling_elapsed:>10.3f} "
+            f"{rolling_elapsed / len(ticks) * 1e6:>8.2f} {recompute_elapsed / rolling_elapsed:>7.1f}x"
+        )
+        
+    provider = MarketDataProvider()
+    provider.update("BTC", 67000.0)
+    reads = 100000
+    _, legacy_elapsed = timed(lambda: [legacy_get("BTC") for _ in range(reads)], repeat)
+    _, get_elapsed = timed(lambda: [provider.get("BTC") for _ in range(reads)], repeat)
+    print(f"{reads} reads: rebuild {legacy_elapsed:.3f} s, provider {get_elapsed:.3f} s")
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ticks", default="1000,10000", help="Comma-separated closes per asset")
+    parser.add_argument("--assets", type=int, default=10, help="Assets in the stream")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.ticks.split(",")], args.assets, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
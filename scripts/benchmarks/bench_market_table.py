@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark the columnar MarketTable against pydantic Market objects.
+
+Builds a synthetic universe of raw API market dicts, as the CLOB markets
+endpoint returns them, and compares three things:
+
+- decode: validating every dict into Market/MarketPrice objects vs.
+  building a MarketTable
+- memory: bytes allocated per market by each representation
+- scan: the open/priced/volume gates and days-to-end computation, one
+  Python loop over objects vs. NumPy column expressions
+
+Both scans must select the same rows.
+
+Usage:
+    python scripts/benchmarks/bench_market_table.py [--markets 100000]
+"""
+
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.clients.polymarket.market_table import MarketTable
+from src.clients.polymarket.models import Market, MarketPrice
+
+from synthetic_markets import make_markets
+
+MIN_VOLUME = 1000.0
+
+
+def make_rows(count):
+    """Raw API dicts; every tenth market is closed."""
+    markets, _ = make_markets(count)
+    rows = []
+    for i, market in enumerate(markets):
+        row = market.model_dump(mode="json")
+        row["closed"] = i % 10 == 0
+        row["volume"] = str(row["volume"])  # The API sends numbers as strings
+        rows.append(row)
+    return rows
+
+
+def decode_objects(rows):
+    """Validate every row into pydantic objects."""
+    markets = [Market(**row) for row in rows]
+    prices = [
+        MarketPrice(
+            condition_id=market.condition_id,
+            yes_price=market.tokens[0].price,
+            no_price=market.tokens[1].price,
+            spread=abs(market.tokens[0].price - market.tokens[1].price)
+        )
+        for market in markets
+    ]
+    return markets, prices
+
+
+def scan_objects(markets, prices, now):
+    """Gate and compute days to end by walking objects."""
+    selected = []
+    days = []
+    for market, price in zip(markets, prices, strict=True):
+        if not market.active or market.closed:
+            continue
+        end = market.end_date_iso
+        if end is not None:
+            if end.tzinfo is None:
+                end = end.replace(tzinfo=timezone.utc)
+            if end <= now:
+                continue
+        if price is None:
+            continue
+        if market.volume and market.volume < MIN_VOLUME:
+            continue
+        selected.append(market.condition_id)
+        days.append((end - now).days if end is not None else None)
+    return selected, days
+
+
+def scan_table(table, now):
+    """Gate and compute days to end on columns."""
+    mask = table.open_mask(now) & table.priced_mask() & table.volume_mask(MIN_VOLUME)
+    rows = np.flatnonzero(mask)
+    return [table.condition_ids[row] for row in rows], table.days_to_end(now)[rows]
+
+
+def measure(build):
+    """Run build() and return (result, seconds, bytes allocated)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, allocated
+
+
+def run(market_count):
+    """Run the benchmark and print a table."""
+    rows = make_rows(market_count)
+    now = datetime.now(timezone.utc)
+    
+    # Timings without tracemalloc overhead, memory with it
+    start = time.perf_counter()
+    markets, prices = decode_objects(rows)
+    object_decode = time.perf_counter() - start
+    start = time.perf_counter()
+    table = MarketTable.from_api_rows(rows)
+    table_decode = time.perf_counter() - start
+    _, _, object_bytes = measure(lambda: decode_objects(rows))
+    _, _, table_bytes = measure(lambda: MarketTable.from_api_rows(rows))
+    
+    start = time.perf_counter()
+    object_ids, object_days = scan_objects(markets, prices, now)
+    object_scan = time.perf_counter() - start
+    start = time.perf_counter()
+    table_ids, table_days = scan_table(table, now)
+    table_scan = time.perf_counter() - start
+    
+    assert object_ids == table_ids
+    assert object_days == [int(days) for days in table_days]
+    
+    print(f"{market_count} markets, {len(table_ids)} pass the gates")
+    print(f"{'':>8} {'decode s':>9} {'bytes/market':>13} {'scan s':>8} {'scan markets/s':>15}")
+    for name, decode, allocated, scan in (
+        ("pydantic", object_decode, object_bytes, object_scan),
+        ("table", table_decode, table_bytes, table_scan),
+    ):
+        print(
+            f"{name:>8} {decode:>9.3f} {allocated / market_count:>13.0f} "
+            f"{scan:>8.4f} {market_count / scan:>15,.0f}"
+        )
+    print(
+        f"decode {object_decode / table_decode:.1f}x, memory {object_bytes / table_bytes:.1f}x, "
+        f"scan {object_scan / table_scan:.1f}x"
+    )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=100000, help="Number of markets")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run(args.markets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark Monte Carlo path simulations, one market at a time vs one batch.
+
+Markets are "will the price reach X" targets over BTC and ETH at random
+strikes and horizons. The baseline runs the engine once per market, as a
+single-market model call does; the batch path simulates every market in
+one run, stepping all their paths together. Both must give the same
+probabilities, since each market draws from its own seeded generator.
+
+A second table shows the paths needed to reach the standard-error target
+with and without antithetic pairs.
+
+Usage:
+    python scripts/benchmarks/bench_monte_carlo.py [--markets 50,200,1000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.monte_carlo import BarrierTouch, MonteCarloEngine, market_key
+
+# Spot, drift and volatility per asset
+ASSETS = {
+    "BTC": (67000.0, 0.2, 0.65),
+    "ETH": (3500.0, 0.2, 0.70),
+}
+
+
+def make_targets(count, seed=42):
+    """Build reproducible reach targets as BarrierTouch columns and keys."""
+    rng = random.Random(seed)
+    columns = {"spot": [], "barrier": [], "days": [], "drift": [], "volatility": []}
+    keys = []
+    for i in range(count):
+        spot, drift, volatility = ASSETS[rng.choice(list(ASSETS))]
+        columns["spot"].append(spot)
+        columns["barrier"].append(spot * rng.uniform(0.5, 2.0))
+        columns["days"].append(rng.randint(7, 365))
+        columns["drift"].append(drift)
+        columns["volatility"].append(volatility)
+        keys.append(market_key(f"0x{i:064x}"))
+    return {name: np.array(values) for name, values in columns.items()}, keys
+
+
+def one_by_one(engine, columns, keys):
+    """Run the engine once per market."""
+    results = []
+    for i, key in enumerate(keys):
+        paths = BarrierTouch(**{name: values[i] for name, values in columns.items()})
+        results.append(float(engine.run(paths, [key]).probabilities[0]))
+    return results
+
+
+def batched(engine, columns, keys):
+    """Run the engine once for all markets."""
+    return engine.run(BarrierTouch(**columns), keys).probabilities.tolist()
+
+
+def timed(price, repeat):
+    """Best-of-repeat time for one call."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = price()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(market_counts, repeat):
+    """Run the benchmark and print tables."""
+    engine = MonteCarloEngine()
+    print(f"Target standard error {engine.target_standard_error}, at most {engine.max_paths} paths per market")
+    print(f"{'markets':>8} {'single s':>9} {'batch s':>9} {'speedup':>8}")
+    
+    for count in market_counts:
+        columns, keys = make_targets(count)
+        expected, single_elapsed = timed(
+            lambda columns=columns, keys=keys: one_by_one(engine, columns, keys), repeat
+        )
+        actual, batch_elapsed = timed(lambda columns=columns, keys=keys: batched(engine, columns, keys), repeat)
+        
+        assert actual == expected
+        print(
+            f"{count:>8} {single_elapsed:>9.4f} {batch_elapsed:>9.4f} "
+            f"{single_elapsed / batch_elapsed:>7.1f}x"
+        )
+        
+    columns, keys = make_targets(market_counts[0])
+    paths = BarrierTouch(**columns)
+    print()
+    print(f"{'sampling':>12} {'mean paths':>11} {'mean s.e.':>10} {'seconds':>9}")
+    for name, antithetic in (("independent", False), ("antithetic", True)):
+        sampler = MonteCarloEngine(antithetic=antithetic)
+        result, elapsed = timed(lambda sampler=sampler: sampler.run(paths, keys), repeat)
+        print(
+            f"{name:>12} {result.paths.mean():>11.0f} {result.standard_errors.mean():>10.4f} {elapsed:>9.4f}"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", default="50,200,1000", help="Comma-separated market counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.markets.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark related-news lookup with and without the keyword index.
+
+Finds related news for every market in a synthetic universe using the
+original keywords-by-articles substring scan and the per-run inverted
+index, and checks both return the same articles.
+
+Usage:
+    python scripts/benchmarks/bench_news_index.py [--markets 10000] [--articles 100,500]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.news_index import NewsKeywordIndex, article_text
+
+from synthetic_markets import make_articles, make_markets
+
+
+def linear_scan(keywords, articles):
+    """The pre-index lookup: every keyword against every article."""
+    related = []
+    for article in articles:
+        text = article_text(article)
+        for keyword in keywords:
+            if keyword in text:
+                related.append(article)
+                break
+    return related
+
+
+def run(market_count, article_counts):
+    """Run the benchmark and print a table."""
+    analyzer = MarketAnalyzer()
+    markets, _ = make_markets(market_count)
+    keywords = [analyzer._extract_market_keywords(market) for market in markets]
+    
+    print(f"{'markets':>8} {'articles':>9} {'scan s':>8} {'index s':>8} {'speedup':>8}")
+    
+    for article_count in article_counts:
+        articles = make_articles(article_count)
+        
+        start = time.perf_counter()
+        expected = [linear_scan(market_keywords, articles) for market_keywords in keywords]
+        scan_elapsed = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        index = NewsKeywordIndex(articles)
+        actual = [index.find(market_keywords) for market_keywords in keywords]
+        index_elapsed = time.perf_counter() - start
+        
+        assert actual == expected
+        print(
+            f"{market_count:>8} {article_count:>9} {scan_elapsed:>8.3f} "
+            f"{index_elapsed:>8.3f} {scan_elapsed / index_elapsed:>7.1f}x"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=10000, help="Number of markets")
+    parser.add_argument("--articles", default="100,500", help="Comma-separated article counts")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run(args.markets, [int(count) for count in args.articles.split(",")])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark branch-and-bound rule selection against checking every pattern.
+
+The baseline is the eager FlexibleAnalyzer, which runs every check method
+and sorts the candidates by edge x confidence. The bounded path is
+FlexibleAnalyzer.analyze_market, whose rule set tries rules from the
+highest price bound down and skips those that cannot win. Both must
+return the same opportunity; the table also shows how many checks were
+pruned. The other pattern analyzers run a handful of checks per market
+and keep a direct best-of.
+
+Usage:
+    python scripts/benchmarks/bench_pattern_pruning.py [--markets 20000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.flexible_analyzer import FlexibleAnalyzer
+
+from bench_flexible_rules import EagerFlexibleAnalyzer, describe, remix
+from synthetic_markets import make_markets
+
+
+def timed(analyze, markets, prices, repeat):
+    """Best-of-repeat time for one pass over the markets."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [analyze(market, price) for market, price in zip(markets, prices, strict=True)]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(count, repeat):
+    """Run the benchmark and print a table."""
+    markets, prices = make_markets(count)
+    markets, prices = remix(markets, prices)
+    
+    analyzer = FlexibleAnalyzer()
+    
+    expected, eager_elapsed = timed(EagerFlexibleAnalyzer().analyze_market, markets, prices, repeat)
+    analyzer.prune_stats.reset()
+    actual, _ = timed(analyzer.analyze_market, markets, prices, 1)
+    stats = analyzer.prune_stats
+    
+    assert [describe(opp) for opp in actual] == [describe(opp) for opp in expected]
+    matches = sum(opp is not None for opp in actual)
+    per_market = stats.evaluated / stats.markets if stats.markets else 0.0
+    by_bound = stats.pruned / stats.considered if stats.considered else 0.0
+    _, bounded_elapsed = timed(analyzer.analyze_market, markets, prices, repeat)
+    
+    print(
+        f"{'markets':>8} {'matches':>8} {'eager s':>8} {'bounded s':>10} {'speedup':>8} "
+        f"{'checks/mkt':>11} {'skipped':>8} {'by bound':>9}"
+    )
+    print(
+        f"{count:>8} {matches:>8} {eager_elapsed:>8.3f} {bounded_elapsed:>10.3f} "
+        f"{eager_elapsed / bounded_elapsed:>7.1f}x {per_market:>11.2f} "
+        f"{stats.prune_rate:>8.0%} {by_bound:>9.0%}"
+    )
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=20000, help="Number of markets")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run(args.markets, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
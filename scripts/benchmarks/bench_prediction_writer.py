@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark prediction recording with per-record appends and batched writes.
+
+Records one backtest prediction and one tracked prediction per synthetic
+opportunity, first by opening the file and appending one json line per
+record, then through BacktestingEngine and PredictionTracker, which
+buffer records in the shared batch writer. The batched files are checked to hold
+every record.
+
+Usage:
+    python scripts/benchmarks/bench_prediction_writer.py [--records 5000]
+"""
+
+import argparse
+import json
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.backtesting import BacktestingEngine, BacktestPrediction
+from src.analyzers.models import MarketOpportunity, OpportunityScore
+from src.utils.prediction_tracker import PredictionRecord, PredictionTracker
+
+from synthetic_markets import make_markets
+
+
+def make_opportunity(market, price):
+    """Build a high-confidence opportunity for a market."""
+    return MarketOpportunity(
+        condition_id=market.condition_id,
+        question=market.question,
+        category=market.category,
+        market_slug=market.condition_id,
+        current_yes_price=price.yes_price,
+        current_no_price=price.no_price,
+        current_spread=price.spread,
+        volume=market.volume,
+        fair_yes_price=min(price.yes_price + 0.1, 0.99),
+        fair_no_price=max(price.no_price - 0.1, 0.01),
+        expected_return=25.0,
+        recommended_position="YES",
+        score=OpportunityScore(
+            value_score=0.7,
+            confidence_score=0.8,
+            volume_score=0.6,
+            time_score=0.5,
+            news_relevance_score=0.4
+        ),
+        end_date=datetime.now() + timedelta(days=30),
+        reasoning="Synthetic opportunity"
+    )
+
+
+def per_record(markets, opportunities, directory):
+    """The pre-batching path: open, append one line and close per record."""
+    tracker = PredictionTracker(data_dir=str(directory))
+    for market, opportunity in zip(markets, opportunities, strict=True):
+        prediction = BacktestPrediction(
+            condition_id=market.condition_id,
+            question=market.question,
+            predicted_probability=opportunity.fair_yes_price,
+            confidence=opportunity.score.confidence_score,
+            recommended_position=opportunity.recommended_position,
+            market_price=opportunity.current_yes_price,
+            prediction_date=datetime.now(),
+            model_version="current"
+        )
+        with open(directory / "backtests.jsonl", "a") as f:
+            f.write(json.dumps(asdict(prediction), default=str) + "\n")
+            
+        record = PredictionRecord(
+            condition_id=opportunity.condition_id,
+            question=opportunity.question,
+            predicted_position=opportunity.recommended_position,
+            predicted_probability=opportunity.fair_yes_price,
+            current_market_price=opportunity.current_yes_price,
+            fair_value_price=opportunity.fair_yes_price,
+            expected_return=opportunity.expected_return,
+            confidence_score=opportunity.score.confidence_score,
+            overall_score=opportunity.score.overall_score,
+            risk_level=opportunity.risk_level,
+            reasoning=opportunity.reasoning,
+            market_url=tracker._generate_market_url(opportunity.condition_id, opportunity.market_slug),
+            prediction_date=datetime.now(),
+            market_end_date=opportunity.end_date
+        )
+        with open(directory / "predictions.jsonl", "a") as f:
+            f.write(record.model_dump_json() + "\n")
+
+
+def batched(markets, opportunities, directory):
+    """The current path: both recorders buffer into shared batch writers."""
+    engine = BacktestingEngine(data_dir=str(directory / "backtests"))
+    tracker = PredictionTracker(data_dir=str(directory))
+    for market, opportunity in zip(markets, opportunities, strict=True):
+        engine.record_prediction(market, opportunity)
+        tracker.log_prediction(opportunity)
+    engine.flush()
+    tracker.flush()
+    return engine, tracker
+
+
+def run(record_count):
+    """Run the benchmark and print a table."""
+    markets, prices = make_markets(record_count)
+    opportunities = [make_opportunity(market, price) for market, price in zip(markets, prices, strict=True)]
+    root = Path(tempfile.mkdtemp())
+    
+    try:
+        (root / "old").mkdir()
+        start = time.perf_counter()
+        per_record(markets, opportunities, root / "old")
+        old_elapsed = time.perf_counter() - start
+        
+        (root / "new").mkdir()
+        start = time.perf_counter()
+        engine, tracker = batched(markets, opportunities, root / "new")
+        new_elapsed = time.perf_counter() - start
+        
+        assert len(engine._load_predictions()) == record_count
+        assert len(tracker.load_predictions()) == record_count
+        
+        print(f"{'records':>8} {'mode':>11} {'seconds':>8} {'per record':>11}")
+        for mode, elapsed in (("per-record", old_elapsed), ("batched", new_elapsed)):
+            print(
+                f"{record_count:>8} {mode:>11} {elapsed:>8.3f} "
+                f"{elapsed / record_count * 1e6:>9.1f}us"
+            )
+        print(f"speedup: {old_elapsed / new_elapsed:.1f}x")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=5000, help="Number of opportunities")
+    args = parser.parse_args()
+    
+    # Per-record info logging would dominate both paths
+    logging.basicConfig(level=logging.WARNING)
+    run(args.records)
+
+
+if __name__ == "__main__":
+    main()
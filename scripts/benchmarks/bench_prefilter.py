@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NumPy numeric prefilter against analyzing every market.
+
+For each pattern analyzer (and the ensemble) the baseline calls
+analyze_market on every market with shared features. The batch path is
+analyze_batch, which masks markets on price bands, volume and days left
+in one pass over a MarketTable and analyzes only the rows left. The
+table is built once, as MarketAnalyzer builds it for its own gates; its
+build time is shown separately. Both paths must return the same
+results; the output shows how many rows the mask let through.
+
+Usage:
+    python scripts/benchmarks/bench_prefilter.py [--markets 2000,20000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.ensemble import AnalyzerEnsemble
+from src.analyzers.flexible_analyzer import FlexibleAnalyzer
+from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+from src.analyzers.prefilter import analyze_batch
+from src.analyzers.refined_simple_analyzer import RefinedSimpleAnalyzer
+from src.analyzers.simple_pattern_analyzer import SimplePatternAnalyzer
+from src.clients.polymarket.market_features import FeatureStore
+from src.clients.polymarket.market_table import MarketTable
+
+from bench_flexible_rules import describe
+from synthetic_markets import make_markets
+
+
+def analyze_all(analyzer, markets, prices):
+    """analyze_market on every market, with features shared across the pass."""
+    features = FeatureStore()
+    return [
+        analyzer.analyze_market(market, price, features=features.get(market, price))
+        for market, price in zip(markets, prices, strict=True)
+    ]
+
+
+def timed(analyze, repeat):
+    """Best-of-repeat time for one call."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = analyze()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(market_counts, repeat):
+    """Run the benchmark and print a table."""
+    print(
+        f"{'markets':>8} {'analyzer':>16} {'matches':>8} {'passed':>7} "
+        f"{'loop s':>8} {'batch s':>8} {'speedup':>8} {'table s':>8}"
+    )
+    for count in market_counts:
+        markets, prices = make_markets(count)
+        table, table_elapsed = timed(
+            lambda markets=markets, prices=prices: MarketTable.from_markets(
+                markets, {price.condition_id: price for price in prices}
+            ),
+            repeat
+        )
+        cases = [
+            ("flexible", FlexibleAnalyzer()),
+            ("simple", SimplePatternAnalyzer()),
+            ("high_confidence", HighConfidenceAnalyzer()),
+            ("refined", RefinedSimpleAnalyzer()),
+            ("ensemble", AnalyzerEnsemble()),
+        ]
+        for name, analyzer in cases:
+            expected, loop_elapsed = timed(
+                lambda analyzer=analyzer, markets=markets, prices=prices: analyze_all(analyzer, markets, prices),
+                repeat
+            )
+            actual, batch_elapsed = timed(
+                lambda analyzer=analyzer, markets=markets, prices=prices, table=table: analyze_batch(
+                    analyzer, markets, prices, table=table
+                ),
+                repeat
+            )
+            
+            assert [describe(opp) for opp in actual] == [describe(opp) for opp in expected]
+            matches = sum(opp is not None for opp in actual)
+            passed = int(analyzer.prefilter(table).sum())
+            print(
+                f"{count:>8} {name:>16} {matches:>8} {passed / count:>7.0%} "
+                f"{loop_elapsed:>8.3f} {batch_elapsed:>8.3f} {loop_elapsed / batch_elapsed:>7.1f}x "
+                f"{table_elapsed:>8.3f}"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", default="2000,20000", help="Comma-separated market counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.markets.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark price-target ladders, one market at a time vs one ladder call.
+
+Markets are threshold ladders over BTC and ETH: many strikes, with and
+without a year in the question. The baseline prices each market on its
+own as _calculate_price_target_probability does (extract the target,
+fetch market data, price one rung). The batch path is
+calculate_price_target_base_probabilities, which fetches market data once
+per asset, prices every ending-above rung in one NumPy call and simulates
+every reach rung in one Monte Carlo batch. Both must give the same
+probabilities.
+
+Usage:
+    python scripts/benchmarks/bench_price_ladder.py [--markets 200,2000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.crypto_model import CryptoFinancialModel
+from src.analyzers.monte_carlo import market_key
+from src.clients.polymarket.models import Market, Token
+
+LADDER_TEMPLATES = [
+    "Will Bitcoin be above ${strike:,} by the end of {year}?",
+    "Will Bitcoin reach ${strike:,}?",
+    "Will Ethereum be above ${small:,} by the end of {year}?",
+    "Will Ethereum reach ${small:,}?",
+]
+
+
+def make_ladder(count, seed=42):
+    """Build reproducible BTC and ETH threshold markets."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    markets = []
+    for i in range(count):
+        question = rng.choice(LADDER_TEMPLATES).format(
+            strike=rng.randrange(40000, 200001, 5000),
+            small=rng.randrange(1000, 10001, 250),
+            year=rng.choice([2025, 2026]),
+        )
+        markets.append(Market(
+            condition_id=f"0x{i:064x}",
+            question=question,
+            description="",
+            tokens=[
+                Token(token_id=f"{i}-yes", outcome="Yes", price=0.5),
+                Token(token_id=f"{i}-no", outcome="No", price=0.5),
+            ],
+            minimum_order_size=1.0,
+            end_date_iso=now + timedelta(days=rng.randint(1, 365)),
+            active=True,
+            closed=False,
+        ))
+    return markets
+
+
+def one_by_one(model, markets):
+    """Price each market's target on its own."""
+    results = []
+    for market in markets:
+        target_data = model._extract_price_target(market.question, market.description)
+        market_data = model._get_crypto_market_data(target_data[0]) if target_data else None
+        if market_data is None:
+            results.append(None)
+            continue
+        results.append(model._calculate_price_target_base_probability(
+            market_data, *target_data[1:],
+            touch=model._is_touch_target(market.question),
+            key=market_key(market.condition_id)
+        ))
+    return results
+
+
+def timed(price, repeat):
+    """Best-of-repeat time for one call."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = price()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(market_counts, repeat):
+    """Run the benchmark and print a table."""
+    model = CryptoFinancialModel()
+    print(f"{'markets':>8} {'single s':>9} {'ladder s':>9} {'speedup':>8}")
+    
+    for count in market_counts:
+        markets = make_ladder(count)
+        expected, single_elapsed = timed(lambda markets=markets: one_by_one(model, markets), repeat)
+        actual, ladder_elapsed = timed(
+            lambda markets=markets: model.calculate_price_target_base_probabilities(markets), repeat
+        )
+        
+        assert actual == expected
+        print(
+            f"{count:>8} {single_elapsed:>9.4f} {ladder_elapsed:>9.4f} "
+            f"{single_elapsed / ladder_elapsed:>7.1f}x"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", default="200,2000", help="Comma-separated market counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.markets.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the process-pool analysis backend against the event-loop backend.
+
+Runs MarketAnalyzer over a synthetic universe (50k markets by default) once
+on the async backend and then on the process backend with increasing worker
+counts. Pass --live to benchmark the current Polymarket universe instead.
+
+Usage:
+    python scripts/benchmarks/bench_process_pool.py [--markets 50000] [--live]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.process_pool import ProcessPoolBackend
+
+from synthetic_markets import make_markets
+
+
+async def load_live_markets():
+    """Fetch the active Polymarket universe and its prices."""
+    from src.clients.polymarket.client import PolymarketClient
+    
+    async with PolymarketClient() as client:
+        markets = await client.get_all_active_markets()
+        prices = [await client.get_market_prices(market) for market in markets]
+    return markets, [price for price in prices if price]
+
+
+async def run(markets, prices, worker_counts, chunk_size):
+    """Time each backend configuration and print a table."""
+    print(f"{'backend':>10} {'workers':>8} {'seconds':>9} {'speedup':>8} {'opps':>7}")
+    
+    analyzer = MarketAnalyzer()
+    # Benchmarks must not append to the real backtest log
+    analyzer.backtesting_engine = MagicMock()
+    
+    start = time.perf_counter()
+    result = await analyzer.analyze_markets(markets, prices, [], backend="async")
+    baseline = time.perf_counter() - start
+    print(f"{'async':>10} {1:>8} {baseline:>9.3f} {1.0:>7.1f}x {len(result.opportunities):>7}")
+    
+    for workers in worker_counts:
+        analyzer._process_backend = ProcessPoolBackend(max_workers=workers, chunk_size=chunk_size)
+        try:
+            # Warm the pool so process start-up is not billed to the run
+            await analyzer.analyze_markets(markets[:workers * chunk_size], prices, [], backend="process")
+            
+            start = time.perf_counter()
+            result = await analyzer.analyze_markets(markets, prices, [], backend="process")
+            elapsed = time.perf_counter() - start
+        finally:
+            analyzer.shutdown()
+            
+        print(
+            f"{'process':>10} {workers:>8} {elapsed:>9.3f} "
+            f"{baseline / elapsed:>7.1f}x {len(result.opportunities):>7}"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    cpu_count = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+    
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=50000, help="Synthetic market count")
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)), help="Comma-separated worker counts")
+    parser.add_argument("--chunk-size", type=int, default=250, help="Markets per worker task")
+    parser.add_argument("--live", action="store_true", help="Use the live Polymarket universe")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    
+    if args.live:
+        markets, prices = asyncio.run(load_live_markets())
+    else:
+        markets, prices = make_markets(args.markets)
+    print(f"Markets: {len(markets)}  CPUs: {cpu_count}")
+    
+    asyncio.run(run(
+        markets,
+        prices,
+        [int(count) for count in args.workers.split(",")],
+        args.chunk_size
+    ))
+
+
+if __name__ == "__main__":
+    main()
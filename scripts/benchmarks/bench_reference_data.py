@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark reference data startup and lookups: parsed JSON vs the mapped store.
+
+A synthetic source with the five reference tables is written to a
+temporary directory. Startup compares each domain model parsing the JSON
+and building its own dicts (five parses per worker) with mapping the
+compiled store once; lookups compare a linear scan over a table's entries
+with the store's hash index. Both must return the same records.
+
+Usage:
+    python scripts/benchmarks/bench_reference_data.py [--entities 1000,20000] [--lookups 20000] [--repeat 3]
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.reference_data import TABLES, load_reference_data
+
+
+def make_source(entities, seed=42):
+    """Build reproducible tables of synthetic entity records."""
+    rng = random.Random(seed)
+    return {
+        table: {
+            f"{table} entity {i}": {"rating": round(rng.uniform(0, 2), 3), "tags": [rng.choice("abcde")] * 3}
+            for i in range(entities)
+        }
+        for table in TABLES
+    }
+
+
+def parse_per_model(source):
+    """Parse the JSON once per domain model, as each loader rebuilding dicts would."""
+    models = []
+    for table in TABLES:
+        with open(source, "r") as f:
+            models.append(list(json.load(f)[table].items()))
+    return models
+
+
+def map_shared(source, path):
+    """Map the compiled store as a freshly started worker would."""
+    with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+        return load_reference_data(str(source), str(path))
+
+
+def scan(entries, name):
+    """Find an entity by scanning a table's entries."""
+    for key, value in entries:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def timed(call, repeat):
+    """Best-of-repeat time for one call."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def run(entity_counts, lookups, repeat):
+    """Run the benchmark and print a table."""
+    print(f"{'entities':>9} {'parse s':>9} {'map s':>9} {'scan us':>9} {'index us':>9} {'speedup':>8}")
+    rng = random.Random(7)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in entity_counts:
+            source = Path(tmp) / f"reference_{count}.json"
+            path = Path(tmp) / f"reference_{count}.refdb"
+            source.write_text(json.dumps(make_source(count)))
+            map_shared(source, path)  # Compile outside the timings
+            
+            models, parse_elapsed = timed(lambda source=source: parse_per_model(source), repeat)
+            _, map_elapsed = timed(lambda source=source, path=path: map_shared(source, path), repeat)
+            
+            names = [f"teams entity {rng.randrange(count)}" for _ in range(lookups)]
+            teams = models[TABLES.index("teams")]
+            # Scans are slow; time a sample and scale per lookup
+            sample = names[:max(1, lookups // 100)]
+            expected, scan_elapsed = timed(
+                lambda teams=teams, sample=sample: [scan(teams, name) for name in sample], 1
+            )
+            # A fresh mapping per pass, so decoded records are not yet cached
+            actual, index_elapsed = timed(
+                lambda source=source, path=path, names=names: [
+                    table[name] for table in [map_shared(source, path).table("teams")] for name in names
+                ],
+                repeat
+            )
+            
+            assert actual[:len(sample)] == expected
+            scan_us = scan_elapsed / len(sample) * 1e6
+            index_us = index_elapsed / len(names) * 1e6
+            print(
+                f"{count:>9} {parse_elapsed:>9.4f} {map_elapsed:>9.4f} "
+                f"{scan_us:>9.2f} {index_us:>9.2f} {scan_us / index_us:>7.1f}x"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", default="1000,20000", help="Comma-separated entities per table")
+    parser.add_argument("--lookups", type=int, default=20000, help="Entity lookups per pass")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.entities.split(",")], args.lookups, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming analysis pipeline against the phased run.
+
+The market source serves pages with simulated download latency. The phased
+run downloads every page before analyzing; the pipeline analyzes each page
+as it arrives. Reports total time and time to first opportunity.
+
+Usage:
+    python scripts/benchmarks/bench_streaming_pipeline.py [--markets 5000] [--page-latency 0.05]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.pipeline import AnalysisPipeline
+
+from synthetic_markets import make_articles, make_markets
+
+
+async def paged_source(markets, page_size, latency):
+    """Serve markets page by page with simulated download latency."""
+    for start in range(0, len(markets), page_size):
+        await asyncio.sleep(latency)
+        yield markets[start:start + page_size]
+
+
+async def run(market_count, page_size, latency):
+    """Run both modes and print a comparison."""
+    markets, prices = make_markets(market_count)
+    price_lookup = {price.condition_id: price for price in prices}
+    news = make_articles(100)
+    
+    async def price_fn(market):
+        return price_lookup.get(market.condition_id)
+        
+    with tempfile.TemporaryDirectory() as data_dir:
+        analyzer = MarketAnalyzer()
+        analyzer.backtesting_engine = BacktestingEngine(data_dir=data_dir)
+        analyzer.record_predictions = False
+        
+        start = time.perf_counter()
+        fetched = []
+        async for page in paged_source(markets, page_size, latency):
+            fetched.extend(page)
+        phased = await analyzer.analyze_markets(fetched, prices, news)
+        phased_elapsed = time.perf_counter() - start
+        
+        pipeline = AnalysisPipeline(analyzer, price_fn)
+        start = time.perf_counter()
+        streamed = await pipeline.run(paged_source(markets, page_size, latency), news)
+        streamed_elapsed = time.perf_counter() - start
+        
+    assert len(phased.opportunities) == len(streamed.opportunities)
+    pages = -(-market_count // page_size)
+    print(f"{market_count} markets, {pages} pages at {latency * 1000:.0f} ms each")
+    print(f"{'mode':>10} {'total s':>8} {'first opp s':>12} {'opps':>6}")
+    print(f"{'phased':>10} {phased_elapsed:>8.3f} {phased_elapsed:>12.3f} {len(phased.opportunities):>6}")
+    print(
+        f"{'streaming':>10} {streamed_elapsed:>8.3f} "
+        f"{pipeline.stats.first_opportunity_seconds:>12.3f} {len(streamed.opportunities):>6}"
+    )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=5000, help="Number of markets")
+    parser.add_argument("--page-size", type=int, default=100, help="Markets per page")
+    parser.add_argument("--page-latency", type=float, default=0.05, help="Simulated seconds per page")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args.markets, args.page_size, args.page_latency))
+
+
+if __name__ == "__main__":
+    main()
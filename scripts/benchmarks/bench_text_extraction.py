@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Benchmark question text extraction, per-call regexes vs the shared registry.
+
+The baseline is the extraction code as it was before text_patterns: each
+call builds its pattern list or team list and goes through re.search with
+a pattern string. The registry path calls the models' own extractors,
+which scan frozen gazetteers and precompiled patterns that only run on
+questions containing their required literal. Questions come
+from the synthetic universe plus domain templates for the crypto,
+technology, entertainment, sports and election extractors, and both
+paths must extract the same values.
+
+Usage:
+    python scripts/benchmarks/bench_text_extraction.py [--markets 2000,20000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.crypto_model import CryptoFinancialModel
+from src.analyzers.entertainment_model import EntertainmentMarketModel
+from src.analyzers.multi_outcome_researcher import MultiOutcomeResearcher
+from src.analyzers.sports_model import SportsMarketModel, SportType
+from src.analyzers.technology_model import TechnologyMarketModel
+
+from synthetic_markets import COMPANIES, PEOPLE, TEAMS, make_markets
+
+DOMAIN_TEMPLATES = [
+    "Will Ethereum reach $10,000 in 2025?",
+    "Will Solana hit 500k by the end of 2025?",
+    "Will {company} launch its headset by June?",
+    "Will {company} acquire a chip startup?",
+    "Will {company} go public in 2026?",
+    "Will regulators ban {company}'s app?",
+    "Will {company} reach 100,000,000 users this year?",
+    "Will {person} win Best Actor at the Oscars?",
+    "Will The Office be renewed for another season?",
+    "Will Dune Part Three gross over $500,000,000?",
+    "Will {person} marry before 2027?",
+    "Will the {team} win the championship?",
+    "Will LeBron James retire this season?",
+    "Will {person} win the 2028 presidential election?",
+    "{person} for mayor in 2025",
+    "Will {person} be the Democratic nominee?",
+]
+
+TEMPLATES = [
+    "Will {candidate} win the {election}?",
+    "{candidate} for {position} in {year}",
+    "Will {candidate} be the {party} nominee",
+]
+
+
+def legacy_price_target(question):
+    """Asset and price target as extracted before the registry."""
+    full_text = f"{question} ".lower()
+    crypto_mapping = {
+        "bitcoin": "BTC", "btc": "BTC", "ethereum": "ETH", "eth": "ETH",
+        "litecoin": "LTC", "ltc": "LTC", "ripple": "XRP", "xrp": "XRP",
+        "dogecoin": "DOGE", "doge": "DOGE", "cardano": "ADA", "ada": "ADA",
+        "solana": "SOL", "sol": "SOL"
+    }
+    asset = "BTC"
+    for name, symbol in crypto_mapping.items():
+        if name in full_text:
+            asset = symbol
+            break
+    price_patterns = [r'\$([0-9,]+)', r'([0-9,]+)\s*k', r'([0-9,]+)\s*thousand']
+    for pattern in price_patterns:
+        match = re.search(pattern, full_text)
+        if match:
+            target_price = float(match.group(1).replace(',', ''))
+            if 'k' in pattern or 'thousand' in pattern:
+                target_price *= 1000
+            return asset, target_price
+    return None
+
+
+def legacy_first(patterns, question, groups, flags=re.IGNORECASE):
+    """Groups of the first matching pattern, searched from its source."""
+    for pattern in patterns:
+        match = re.search(pattern, question, flags)
+        if match:
+            return tuple(match.group(group).strip() for group in groups)
+    return None
+
+
+def legacy_box_office(question):
+    """Movie title and parsed gross target."""
+    match = re.search(r"Will (.+) gross over \$([0-9,]+)", question, re.IGNORECASE)
+    if match:
+        return match.group(1).strip(), float(match.group(2).replace(',', ''))
+    return None
+
+
+def legacy_teams(sport_type):
+    """Team list rebuilt per call, as before the registry."""
+    return {
+        SportType.NFL: [
+            "Chiefs", "Bills", "Bengals", "Ravens", "Browns", "Steelers", "Titans", "Colts",
+            "Texans", "Jaguars", "Chargers", "Raiders", "Broncos", "Cowboys", "Giants",
+            "Eagles", "Commanders", "Packers", "Bears", "Lions", "Vikings", "Falcons",
+            "Panthers", "Saints", "Buccaneers", "Cardinals", "Rams", "49ers", "Seahawks",
+            "Jets", "Dolphins", "Patriots"
+        ],
+        SportType.NBA: [
+            "Lakers", "Warriors", "Celtics", "Heat", "Nets", "Knicks", "76ers", "Bucks",
+            "Bulls", "Cavaliers", "Pistons", "Pacers", "Hawks", "Hornets", "Magic", "Wizards",
+            "Raptors", "Nuggets", "Timberwolves", "Thunder", "Trail Blazers", "Jazz", "Suns",
+            "Kings", "Clippers", "Mavericks", "Rockets", "Grizzlies", "Pelicans", "Spurs"
+        ],
+        SportType.MLB: [
+            "Yankees", "Red Sox", "Blue Jays", "Orioles", "Rays", "White Sox", "Indians",
+            "Tigers", "Royals", "Twins", "Astros", "Angels", "Athletics", "Mariners", "Rangers",
+            "Braves", "Marlins", "Mets", "Phillies", "Nationals", "Cubs", "Reds", "Brewers",
+            "Pirates", "Cardinals", "Diamondbacks", "Rockies", "Dodgers", "Padres", "Giants"
+        ],
+    }[sport_type]
+
+
+def legacy_team(question, sport_type):
+    """First listed team in the question, ignoring case."""
+    question_lower = question.lower()
+    for team in legacy_teams(sport_type):
+        if team.lower() in question_lower:
+            return team
+    return None
+
+
+def legacy_template_match(question, template):
+    """Template converted to a regex on every call."""
+    pattern_regex = template.replace('{candidate}', r'(\w+)')
+    pattern_regex = pattern_regex.replace('{election}', r'(.+)')
+    pattern_regex = pattern_regex.replace('{position}', r'(.+)')
+    pattern_regex = pattern_regex.replace('{year}', r'(\d+)')
+    pattern_regex = pattern_regex.replace('{party}', r'(\w+)')
+    return bool(re.search(pattern_regex, question, re.IGNORECASE))
+
+
+def legacy_extract(question):
+    """Everything the extractors pull from one question, before the registry."""
+    return (
+        legacy_price_target(question),
+        legacy_first([
+            r"Will (.+) launch (.+) by", r"(.+) to release (.+) in",
+            r"(.+) announce (.+) before", r"Will (.+)'s (.+) be released"
+        ], question, (2, 1)),
+        legacy_first([
+            r"Will (.+) acquire (.+)", r"(.+) to buy (.+)",
+            r"(.+) merger with (.+)", r"(.+) acquisition of (.+)"
+        ], question, (1, 2)),
+        legacy_first([
+            r"Will (.+) go public", r"(.+) IPO", r"(.+) to list", r"(.+) direct listing"
+        ], question, (1,)),
+        legacy_first([
+            r"Will (.+) win Best (.+)", r"(.+) to win (.+) award", r"(.+) for Best (.+)"
+        ], question, (1, 2)),
+        legacy_first([
+            r"Will (.+) be renewed", r"(.+) renewal", r"(.+) cancelled", r"(.+) get another season"
+        ], question, (1,)),
+        legacy_box_office(question),
+        tuple(legacy_team(question, sport) for sport in (SportType.NFL, SportType.NBA, SportType.MLB)),
+        legacy_first([
+            r"will ([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+)", r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) retire",
+            r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) will", r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) to"
+        ], question, (1,), flags=0),
+        tuple(legacy_template_match(question, template) for template in TEMPLATES),
+    )
+
+
+class RegistryExtractor:
+    """The models' own extractors, backed by the shared registry."""
+    
+    def __init__(self):
+        self.crypto = CryptoFinancialModel()
+        self.technology = TechnologyMarketModel()
+        self.entertainment = EntertainmentMarketModel()
+        self.sports = SportsMarketModel()
+        self.researcher = MultiOutcomeResearcher()
+        
+    def extract(self, question):
+        """Everything the extractors pull from one question."""
+        target = self.crypto._extract_price_target(question, "")
+        return (
+            target[:2] if target else None,
+            self._pair(self.technology._extract_product_launch_info(question)),
+            self._pair(self.technology._extract_acquisition_info(question)),
+            self._single(self.technology._extract_ipo_company(question)),
+            self._pair(self.entertainment._extract_awards_info(question)),
+            self._single(self.entertainment._extract_show_name(question)),
+            self._pair(self.entertainment._extract_box_office_info(question)),
+            tuple(
+                self.sports._extract_team_name(question, sport)
+                for sport in (SportType.NFL, SportType.NBA, SportType.MLB)
+            ),
+            self._single(self.sports._extract_player_name(question)),
+            tuple(self.researcher._matches_pattern(question, template) for template in TEMPLATES),
+        )
+        
+    @staticmethod
+    def _pair(values):
+        return None if values[0] is None else values
+        
+    @staticmethod
+    def _single(value):
+        return None if value is None else (value,)
+
+
+def make_questions(count, seed=42):
+    """Synthetic questions mixed with domain templates."""
+    rng = random.Random(seed)
+    markets, _ = make_markets(count, seed)
+    questions = []
+    for market in markets:
+        if rng.random() < 0.5:
+            questions.append(market.question)
+        else:
+            questions.append(rng.choice(DOMAIN_TEMPLATES).format(
+                person=rng.choice(PEOPLE), team=rng.choice(TEAMS), company=rng.choice(COMPANIES)
+            ))
+    return questions
+
+
+def timed(extract, questions, repeat):
+    """Best-of-repeat time for one pass over the questions."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [extract(question) for question in questions]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def run(market_counts, repeat):
+    """Run the benchmark and print a table."""
+    registry = RegistryExtractor()
+    print(f"{'questions':>9} {'legacy q/s':>11} {'registry q/s':>13} {'speedup':>8}")
+    
+    for count in market_counts:
+        questions = make_questions(count)
+        expected, legacy_elapsed = timed(legacy_extract, questions, repeat)
+        actual, registry_elapsed = timed(registry.extract, questions, repeat)
+        
+        assert actual == expected
+        print(
+            f"{count:>9} {count / legacy_elapsed:>11,.0f} {count / registry_elapsed:>13,.0f} "
+            f"{legacy_elapsed / registry_elapsed:>7.1f}x"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", default="2000,20000", help="Comma-separated question counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best is kept)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.markets.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark top-K opportunity queries with re-sorting and with the ranking index.
+
+Simulates a console session over one analysis result: repeated top,
+details and chat lookups, a top list by value score and a high-confidence
+view. The baseline re-sorts the opportunity list and recomputes
+overall_score on every query, as AnalysisResult.top_opportunities used
+to. The indexed path uses AnalysisResult.top. Both return the same
+opportunities.
+
+Usage:
+    python scripts/benchmarks/bench_top_k.py [--opportunities 1000,20000] [--queries 200]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.models import AnalysisResult
+
+from synthetic_markets import make_opportunities
+
+
+def resort_queries(opportunities, queries):
+    """The pre-index path: sort the whole list for every query."""
+    results = []
+    for _ in range(queries):
+        results.append(sorted(opportunities, key=lambda x: x.score.overall_score, reverse=True)[:10])
+        results.append(sorted(opportunities, key=lambda x: x.score.value_score, reverse=True)[:10])
+        high_confidence = [opp for opp in opportunities if opp.score.confidence_score >= 0.7]
+        results.append(sorted(high_confidence, key=lambda x: x.score.overall_score, reverse=True)[:10])
+    return results
+
+
+def indexed_queries(opportunities, queries):
+    """The current path: one ranking index maintained on the result."""
+    result = AnalysisResult(
+        opportunities=opportunities,
+        total_markets_analyzed=len(opportunities),
+        analysis_duration_seconds=0.0,
+        news_articles_processed=0
+    )
+    results = []
+    for _ in range(queries):
+        results.append(result.top(10))
+        results.append(result.top(10, by="value"))
+        results.append(result.top(10, high_confidence=True))
+    return results
+
+
+def run(opportunity_counts, queries):
+    """Run the benchmark and print a table."""
+    print(f"{'opps':>7} {'queries':>8} {'re-sort s':>10} {'index s':>8} {'speedup':>8}")
+    
+    for count in opportunity_counts:
+        opportunities = make_opportunities(count)
+        
+        start = time.perf_counter()
+        expected = resort_queries(opportunities, queries)
+        resort_elapsed = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        actual = indexed_queries(opportunities, queries)
+        index_elapsed = time.perf_counter() - start
+        
+        assert [[opp.condition_id for opp in top] for top in actual] == [
+            [opp.condition_id for opp in top] for top in expected
+        ]
+        print(
+            f"{count:>7} {queries * 3:>8} {resort_elapsed:>10.3f} "
+            f"{index_elapsed:>8.3f} {resort_elapsed / index_elapsed:>7.1f}x"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--opportunities", default="1000,20000", help="Comma-separated opportunity counts")
+    parser.add_argument("--queries", type=int, default=200, help="Query rounds per session")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(count) for count in args.opportunities.split(",")], args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark vectorized opportunity scoring against the per-market path.
+
+Scores every pattern candidate in a synthetic universe once with
+MarketAnalyzer._calculate_simple_opportunity_score per market and once
+with a single vectorized pass, then materialises only the survivors.
+
+Usage:
+    python scripts/benchmarks/bench_vectorized_scoring.py [--sizes 1000,10000,100000]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analyzers.market_analyzer import MarketAnalyzer
+
+from synthetic_markets import make_markets
+
+
+def run(sizes):
+    """Run the benchmark and print a table."""
+    analyzer = MarketAnalyzer()
+    
+    print(f"{'markets':>8} {'candidates':>11} {'scalar s':>9} {'vector s':>9} {'speedup':>8}")
+    
+    for size in sizes:
+        markets, prices = make_markets(size)
+        price_lookup = {price.condition_id: price for price in prices}
+        candidates = []
+        for market in markets:
+            price = price_lookup[market.condition_id]
+            opportunity = analyzer._detect_opportunity(market, price)
+            if opportunity:
+                candidates.append((market, price, opportunity))
+                
+        start = time.perf_counter()
+        scalar = [
+            analyzer._calculate_simple_opportunity_score(market, price, opportunity, [])
+            for market, price, opportunity in candidates
+            if opportunity.edge >= analyzer.min_spread
+        ]
+        scalar_elapsed = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        scores = analyzer._score_candidates(candidates, [])
+        edges = np.array([opportunity.edge for _, _, opportunity in candidates])
+        vector = scores.to_scores(np.flatnonzero(edges >= analyzer.min_spread))
+        vector_elapsed = time.perf_counter() - start
+        
+        assert len(scalar) == len(vector)
+        print(
+            f"{size:>8} {len(candidates):>11} {scalar_elapsed:>9.3f} "
+            f"{vector_elapsed:>9.3f} {scalar_elapsed / vector_elapsed:>7.1f}x"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated market counts")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    run([int(size) for size in args.sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
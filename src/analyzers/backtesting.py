@@ -16,6 +16,7 @@ import math
 
 from src.clients.polymarket.models import Market
 from src.analyzers.models import MarketOpportunity
+from src.utils.batch_writer import get_writer
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +91,7 @@ class BacktestingEngine:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.predictions_file = self.data_dir / "predictions.jsonl"
+        self._writer = get_writer(self.predictions_file)
         
     def record_prediction(
         self,
@@ -122,12 +124,15 @@ class BacktestingEngine:
             model_version=model_version
         )
         
-        # Append to predictions file
-        with open(self.predictions_file, "a") as f:
-            f.write(json.dumps(asdict(prediction), default=str) + "\n")
+        # Buffered; appended to the predictions file in batches
+        self._writer.write(prediction)
             
         logger.info(f"Recorded prediction for {market.condition_id}")
         
+    def flush(self) -> None:
+        """Write buffered predictions to disk."""
+        self._writer.flush()
+        
     def update_outcome(
         self,
         condition_id: str,
@@ -212,6 +217,7 @@ class BacktestingEngine:
     def _load_predictions(self) -> List[BacktestPrediction]:
         """Load all predictions from storage."""
         predictions = []
+        self.flush()
         
         if not self.predictions_file.exists():
             return predictions
@@ -233,6 +239,7 @@ class BacktestingEngine:
         
     def _save_predictions(self, predictions: List[BacktestPrediction]) -> None:
         """Save all predictions to storage."""
+        self.flush()
         with open(self.predictions_file, "w") as f:
             for pred in predictions:
                 f.write(json.dumps(asdict(pred), default=str) + "\n")
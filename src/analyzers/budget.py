@@ -0,0 +1,166 @@
+"""
+Time budgets for deadline-bounded ("anytime") analysis runs.
+
+A budgeted run analyzes markets in priority order, stops launching work
+once the deadline passes and cancels whatever is still in flight. Pattern
+detection stops early, leaving a share of the budget to build the
+opportunities it matched. The
+result covers the markets that finished, most promising first, and is
+flagged as partial when some were left out.
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, List, Mapping, Optional, Set
+
+import numpy as np
+
+from src.analyzers.vectorized_scoring import time_scores, volume_scores
+from src.clients.polymarket.market_table import MarketTable
+from src.clients.polymarket.models import Market
+
+# Priority credited to markets with no previous result
+UNKNOWN_PRIOR_VALUE = 0.5
+
+# Share of the budget held back from detection for building opportunities
+BUILD_RESERVE = 0.2
+
+
+class AnalysisBudget:
+    """
+    Deadline for one analysis run, and the markets it left unfinished.
+    """
+    
+    def __init__(
+        self,
+        seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        build_reserve: float = BUILD_RESERVE
+    ):
+        """
+        Initialize analysis budget; the deadline starts counting now.
+        
+        Args:
+            seconds: Wall-clock budget for the run
+            clock: Monotonic clock in seconds
+            build_reserve: Share of the budget detection leaves for builds (0-1)
+        """
+        self.seconds = seconds
+        self._clock = clock
+        self.expires_at = clock() + seconds
+        self.detection_expires_at = self.expires_at - seconds * build_reserve
+        self.unfinished: Set[str] = set()
+        self.cancelled = 0
+        
+    @property
+    def remaining(self) -> float:
+        """
+        Get the time left before the deadline.
+        
+        Returns:
+            float: Seconds remaining (0 once expired)
+        """
+        return max(0.0, self.expires_at - self._clock())
+        
+    @property
+    def expired(self) -> bool:
+        """
+        Check whether the deadline has passed.
+        
+        Returns:
+            bool: True once no time remains
+        """
+        return self._clock() >= self.expires_at
+        
+    @property
+    def detection_expired(self) -> bool:
+        """
+        Check whether pattern detection should stop to leave time for builds.
+        
+        Returns:
+            bool: True once only the build reserve remains
+        """
+        return self._clock() >= self.detection_expires_at
+        
+    def clamp(self, timeout: Optional[float]) -> float:
+        """
+        Limit a timeout to the time remaining.
+        
+        Args:
+            timeout: Timeout in seconds (None for no limit)
+            
+        Returns:
+            float: The smaller of the timeout and the remaining time
+        """
+        return self.remaining if timeout is None else min(timeout, self.remaining)
+        
+    def skip(self, condition_id: str) -> None:
+        """
+        Mark a market as not analyzed because the deadline passed.
+        
+        Args:
+            condition_id: Market condition ID
+        """
+        self.unfinished.add(condition_id)
+        
+    def cancel(self, condition_id: str) -> None:
+        """
+        Mark a market whose in-flight analysis was cancelled at the deadline.
+        
+        Args:
+            condition_id: Market condition ID
+        """
+        self.unfinished.add(condition_id)
+        self.cancelled += 1
+
+
+def priority_scores(
+    markets: List[Market],
+    prior_values: Optional[Mapping[str, Optional[float]]] = None,
+    now: Optional[datetime] = None
+) -> np.ndarray:
+    """
+    Score how worthwhile each market is to analyze early.
+    
+    Sums the volume and time-to-close score components with the value
+    score of the market's previous opportunity. Markets that produced no
+    opportunity last time get 0 for the last term, and markets never
+    analyzed get UNKNOWN_PRIOR_VALUE.
+    
+    Args:
+        markets: Markets to score
+        prior_values: Previous value score per condition ID (None if no opportunity)
+        now: Current time (defaults to now)
+        
+    Returns:
+        np.ndarray: Priority per market, higher first
+    """
+    table = MarketTable.from_markets(markets)
+    prior_values = prior_values or {}
+    prior = np.array([
+        prior_values.get(market.condition_id, UNKNOWN_PRIOR_VALUE) or 0.0
+        for market in markets
+    ], dtype=float)
+    return volume_scores(table.volume) + time_scores(table.days_to_end(now)) + prior
+
+
+def prioritize_markets(
+    markets: List[Market],
+    prior_values: Optional[Mapping[str, Optional[float]]] = None,
+    now: Optional[datetime] = None
+) -> List[Market]:
+    """
+    Order markets by analysis priority, keeping input order among ties.
+    
+    Args:
+        markets: Markets to order
+        prior_values: Previous value score per condition ID (None if no opportunity)
+        now: Current time (defaults to now)
+        
+    Returns:
+        List[Market]: Markets, highest priority first
+    """
+    if not markets:
+        return []
+    order = np.argsort(-priority_scores(markets, prior_values, now), kind="stable")
+    return [markets[i] for i in order]
@@ -2,20 +2,38 @@
 Advanced crypto/financial market modeling with real-time data integration.
 """
 
-import re
 import logging
+import math
 import statistics
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
+from src.clients.market_data.models import CryptoMarketData
+from src.clients.market_data.provider import FileMarketDataProvider, MarketDataProvider
+from src.config.settings import settings
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType, ProbabilityDistribution
+from src.analyzers.monte_carlo import BarrierTouch, MonteCarloEngine, market_key
+from src.analyzers.price_ladder import (
+    PROBABILITY_CEILING,
+    PROBABILITY_FLOOR,
+    AssetDynamics,
+    PriceLadder,
+    exceed_probabilities,
+)
+from src.analyzers.text_patterns import CRYPTO_ASSETS, PRICE_TARGETS, TOUCH_TARGET
 
 logger = logging.getLogger(__name__)
 
+# Annualized drift assumed per asset (slight positive drift for major cryptos)
+ASSET_DRIFTS = {"BTC": 0.2, "ETH": 0.2}
+DEFAULT_DRIFT = 0.1
+
 
 class ETFApprovalStage(Enum):
     """Stages of ETF approval process."""
@@ -39,20 +57,6 @@ class ETFApplication:
     sec_staff_feedback: str  # "positive", "neutral", "negative"
 
 
-@dataclass
-class CryptoMarketData:
-    """Crypto market data for analysis."""
-    symbol: str
-    current_price: float
-    market_cap: float
-    volume_24h: float
-    price_change_7d: float
-    price_change_30d: float
-    volatility_30d: float
-    all_time_high: float
-    distance_from_ath: float
-
-
 @dataclass
 class FinancialIndicators:
     """General financial market indicators."""
@@ -68,9 +72,19 @@ class CryptoFinancialModel:
     Advanced crypto and financial market model using real-time data feeds.
     """
     
-    def __init__(self):
-        """Initialize the crypto/financial model."""
+    def __init__(self, market_data_provider: Optional[MarketDataProvider] = None):
+        """
+        Initialize the crypto/financial model.
+        
+        Args:
+            market_data_provider: Source of asset prices and statistics
+                (the local file in settings.market_data_file if omitted)
+        """
         self.bayesian_updater = BayesianUpdater()
+        if market_data_provider is None:
+            market_data_provider = FileMarketDataProvider(settings.market_data_file)
+        self.market_data_provider = market_data_provider
+        self.monte_carlo = MonteCarloEngine()
         self.etf_approval_history = self._load_etf_approval_history()
         self.crypto_volatility_models = self._load_volatility_models()
         
@@ -206,7 +220,9 @@ class CryptoFinancialModel:
             
         # Calculate base probability using volatility and distance
         base_prob = self._calculate_price_target_base_probability(
-            market_data, target_price, timeframe_days
+            market_data, target_price, timeframe_days,
+            touch=self._is_touch_target(market.question),
+            key=market_key(market.condition_id)
         )
         
         # Create evidence list
@@ -263,24 +279,7 @@ class CryptoFinancialModel:
         question_lower = question.lower()
         
         # Common crypto assets
-        crypto_mapping = {
-            "bitcoin": "BTC",
-            "btc": "BTC", 
-            "ethereum": "ETH",
-            "eth": "ETH",
-            "litecoin": "LTC",
-            "ltc": "LTC",
-            "ripple": "XRP",
-            "xrp": "XRP",
-            "dogecoin": "DOGE",
-            "doge": "DOGE",
-            "cardano": "ADA",
-            "ada": "ADA",
-            "solana": "SOL",
-            "sol": "SOL"
-        }
-        
-        for name, symbol in crypto_mapping.items():
+        for name, symbol in CRYPTO_ASSETS:
             if name in question_lower:
                 return symbol
                 
@@ -368,20 +367,12 @@ class CryptoFinancialModel:
         asset = self._extract_crypto_asset(full_text)
         
         # Extract price target using regex
-        price_patterns = [
-            r'\$([0-9,]+)',  # $100,000
-            r'([0-9,]+)\s*k',  # 100k
-            r'([0-9,]+)\s*thousand',  # 100 thousand
-        ]
-        
         target_price = None
-        for pattern in price_patterns:
-            match = re.search(pattern, full_text)
+        for pattern, multiplier in PRICE_TARGETS:
+            match = pattern.search(full_text)
             if match:
                 price_str = match.group(1).replace(',', '')
-                target_price = float(price_str)
-                if 'k' in pattern or 'thousand' in pattern:
-                    target_price *= 1000
+                target_price = float(price_str) * multiplier
                 break
                 
         if not target_price:
@@ -399,78 +390,146 @@ class CryptoFinancialModel:
             
         return (asset, target_price, timeframe_days)
         
+    def _is_touch_target(self, question: str) -> bool:
+        """Check whether a target is met by trading at the price once before expiry."""
+        return TOUCH_TARGET.search(question.lower()) is not None
+        
     def _get_crypto_market_data(self, asset: str) -> Optional[CryptoMarketData]:
         """
         Get current crypto market data.
-        Note: Placeholder - in production would use CoinGecko/CoinMarketCap API.
+        
+        Snapshots are precomputed by the provider on each price tick.
+        
+        Args:
+            asset: Asset symbol
+            
+        Returns:
+            Optional[CryptoMarketData]: Latest snapshot, None for unknown assets
         """
-        # Simulate current market data
-        market_data = {
-            "BTC": CryptoMarketData(
-                symbol="BTC",
-                current_price=67000.0,
-                market_cap=1.3e12,
-                volume_24h=25e9,
-                price_change_7d=0.05,
-                price_change_30d=0.12,
-                volatility_30d=0.65,
-                all_time_high=73000.0,
-                distance_from_ath=-0.08
-            ),
-            "ETH": CryptoMarketData(
-                symbol="ETH",
-                current_price=3500.0,
-                market_cap=420e9,
-                volume_24h=12e9,
-                price_change_7d=0.03,
-                price_change_30d=0.08,
-                volatility_30d=0.70,
-                all_time_high=4800.0,
-                distance_from_ath=-0.27
-            )
-        }
+        return self.market_data_provider.get(asset)
+        
+    def _asset_dynamics(self, market_data: CryptoMarketData) -> AssetDynamics:
+        """
+        Get the spot, drift and volatility used to price an asset's targets.
         
-        return market_data.get(asset)
+        Args:
+            market_data: Current market data of the asset
+            
+        Returns:
+            AssetDynamics: Lognormal dynamics of the asset
+        """
+        return AssetDynamics(
+            spot=market_data.current_price,
+            drift=ASSET_DRIFTS.get(market_data.symbol, DEFAULT_DRIFT),
+            volatility=market_data.volatility_30d
+        )
         
     def _calculate_price_target_base_probability(
         self, 
         market_data: CryptoMarketData, 
         target_price: float, 
-        timeframe_days: int
+        timeframe_days: int,
+        touch: bool = False,
+        key: int = 0
     ) -> float:
-        """Calculate base probability for reaching price target."""
+        """
+        Calculate base probability of reaching a price target.
         
-        current_price = market_data.current_price
-        required_return = (target_price / current_price) - 1
+        Args:
+            market_data: Current market data of the asset
+            target_price: Target price
+            timeframe_days: Days to expiry
+            touch: Whether trading at the target once is enough; otherwise the
+                price must end at or above it
+            key: Seed key of the market's simulated paths (touch targets only)
+            
+        Returns:
+            float: Base probability
+        """
+        dynamics = self._asset_dynamics(market_data)
+        if touch:
+            return float(self._touch_probabilities([dynamics], [target_price], [timeframe_days], [key])[0])
+        return float(exceed_probabilities(
+            dynamics.spot, target_price, timeframe_days, dynamics.drift, dynamics.volatility
+        ))
+        
+    def _touch_probabilities(
+        self,
+        dynamics: List[AssetDynamics],
+        targets: List[float],
+        days: List[int],
+        keys: List[int]
+    ) -> np.ndarray:
+        """
+        Simulate the probability of each target trading before expiry.
         
-        # Use geometric Brownian motion approximation
-        # Adjust for crypto-specific drift and volatility
-        annual_volatility = market_data.volatility_30d * (365/30)**0.5
-        timeframe_years = timeframe_days / 365.0
+        Args:
+            dynamics: Dynamics of each target's asset
+            targets: Target prices
+            days: Days to expiry
+            keys: Seed key per target
+            
+        Returns:
+            np.ndarray: Probability per target within the ladder's bounds
+        """
+        paths = BarrierTouch(
+            spot=[d.spot for d in dynamics],
+            barrier=targets,
+            days=days,
+            drift=[d.drift for d in dynamics],
+            volatility=[d.volatility for d in dynamics]
+        )
+        result = self.monte_carlo.run(paths, keys)
+        return np.clip(result.probabilities, PROBABILITY_FLOOR, PROBABILITY_CEILING)
         
-        # Simplified probability calculation using normal approximation
-        # P(return > required_return) in timeframe
-        import math
+    def calculate_price_target_base_probabilities(self, markets: List[Market]) -> List[Optional[float]]:
+        """
+        Calculate base probabilities for a batch of price-target markets.
         
-        # Assume slight positive drift for major cryptos
-        annual_drift = 0.2 if market_data.symbol in ["BTC", "ETH"] else 0.1
+        Targets ending above a price are priced as one ladder and targets
+        reached at any point as one Monte Carlo batch, with market data and
+        dynamics looked up once per asset.
         
-        expected_return = annual_drift * timeframe_years
-        volatility_adjusted = annual_volatility * math.sqrt(timeframe_years)
+        Args:
+            markets: Markets to price
         
-        # Z-score calculation
-        z_score = (required_return - expected_return) / volatility_adjusted
+        Returns:
+            List[Optional[float]]: Base probability per market, None without a
+            target or market data
+        """
+        ladder = PriceLadder()
+        rows: List[Optional[int]] = []
+        touches: List[Tuple[int, str, float, int, int]] = []
+        for i, market in enumerate(markets):
+            target_data = self._extract_price_target(market.question, market.description)
+            row = None
+            if target_data and self._is_touch_target(market.question):
+                touches.append((i, *target_data, market_key(market.condition_id)))
+            elif target_data:
+                row = ladder.add(*target_data)
+            rows.append(row)
+        
+        dynamics = {}
+        for asset in set(ladder.assets) | {touch[1] for touch in touches}:
+            market_data = self._get_crypto_market_data(asset)
+            if market_data:
+                dynamics[asset] = self._asset_dynamics(market_data)
+        
+        probabilities = ladder.price(dynamics)
+        results = [
+            None if row is None or math.isnan(probabilities[row]) else float(probabilities[row])
+            for row in rows
+        ]
         
-        # Convert to probability (rough normal approximation)
-        if z_score < -3:
-            probability = 0.95
-        elif z_score > 3:
-            probability = 0.05
-        else:
-            # Simple sigmoid approximation
-            probability = 1 / (1 + math.exp(z_score))
-            
-        return max(0.01, min(0.99, probability))
+        touches = [touch for touch in touches if touch[1] in dynamics]
+        if touches:
+            indices, assets, targets, days, keys = zip(*touches, strict=True)
+            touch_probabilities = self._touch_probabilities(
+                [dynamics[asset] for asset in assets], list(targets), list(days), list(keys)
+            )
+            for i, probability in zip(indices, touch_probabilities, strict=True):
+                results[i] = float(probability)
+        return results
         
     def _calculate_technical_analysis_signal(self, market_data: CryptoMarketData) -> float:
         """Calculate technical analysis signal."""
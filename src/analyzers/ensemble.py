@@ -0,0 +1,293 @@
+"""
+Single-pass ensemble of the pattern analyzers.
+
+Every pattern analyzer sees the same market features, so instead of
+running the whole analysis once per analyzer, AnalyzerEnsemble runs each
+of them on a market in turn and keeps all verdicts. Its mode picks which
+verdict flows on as the pattern match: one analyzer's, or the combined
+pick. The verdicts of the last run stay available for every analyzer
+through matches(), so a mode's match count needs no re-analysis.
+Switching mode does not rebuild opportunities already built from the old
+verdicts; the mode is part of MarketAnalyzer's incremental config key, so
+the next run re-analyzes every market.
+
+The combined pick takes the side (YES or NO) backed by more analyzers
+and, on that side, the verdict with the highest edge x confidence,
+earlier analyzers winning ties. Analyzers split evenly between sides
+give no pick.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.analyzers.flexible_analyzer import FlexibleAnalyzer
+from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+from src.analyzers.prefilter import gate_all
+from src.analyzers.refined_simple_analyzer import RefinedSimpleAnalyzer
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity, SimplePatternAnalyzer
+from src.clients.polymarket.market_features import MarketFeatures
+from src.clients.polymarket.market_table import MarketTable
+from src.clients.polymarket.models import Market, MarketPrice
+
+# Mode returning the combined pick instead of one analyzer's verdict
+COMBINED = "combined"
+
+# Actions that back the YES side, as in MarketAnalyzer
+YES_ACTIONS = ("BUY_YES", "SELL_NO")
+
+
+def default_analyzers() -> Dict[str, object]:
+    """
+    Build the standard pattern analyzers in priority order.
+    
+    Returns:
+        Dict[str, object]: Analyzers keyed by name
+    """
+    return {
+        "flexible": FlexibleAnalyzer(),
+        "simple": SimplePatternAnalyzer(),
+        "high_confidence": HighConfidenceAnalyzer(),
+        "refined": RefinedSimpleAnalyzer(),
+    }
+
+
+@dataclass
+class AnalyzerLatency:
+    """Calls, matches and time spent in one analyzer."""
+    calls: int = 0
+    matches: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def mean_us(self) -> float:
+        """
+        Get the mean time per call.
+        
+        Returns:
+            float: Microseconds per call (0 when never called)
+        """
+        return self.seconds / self.calls * 1e6 if self.calls else 0.0
+
+
+@dataclass
+class EnsembleVerdict:
+    """Every analyzer's verdict on one market and the combined pick."""
+    verdicts: Dict[str, Optional[SimpleOpportunity]]
+    pick: Optional[SimpleOpportunity] = None
+    pick_analyzer: Optional[str] = None
+    agreement: int = 0  # Analyzers backing the pick's side
+    
+    def view(self, mode: str) -> Optional[SimpleOpportunity]:
+        """
+        Get the verdict for a mode.
+        
+        Args:
+            mode: Analyzer name or COMBINED
+            
+        Returns:
+            Optional[SimpleOpportunity]: Verdict, or None if no match
+        """
+        if mode == COMBINED:
+            return self.pick
+        return self.verdicts[mode]
+
+
+def combine(verdicts: Dict[str, Optional[SimpleOpportunity]]) -> EnsembleVerdict:
+    """
+    Pick one verdict from several analyzers.
+    
+    Args:
+        verdicts: Verdicts keyed by analyzer name, in priority order
+        
+    Returns:
+        EnsembleVerdict: Verdicts with the combined pick
+    """
+    sides: Dict[bool, List[Tuple[str, SimpleOpportunity]]] = {True: [], False: []}
+    for name, opportunity in verdicts.items():
+        if opportunity is not None:
+            sides[opportunity.recommended_action in YES_ACTIONS].append((name, opportunity))
+            
+    yes, no = sides[True], sides[False]
+    if len(yes) == len(no):
+        return EnsembleVerdict(verdicts=verdicts)
+    backing = yes if len(yes) > len(no) else no
+    
+    pick_analyzer, pick = backing[0]
+    for name, opportunity in backing[1:]:
+        if opportunity.edge * opportunity.confidence > pick.edge * pick.confidence:
+            pick_analyzer, pick = name, opportunity
+    return EnsembleVerdict(
+        verdicts=verdicts, pick=pick, pick_analyzer=pick_analyzer, agreement=len(backing)
+    )
+
+
+class AnalyzerEnsemble:
+    """
+    Runs several pattern analyzers over shared features in one pass.
+    
+    It is a pattern analyzer itself, so MarketAnalyzer can use it in
+    place of a single one.
+    """
+    
+    def __init__(self, analyzers: Optional[Dict[str, object]] = None, mode: str = COMBINED):
+        """
+        Initialize the ensemble.
+        
+        Args:
+            analyzers: Analyzers keyed by name, in priority order (standard set if omitted)
+            mode: Analyzer name whose verdict analyze_market returns, or COMBINED
+        """
+        self.analyzers = analyzers if analyzers is not None else default_analyzers()
+        self.mode = mode
+        self.latency = {name: AnalyzerLatency() for name in self.analyzers}
+        self.verdicts: Dict[str, EnsembleVerdict] = {}
+        
+    @property
+    def mode(self) -> str:
+        """Analyzer name whose verdict analyze_market returns, or COMBINED."""
+        return self._mode
+        
+    @mode.setter
+    def mode(self, mode: str) -> None:
+        if mode != COMBINED and mode not in self.analyzers:
+            raise ValueError(f"Unknown ensemble mode: {mode}")
+        self._mode = mode
+        
+    def prefilter(self, table: MarketTable, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Mask the markets that at least one analyzer can match on numbers alone.
+        
+        Every analyzer's verdict is kept whatever the mode, so the mask is
+        the union over all of them.
+        
+        Args:
+            table: Markets with their prices
+            now: Reference time for days left (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Boolean mask over the table's rows
+        """
+        return gate_all(*(analyzer.prefilter(table, now) for analyzer in self.analyzers.values()))
+        
+    def evaluate(
+        self,
+        market: Market,
+        price: MarketPrice,
+        features: Optional[MarketFeatures] = None
+    ) -> EnsembleVerdict:
+        """
+        Run every analyzer on a market and combine their verdicts.
+        
+        Args:
+            market: Market to analyze
+            price: Current market price
+            features: Precomputed market features (derived here if omitted)
+            
+        Returns:
+            EnsembleVerdict: Every verdict and the combined pick
+        """
+        features = features or MarketFeatures.from_market(market, price)
+        verdicts = {}
+        for name, analyzer in self.analyzers.items():
+            latency = self.latency[name]
+            start = time.perf_counter()
+            opportunity = analyzer.analyze_market(market, price, features=features)
+            latency.seconds += time.perf_counter() - start
+            latency.calls += 1
+            if opportunity is not None:
+                latency.matches += 1
+            verdicts[name] = opportunity
+            
+        verdict = combine(verdicts)
+        self.verdicts[market.condition_id] = verdict
+        return verdict
+        
+    def analyze_market(
+        self,
+        market: Market,
+        price: MarketPrice,
+        features: Optional[MarketFeatures] = None
+    ) -> Optional[SimpleOpportunity]:
+        """
+        Analyze a market and return the verdict for the current mode.
+        
+        Args:
+            market: Market to analyze
+            price: Current market price
+            features: Precomputed market features (derived here if omitted)
+            
+        Returns:
+            Optional[SimpleOpportunity]: Verdict for the mode, or None
+        """
+        return self.evaluate(market, price, features).view(self.mode)
+        
+    def calculate_fair_value(self, opportunity: SimpleOpportunity) -> Tuple[float, float]:
+        """
+        Calculate fair value with the analyzer that produced the opportunity.
+        
+        Args:
+            opportunity: Verdict from this ensemble
+            
+        Returns:
+            Tuple[float, float]: Fair YES and NO prices
+        """
+        name = self.owner(opportunity) or next(iter(self.analyzers))
+        return self.analyzers[name].calculate_fair_value(opportunity)
+        
+    def owner(self, opportunity: SimpleOpportunity) -> Optional[str]:
+        """
+        Find the analyzer that produced an opportunity.
+        
+        Args:
+            opportunity: Verdict from this ensemble
+            
+        Returns:
+            Optional[str]: Analyzer name, or None if the opportunity is not from the last run
+        """
+        verdict = self.verdicts.get(opportunity.market.condition_id)
+        if verdict is None:
+            return None
+        for name, candidate in verdict.verdicts.items():
+            if candidate is opportunity:
+                return name
+        return None
+        
+    def matches(self, mode: str) -> List[SimpleOpportunity]:
+        """
+        Get the last run's matches for a mode without re-analyzing.
+        
+        Args:
+            mode: Analyzer name or COMBINED
+            
+        Returns:
+            List[SimpleOpportunity]: Matches in the order markets were analyzed
+        """
+        return [
+            opportunity for opportunity in (verdict.view(mode) for verdict in self.verdicts.values())
+            if opportunity is not None
+        ]
+        
+    def reset(self) -> None:
+        """Forget the last run's verdicts and latency counters."""
+        self.verdicts.clear()
+        for latency in self.latency.values():
+            latency.calls = latency.matches = 0
+            latency.seconds = 0.0
+            
+    def summary(self) -> str:
+        """
+        Describe per-analyzer latency and matches in one line.
+        
+        Returns:
+            str: Human-readable summary
+        """
+        parts = [
+            f"{name} {latency.mean_us:.0f}us/market, {latency.matches} matches"
+            for name, latency in self.latency.items()
+        ]
+        picks = sum(1 for verdict in self.verdicts.values() if verdict.pick is not None)
+        return f"{len(self.verdicts)} markets, {picks} combined picks ({'; '.join(parts)})"
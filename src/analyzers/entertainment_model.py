@@ -2,7 +2,6 @@
 Advanced entertainment and awards market modeling.
 """
 
-import re
 import logging
 import statistics
 from datetime import datetime, timedelta, timezone
@@ -13,6 +12,8 @@ from enum import Enum
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType, ProbabilityDistribution
+from src.analyzers.text_patterns import AWARDS, BOX_OFFICE, CELEBRITY_EVENTS, SHOW_RENEWAL, first_match
+from src.utils.reference_data import ReferenceTable, load_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -462,40 +463,24 @@ class EntertainmentMarketModel:
     def _extract_awards_info(self, question: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract nominee and category from awards market question."""
         # Common patterns for awards markets
-        patterns = [
-            r"Will (.+) win Best (.+)",
-            r"(.+) to win (.+) award",
-            r"(.+) for Best (.+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                return match.group(1).strip(), match.group(2).strip()
+        match = first_match(AWARDS, question)
+        if match:
+            return match.group(1).strip(), match.group(2).strip()
                 
         return None, None
         
     def _extract_show_name(self, question: str) -> Optional[str]:
         """Extract TV show name from market question."""
-        patterns = [
-            r"Will (.+) be renewed",
-            r"(.+) renewal",
-            r"(.+) cancelled",
-            r"(.+) get another season"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        match = first_match(SHOW_RENEWAL, question)
+        if match:
+            return match.group(1).strip()
                 
         return None
         
     def _extract_box_office_info(self, question: str) -> Tuple[Optional[str], Optional[float]]:
         """Extract movie title and box office target."""
         # Pattern to find movie title and dollar amount
-        pattern = r"Will (.+) gross over \$([0-9,]+)"
-        match = re.search(pattern, question, re.IGNORECASE)
+        match = BOX_OFFICE.search(question)
         
         if match:
             movie = match.group(1).strip()
@@ -506,16 +491,10 @@ class EntertainmentMarketModel:
         
     def _extract_celebrity_event_info(self, question: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract celebrity name and event type."""
-        event_patterns = {
-            "marriage": ["marry", "married", "wedding"],
-            "divorce": ["divorce", "split", "separate"],
-            "baby": ["pregnant", "baby", "child"],
-            "retirement": ["retire", "quit", "leave"]
-        }
-        
-        for event_type, keywords in event_patterns.items():
+        question_lower = question.lower()
+        for event_type, keywords in CELEBRITY_EVENTS:
             for keyword in keywords:
-                if keyword in question.lower():
+                if keyword in question_lower:
                     # Extract celebrity name (usually at start)
                     words = question.split()
                     if len(words) >= 2:
@@ -867,9 +846,9 @@ class EntertainmentMarketModel:
         return self.bayesian_updater._create_distribution_from_point(base_prob, confidence=0.4)
         
     # Placeholder data loading methods
-    def _load_awards_databases(self) -> Dict:
-        """Load awards historical data."""
-        return {}
+    def _load_awards_databases(self) -> ReferenceTable:
+        """Load awards historical data (records by lowercase nominee)."""
+        return load_reference_data().table("awards")
         
     def _load_box_office_patterns(self) -> Dict:
         """Load box office performance patterns."""
@@ -3,29 +3,65 @@ Sophisticated fair value calculation engine.
 Replaces the naive 50% baseline with intelligent base rates.
 """
 
+import asyncio
 import logging
 import re
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from src.clients.polymarket.market_features import FeatureStore, MarketFeatures
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
-from src.analyzers.llm_news_analyzer import LLMNewsAnalyzer
-from src.analyzers.market_categorizer import MarketCategorizer
+from src.analyzers.market_classifier import Classification, MarketClassifier, MarketFamily
+from src.analyzers.news_index import NewsKeywordIndex
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType
-from src.analyzers.political_model import PoliticalMarketModel
-from src.analyzers.crypto_model import CryptoFinancialModel
-from src.analyzers.sports_model import SportsMarketModel
-from src.analyzers.entertainment_model import EntertainmentMarketModel
-from src.analyzers.weather_model import WeatherClimateModel
-from src.analyzers.technology_model import TechnologyMarketModel
-from src.analyzers.sanity_checker import SanityChecker
-from src.analyzers.kelly_criterion import KellyCriterion
-from src.analyzers.backtesting import BacktestingEngine
+from src.utils.lazy import LazyComponent
 
 logger = logging.getLogger(__name__)
 
+# Domain model per family: engine attribute, method, reasoning and name for logs
+DOMAIN_MODELS = {
+    MarketFamily.POLITICAL: (
+        "political_model", "calculate_political_probability",
+        "Advanced political model with polling/fundamentals", "Political"
+    ),
+    MarketFamily.CRYPTO: (
+        "crypto_model", "calculate_crypto_probability",
+        "Advanced crypto/financial model with market data", "Crypto"
+    ),
+    MarketFamily.SPORTS: (
+        "sports_model", "calculate_sports_probability",
+        "Advanced sports model with performance data", "Sports"
+    ),
+    MarketFamily.ENTERTAINMENT: (
+        "entertainment_model", "calculate_entertainment_probability",
+        "Advanced entertainment model with industry data", "Entertainment"
+    ),
+    MarketFamily.WEATHER: (
+        "weather_model", "calculate_weather_probability",
+        "Advanced weather/climate model with meteorological data", "Weather"
+    ),
+    MarketFamily.TECHNOLOGY: (
+        "technology_model", "calculate_technology_probability",
+        "Advanced technology model with industry tracking", "Technology"
+    ),
+}
+
+# Base-rate rule per family
+BASE_RATE_RULES = {
+    MarketFamily.MULTI_PARTY: "_calculate_multi_party_probability",
+    MarketFamily.CONSTITUTIONAL: "_calculate_constitutional_probability",
+    MarketFamily.POLITICAL: "_calculate_political_binary_probability",
+    MarketFamily.CRYPTO: "_calculate_crypto_probability",
+    MarketFamily.SPORTS: "_calculate_sports_probability",
+    MarketFamily.ENTERTAINMENT: "_calculate_entertainment_probability",
+    MarketFamily.WEATHER: "_calculate_weather_climate_probability",
+    MarketFamily.TECHNOLOGY: "_calculate_technology_probability",
+    MarketFamily.CORPORATE: "_calculate_corporate_probability",
+    MarketFamily.RARE_EVENT: "_calculate_rare_event_probability",
+}
+
 
 @dataclass
 class BaseRateData:
@@ -41,29 +77,104 @@ class FairValueEngine:
     """
     Advanced fair value calculation using historical base rates,
     market fundamentals, and intelligent probability estimation.
+    
+    Sub-models are built, and their modules imported, on first use, so a
+    run only pays for the market types it touches.
     """
     
+    llm_news_analyzer = LazyComponent("src.analyzers.llm_news_analyzer", "LLMNewsAnalyzer")
+    categorizer = LazyComponent("src.analyzers.market_categorizer", "MarketCategorizer")
+    political_model = LazyComponent("src.analyzers.political_model", "PoliticalMarketModel")
+    crypto_model = LazyComponent("src.analyzers.crypto_model", "CryptoFinancialModel")
+    sports_model = LazyComponent("src.analyzers.sports_model", "SportsMarketModel")
+    entertainment_model = LazyComponent("src.analyzers.entertainment_model", "EntertainmentMarketModel")
+    weather_model = LazyComponent("src.analyzers.weather_model", "WeatherClimateModel")
+    technology_model = LazyComponent("src.analyzers.technology_model", "TechnologyMarketModel")
+    sanity_checker = LazyComponent("src.analyzers.sanity_checker", "SanityChecker")
+    kelly_criterion = LazyComponent("src.analyzers.kelly_criterion", "KellyCriterion")
+    backtesting_engine = LazyComponent("src.analyzers.backtesting", "BacktestingEngine")
+    
     def __init__(self):
         """Initialize the fair value engine."""
         self.base_rates = self._load_base_rates()
         self.market_patterns = self._load_market_patterns()
-        self.llm_news_analyzer = LLMNewsAnalyzer()
-        self.categorizer = MarketCategorizer()
         self.bayesian_updater = BayesianUpdater()
-        self.political_model = PoliticalMarketModel()
-        self.crypto_model = CryptoFinancialModel()
-        self.sports_model = SportsMarketModel()
-        self.entertainment_model = EntertainmentMarketModel()
-        self.weather_model = WeatherClimateModel()
-        self.technology_model = TechnologyMarketModel()
-        self.sanity_checker = SanityChecker()
-        self.kelly_criterion = KellyCriterion()
-        self.backtesting_engine = BacktestingEngine()
+        # Kept across runs; entries are keyed by market text
+        self.classifier = MarketClassifier()
+        # Set to a run's store to share market features with the rest of the run
+        self.features: Optional[FeatureStore] = None
+        
+    def _market_features(self, market: Market) -> MarketFeatures:
+        """
+        Get the features of a market, from the run's store if one is set.
+        
+        Args:
+            market: Market to describe
+            
+        Returns:
+            MarketFeatures: Market features
+        """
+        if self.features is None:
+            return MarketFeatures.from_market(market)
+        return self.features.get(market)
+        
+    def _classify(self, market: Market) -> Classification:
+        """
+        Get the families and routes of a market, cached across runs.
+        
+        Args:
+            market: Market to classify
+            
+        Returns:
+            Classification: Families and routes
+        """
+        return self.classifier.classify(market, self.features)
+        
+    async def calculate_fair_values(
+        self,
+        markets: List[Market],
+        news_index: Optional[NewsKeywordIndex]
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Calculate fair values for a batch of markets concurrently.
+        
+        Each market's related news is looked up in the index with the news
+        analyzer's keywords. All markets are scheduled at once, so their
+        LLM news analyses overlap (capped by settings.llm_max_concurrency)
+        while CPU-only steps of other markets run. A market listed twice
+        is computed once, and an article is analyzed once per question
+        text in the batch.
+        
+        Args:
+            markets: Markets to analyze
+            news_index: Index over the run's articles (None for no news)
+            
+        Returns:
+            List[Tuple[float, float, str]]: (fair_yes_price, fair_no_price, reasoning) per market, in order
+        """
+        pairs: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        tasks: Dict[Tuple[str, str], asyncio.Future] = {}
+        for market in markets:
+            key = MarketClassifier.key(market)
+            if key not in tasks:
+                news_articles = (
+                    news_index.find(self.llm_news_analyzer._extract_market_keywords(market))
+                    if news_index is not None else []
+                )
+                tasks[key] = asyncio.ensure_future(self.calculate_fair_value(market, news_articles, pairs=pairs))
+                
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return [tasks[MarketClassifier.key(market)].result() for market in markets]
         
     async def calculate_fair_value(
         self, 
         market: Market, 
-        news_articles: List[NewsArticle]
+        news_articles: List[NewsArticle],
+        pairs: Optional[Dict[Tuple[str, str, str], asyncio.Future]] = None
     ) -> Tuple[float, float, str]:
         """
         Calculate sophisticated fair value for a market using Bayesian updating.
@@ -71,66 +182,24 @@ class FairValueEngine:
         Args:
             market: Market to analyze
             news_articles: Related news articles
+            pairs: LLM article analyses shared across a batch
             
         Returns:
             Tuple[float, float, str]: (fair_yes_price, fair_no_price, reasoning)
         """
-        # Check if this is a political market that can use advanced modeling
-        if self._is_political_binary(market) and not self._is_constitutional_amendment(market):
-            try:
-                distribution = self.political_model.calculate_political_probability(market, news_articles)
-                reasoning = self._generate_bayesian_reasoning(distribution, "Advanced political model with polling/fundamentals")
-                return self._apply_sanity_checks(market, distribution.mean, 1.0 - distribution.mean, reasoning)
-            except Exception as e:
-                logger.warning(f"Political model failed, falling back to standard approach: {e}")
-        
-        # Check if this is a crypto/financial market that can use advanced modeling
-        if self._is_crypto_financial(market):
+        # One classification routes to every domain model that applies; a
+        # model that fails hands over to the next one
+        for family in self._classify(market).domain_models:
+            attribute, method, label, name = DOMAIN_MODELS[family]
             try:
-                distribution = self.crypto_model.calculate_crypto_probability(market, news_articles)
-                reasoning = self._generate_bayesian_reasoning(distribution, "Advanced crypto/financial model with market data")
+                distribution = getattr(getattr(self, attribute), method)(market, news_articles)
+                reasoning = self._generate_bayesian_reasoning(distribution, label)
                 return self._apply_sanity_checks(market, distribution.mean, 1.0 - distribution.mean, reasoning)
             except Exception as e:
-                logger.warning(f"Crypto model failed, falling back to standard approach: {e}")
-        
-        # Check if this is a sports market that can use advanced modeling
-        if self._is_sports_event(market):
-            try:
-                distribution = self.sports_model.calculate_sports_probability(market, news_articles)
-                reasoning = self._generate_bayesian_reasoning(distribution, "Advanced sports model with performance data")
-                return self._apply_sanity_checks(market, distribution.mean, 1.0 - distribution.mean, reasoning)
-            except Exception as e:
-                logger.warning(f"Sports model failed, falling back to standard approach: {e}")
-        
-        # Check if this is an entertainment market that can use advanced modeling
-        if self._is_entertainment_event(market):
-            try:
-                distribution = self.entertainment_model.calculate_entertainment_probability(market, news_articles)
-                reasoning = self._generate_bayesian_reasoning(distribution, "Advanced entertainment model with industry data")
-                return self._apply_sanity_checks(market, distribution.mean, 1.0 - distribution.mean, reasoning)
-            except Exception as e:
-                logger.warning(f"Entertainment model failed, falling back to standard approach: {e}")
-        
-        # Check if this is a weather/climate market that can use advanced modeling
-        if self._is_weather_climate_event(market):
-            try:
-                distribution = self.weather_model.calculate_weather_probability(market, news_articles)
-                reasoning = self._generate_bayesian_reasoning(distribution, "Advanced weather/climate model with meteorological data")
-                return self._apply_sanity_checks(market, distribution.mean, 1.0 - distribution.mean, reasoning)
-            except Exception as e:
-                logger.warning(f"Weather model failed, falling back to standard approach: {e}")
-        
-        # Check if this is a technology market that can use advanced modeling
-        if self._is_technology_event(market):
-            try:
-                distribution = self.technology_model.calculate_technology_probability(market, news_articles)
-                reasoning = self._generate_bayesian_reasoning(distribution, "Advanced technology model with industry tracking")
-                return self._apply_sanity_checks(market, distribution.mean, 1.0 - distribution.mean, reasoning)
-            except Exception as e:
-                logger.warning(f"Technology model failed, falling back to standard approach: {e}")
+                logger.warning(f"{name} model failed, falling back to standard approach: {e}")
         
         # Use standard approach with Bayesian updating for other markets
-        yes_prob, no_prob, reasoning = await self._calculate_standard_fair_value(market, news_articles)
+        yes_prob, no_prob, reasoning = await self._calculate_standard_fair_value(market, news_articles, pairs)
         
         # Apply sanity checking to the final result
         return self._apply_sanity_checks(market, yes_prob, no_prob, reasoning)
@@ -151,7 +220,8 @@ class FairValueEngine:
             market=market,
             predicted_probability=yes_prob,
             confidence=confidence,
-            reasoning=reasoning
+            reasoning=reasoning,
+            features=self._market_features(market)
         )
         
         # Adjust probability if needed
@@ -176,19 +246,36 @@ class FairValueEngine:
     async def _calculate_standard_fair_value(
         self, 
         market: Market, 
-        news_articles: List[NewsArticle]
+        news_articles: List[NewsArticle],
+        pairs: Optional[Dict[Tuple[str, str, str], asyncio.Future]] = None
     ) -> Tuple[float, float, str]:
         """Calculate fair value using standard approach with Bayesian updating."""
         
-        # Step 1: Get intelligent base probability
-        base_prob, base_reasoning = self._get_base_probability(market)
-        is_constitutional = self._is_constitutional_amendment(market)
+        # Start the news analysis first; the CPU-only steps below run while
+        # its LLM calls are outstanding
+        if pairs is None:
+            news_task = asyncio.ensure_future(self._calculate_llm_news_adjustment(news_articles, market))
+        else:
+            news_task = asyncio.ensure_future(self._calculate_llm_news_adjustment(news_articles, market, pairs))
+        try:
+            # Step 1: Get intelligent base probability
+            base_prob, base_reasoning = self._get_base_probability(market)
+            classification = self._classify(market)
+            is_constitutional = classification.has(MarketFamily.CONSTITUTIONAL)
+            
+            time_adjustment, time_reasoning = (
+                self._calculate_time_adjustment(market) if not is_constitutional else (0.0, "")
+            )
+            market_adjustment, market_reasoning = self._calculate_market_adjustment(market)
+            
+            news_adjustment, news_reasoning = await news_task
+        finally:
+            news_task.cancel()
         
         # Step 2: Create evidence list for Bayesian updating
         evidence_list = []
         
         # Add news evidence
-        news_adjustment, news_reasoning = await self._calculate_llm_news_adjustment(news_articles, market)
         if abs(news_adjustment) > 0.01:
             evidence_list.append(self.bayesian_updater.create_evidence(
                 evidence_type=EvidenceType.NEWS_SENTIMENT,
@@ -199,21 +286,18 @@ class FairValueEngine:
                 source="news_analyzer"
             ))
         
-        # Add time-based evidence (skip for constitutional amendments)
-        if not is_constitutional:
-            time_adjustment, time_reasoning = self._calculate_time_adjustment(market)
-            if abs(time_adjustment) > 0.01:
-                evidence_list.append(self.bayesian_updater.create_evidence(
-                    evidence_type=EvidenceType.TIME_DECAY,
-                    positive_signal=time_adjustment > 0,
-                    strength=min(abs(time_adjustment) * 20, 1.0),  # Scale to 0-1
-                    confidence=0.7,
-                    description=f"Time factors: {time_reasoning}",
-                    source="time_analysis"
-                ))
+        # Add time-based evidence (skipped for constitutional amendments)
+        if abs(time_adjustment) > 0.01:
+            evidence_list.append(self.bayesian_updater.create_evidence(
+                evidence_type=EvidenceType.TIME_DECAY,
+                positive_signal=time_adjustment > 0,
+                strength=min(abs(time_adjustment) * 20, 1.0),  # Scale to 0-1
+                confidence=0.7,
+                description=f"Time factors: {time_reasoning}",
+                source="time_analysis"
+            ))
         
         # Add market behavior evidence
-        market_adjustment, market_reasoning = self._calculate_market_adjustment(market)
         if abs(market_adjustment) > 0.01:
             evidence_list.append(self.bayesian_updater.create_evidence(
                 evidence_type=EvidenceType.MARKET_BEHAVIOR,
@@ -227,7 +311,7 @@ class FairValueEngine:
         # Use Bayesian updating to combine evidence
         if evidence_list:
             # Determine market type for proper evidence weighting
-            market_type = self._determine_market_type(market)
+            market_type = classification.market_type
             distribution = self.bayesian_updater.update_probability(
                 prior=base_prob,
                 evidence_list=evidence_list,
@@ -243,20 +327,7 @@ class FairValueEngine:
         
     def _determine_market_type(self, market: Market) -> str:
         """Determine market type for evidence weighting."""
-        if self._is_political_binary(market):
-            return "political"
-        elif self._is_crypto_financial(market):
-            return "crypto"
-        elif self._is_sports_event(market):
-            return "sports"
-        elif self._is_entertainment_event(market):
-            return "entertainment"
-        elif self._is_weather_climate_event(market):
-            return "weather"
-        elif self._is_technology_event(market):
-            return "technology"
-        else:
-            return "general"
+        return self._classify(market).market_type
             
     def _generate_bayesian_reasoning(self, distribution, base_reasoning: str) -> str:
         """Generate reasoning for Bayesian probability distribution."""
@@ -278,47 +349,9 @@ class FairValueEngine:
         Returns:
             Tuple[float, str]: (base_probability, reasoning)
         """
-        question_lower = market.question.lower()
-        
-        # Political Elections - Multi-party systems
-        if self._is_multi_party_election(market):
-            return self._calculate_multi_party_probability(market)
-            
-        # Constitutional Amendments (must come before general political)
-        if self._is_constitutional_amendment(market):
-            return self._calculate_constitutional_probability(market)
-            
-        # Binary Political Events
-        if self._is_political_binary(market):
-            return self._calculate_political_binary_probability(market)
-            
-        # Crypto/Financial Events
-        if self._is_crypto_financial(market):
-            return self._calculate_crypto_probability(market)
-            
-        # Sports Events
-        if self._is_sports_event(market):
-            return self._calculate_sports_probability(market)
-            
-        # Entertainment Events
-        if self._is_entertainment_event(market):
-            return self._calculate_entertainment_probability(market)
-            
-        # Weather/Climate Events
-        if self._is_weather_climate_event(market):
-            return self._calculate_weather_climate_probability(market)
-            
-        # Technology Events
-        if self._is_technology_event(market):
-            return self._calculate_technology_probability(market)
-            
-        # Corporate/Business Events
-        if self._is_corporate_event(market):
-            return self._calculate_corporate_probability(market)
-            
-        # Natural Disasters/Rare Events
-        if self._is_rare_event(market):
-            return self._calculate_rare_event_probability(market)
+        subtype = self._classify(market).subtype
+        if subtype is not None:
+            return getattr(self, BASE_RATE_RULES[subtype])(market)
             
         # Use learning categorizer for unknown types
         category, baseline_prob, reasoning = self.categorizer.categorize_market(market)
@@ -326,20 +359,11 @@ class FairValueEngine:
         
     def _is_multi_party_election(self, market: Market) -> bool:
         """Check if this is a multi-party election market."""
-        question = market.question.lower()
-        has_election_phrase = any(phrase in question for phrase in [
-            "most seats", "win the most", "hold the most", "plurality", "largest party"
-        ])
-        has_party_indicator = any(party in question for party in [
-            "ldp", "cdp", "party", "democratic", "republican", "conservative", "liberal",
-            "sdp", "jcp", "komeito", "jip", "dpj", "dpp", "labour", "labor", "green",
-            "reiwa", "shinsengumi"
-        ])
-        return has_election_phrase and has_party_indicator
+        return self._classify(market).has(MarketFamily.MULTI_PARTY)
         
     def _calculate_multi_party_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for multi-party elections."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Major parties (historical advantage)
         if any(party in question for party in ["ldp", "liberal democratic party"]):
@@ -387,15 +411,11 @@ class FairValueEngine:
             
     def _is_political_binary(self, market: Market) -> bool:
         """Check if this is a binary political event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "trump", "biden", "president", "election", "impeach", "resign", 
-            "tariff", "war", "treaty", "law", "bill", "congress", "senate"
-        ])
+        return self._classify(market).has(MarketFamily.POLITICAL)
         
     def _calculate_political_binary_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for binary political events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Presidential Elections
         if "president" in question and "elect" in question:
@@ -425,36 +445,13 @@ class FairValueEngine:
         
     def _is_constitutional_amendment(self, market: Market) -> bool:
         """Check if this market involves a Constitutional amendment."""
-        question = market.question.lower()
-        description = (market.description or "").lower()
-        
-        # Direct constitutional amendment indicators
-        constitutional_indicators = [
-            "constitutional amendment", "22nd amendment", "term limits", "repeal",
-            "constitution", "amendment", "supreme court", "constitutional"
-        ]
-        
-        # Actions that require constitutional changes
-        action_indicators = [
-            "repeal presidential term limits", "change term limits", "third term",
-            "more than two terms", "eliminate term limits", "extend presidency"
-        ]
-        
-        # Check in both question and description
-        full_text = f"{question} {description}"
-        
-        has_constitutional = any(indicator in full_text for indicator in constitutional_indicators)
-        has_action = any(indicator in full_text for indicator in action_indicators)
-        
-        # Specific Trump term limits case
-        is_trump_term_limits = "trump" in full_text and any(term in full_text for term in ["term limit", "22nd amendment", "third term"])
-        
-        return has_constitutional and has_action or is_trump_term_limits
+        return self._classify(market).has(MarketFamily.CONSTITUTIONAL)
         
     def _calculate_constitutional_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for Constitutional amendment markets."""
-        question = market.question.lower()
-        description = (market.description or "").lower()
+        features = self._market_features(market)
+        question = features.question
+        description = features.description
         full_text = f"{question} {description}"
         
         # Check timeline - constitutional amendments take years typically
@@ -479,29 +476,15 @@ class FairValueEngine:
         
     def _get_days_remaining(self, market: Market) -> Optional[int]:
         """Get days remaining until market resolution."""
-        if not market.end_date_iso:
-            return None
-            
-        now = datetime.now(timezone.utc)
-        if market.end_date_iso.tzinfo is not None:
-            from datetime import timezone
-            now = now.replace(tzinfo=timezone.utc)
-        else:
-            market.end_date_iso = market.end_date_iso.replace(tzinfo=None)
-            
-        return (market.end_date_iso - now).days
+        return self._market_features(market).days_left
         
     def _is_crypto_financial(self, market: Market) -> bool:
         """Check if this is a crypto/financial market."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "bitcoin", "ethereum", "crypto", "btc", "eth", "price", "etf", 
-            "sec", "approved", "stock", "market", "$"
-        ])
+        return self._classify(market).has(MarketFamily.CRYPTO)
         
     def _calculate_crypto_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for crypto/financial events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # ETF Approvals
         if "etf" in question and "approved" in question:
@@ -527,15 +510,11 @@ class FairValueEngine:
         
     def _is_sports_event(self, market: Market) -> bool:
         """Check if this is a sports event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "nfl", "nba", "mlb", "nhl", "championship", "super bowl", "world series",
-            "playoffs", "trade", "draft", "coach", "fire", "retire", "mvp"
-        ])
+        return self._classify(market).has(MarketFamily.SPORTS)
         
     def _calculate_sports_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for sports events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Coaching Changes
         if any(term in question for term in ["fire", "fired", "coach"]):
@@ -561,16 +540,11 @@ class FairValueEngine:
         
     def _is_entertainment_event(self, market: Market) -> bool:
         """Check if this is an entertainment event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "oscar", "emmy", "grammy", "golden globe", "award", "nomination",
-            "renewed", "cancelled", "canceled", "season", "tv show",
-            "box office", "movie", "film", "gross", "celebrity"
-        ])
+        return self._classify(market).has(MarketFamily.ENTERTAINMENT)
         
     def _calculate_entertainment_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for entertainment events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Awards shows
         if any(term in question for term in ["oscar", "emmy", "grammy", "award"]):
@@ -600,26 +574,15 @@ class FairValueEngine:
         
     def _is_weather_climate_event(self, market: Market) -> bool:
         """Check if this is a weather/climate event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "hurricane", "storm", "temperature", "rainfall", "snow", "drought",
-            "wildfire", "tornado", "weather", "climate", "degrees", "inches",
-            "global warming", "sea level", "ice", "record high", "record low"
-        ])
+        return self._classify(market).has(MarketFamily.WEATHER)
         
     def _is_technology_event(self, market: Market) -> bool:
         """Check if this is a technology event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "technology", "tech", "software", "hardware", "ai", "artificial intelligence",
-            "launch", "release", "product", "acquisition", "merger", "ipo",
-            "adoption", "users", "download", "install", "upgrade", "version",
-            "patent", "innovation", "breakthrough", "development", "announcement"
-        ])
+        return self._classify(market).has(MarketFamily.TECHNOLOGY)
         
     def _calculate_weather_climate_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for weather/climate events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Hurricane landfall
         if any(term in question for term in ["hurricane", "tropical storm", "landfall"]):
@@ -645,7 +608,7 @@ class FairValueEngine:
         
     def _calculate_technology_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for technology events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Product launches
         if any(term in question for term in ["launch", "release", "announce"]):
@@ -675,15 +638,11 @@ class FairValueEngine:
         
     def _is_corporate_event(self, market: Market) -> bool:
         """Check if this is a corporate/business event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "merger", "acquisition", "ceo", "earnings", "ipo", "bankruptcy",
-            "tesla", "apple", "amazon", "google", "microsoft", "meta"
-        ])
+        return self._classify(market).has(MarketFamily.CORPORATE)
         
     def _calculate_corporate_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for corporate events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Mergers & Acquisitions
         if any(term in question for term in ["merger", "acquisition", "buyout"]):
@@ -701,15 +660,11 @@ class FairValueEngine:
         
     def _is_rare_event(self, market: Market) -> bool:
         """Check if this is a rare/catastrophic event."""
-        question = market.question.lower()
-        return any(term in question for term in [
-            "pandemic", "earthquake", "hurricane", "war", "nuclear", "asteroid",
-            "collapse", "crash", "disaster", "outbreak"
-        ])
+        return self._classify(market).has(MarketFamily.RARE_EVENT)
         
     def _calculate_rare_event_probability(self, market: Market) -> Tuple[float, str]:
         """Calculate probability for rare events."""
-        question = market.question.lower()
+        question = self._market_features(market).question
         
         # Pandemics
         if "pandemic" in question:
@@ -729,14 +684,22 @@ class FairValueEngine:
             
         return 0.10, "Rare event baseline (10%)"
         
-    async def _calculate_llm_news_adjustment(self, news_articles: List[NewsArticle], market: Market) -> Tuple[float, str]:
+    async def _calculate_llm_news_adjustment(
+        self,
+        news_articles: List[NewsArticle],
+        market: Market,
+        pairs: Optional[Dict[Tuple[str, str, str], asyncio.Future]] = None
+    ) -> Tuple[float, str]:
         """Calculate probability adjustment using LLM-powered news analysis."""
         if not news_articles:
             return 0.0, "No news coverage found"
             
         try:
             # Get sophisticated news analysis
-            news_analysis = await self.llm_news_analyzer.analyze_market_news(market, news_articles)
+            if pairs is None:
+                news_analysis = await self.llm_news_analyzer.analyze_market_news(market, news_articles)
+            else:
+                news_analysis = await self.llm_news_analyzer.analyze_market_news(market, news_articles, pairs=pairs)
             
             # Use the calculated probability adjustment from LLM analysis
             adjustment = news_analysis.probability_adjustment
@@ -800,17 +763,10 @@ class FairValueEngine:
         
     def _calculate_time_adjustment(self, market: Market) -> Tuple[float, str]:
         """Calculate probability adjustment based on timing factors."""
-        if not market.end_date_iso:
+        days_remaining = self._get_days_remaining(market)
+        if days_remaining is None:
             return 0.0, "No end date available"
             
-        now = datetime.now(timezone.utc)
-        if market.end_date_iso.tzinfo is not None:
-            from datetime import timezone
-            now = now.replace(tzinfo=timezone.utc)
-        else:
-            market.end_date_iso = market.end_date_iso.replace(tzinfo=None)
-            
-        days_remaining = (market.end_date_iso - now).days
         
         if days_remaining <= 7:
             return 0.0, "Very close to resolution - no time adjustment"
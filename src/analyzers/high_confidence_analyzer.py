@@ -4,10 +4,15 @@ Focuses on finding markets with strong directional conviction.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import List, Optional, Tuple
 
+import numpy as np
+
+from src.clients.polymarket.market_features import MarketFeatures
+from src.clients.polymarket.market_table import MarketTable
 from src.clients.polymarket.models import Market, MarketPrice
+from src.analyzers.prefilter import NumericGate, NumericProfile
 from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
 
 logger = logging.getLogger(__name__)
@@ -23,23 +28,38 @@ class HighConfidenceAnalyzer:
         self.min_volume = 5000  # $5k minimum volume
         self.min_confidence = 0.7  # 70% minimum confidence
         
+        # Price bands (and days left) in which each pattern can match
+        self.gates = (
+            NumericGate(0.0, 0.9499),  # NEAR_CERTAINTY
+            NumericGate(0.0301, 1.0),  # NEAR_IMPOSSIBILITY
+            NumericGate(0.70, 0.85, (7, 90)),  # STABLE_CONTINUATION
+            NumericGate(0.15, 0.30, (7, 90)),
+            NumericGate(0.0, 0.80),  # STRUCTURAL_CERTAINTY
+            NumericGate(0.20, 1.0),
+            NumericGate(0.05, 0.20),  # EXTREME_MISPRICING
+            NumericGate(0.70, 0.90),
+        )
+        
     def analyze_market(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: Optional[MarketFeatures] = None
     ) -> Optional[SimpleOpportunity]:
         """Analyze for high confidence opportunities only."""
         
         if not self._basic_filters(market, price):
             return None
             
+        features = features or MarketFeatures.from_market(market, price)
+        
         # Try all high confidence patterns
         patterns = [
-            self._check_near_certainties(market, price),
-            self._check_near_impossibilities(market, price),
-            self._check_stable_continuations(market, price),
-            self._check_structural_certainties(market, price),
-            self._check_extreme_mispricing(market, price),
+            self._check_near_certainties(market, price, features),
+            self._check_near_impossibilities(market, price, features),
+            self._check_stable_continuations(market, price, features),
+            self._check_structural_certainties(market, price, features),
+            self._check_extreme_mispricing(market, price, features),
         ]
         
         # Filter by minimum confidence
@@ -52,6 +72,19 @@ class HighConfidenceAnalyzer:
             
         return None
     
+    def prefilter(self, table: MarketTable, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Mask the markets that can match on price, volume and days left alone.
+        
+        Args:
+            table: Markets with their prices
+            now: Reference time for days left (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Boolean mask over the table's rows
+        """
+        return NumericProfile(self.min_volume, self.gates).mask(table, now)
+        
     def _basic_filters(self, market: Market, price: MarketPrice) -> bool:
         """Basic filters."""
         if not market.volume or market.volume < self.min_volume:
@@ -63,11 +96,12 @@ class HighConfidenceAnalyzer:
     def _check_near_certainties(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: MarketFeatures
     ) -> Optional[SimpleOpportunity]:
         """Check for near-certain events underpriced."""
         
-        question = market.question.lower()
+        question = features.question
         
         # Near certainty patterns with expected probabilities
         certainty_patterns = [
@@ -111,11 +145,12 @@ class HighConfidenceAnalyzer:
     def _check_near_impossibilities(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: MarketFeatures
     ) -> Optional[SimpleOpportunity]:
         """Check for near-impossible events overpriced."""
         
-        question = market.question.lower()
+        question = features.question
         
         # Near impossibility patterns with expected probabilities
         impossibility_patterns = [
@@ -160,18 +195,16 @@ class HighConfidenceAnalyzer:
     def _check_stable_continuations(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: MarketFeatures
     ) -> Optional[SimpleOpportunity]:
         """Check for stable continuation events."""
         
-        question = market.question.lower()
+        question = features.question
         
         # Only for medium-term markets
-        if market.end_date_iso:
-            days_left = (market.end_date_iso - datetime.now(timezone.utc)).days
-            if days_left < 7 or days_left > 90:
-                return None
-        else:
+        days_left = features.days_left
+        if not features.ends_within(7, 90):
             return None
             
         # Stable continuation patterns
@@ -217,11 +250,12 @@ class HighConfidenceAnalyzer:
     def _check_structural_certainties(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: MarketFeatures
     ) -> Optional[SimpleOpportunity]:
         """Check for structural/mathematical certainties."""
         
-        question = market.question.lower()
+        question = features.question
         
         # Mathematical/structural patterns
         if 'at least one' in question or 'any' in question:
@@ -258,11 +292,12 @@ class HighConfidenceAnalyzer:
     def _check_extreme_mispricing(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: MarketFeatures
     ) -> Optional[SimpleOpportunity]:
         """Check for extreme mispricings with high confidence."""
         
-        question = market.question.lower()
+        question = features.question
         
         # Extreme longshots that should be < 1%
         extreme_patterns = [
@@ -0,0 +1,269 @@
+"""
+Change-driven incremental re-analysis.
+
+Each analyzed market leaves behind a fingerprint of its inputs: prices,
+volume, end date and related-news set. The fingerprint is stored with the
+opportunity the market produced, if any. On a refresh, a market whose
+inputs moved less than the configured epsilons keeps its previous result.
+Only the changed set is analyzed again.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, Optional, Tuple
+
+from src.analyzers.models import MarketOpportunity
+from src.clients.polymarket.models import Market, MarketPrice
+from src.config.settings import settings
+
+
+@dataclass(frozen=True)
+class ChangeEpsilons:
+    """Thresholds below which an input change is ignored."""
+    price: float = 0.005  # Absolute YES/NO price move
+    volume: float = 0.02  # Relative volume move
+    end_date_seconds: float = 3600.0  # End date shift
+    news: float = 0.0  # Jaccard distance between related-news sets
+    max_age_seconds: float = 3600.0  # Re-analyze results older than this
+    
+    @classmethod
+    def from_settings(cls) -> "ChangeEpsilons":
+        """Build epsilons from application settings."""
+        return cls(
+            price=settings.incremental_price_epsilon,
+            volume=settings.incremental_volume_epsilon,
+            end_date_seconds=settings.incremental_end_date_epsilon_seconds,
+            news=settings.incremental_news_epsilon,
+            max_age_seconds=settings.incremental_max_age_seconds
+        )
+
+
+@dataclass(frozen=True)
+class MarketFingerprint:
+    """Inputs that determine a market's analysis result."""
+    yes_price: float
+    no_price: float
+    volume: Optional[float]
+    end_timestamp: Optional[float]
+    news_urls: FrozenSet[str]
+    
+    def differs(self, other: "MarketFingerprint", epsilons: ChangeEpsilons) -> bool:
+        """
+        Check whether inputs moved beyond the epsilons.
+        
+        Args:
+            other: Previous fingerprint
+            epsilons: Change thresholds
+            
+        Returns:
+            bool: True if the market should be re-analyzed
+        """
+        if abs(self.yes_price - other.yes_price) > epsilons.price:
+            return True
+        if abs(self.no_price - other.no_price) > epsilons.price:
+            return True
+            
+        if (self.volume is None) != (other.volume is None):
+            return True
+        if self.volume is not None:
+            baseline = max(abs(other.volume), 1.0)
+            if abs(self.volume - other.volume) / baseline > epsilons.volume:
+                return True
+                
+        if (self.end_timestamp is None) != (other.end_timestamp is None):
+            return True
+        if self.end_timestamp is not None:
+            if abs(self.end_timestamp - other.end_timestamp) > epsilons.end_date_seconds:
+                return True
+                
+        union = self.news_urls | other.news_urls
+        if union:
+            jaccard_distance = 1.0 - len(self.news_urls & other.news_urls) / len(union)
+            if jaccard_distance > epsilons.news:
+                return True
+                
+        return False
+
+
+def fingerprint_market(
+    market: Market,
+    price: MarketPrice,
+    news_urls: FrozenSet[str]
+) -> MarketFingerprint:
+    """
+    Fingerprint a market's analysis inputs.
+    
+    Args:
+        market: Market
+        price: Current market price
+        news_urls: URLs of news related to the market
+        
+    Returns:
+        MarketFingerprint: Fingerprint
+    """
+    return MarketFingerprint(
+        yes_price=price.yes_price,
+        no_price=price.no_price,
+        volume=market.volume,
+        end_timestamp=market.end_date_iso.timestamp() if market.end_date_iso else None,
+        news_urls=news_urls
+    )
+
+
+@dataclass
+class _Entry:
+    """Stored result for one market."""
+    fingerprint: MarketFingerprint
+    opportunity: Optional[MarketOpportunity]
+    analyzed_at: float
+
+
+class IncrementalTracker:
+    """
+    Remembers the previous run's fingerprints and opportunities per condition_id.
+    
+    A run calls begin(), then carry() or record() for each market, then
+    finish(). Markets absent from a run are forgotten, so the state never
+    outgrows the active universe.
+    """
+    
+    def __init__(self, epsilons: Optional[ChangeEpsilons] = None):
+        """
+        Initialize incremental tracker.
+        
+        Args:
+            epsilons: Change thresholds (defaults to settings)
+        """
+        self.epsilons = epsilons or ChangeEpsilons.from_settings()
+        self._entries: Dict[str, _Entry] = {}
+        self._next: Dict[str, _Entry] = {}
+        self._config_key: Optional[Hashable] = None
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def begin(self, config_key: Hashable) -> None:
+        """
+        Start a run.
+        
+        Args:
+            config_key: Analysis configuration; a change invalidates every entry
+        """
+        if config_key != self._config_key:
+            self._entries = {}
+            self._config_key = config_key
+        self._next = {}
+        
+    def lookup(
+        self,
+        condition_id: str,
+        fingerprint: MarketFingerprint,
+        now: Optional[float] = None
+    ) -> Tuple[bool, Optional[MarketOpportunity]]:
+        """
+        Check whether a market is unchanged since the previous run.
+        
+        Args:
+            condition_id: Market condition ID
+            fingerprint: Current input fingerprint
+            now: Current time (defaults to time.time())
+            
+        Returns:
+            Tuple[bool, Optional[MarketOpportunity]]: Whether it is unchanged,
+            and the previous opportunity (None if it produced none)
+        """
+        entry = self._entries.get(condition_id)
+        if entry is None:
+            return False, None
+            
+        now = now if now is not None else time.time()
+        if now - entry.analyzed_at > self.epsilons.max_age_seconds:
+            return False, None
+        if fingerprint.differs(entry.fingerprint, self.epsilons):
+            return False, None
+            
+        return True, entry.opportunity
+        
+    def carry(self, condition_id: str) -> None:
+        """
+        Keep a market's previous entry for the next run.
+        
+        The stored fingerprint is not replaced, so slow drift still
+        accumulates until it crosses an epsilon.
+        
+        Args:
+            condition_id: Market condition ID
+        """
+        entry = self._entries.get(condition_id)
+        if entry is not None:
+            self._next[condition_id] = entry
+            
+    def record(
+        self,
+        condition_id: str,
+        fingerprint: MarketFingerprint,
+        opportunity: Optional[MarketOpportunity],
+        now: Optional[float] = None
+    ) -> None:
+        """
+        Store a freshly analyzed market's result.
+        
+        Args:
+            condition_id: Market condition ID
+            fingerprint: Input fingerprint used for the analysis
+            opportunity: Opportunity found (None if none)
+            now: Analysis time (defaults to time.time())
+        """
+        self._next[condition_id] = _Entry(
+            fingerprint=fingerprint,
+            opportunity=opportunity,
+            analyzed_at=now if now is not None else time.time()
+        )
+        
+    def revert(self, condition_id: str) -> None:
+        """
+        Undo this run's record for a market whose analysis did not finish.
+        
+        The previous entry, if any, is kept for the next run instead.
+        
+        Args:
+            condition_id: Market condition ID
+        """
+        entry = self._entries.get(condition_id)
+        if entry is None:
+            self._next.pop(condition_id, None)
+        else:
+            self._next[condition_id] = entry
+            
+    def prior_values(self) -> Dict[str, Optional[float]]:
+        """
+        Get each market's value score from the previous run.
+        
+        Returns:
+            Dict[str, Optional[float]]: Value score per condition ID (None if
+            the market produced no opportunity)
+        """
+        return {
+            condition_id: entry.opportunity.score.value_score if entry.opportunity else None
+            for condition_id, entry in self._entries.items()
+        }
+        
+    def finish(self, keep_unseen: bool = False) -> None:
+        """
+        Make this run's entries the baseline for the next run.
+        
+        Args:
+            keep_unseen: Keep previous entries for markets this run never
+                reached (a deadline-bounded run), instead of forgetting them
+        """
+        if keep_unseen:
+            for condition_id, entry in self._entries.items():
+                self._next.setdefault(condition_id, entry)
+        self._entries = self._next
+        self._next = {}
+        
+    def clear(self) -> None:
+        """Forget every entry."""
+        self._entries = {}
+        self._next = {}
+        self._config_key = None
@@ -5,7 +5,7 @@ Replaces primitive keyword-based analysis with intelligent understanding.
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -52,18 +52,68 @@ class LLMNewsAnalyzer:
         self.claude_available = bool(settings.claude_api_key)
         if not self.claude_available:
             logger.warning("Claude API key not configured - falling back to enhanced keyword analysis")
+        # Built on the first LLM call and reused afterwards
+        self._client = None
+        # Caps LLM calls in flight across every market; bound to one event loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+    def _llm_slots(self) -> asyncio.Semaphore:
+        """Get the semaphore capping concurrent LLM calls on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(settings.llm_max_concurrency)
+            self._slots_loop = loop
+        return self._slots
+        
+    def _shared_analysis(
+        self,
+        market: Market,
+        article: NewsArticle,
+        pairs: Optional[Dict[Tuple[str, str, str], asyncio.Future]]
+    ) -> Awaitable[NewsAnalysisResult]:
+        """
+        Get an awaitable analysis of an article for a market.
+        
+        With a pairs map, an article is analyzed once per question text and
+        later requests await the same task, finished or in flight, so
+        markets that share a question (relisted or duplicate markets) share
+        the analysis. The category is part of the key because the prompt
+        includes it.
+        
+        Args:
+            market: Market the article is analyzed for
+            article: Article to analyze
+            pairs: Analyses shared across a batch, keyed by article URL, question and category
+            
+        Returns:
+            Awaitable[NewsAnalysisResult]: Pending analysis
+        """
+        if pairs is None:
+            return self._analyze_single_article(market, article)
+        key = (article.url, market.question, market.category or "")
+        task = pairs.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._analyze_single_article(market, article))
+            pairs[key] = task
+        return task
     
     async def analyze_market_news(
         self,
         market: Market,
-        news_articles: List[NewsArticle]
+        news_articles: List[NewsArticle],
+        pairs: Optional[Dict[Tuple[str, str, str], asyncio.Future]] = None
     ) -> MarketNewsAnalysis:
         """
         Analyze news articles for market impact using LLM.
         
+        The top articles are analyzed concurrently; LLM calls are capped by
+        settings.llm_max_concurrency across all markets.
+        
         Args:
             market: Market to analyze
             news_articles: Related news articles
+            pairs: Analyses shared across a batch (see _shared_analysis)
             
         Returns:
             MarketNewsAnalysis: Comprehensive analysis
@@ -96,14 +146,19 @@ class LLMNewsAnalyzer:
             )
         
         # Analyze each article
+        top_articles = relevant_articles[:10]  # Limit to top 10 for performance
+        results = await asyncio.gather(
+            *(self._shared_analysis(market, article, pairs) for article in top_articles),
+            return_exceptions=True
+        )
         article_analyses = []
-        for article in relevant_articles[:10]:  # Limit to top 10 for performance
-            try:
-                analysis = await self._analyze_single_article(market, article)
-                article_analyses.append(analysis)
-            except Exception as e:
-                logger.error(f"Error analyzing article {article.title}: {e}")
+        for article, result in zip(top_articles, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error analyzing article {article.title}: {result}")
                 continue
+            if isinstance(result, BaseException):
+                raise result
+            article_analyses.append(result)
         
         # Aggregate results
         return self._aggregate_analyses(relevant_articles, article_analyses)
@@ -211,12 +266,14 @@ class LLMNewsAnalyzer:
         try:
             # For now, import anthropic here to avoid dependency issues
             # In production, this would be properly configured
-            try:
-                import anthropic
-                client = anthropic.Anthropic(api_key=settings.claude_api_key)
-            except ImportError:
-                logger.warning("Anthropic library not available, falling back to keyword analysis")
-                return self._enhanced_keyword_analysis(market, article)
+            if self._client is None:
+                try:
+                    import anthropic
+                    self._client = anthropic.Anthropic(api_key=settings.claude_api_key)
+                except ImportError:
+                    logger.warning("Anthropic library not available, falling back to keyword analysis")
+                    return self._enhanced_keyword_analysis(market, article)
+            client = self._client
             
             # Construct analysis prompt
             prompt = f"""
@@ -244,13 +301,16 @@ Format your response as JSON with these exact keys:
 sentiment_score, relevance_score, confidence_level, key_insights, bias_detected, source_credibility, reasoning
 """
             
-            # Get LLM analysis
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",  # Fast model for news analysis
-                max_tokens=500,
-                temperature=0.1,  # Low temperature for consistent analysis
-                messages=[{"role": "user", "content": prompt}]
-            )
+            # Get LLM analysis; the client is blocking, so it runs on a
+            # worker thread and other markets proceed meanwhile
+            async with self._llm_slots():
+                response = await asyncio.to_thread(
+                    client.messages.create,
+                    model="claude-3-haiku-20240307",  # Fast model for news analysis
+                    max_tokens=500,
+                    temperature=0.1,  # Low temperature for consistent analysis
+                    messages=[{"role": "user", "content": prompt}]
+                )
             
             # Parse response
             import json
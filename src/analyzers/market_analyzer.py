@@ -2,20 +2,34 @@
 Market analyzer for identifying high-value opportunities.
 """
 
+import asyncio
 import logging
 import math
 import time
-from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from src.analyzers.budget import AnalysisBudget, prioritize_markets
+from src.analyzers.incremental import IncrementalTracker, MarketFingerprint, fingerprint_market
 from src.analyzers.models import AnalysisResult, MarketOpportunity, OpportunityScore
+from src.analyzers.news_index import NewsKeywordIndex
+from src.analyzers.vectorized_scoring import (
+    ScoreArrays,
+    score_fair_value_opportunities,
+    score_pattern_opportunities,
+)
+from src.analyzers.ensemble import AnalyzerEnsemble
 from src.analyzers.flexible_analyzer import FlexibleAnalyzer
 from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
 from src.analyzers.kelly_criterion import KellyCriterion
 from src.analyzers.backtesting import BacktestingEngine
 from src.clients.news.models import NewsArticle
+from src.clients.polymarket.market_features import FeatureStore, MarketFeatures
+from src.clients.polymarket.market_table import MarketTable
 from src.clients.polymarket.models import Market, MarketPrice
 from src.config.settings import settings
+from src.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -29,45 +43,143 @@ class MarketAnalyzer:
         """Initialize market analyzer."""
         self.min_volume = settings.min_market_volume
         self.min_spread = settings.min_probability_spread
+        self.max_concurrency = settings.analysis_max_concurrency
+        self.market_timeout = settings.analysis_market_timeout_seconds
         self.pattern_analyzer = FlexibleAnalyzer()
         self.kelly_criterion = KellyCriterion()
         self.backtesting_engine = BacktestingEngine()
+        self.record_predictions = True
+        self.backend = settings.analysis_backend
+        self._process_backend = None
+        self._news_index: Optional[NewsKeywordIndex] = None
+        self.features: Optional[FeatureStore] = None
+        self.incremental_tracker = IncrementalTracker()
+        self.timer = StageTimer()
         
     async def analyze_markets(
         self,
         markets: List[Market],
         market_prices: List[MarketPrice],
-        news_articles: List[NewsArticle]
+        news_articles: List[NewsArticle],
+        max_concurrency: Optional[int] = None,
+        market_timeout: Optional[float] = None,
+        backend: Optional[str] = None,
+        news_index: Optional[NewsKeywordIndex] = None,
+        incremental: bool = False,
+        timer: Optional[StageTimer] = None,
+        budget: Optional[AnalysisBudget] = None
     ) -> AnalysisResult:
         """
         Analyze markets for opportunities.
         
+        Markets go through three stages: pattern detection per market, one
+        vectorized scoring pass over every detected candidate (which also
+        applies the minimum-edge gate), and opportunity construction for the
+        survivors only. Construction runs concurrently, bounded by a
+        semaphore, so that I/O-bound work overlaps across markets.
+        Opportunities are returned in input order regardless of completion
+        order, and a failing or slow market never affects the others.
+        
+        With the 'process' backend the same stages run in worker processes
+        instead; concurrency and timeout do not apply.
+        
+        Every run fingerprints its inputs. An incremental run re-analyzes
+        only markets whose inputs changed beyond the tracker's epsilons
+        since the previous run, and carries the rest forward.
+        
+        Time spent in each stage is recorded on the timer and attached to
+        the result.
+        
+        Derived market facts (lowered question, days left, price flags) are
+        computed once per market against a single reference time for the
+        run and shared by every stage.
+        
+        With a time budget, markets are analyzed in priority order, no new
+        work starts after the deadline and in-flight work is cancelled at
+        it. The result covers the markets that finished and is flagged as
+        partial if any did not.
+        
         Args:
             markets: List of markets to analyze
             market_prices: List of market prices
             news_articles: Related news articles
+            max_concurrency: Markets in flight at once (defaults to settings, 1 = sequential)
+            market_timeout: Per-market timeout in seconds (defaults to settings)
+            backend: 'async' or 'process' (defaults to settings)
+            news_index: Keyword index over news_articles (built here if omitted)
+            incremental: Skip markets unchanged since the previous run
+            timer: Stage timer shared with the rest of the run (a fresh one if omitted)
+            budget: Time budget for the run (None for no limit)
             
         Returns:
             AnalysisResult: Analysis results
         """
         start_time = time.time()
-        opportunities = []
+        self.timer = timer or StageTimer()
+        self.features = FeatureStore()
+        
+        # Index news once per run; related-news lookups reuse it
+        with self.timer.stage("news"):
+            if news_index is not None and news_index.covers(news_articles):
+                self._news_index = news_index
+            else:
+                self._news_index = NewsKeywordIndex(news_articles)
         
         # Create price lookup
         price_lookup = {price.condition_id: price for price in market_prices}
         
-        for market in markets:
-            try:
-                opportunity = await self._analyze_single_market(
-                    market, 
-                    price_lookup.get(market.condition_id),
-                    news_articles
-                )
-                if opportunity:
-                    opportunities.append(opportunity)
-            except Exception as e:
-                logger.error(f"Error analyzing market {market.condition_id}: {e}")
+        self.incremental_tracker.begin(self._analysis_config_key())
+        with self.timer.stage("filter"):
+            fingerprints = {
+                market.condition_id: self._fingerprint(market, price_lookup[market.condition_id], news_articles)
+                for market in markets
+                if market.condition_id in price_lookup
+            }
+            carried = self._carry_unchanged(fingerprints, start_time) if incremental else {}
+        to_analyze = [market for market in markets if market.condition_id not in carried]
+        if budget is not None:
+            # Most promising markets first, so the deadline cuts the least valuable
+            to_analyze = prioritize_markets(to_analyze, self.incremental_tracker.prior_values())
+            
+        self._reset_pattern_stats()
+            
+        if (backend or self.backend) == "process":
+            opportunities = await self._analyze_in_processes(
+                to_analyze, price_lookup, news_articles, budget
+            )
+        else:
+            opportunities = await self._analyze_batch(
+                to_analyze,
+                price_lookup,
+                news_articles,
+                concurrency=max(1, max_concurrency or self.max_concurrency),
+                timeout=market_timeout if market_timeout is not None else self.market_timeout,
+                budget=budget
+            )
+            
+        # Only in-process runs count here; worker processes keep their own
+        self._log_pattern_stats()
+            
+        found = {opportunity.condition_id: opportunity for opportunity in opportunities}
+        for market in to_analyze:
+            if budget is not None and market.condition_id in budget.unfinished:
+                # Not analyzed; keep the previous result for the next run
+                self.incremental_tracker.revert(market.condition_id)
                 continue
+            fingerprint = fingerprints.get(market.condition_id)
+            if fingerprint:
+                self.incremental_tracker.record(
+                    market.condition_id, fingerprint, found.get(market.condition_id), start_time
+                )
+        self.incremental_tracker.finish()
+        
+        # Merge carried-forward results back in market order
+        for condition_id, opportunity in carried.items():
+            if opportunity:
+                found[condition_id] = opportunity
+        opportunities = [
+            found[market.condition_id] for market in markets if market.condition_id in found
+        ]
                 
         analysis_duration = time.time() - start_time
         
@@ -75,25 +187,274 @@ class MarketAnalyzer:
             opportunities=opportunities,
             total_markets_analyzed=len(markets),
             analysis_duration_seconds=analysis_duration,
-            news_articles_processed=len(news_articles)
+            news_articles_processed=len(news_articles),
+            markets_reanalyzed=len(to_analyze) if incremental else None,
+            markets_skipped=len(carried),
+            timings=self.timer.timings(),
+            budget_seconds=budget.seconds if budget is not None else None,
+            partial=budget is not None and bool(budget.unfinished),
+            markets_covered=(
+                sum(1 for market in markets if market.condition_id not in budget.unfinished)
+                if budget is not None else None
+            ),
+            markets_cancelled=budget.cancelled if budget is not None else 0
         )
         
-    async def _analyze_single_market(
+    def _analysis_config_key(self) -> Tuple:
+        """
+        Get the settings that invalidate every stored result when changed.
+        
+        Returns:
+            Tuple: Pattern analyzer class, ensemble mode and thresholds
+        """
+        return (
+            type(self.pattern_analyzer),
+            getattr(self.pattern_analyzer, "mode", None),
+            self.min_spread,
+            self.min_volume
+        )
+        
+    def _fingerprint(
         self,
         market: Market,
-        price: Optional[MarketPrice],
+        price: MarketPrice,
         news_articles: List[NewsArticle]
-    ) -> Optional[MarketOpportunity]:
+    ) -> MarketFingerprint:
         """
-        Analyze a single market for opportunities.
+        Fingerprint a market's analysis inputs.
         
         Args:
-            market: Market to analyze
+            market: Market to fingerprint
             price: Current market price
+            news_articles: Available news articles
+            
+        Returns:
+            MarketFingerprint: Input fingerprint
+        """
+        news_urls = self._get_news_index(news_articles).related_urls(
+            self._extract_market_keywords(market)
+        )
+        return fingerprint_market(market, price, news_urls)
+        
+    def _carry_unchanged(
+        self,
+        fingerprints: Dict[str, MarketFingerprint],
+        now: float
+    ) -> Dict[str, Optional[MarketOpportunity]]:
+        """
+        Find markets unchanged since the previous run.
+        
+        Args:
+            fingerprints: Current fingerprints keyed by condition ID
+            now: Current time
+            
+        Returns:
+            Dict[str, Optional[MarketOpportunity]]: Previous result per unchanged market
+        """
+        carried = {}
+        for condition_id, fingerprint in fingerprints.items():
+            unchanged, previous = self.incremental_tracker.lookup(condition_id, fingerprint, now)
+            if unchanged:
+                self.incremental_tracker.carry(condition_id)
+                carried[condition_id] = previous
+        return carried
+        
+    async def _analyze_batch(
+        self,
+        markets: List[Market],
+        price_lookup: Dict[str, MarketPrice],
+        news_articles: List[NewsArticle],
+        concurrency: int = 1,
+        timeout: Optional[float] = None,
+        budget: Optional[AnalysisBudget] = None
+    ) -> List[MarketOpportunity]:
+        """
+        Detect, score and build opportunities for a batch of markets.
+        
+        Markets are processed in list order. Detection stops once only the
+        budget's build reserve remains, so matched markets still get built.
+        Past the deadline no new build is started, builds still running are
+        cancelled, and both are recorded on the budget as unfinished.
+        
+        Args:
+            markets: Markets to analyze
+            price_lookup: Prices keyed by condition ID
             news_articles: Related news articles
+            concurrency: Opportunities built at once
+            timeout: Per-market build timeout in seconds (None for no limit)
+            budget: Time budget for the run (None for no limit)
             
         Returns:
-            Optional[MarketOpportunity]: Opportunity if found
+            List[MarketOpportunity]: Opportunities in market order
+        """
+        # Price and volume gates run on columns, then the pattern analyzer's
+        # own price, volume and days-left gates; only rows passing them
+        # reach the per-market pattern analyzer
+        now = self.features.now if self.features is not None else None
+        with self.timer.stage("filter"):
+            table = MarketTable.from_markets(markets, price_lookup)
+            passed = table.priced_mask() & table.volume_mask(self.min_volume)
+            # Analyzers without a NumPy prefilter see every row passing the above
+            prefilter = getattr(self.pattern_analyzer, "prefilter", None)
+            mask = prefilter(table, now) if prefilter is not None and passed.any() else None
+            if isinstance(mask, np.ndarray):
+                passed &= mask
+            gated = np.flatnonzero(passed)
+        
+        candidates = []
+        rows = []
+        for position, row in enumerate(gated):
+            if budget is not None and budget.detection_expired:
+                for skipped in gated[position:]:
+                    budget.skip(markets[skipped].condition_id)
+                break
+            market = markets[row]
+            price = price_lookup[market.condition_id]
+            simple_opportunity = self._match_pattern(market, price)
+            if simple_opportunity:
+                candidates.append((market, price, simple_opportunity))
+                rows.append(row)
+                
+        if not candidates:
+            return []
+            
+        # One NumPy pass scores every candidate; only survivors get objects
+        scores = self._score_candidates(
+            candidates,
+            news_articles,
+            volume=table.volume[rows],
+            days_to_end=table.days_to_end(now)[rows]
+        )
+        edges = np.array([simple_opportunity.edge for _, _, simple_opportunity in candidates])
+        survivors = np.flatnonzero(edges >= self.min_spread)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        launched = set()
+        
+        async def build_bounded(index: int) -> Optional[MarketOpportunity]:
+            market, price, simple_opportunity = candidates[index]
+            async with semaphore:
+                if budget is not None and budget.expired:
+                    budget.skip(market.condition_id)
+                    return None
+                launched.add(index)
+                return await self._build_opportunity_safely(
+                    market, price, simple_opportunity, scores, index, news_articles, timeout
+                )
+                
+        tasks = [asyncio.ensure_future(build_bounded(int(index))) for index in survivors]
+        if budget is not None and tasks:
+            # Stop waiting at the deadline and cancel the stragglers
+            _, pending = await asyncio.wait(tasks, timeout=budget.remaining)
+            for task in pending:
+                task.cancel()
+                
+        # gather preserves input order, keeping results stable across runs
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        opportunities = []
+        for index, result in zip(survivors, results, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                condition_id = candidates[index][0].condition_id
+                if index in launched:
+                    budget.cancel(condition_id)
+                else:
+                    budget.skip(condition_id)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result:
+                opportunities.append(result)
+        return opportunities
+        
+    async def _analyze_in_processes(
+        self,
+        markets: List[Market],
+        price_lookup: Dict[str, MarketPrice],
+        news_articles: List[NewsArticle],
+        budget: Optional[AnalysisBudget] = None
+    ) -> List[MarketOpportunity]:
+        """
+        Analyze markets on the process-pool backend.
+        
+        Workers never write predictions; they are recorded here once the
+        opportunities are merged back.
+        
+        Args:
+            markets: Markets to analyze
+            price_lookup: Prices keyed by condition ID
+            news_articles: Related news articles
+            budget: Time budget for the run (None for no limit)
+            
+        Returns:
+            List[MarketOpportunity]: Opportunities in market order
+        """
+        if self._process_backend is None:
+            from src.analyzers.process_pool import ProcessPoolBackend
+            
+            self._process_backend = ProcessPoolBackend(
+                max_workers=settings.analysis_process_workers,
+                chunk_size=settings.analysis_process_chunk_size
+            )
+            
+        # Workers cannot report into this process's timer, so the whole
+        # round trip counts as pattern time and per-market times are missing
+        with self.timer.stage("pattern"):
+            opportunities = await self._process_backend.analyze(
+                type(self.pattern_analyzer), markets, price_lookup, news_articles, budget,
+                now=self.features.now if self.features is not None else None,
+                mode=getattr(self.pattern_analyzer, "mode", None)
+            )
+            
+        if self.record_predictions:
+            markets_by_id = {market.condition_id: market for market in markets}
+            for opportunity in opportunities:
+                try:
+                    with self.timer.stage("record", opportunity.condition_id):
+                        self.backtesting_engine.record_prediction(
+                            market=markets_by_id[opportunity.condition_id],
+                            opportunity=opportunity,
+                            model_version="v2024.1"
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to record prediction for {opportunity.condition_id}: {e}")
+                    
+        return opportunities
+        
+    def _reset_pattern_stats(self) -> None:
+        """Clear the pattern analyzer's counters before a run."""
+        prune_stats = getattr(self.pattern_analyzer, "prune_stats", None)
+        if prune_stats is not None:
+            prune_stats.reset()
+        if isinstance(self.pattern_analyzer, AnalyzerEnsemble):
+            self.pattern_analyzer.reset()
+            
+    def _log_pattern_stats(self) -> None:
+        """Log the pattern analyzer's counters after a run."""
+        prune_stats = getattr(self.pattern_analyzer, "prune_stats", None)
+        if prune_stats is not None and prune_stats.markets:
+            logger.info(f"Pattern search: {prune_stats.summary()}")
+        if isinstance(self.pattern_analyzer, AnalyzerEnsemble) and self.pattern_analyzer.verdicts:
+            logger.info(f"Analyzer ensemble: {self.pattern_analyzer.summary()}")
+        
+    def shutdown(self) -> None:
+        """Release worker processes held by the process-pool backend."""
+        if self._process_backend is not None:
+            self._process_backend.shutdown()
+            self._process_backend = None
+            
+    def _detect_opportunity(
+        self,
+        market: Market,
+        price: Optional[MarketPrice]
+    ) -> Optional[SimpleOpportunity]:
+        """
+        Run the volume gate and pattern analyzer for a market.
+        
+        Args:
+            market: Market to analyze
+            price: Current market price
+            
+        Returns:
+            Optional[SimpleOpportunity]: Pattern match if any (edge not yet gated)
         """
         if not price:
             return None
@@ -102,56 +463,235 @@ class MarketAnalyzer:
         if market.volume and market.volume < self.min_volume:
             return None
             
-        # Use simple pattern analyzer
+        return self._match_pattern(market, price)
+        
+    def _match_pattern(
+        self,
+        market: Market,
+        price: MarketPrice
+    ) -> Optional[SimpleOpportunity]:
+        """
+        Run the pattern analyzer for a market that passed the gates.
+        
+        Args:
+            market: Market to analyze
+            price: Current market price
+            
+        Returns:
+            Optional[SimpleOpportunity]: Pattern match if any (edge not yet gated)
+        """
         try:
-            simple_opportunity = self.pattern_analyzer.analyze_market(
-                market, price
-            )
+            with self.timer.stage("pattern", market.condition_id):
+                return self.pattern_analyzer.analyze_market(
+                    market, price, features=self._market_features(market, price)
+                )
+        except Exception as e:
+            logger.error(f"Pattern analysis failed for {market.condition_id}: {e}")
+            return None
             
-            if not simple_opportunity:
-                return None
-                
-            # Only proceed if edge meets minimum threshold
-            if simple_opportunity.edge < self.min_spread:
-                return None
-                
-            # Calculate fair values based on the opportunity
-            fair_yes_price, fair_no_price = self.pattern_analyzer.calculate_fair_value(
-                simple_opportunity
-            )
+    def _score_candidates(
+        self,
+        candidates: List[Tuple[Market, MarketPrice, SimpleOpportunity]],
+        news_articles: List[NewsArticle],
+        volume: Optional[np.ndarray] = None,
+        days_to_end: Optional[np.ndarray] = None
+    ) -> ScoreArrays:
+        """
+        Score pattern candidates in one vectorized pass.
+        
+        Args:
+            candidates: (market, price, pattern match) triples
+            news_articles: Related news articles
+            volume: Candidate volumes from a MarketTable (read from markets if omitted)
+            days_to_end: Candidate days to end from a MarketTable (computed if omitted)
             
-            # Create reasoning from the simple pattern
-            fair_value_reasoning = (
-                f"Pattern: {simple_opportunity.pattern_type} | "
-                f"{simple_opportunity.reason} | "
-                f"Confidence: {simple_opportunity.confidence:.0%}"
+        Returns:
+            ScoreArrays: Score components per candidate
+        """
+        if volume is None:
+            volume = [market.volume for market, _, _ in candidates]
+        if days_to_end is None:
+            days_to_end = [self._days_until_end(market) for market, _, _ in candidates]
+        with self.timer.stage("score"):
+            return score_pattern_opportunities(
+                edge=[opportunity.edge for _, _, opportunity in candidates],
+                confidence=[opportunity.confidence for _, _, opportunity in candidates],
+                volume=volume,
+                days_to_end=days_to_end,
+                news_counts=[len(news_articles)] * len(candidates),
+                news_driven=[
+                    opportunity.pattern_type == "NEWS_OVERREACTION"
+                    for _, _, opportunity in candidates
+                ]
             )
+        
+    async def _build_opportunity_safely(
+        self,
+        market: Market,
+        price: MarketPrice,
+        simple_opportunity: SimpleOpportunity,
+        scores: ScoreArrays,
+        index: int,
+        news_articles: List[NewsArticle],
+        timeout: Optional[float]
+    ) -> Optional[MarketOpportunity]:
+        """
+        Build one opportunity, isolating errors and enforcing the timeout.
+        
+        Args:
+            market: Market being analyzed
+            price: Current market price
+            simple_opportunity: Pattern match for the market
+            scores: Vectorized scores for the batch
+            index: Row of this market in scores
+            news_articles: Related news articles
+            timeout: Timeout in seconds (None for no limit)
             
+        Returns:
+            Optional[MarketOpportunity]: Opportunity, or None on failure
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._build_opportunity(
+                    market, price, simple_opportunity, scores.to_score(index), news_articles
+                )
+        except TimeoutError:
+            logger.warning(f"Timed out analyzing market {market.condition_id} after {timeout}s")
+        except Exception as e:
+            logger.error(f"Error analyzing market {market.condition_id}: {e}")
+        return None
+        
+    async def _analyze_single_market(
+        self,
+        market: Market,
+        price: Optional[MarketPrice],
+        news_articles: List[NewsArticle]
+    ) -> Optional[MarketOpportunity]:
+        """
+        Analyze a single market for opportunities.
+        
+        Args:
+            market: Market to analyze
+            price: Current market price
+            news_articles: Related news articles
+            
+        Returns:
+            Optional[MarketOpportunity]: Opportunity if found
+        """
+        simple_opportunity = self._detect_opportunity(market, price)
+        
+        # Only proceed if edge meets minimum threshold
+        if not simple_opportunity or simple_opportunity.edge < self.min_spread:
+            return None
+            
+        # Calculate scores based on simple opportunity
+        score = self._calculate_simple_opportunity_score(
+            market, price, simple_opportunity, news_articles
+        )
+        
+        return await self._build_opportunity(
+            market, price, simple_opportunity, score, news_articles
+        )
+        
+    async def _build_opportunity(
+        self,
+        market: Market,
+        price: MarketPrice,
+        simple_opportunity: SimpleOpportunity,
+        score: OpportunityScore,
+        news_articles: List[NewsArticle]
+    ) -> Optional[MarketOpportunity]:
+        """
+        Turn a scored pattern match into a full opportunity.
+        
+        Args:
+            market: Market being analyzed
+            price: Current market price
+            simple_opportunity: Pattern match for the market
+            score: Opportunity score
+            news_articles: Related news articles
+            
+        Returns:
+            Optional[MarketOpportunity]: Opportunity, or None if fair value fails
+        """
+        fair_values = self._calculate_fair_values(market, simple_opportunity)
+        if fair_values is None:
+            return None
+            
+        return self._assemble_opportunity(
+            market, price, simple_opportunity, fair_values, score, news_articles
+        )
+        
+    def _calculate_fair_values(
+        self,
+        market: Market,
+        simple_opportunity: SimpleOpportunity
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Calculate fair YES/NO prices for a pattern match.
+        
+        Args:
+            market: Market being analyzed
+            simple_opportunity: Pattern match for the market
+            
+        Returns:
+            Optional[Tuple[float, float]]: Fair YES and NO prices, or None on failure
+        """
+        try:
+            # Calculate fair values based on the opportunity
+            with self.timer.stage("fair_value", market.condition_id):
+                return self.pattern_analyzer.calculate_fair_value(simple_opportunity)
         except Exception as e:
             logger.error(f"Pattern analysis failed for {market.condition_id}: {e}")
             return None
             
+    def _assemble_opportunity(
+        self,
+        market: Market,
+        price: MarketPrice,
+        simple_opportunity: SimpleOpportunity,
+        fair_values: Tuple[float, float],
+        score: OpportunityScore,
+        news_articles: List[NewsArticle]
+    ) -> MarketOpportunity:
+        """
+        Assemble the opportunity with reasoning, Kelly sizing and recording.
+        
+        Args:
+            market: Market being analyzed
+            price: Current market price
+            simple_opportunity: Pattern match for the market
+            fair_values: Fair YES and NO prices
+            score: Opportunity score
+            news_articles: Related news articles
+            
+        Returns:
+            MarketOpportunity: Opportunity
+        """
+        fair_yes_price, fair_no_price = fair_values
+        
+        # Create reasoning from the simple pattern
+        fair_value_reasoning = (
+            f"Pattern: {simple_opportunity.pattern_type} | "
+            f"{simple_opportunity.reason} | "
+            f"Confidence: {simple_opportunity.confidence:.0%}"
+        )
+            
         # Determine position from simple opportunity
         if simple_opportunity.recommended_action in ["BUY_YES", "SELL_NO"]:
             recommended_position = "YES"
             cost = price.yes_price
             expected_value = fair_yes_price * 1.0
             expected_return = ((expected_value - cost) / cost * 100) if cost > 0 else 0
-            edge = simple_opportunity.edge
         else:
             recommended_position = "NO"
             cost = price.no_price
             expected_value = fair_no_price * 1.0
             expected_return = ((expected_value - cost) / cost * 100) if cost > 0 else 0
-            edge = simple_opportunity.edge
-            
-        # Calculate scores based on simple opportunity
-        score = self._calculate_simple_opportunity_score(
-            market, price, simple_opportunity, news_articles
-        )
         
         # Find related news
-        related_news = self._find_related_news(market, news_articles)
+        with self.timer.stage("news", market.condition_id):
+            related_news = self._find_related_news(market, news_articles)
         
         # Generate reasoning (now includes sophisticated fair value analysis)
         reasoning = self._generate_reasoning(
@@ -182,21 +722,24 @@ class MarketAnalyzer:
         
         # Add Kelly Criterion analysis
         try:
-            predicted_prob = fair_yes_price if recommended_position == "YES" else fair_no_price
-            kelly_analysis = self.kelly_criterion.calculate(
-                market=market,
-                predicted_probability=predicted_prob,
-                confidence=score.confidence_score,
-                recommended_position=recommended_position
-            )
+            with self.timer.stage("kelly", market.condition_id):
+                predicted_prob = fair_yes_price if recommended_position == "YES" else fair_no_price
+                kelly_analysis = self.kelly_criterion.calculate(
+                    market=market,
+                    predicted_probability=predicted_prob,
+                    confidence=score.confidence_score,
+                    recommended_position=recommended_position
+                )
             opportunity.kelly_analysis = kelly_analysis
             
             # Record prediction for backtesting
-            self.backtesting_engine.record_prediction(
-                market=market,
-                opportunity=opportunity,
-                model_version="v2024.1"  # Update this as model evolves
-            )
+            if self.record_predictions:
+                with self.timer.stage("record", market.condition_id):
+                    self.backtesting_engine.record_prediction(
+                        market=market,
+                        opportunity=opportunity,
+                        model_version="v2024.1"  # Update this as model evolves
+                    )
             
         except Exception as e:
             logger.warning(f"Failed to calculate Kelly Criterion for {market.condition_id}: {e}")
@@ -217,31 +760,9 @@ class MarketAnalyzer:
         if not news_articles:
             return 0.0
             
-        # Simple keyword-based sentiment analysis
-        positive_keywords = [
-            "success", "win", "victory", "positive", "good", "strong", 
-            "growth", "increase", "improve", "better", "up", "gain"
-        ]
-        negative_keywords = [
-            "fail", "lose", "defeat", "negative", "bad", "weak",
-            "decline", "decrease", "worse", "down", "loss", "drop"
-        ]
-        
-        total_sentiment = 0.0
-        article_count = 0
-        
-        for article in news_articles:
-            text = f"{article.title} {article.description or ''}".lower()
-            
-            positive_count = sum(1 for keyword in positive_keywords if keyword in text)
-            negative_count = sum(1 for keyword in negative_keywords if keyword in text)
-            
-            if positive_count > 0 or negative_count > 0:
-                article_sentiment = (positive_count - negative_count) / (positive_count + negative_count)
-                total_sentiment += article_sentiment
-                article_count += 1
-                
-        return total_sentiment / article_count if article_count > 0 else 0.0
+        # Per-article counts are memoized on the run's index
+        index = self._news_index or NewsKeywordIndex(news_articles)
+        return index.sentiment(news_articles)
         
     def _calculate_time_factor(self, market: Market) -> float:
         """
@@ -253,20 +774,44 @@ class MarketAnalyzer:
         Returns:
             float: Time factor (0-1, higher is better)
         """
-        if not market.end_date_iso:
+        days_until_end = self._days_until_end(market)
+        if days_until_end is None:
             return 0.5  # Unknown end date
             
-        # Handle timezone-aware datetime comparison
-        now = datetime.now(timezone.utc)
-        if market.end_date_iso.tzinfo is not None:
-            # Both are already timezone-aware
-            market_end = market.end_date_iso
-        else:
-            # Market date is naive, make it aware
-            market_end = market.end_date_iso.replace(tzinfo=timezone.utc)
-            
-        days_until_end = (market_end - now).days
         return self._calculate_time_score_from_days(days_until_end)
+            
+    def _market_features(
+        self,
+        market: Market,
+        price: Optional[MarketPrice] = None
+    ) -> MarketFeatures:
+        """
+        Get the features of a market for the current run.
+        
+        Outside a run they are derived against the current time.
+        
+        Args:
+            market: Market to describe
+            price: Current market price (optional)
+            
+        Returns:
+            MarketFeatures: Market features
+        """
+        if self.features is None:
+            return MarketFeatures.from_market(market, price)
+        return self.features.get(market, price)
+        
+    def _days_until_end(self, market: Market) -> Optional[int]:
+        """
+        Get whole days until market resolution.
+        
+        Args:
+            market: Market to analyze
+            
+        Returns:
+            Optional[int]: Days until end, or None if unknown
+        """
+        return self._market_features(market).days_left
         
     def _calculate_time_score_from_days(self, days_until_end: int) -> float:
         """
@@ -299,7 +844,7 @@ class MarketAnalyzer:
         Returns:
             float: Base probability estimate
         """
-        question_lower = market.question.lower()
+        question_lower = self._market_features(market).question
         
         # For "most seats" or "win the most" type questions in multi-party systems
         if any(phrase in question_lower for phrase in ["most seats", "win the most", "hold the most"]):
@@ -381,32 +926,7 @@ class MarketAnalyzer:
         """
         Calculate scoring based on simple opportunity.
         """
-        # Value score based on edge
-        value_score = min(1.0, opportunity.edge / 0.3)  # Normalize to 0-1
-        
-        # Confidence from the pattern analyzer
-        confidence_score = opportunity.confidence
-        
-        # Volume score
-        volume_score = 0.5
-        if market.volume:
-            volume_score = min(1.0, market.volume / 50000)
-            
-        # Time score
-        time_score = self._calculate_time_factor(market)
-        
-        # News relevance (reduced importance for simple patterns)
-        news_relevance_score = 0.3  # Default
-        if news_articles and opportunity.pattern_type == "NEWS_OVERREACTION":
-            news_relevance_score = 0.8
-            
-        return OpportunityScore(
-            value_score=value_score,
-            confidence_score=confidence_score,
-            volume_score=volume_score,
-            time_score=time_score,
-            news_relevance_score=news_relevance_score
-        )
+        return self._score_candidates([(market, price, opportunity)], news_articles).to_score(0)
     
     def _calculate_opportunity_score(
         self,
@@ -434,46 +954,16 @@ class MarketAnalyzer:
             abs(fair_yes_price - price.yes_price),
             abs(fair_no_price - price.no_price)
         )
-        value_score = min(1.0, value_diff / 0.3)  # Normalize to 0-1
-        
-        # Confidence score: How confident we are in the analysis
-        confidence_factors = []
-        
-        # More news articles = higher confidence
-        if news_articles:
-            news_confidence = min(1.0, len(news_articles) / 10)
-            confidence_factors.append(news_confidence)
-            
-        # Time factor
-        time_factor = self._calculate_time_factor(market)
-        confidence_factors.append(time_factor)
         
-        # Market maturity (higher volume = higher confidence)
-        if market.volume:
-            volume_confidence = min(1.0, market.volume / 10000)
-            confidence_factors.append(volume_confidence)
-            
-        confidence_score = sum(confidence_factors) / len(confidence_factors) if confidence_factors else 0.3
-        
-        # Volume score: Market liquidity
-        volume_score = 0.5
-        if market.volume:
-            volume_score = min(1.0, market.volume / 50000)
-            
-        # Time score: Time until resolution
-        time_score = self._calculate_time_factor(market)
-        
-        # News relevance score
         related_news = self._find_related_news(market, news_articles)
-        news_relevance_score = min(1.0, len(related_news) / 5)
-        
-        return OpportunityScore(
-            value_score=value_score,
-            confidence_score=confidence_score,
-            volume_score=volume_score,
-            time_score=time_score,
-            news_relevance_score=news_relevance_score
-        )
+        
+        return score_fair_value_opportunities(
+            value_diff=[value_diff],
+            volume=[market.volume],
+            days_to_end=[self._days_until_end(market)],
+            news_counts=[len(news_articles)],
+            related_news_counts=[len(related_news)]
+        ).to_score(0)
         
     def _find_related_news(
         self,
@@ -490,19 +980,24 @@ class MarketAnalyzer:
         Returns:
             List[NewsArticle]: Related news articles
         """
-        market_keywords = self._extract_market_keywords(market)
-        related = []
+        if not news_articles:
+            return []
         
-        for article in news_articles:
-            article_text = f"{article.title} {article.description or ''}".lower()
+        return self._get_news_index(news_articles).find(self._extract_market_keywords(market))
             
-            # Check if any market keywords appear in the article
-            for keyword in market_keywords:
-                if keyword in article_text:
-                    related.append(article)
-                    break
+    def _get_news_index(self, news_articles: List[NewsArticle]) -> NewsKeywordIndex:
+        """
+        Get the keyword index for an article list, building it if needed.
                     
-        return related
+        Args:
+            news_articles: Available news articles
+            
+        Returns:
+            NewsKeywordIndex: Index over news_articles
+        """
+        if self._news_index is None or not self._news_index.covers(news_articles):
+            self._news_index = NewsKeywordIndex(news_articles)
+        return self._news_index
         
     def _extract_market_keywords(self, market: Market) -> List[str]:
         """
@@ -515,7 +1010,7 @@ class MarketAnalyzer:
             List[str]: List of keywords
         """
         # Simple keyword extraction
-        question = market.question.lower()
+        features = self._market_features(market)
         
         # Remove common words
         stop_words = {
@@ -524,8 +1019,7 @@ class MarketAnalyzer:
             "do", "does", "did", "can", "could", "should", "would", "may", "might", "must"
         }
         
-        words = question.split()
-        keywords = [word.strip(".,!?;:") for word in words if word not in stop_words and len(word) > 2]
+        keywords = [word.strip(".,!?;:") for word in features.words if word not in stop_words and len(word) > 2]
         
         return keywords[:10]  # Return top 10 keywords
         
@@ -584,9 +1078,7 @@ class MarketAnalyzer:
             sentiment_desc = "positive" if news_sentiment > 0.1 else "negative" if news_sentiment < -0.1 else "neutral"
             
             # Get news source quality
-            high_quality_sources = sum(1 for article in related_news 
-                                     if any(source in article.source.name.lower() 
-                                           for source in ["reuters", "bbc", "bloomberg", "associated press", "wall street journal"]))
+            high_quality_sources = NewsKeywordIndex.high_quality_count(related_news)
             
             reasoning_parts.append(f"News analysis: {len(related_news)} articles with {sentiment_desc} sentiment")
             if high_quality_sources > 0:
@@ -614,14 +1106,9 @@ class MarketAnalyzer:
             reasoning_parts.append("Volume data unavailable - liquidity risk unknown")
             
         # Time analysis with specific metrics
-        if market.end_date_iso:
-            # Handle timezone-aware datetime comparison
-            now = datetime.now(timezone.utc)
-            if market.end_date_iso.tzinfo is None:
-                # Make market date timezone-aware
-                market.end_date_iso = market.end_date_iso.replace(tzinfo=timezone.utc)
-                
-            days_until_end = (market.end_date_iso - now).days
+        features = self._market_features(market, price)
+        if features.days_left is not None:
+            days_until_end = features.days_left
             time_score = self._calculate_time_score_from_days(days_until_end)
             
             if days_until_end <= 7:
@@ -648,8 +1135,8 @@ class MarketAnalyzer:
             confidence_factors.append("adequate news coverage")
         if market.volume and market.volume > 5000:
             confidence_factors.append("sufficient market volume")
-        if market.end_date_iso:
-            days_left = (market.end_date_iso - datetime.now(timezone.utc)).days if market.end_date_iso else None
+        if features.days_left is not None:
+            days_left = features.days_left
             if days_left and days_left <= 30:
                 confidence_factors.append("near-term resolution")
                 
@@ -0,0 +1,268 @@
+"""
+Single-pass market classification for the fair value engine.
+
+The fair value engine routes a market three ways: to a domain model, to
+a base-rate rule, and to an evidence weighting type. Each route used to
+probe the same family checks in its own order, so a market was scanned
+for political, crypto, sports and other terms several times per fair
+value. classify() runs every family check once and derives all three
+routes from the result. A MarketClassifier caches the result per market,
+keyed by condition ID and a digest of the question and description, so
+a market keeps its classification across runs until its text changes.
+The digest does not depend on the process, so keys can be persisted or
+shared with worker processes.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from src.clients.polymarket.market_features import FeatureStore, MarketFeatures
+from src.clients.polymarket.models import Market
+
+
+class MarketFamily(Enum):
+    """Families of markets with their own base rates."""
+    MULTI_PARTY = "multi_party"
+    CONSTITUTIONAL = "constitutional"
+    POLITICAL = "political"
+    CRYPTO = "crypto"
+    SPORTS = "sports"
+    ENTERTAINMENT = "entertainment"
+    WEATHER = "weather"
+    TECHNOLOGY = "technology"
+    CORPORATE = "corporate"
+    RARE_EVENT = "rare_event"
+
+
+# Base-rate rules, first family present wins
+BASE_RATE_ORDER = (
+    MarketFamily.MULTI_PARTY,
+    MarketFamily.CONSTITUTIONAL,
+    MarketFamily.POLITICAL,
+    MarketFamily.CRYPTO,
+    MarketFamily.SPORTS,
+    MarketFamily.ENTERTAINMENT,
+    MarketFamily.WEATHER,
+    MarketFamily.TECHNOLOGY,
+    MarketFamily.CORPORATE,
+    MarketFamily.RARE_EVENT,
+)
+
+# Families with a domain model, tried in this order
+DOMAIN_MODEL_ORDER = (
+    MarketFamily.POLITICAL,
+    MarketFamily.CRYPTO,
+    MarketFamily.SPORTS,
+    MarketFamily.ENTERTAINMENT,
+    MarketFamily.WEATHER,
+    MarketFamily.TECHNOLOGY,
+)
+
+# Evidence weighting type when no domain family matches
+GENERAL = "general"
+
+MULTI_PARTY_PHRASES = ("most seats", "win the most", "hold the most", "plurality", "largest party")
+PARTY_TERMS = (
+    "ldp", "cdp", "party", "democratic", "republican", "conservative", "liberal",
+    "sdp", "jcp", "komeito", "jip", "dpj", "dpp", "labour", "labor", "green",
+    "reiwa", "shinsengumi"
+)
+CONSTITUTIONAL_TERMS = (
+    "constitutional amendment", "22nd amendment", "term limits", "repeal",
+    "constitution", "amendment", "supreme court", "constitutional"
+)
+CONSTITUTIONAL_ACTIONS = (
+    "repeal presidential term limits", "change term limits", "third term",
+    "more than two terms", "eliminate term limits", "extend presidency"
+)
+TERM_LIMIT_TERMS = ("term limit", "22nd amendment", "third term")
+POLITICAL_TERMS = (
+    "trump", "biden", "president", "election", "impeach", "resign",
+    "tariff", "war", "treaty", "law", "bill", "congress", "senate"
+)
+CRYPTO_TERMS = (
+    "bitcoin", "ethereum", "crypto", "btc", "eth", "price", "etf",
+    "sec", "approved", "stock", "market", "$"
+)
+SPORTS_TERMS = (
+    "nfl", "nba", "mlb", "nhl", "championship", "super bowl", "world series",
+    "playoffs", "trade", "draft", "coach", "fire", "retire", "mvp"
+)
+ENTERTAINMENT_TERMS = (
+    "oscar", "emmy", "grammy", "golden globe", "award", "nomination",
+    "renewed", "cancelled", "canceled", "season", "tv show",
+    "box office", "movie", "film", "gross", "celebrity"
+)
+WEATHER_TERMS = (
+    "hurricane", "storm", "temperature", "rainfall", "snow", "drought",
+    "wildfire", "tornado", "weather", "climate", "degrees", "inches",
+    "global warming", "sea level", "ice", "record high", "record low"
+)
+TECHNOLOGY_TERMS = (
+    "technology", "tech", "software", "hardware", "ai", "artificial intelligence",
+    "launch", "release", "product", "acquisition", "merger", "ipo",
+    "adoption", "users", "download", "install", "upgrade", "version",
+    "patent", "innovation", "breakthrough", "development", "announcement"
+)
+CORPORATE_TERMS = (
+    "merger", "acquisition", "ceo", "earnings", "ipo", "bankruptcy",
+    "tesla", "apple", "amazon", "google", "microsoft", "meta"
+)
+RARE_EVENT_TERMS = (
+    "pandemic", "earthquake", "hurricane", "war", "nuclear", "asteroid",
+    "collapse", "crash", "disaster", "outbreak"
+)
+
+# Families decided by the question alone
+QUESTION_TERMS = (
+    (MarketFamily.POLITICAL, POLITICAL_TERMS),
+    (MarketFamily.CRYPTO, CRYPTO_TERMS),
+    (MarketFamily.SPORTS, SPORTS_TERMS),
+    (MarketFamily.ENTERTAINMENT, ENTERTAINMENT_TERMS),
+    (MarketFamily.WEATHER, WEATHER_TERMS),
+    (MarketFamily.TECHNOLOGY, TECHNOLOGY_TERMS),
+    (MarketFamily.CORPORATE, CORPORATE_TERMS),
+    (MarketFamily.RARE_EVENT, RARE_EVENT_TERMS),
+)
+
+
+def _contains_any(text: str, terms: Tuple[str, ...]) -> bool:
+    """Check whether any term occurs in a text."""
+    for term in terms:
+        if term in text:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class Classification:
+    """
+    Families a market belongs to and the routes derived from them.
+    """
+    families: FrozenSet[MarketFamily]
+    subtype: Optional[MarketFamily]  # Base-rate family (None for the learning categorizer)
+    domain_models: Tuple[MarketFamily, ...]  # Domain models to try, in order
+    market_type: str  # Evidence weighting type for the Bayesian updater
+    
+    def has(self, family: MarketFamily) -> bool:
+        """
+        Check whether the market belongs to a family.
+        
+        Args:
+            family: Family to check
+            
+        Returns:
+            bool: True if the family's terms matched
+        """
+        return family in self.families
+
+
+def classify(features: MarketFeatures) -> Classification:
+    """
+    Classify a market from its features in one pass.
+    
+    Args:
+        features: Features of the market
+        
+    Returns:
+        Classification: Families and routes
+    """
+    question = features.question
+    families = {family for family, terms in QUESTION_TERMS if _contains_any(question, terms)}
+    
+    if _contains_any(question, MULTI_PARTY_PHRASES) and _contains_any(question, PARTY_TERMS):
+        families.add(MarketFamily.MULTI_PARTY)
+        
+    full_text = f"{question} {features.description}"
+    is_trump_term_limits = "trump" in full_text and _contains_any(full_text, TERM_LIMIT_TERMS)
+    if (
+        (_contains_any(full_text, CONSTITUTIONAL_TERMS) and _contains_any(full_text, CONSTITUTIONAL_ACTIONS))
+        or is_trump_term_limits
+    ):
+        families.add(MarketFamily.CONSTITUTIONAL)
+        
+    subtype = next((family for family in BASE_RATE_ORDER if family in families), None)
+    typed = [family for family in DOMAIN_MODEL_ORDER if family in families]
+    # Constitutional questions skip the political model but keep its evidence weighting
+    domain_models = tuple(
+        family for family in typed
+        if not (family is MarketFamily.POLITICAL and MarketFamily.CONSTITUTIONAL in families)
+    )
+    return Classification(
+        families=frozenset(families),
+        subtype=subtype,
+        domain_models=domain_models,
+        market_type=typed[0].value if typed else GENERAL
+    )
+
+
+class MarketClassifier:
+    """
+    Classification cache keyed by market and text.
+    """
+    
+    def __init__(self, max_entries: int = 50000):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries: Classifications kept before the oldest are dropped
+        """
+        self.max_entries = max_entries
+        self._cache: Dict[Tuple[str, str], Classification] = {}
+        self.hits = 0
+        self.misses = 0
+        
+    @staticmethod
+    def key(market: Market) -> Tuple[str, str]:
+        """
+        Get the cache key of a market.
+        
+        Args:
+            market: Market to key
+            
+        Returns:
+            Tuple[str, str]: Condition ID and hex digest of the question and description
+        """
+        text = f"{market.question}\x00{market.description or ''}"
+        return market.condition_id, hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        
+    def classify(self, market: Market, store: Optional[FeatureStore] = None) -> Classification:
+        """
+        Classify a market, reusing the cached result if its text is unchanged.
+        
+        Features are only derived on a cache miss.
+        
+        Args:
+            market: Market to classify
+            store: Run's feature store (features are derived here if omitted)
+            
+        Returns:
+            Classification: Families and routes
+        """
+        key = self.key(market)
+        classification = self._cache.get(key)
+        if classification is not None:
+            self.hits += 1
+            return classification
+            
+        self.misses += 1
+        features = store.get(market) if store is not None else MarketFeatures.from_market(market)
+        classification = classify(features)
+        if len(self._cache) >= self.max_entries:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = classification
+        return classification
+        
+    def clear(self) -> None:
+        """Drop every cached classification and reset the counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+        
+    def __len__(self) -> int:
+        """Number of cached classifications."""
+        return len(self._cache)
@@ -5,14 +5,35 @@ Pydantic models for market analysis.
 from datetime import datetime
 from typing import List, Optional, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from src.analyzers.ranking import OpportunityRanking
+from src.utils.timing import StageTimings
+
+
+# Component weights for OpportunityScore.overall_score (sum to 1.0)
+SCORE_WEIGHTS = {
+    "value": 0.3,
+    "confidence": 0.25,
+    "volume": 0.2,
+    "time": 0.15,
+    "news": 0.1
+}
+
+# Minimum confidence_score for an opportunity to count as high confidence
+HIGH_CONFIDENCE_THRESHOLD = 0.7
 
 
 class OpportunityScore(BaseModel):
     """
     Score for a market opportunity.
+    
+    Scores are frozen so a ranking's cached keys cannot go stale; rescore
+    an opportunity by replacing it with a copy that has a new score.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     value_score: float = Field(..., ge=0, le=1, description="Value opportunity score (0-1)")
     confidence_score: float = Field(..., ge=0, le=1, description="Confidence in analysis (0-1)")
     volume_score: float = Field(..., ge=0, le=1, description="Market volume score (0-1)")
@@ -27,20 +48,12 @@ class OpportunityScore(BaseModel):
         Returns:
             float: Weighted overall score (0-1)
         """
-        weights = {
-            "value": 0.3,
-            "confidence": 0.25,
-            "volume": 0.2,
-            "time": 0.15,
-            "news": 0.1
-        }
-        
         return (
-            self.value_score * weights["value"] +
-            self.confidence_score * weights["confidence"] +
-            self.volume_score * weights["volume"] +
-            self.time_score * weights["time"] +
-            self.news_relevance_score * weights["news"]
+            self.value_score * SCORE_WEIGHTS["value"] +
+            self.confidence_score * SCORE_WEIGHTS["confidence"] +
+            self.volume_score * SCORE_WEIGHTS["volume"] +
+            self.time_score * SCORE_WEIGHTS["time"] +
+            self.news_relevance_score * SCORE_WEIGHTS["news"]
         )
 
 
@@ -69,7 +82,7 @@ class MarketOpportunity(BaseModel):
     recommended_position: str = Field(..., description="Recommended position (YES/NO)")
     
     # Scoring
-    score: OpportunityScore = Field(..., description="Opportunity scoring")
+    score: OpportunityScore = Field(..., frozen=True, description="Opportunity scoring")
     
     # Metadata
     end_date: Optional[datetime] = Field(None, description="Market end date")
@@ -139,7 +152,117 @@ class AnalysisResult(BaseModel):
     analysis_duration_seconds: float = Field(..., description="Analysis duration")
     news_articles_processed: int = Field(..., description="News articles processed")
     analyzed_at: datetime = Field(default_factory=datetime.now, description="Analysis timestamp")
+    markets_reanalyzed: Optional[int] = Field(
+        default=None,
+        description="Markets re-analyzed by an incremental run (None for a full run)"
+    )
+    markets_skipped: int = Field(default=0, description="Unchanged markets carried forward")
+    timings: Optional[StageTimings] = Field(default=None, description="Per-stage and per-market timings")
+    budget_seconds: Optional[float] = Field(default=None, description="Time budget the run was given")
+    partial: bool = Field(default=False, description="Stopped at the time budget before covering every market")
+    markets_covered: Optional[int] = Field(
+        default=None,
+        description="Markets fully analyzed within the time budget (None without a budget)"
+    )
+    markets_cancelled: int = Field(default=0, description="In-flight markets cancelled at the deadline")
+    
+    _ranking: Optional[OpportunityRanking] = PrivateAttr(default=None)
     
+    @property
+    def skipped_work_ratio(self) -> float:
+        """
+        Get the share of markets an incremental run did not re-analyze.
+        
+        Returns:
+            float: Skipped markets / markets analyzed (0-1)
+        """
+        if not self.total_markets_analyzed:
+            return 0.0
+        return self.markets_skipped / self.total_markets_analyzed
+        
+    @property
+    def coverage(self) -> float:
+        """
+        Get the share of markets a budgeted run finished analyzing.
+        
+        Returns:
+            float: Covered markets / markets analyzed (0-1, 1 without a budget)
+        """
+        if self.markets_covered is None or not self.total_markets_analyzed:
+            return 1.0
+        return self.markets_covered / self.total_markets_analyzed
+        
+    @property
+    def ranking(self) -> OpportunityRanking:
+        """
+        Get the ranking index over opportunities.
+        
+        The index is built on first use and follows appends to the
+        opportunities list; it is rebuilt if the list is replaced or an
+        opportunity in it is removed or replaced.
+        
+        Returns:
+            OpportunityRanking: Ranking index
+        """
+        if self._ranking is None or self._ranking.source is not self.opportunities:
+            self._ranking = OpportunityRanking(self.opportunities)
+        return self._ranking
+        
+    def add_opportunity(self, opportunity: MarketOpportunity) -> None:
+        """
+        Add an opportunity, keeping the ranking up to date.
+        
+        Args:
+            opportunity: Opportunity to add
+        """
+        self.ranking.add(opportunity)
+        
+    def top(
+        self,
+        k: Optional[int] = 10,
+        by: str = "overall",
+        high_confidence: bool = False
+    ) -> List[MarketOpportunity]:
+        """
+        Get the best opportunities by a score component.
+        
+        Args:
+            k: Number of opportunities (None for all)
+            by: Score component ("overall", "value", "confidence", "volume", "time", "news")
+            high_confidence: Only include high-confidence opportunities
+            
+        Returns:
+            List[MarketOpportunity]: Opportunities, best first
+        """
+        return self.ranking.top(
+            k,
+            by=by,
+            min_confidence=HIGH_CONFIDENCE_THRESHOLD if high_confidence else None
+        )
+        
+    def find_opportunity(self, opportunity_id: str) -> Optional[MarketOpportunity]:
+        """
+        Find an opportunity by condition ID or by rank in the top list.
+        
+        Args:
+            opportunity_id: Condition ID or 1-based rank by overall score
+            
+        Returns:
+            Optional[MarketOpportunity]: Opportunity if found
+        """
+        for opp in self.opportunities:
+            if opp.condition_id == opportunity_id:
+                return opp
+                
+        try:
+            rank = int(opportunity_id)
+        except ValueError:
+            return None
+        if rank < 1:
+            return None
+        ranked = self.top(rank)
+        return ranked[-1] if len(ranked) == rank else None
+        
     @property
     def top_opportunities(self) -> List[MarketOpportunity]:
         """
@@ -148,11 +271,7 @@ class AnalysisResult(BaseModel):
         Returns:
             List[MarketOpportunity]: Top opportunities
         """
-        return sorted(
-            self.opportunities, 
-            key=lambda x: x.score.overall_score, 
-            reverse=True
-        )[:10]
+        return self.top(10)
         
     @property
     def high_confidence_opportunities(self) -> List[MarketOpportunity]:
@@ -164,7 +283,7 @@ class AnalysisResult(BaseModel):
         """
         return [
             opp for opp in self.opportunities 
-            if opp.score.confidence_score >= 0.7
+            if opp.score.confidence_score >= HIGH_CONFIDENCE_THRESHOLD
         ]
 
 
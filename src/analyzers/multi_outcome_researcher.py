@@ -2,7 +2,6 @@
 Multi-Outcome Market Research Module - Analyzes elections and multi-choice markets
 """
 
-import re
 import httpx
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
@@ -12,6 +11,14 @@ from dataclasses import dataclass
 from typing import Optional as Opt
 
 from src.analyzers.market_researcher import MarketResearcher, SimpleMarket
+from src.analyzers.text_patterns import (
+    CANDIDATE_NAME,
+    ELECTION_PATTERNS,
+    ELECTION_SLUG_SUFFIX,
+    LEADING_WILL,
+    QUESTION_TEMPLATES,
+    template_regex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -183,7 +190,7 @@ class MultiOutcomeResearcher(MarketResearcher):
         """Extract search terms from event slug."""
         # Remove common suffixes
         slug = event_slug.lower()
-        slug = re.sub(r'-(election|primary|nominee|race|contest)$', '', slug)
+        slug = ELECTION_SLUG_SUFFIX.sub('', slug)
         
         # Extract key terms
         terms = []
@@ -215,15 +222,8 @@ class MultiOutcomeResearcher(MarketResearcher):
             return True
         
         # Check for election patterns
-        election_patterns = [
-            r'will (\w+) win',
-            r'(\w+) (for|as) (mayor|president|governor)',
-            r'(democratic|republican) (nominee|primary)',
-            r'which (candidate|party) will'
-        ]
-        
-        for pattern in election_patterns:
-            if re.search(pattern, question):
+        for pattern in ELECTION_PATTERNS:
+            if pattern.search(question):
                 # Check if it contains any base terms
                 for term in base_terms:
                     if term in question:
@@ -234,29 +234,16 @@ class MultiOutcomeResearcher(MarketResearcher):
     def _extract_pattern(self, question: str) -> Optional[str]:
         """Extract pattern from question for finding similar markets."""
         # Common election patterns
-        patterns = [
-            (r'Will (\w+) win the (.+)\?', 'Will {candidate} win the {election}?'),
-            (r'(\w+) for (.+) in (\d+)', '{candidate} for {position} in {year}'),
-            (r'Will (\w+) be the (.+) nominee', 'Will {candidate} be the {party} nominee'),
-        ]
-        
-        for regex, template in patterns:
-            match = re.search(regex, question, re.IGNORECASE)
-            if match:
+        for regex, template in QUESTION_TEMPLATES:
+            if regex.search(question):
                 return template
         
         return None
     
     def _matches_pattern(self, question: str, pattern: str) -> bool:
         """Check if question matches a pattern template."""
-        # Convert pattern to regex
-        pattern_regex = pattern.replace('{candidate}', r'(\w+)')
-        pattern_regex = pattern_regex.replace('{election}', r'(.+)')
-        pattern_regex = pattern_regex.replace('{position}', r'(.+)')
-        pattern_regex = pattern_regex.replace('{year}', r'(\d+)')
-        pattern_regex = pattern_regex.replace('{party}', r'(\w+)')
-        
-        return bool(re.search(pattern_regex, question, re.IGNORECASE))
+        # Templates compile to regexes once and are cached
+        return bool(template_regex(pattern).search(question))
     
     async def _convert_to_simple_market(self, market_data: dict) -> Optional[SimpleMarket]:
         """Convert API data to SimpleMarket."""
@@ -284,7 +271,7 @@ class MultiOutcomeResearcher(MarketResearcher):
         
         for market in markets:
             # Extract candidate name
-            candidate_match = re.search(r'Will (\w+(?:\s+\w+)?)', market.question)
+            candidate_match = CANDIDATE_NAME.search(market.question)
             candidate = candidate_match.group(1) if candidate_match else market.question[:30]
             
             options.append({
@@ -335,7 +322,7 @@ class MultiOutcomeResearcher(MarketResearcher):
                 return "Gubernatorial Election"
         
         # Fall back to first market question pattern
-        return re.sub(r'Will \w+ ', 'Who will ', markets[0].question)
+        return LEADING_WILL.sub('Who will ', markets[0].question)
     
     def _analyze_multi_outcome(self, market: MultiOutcomeMarket) -> Dict:
         """Analyze a multi-outcome market for opportunities."""
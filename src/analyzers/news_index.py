@@ -0,0 +1,235 @@
+"""
+Per-run inverted index over news articles.
+
+Related-news lookup used to scan every article for every keyword of every
+market. The index is built once per batch of articles. It maps each
+lower-cased whitespace token to the articles containing it, so a market's
+related news is the union of its keywords' postings. Keyword matching stays
+substring-based, as before: a keyword also matches any token it is part of
+("bitcoin" matches "bitcoin's"). Those partial matches are resolved once per
+distinct keyword against the token vocabulary and memoized.
+"""
+
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from src.clients.news.models import NewsArticle
+
+# Keyword lists for the simple sentiment heuristic
+POSITIVE_KEYWORDS = [
+    "success", "win", "victory", "positive", "good", "strong",
+    "growth", "increase", "improve", "better", "up", "gain"
+]
+NEGATIVE_KEYWORDS = [
+    "fail", "lose", "defeat", "negative", "bad", "weak",
+    "decline", "decrease", "worse", "down", "loss", "drop"
+]
+
+# Sources whose coverage adds confidence to reasoning
+HIGH_QUALITY_SOURCES = ["reuters", "bbc", "bloomberg", "associated press", "wall street journal"]
+
+
+def article_text(article: NewsArticle) -> str:
+    """
+    Get the lower-cased text used for keyword matching.
+    
+    Args:
+        article: News article
+        
+    Returns:
+        str: Title and description, lower-cased
+    """
+    return f"{article.title} {article.description or ''}".lower()
+
+
+def sentiment_counts(text: str) -> Tuple[int, int]:
+    """
+    Count positive and negative sentiment keywords in text.
+    
+    Args:
+        text: Lower-cased article text
+        
+    Returns:
+        Tuple[int, int]: Positive and negative keyword counts
+    """
+    positive_count = sum(1 for keyword in POSITIVE_KEYWORDS if keyword in text)
+    negative_count = sum(1 for keyword in NEGATIVE_KEYWORDS if keyword in text)
+    return positive_count, negative_count
+
+
+class NewsKeywordIndex:
+    """
+    Inverted index from normalised token to article ids.
+    """
+    
+    def __init__(self, articles: List[NewsArticle]):
+        """
+        Build the index.
+        
+        Args:
+            articles: Articles fetched for this run
+        """
+        self.articles = articles
+        self._size = len(articles)
+        self._texts = [article_text(article) for article in articles]
+        self._positions = {id(article): i for i, article in enumerate(articles)}
+        
+        postings: Dict[str, Set[int]] = {}
+        for i, text in enumerate(self._texts):
+            for token in text.split():
+                postings.setdefault(token, set()).add(i)
+                
+        self._vocabulary = list(postings)
+        self._postings = [frozenset(postings[token]) for token in self._vocabulary]
+        self._token_ids = {token: i for i, token in enumerate(self._vocabulary)}
+        
+        # Tokens never contain whitespace, so a newline-joined blob lets
+        # str.find locate partial matches at C speed
+        self._blob = "\n".join(self._vocabulary)
+        self._token_starts = []
+        offset = 0
+        for token in self._vocabulary:
+            self._token_starts.append(offset)
+            offset += len(token) + 1
+            
+        self._keyword_cache: Dict[str, FrozenSet[int]] = {}
+        self._url_cache: Dict[str, FrozenSet[str]] = {}
+        self._sentiment_cache: Dict[int, Tuple[int, int]] = {}
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def covers(self, articles: List[NewsArticle]) -> bool:
+        """
+        Check whether this index was built from the given article list.
+        
+        Args:
+            articles: Article list
+            
+        Returns:
+            bool: True if the index can answer lookups for it
+        """
+        return articles is self.articles and len(articles) == self._size
+        
+    def article_ids(self, keyword: str) -> FrozenSet[int]:
+        """
+        Get ids of articles whose text contains a keyword.
+        
+        Args:
+            keyword: Lower-cased keyword
+            
+        Returns:
+            FrozenSet[int]: Matching article ids
+        """
+        cached = self._keyword_cache.get(keyword)
+        if cached is not None:
+            return cached
+            
+        if not keyword:
+            # An empty keyword matched every article under substring search
+            ids = frozenset(range(self._size))
+        else:
+            token_ids = set()
+            exact = self._token_ids.get(keyword)
+            if exact is not None:
+                token_ids.add(exact)
+                
+            start = self._blob.find(keyword)
+            while start != -1:
+                token_id = bisect_right(self._token_starts, start) - 1
+                token_ids.add(token_id)
+                next_token = self._token_starts[token_id] + len(self._vocabulary[token_id]) + 1
+                start = self._blob.find(keyword, next_token)
+                
+            ids = frozenset().union(*(self._postings[token_id] for token_id in token_ids))
+            
+        self._keyword_cache[keyword] = ids
+        return ids
+        
+    def find(self, keywords: Iterable[str]) -> List[NewsArticle]:
+        """
+        Get articles matching any keyword, in original article order.
+        
+        Args:
+            keywords: Lower-cased keywords
+            
+        Returns:
+            List[NewsArticle]: Related articles
+        """
+        ids: Set[int] = set()
+        for keyword in keywords:
+            ids.update(self.article_ids(keyword))
+            if len(ids) == self._size:
+                break
+        return [self.articles[i] for i in sorted(ids)]
+        
+    def related_urls(self, keywords: Iterable[str]) -> FrozenSet[str]:
+        """
+        Get URLs of articles matching any keyword.
+        
+        Per-keyword URL sets are memoized, so fingerprinting many markets
+        that share keywords is a union of cached sets.
+        
+        Args:
+            keywords: Lower-cased keywords
+            
+        Returns:
+            FrozenSet[str]: Related article URLs
+        """
+        url_sets = []
+        for keyword in keywords:
+            urls = self._url_cache.get(keyword)
+            if urls is None:
+                urls = frozenset(self.articles[i].url for i in self.article_ids(keyword))
+                self._url_cache[keyword] = urls
+            url_sets.append(urls)
+        return frozenset().union(*url_sets)
+        
+    def _article_sentiment_counts(self, article: NewsArticle) -> Tuple[int, int]:
+        """Get memoized sentiment counts, computing them for unindexed articles."""
+        position: Optional[int] = self._positions.get(id(article))
+        if position is None:
+            return sentiment_counts(article_text(article))
+            
+        counts = self._sentiment_cache.get(position)
+        if counts is None:
+            counts = sentiment_counts(self._texts[position])
+            self._sentiment_cache[position] = counts
+        return counts
+        
+    def sentiment(self, articles: List[NewsArticle]) -> float:
+        """
+        Average keyword sentiment over articles with any sentiment keyword.
+        
+        Args:
+            articles: Articles to score (usually a market's related news)
+            
+        Returns:
+            float: Sentiment score (-1 to 1)
+        """
+        total_sentiment = 0.0
+        article_count = 0
+        
+        for article in articles:
+            positive_count, negative_count = self._article_sentiment_counts(article)
+            if positive_count > 0 or negative_count > 0:
+                total_sentiment += (positive_count - negative_count) / (positive_count + negative_count)
+                article_count += 1
+                
+        return total_sentiment / article_count if article_count > 0 else 0.0
+        
+    @staticmethod
+    def high_quality_count(articles: List[NewsArticle]) -> int:
+        """
+        Count articles from high-quality sources.
+        
+        Args:
+            articles: Articles to check
+            
+        Returns:
+            int: Articles from a high-quality source
+        """
+        return sum(
+            1 for article in articles
+            if any(source in article.source.name.lower() for source in HIGH_QUALITY_SOURCES)
+        )
@@ -0,0 +1,367 @@
+"""
+Declarative pattern rules compiled into a decision table.
+
+A PatternRule states when a pattern applies (YES price band, days-left
+band, keyword groups) and what it predicts (fair value, action,
+confidence). A RuleSet compiles an ordered list of rules once:
+
+- The price axis is cut at every band edge into segments. Each segment
+  lists only the rules whose band overlaps it, so a market is looked up
+  by price with one bisect and never considers rules that cannot apply.
+- Each segment gets a keyword trigger table. Every rule is anchored on
+  its smallest keyword group; the question is lowered once and scanned
+  once for the segment's anchor keywords, and only the rules those hits
+  trigger are verified. Most markets hit nothing and stop there.
+- Triggered rules are verified branch-and-bound: highest price bound on
+  edge x confidence first, stopping once no bound can beat the best
+  match. PruneStats counts the checks run and skipped.
+
+Results follow the hand-written analyzers exactly: every matching rule
+is a candidate, the first matching rule of a group shadows the rest of
+that group, and the best candidate by edge x confidence wins, earlier
+rules winning ties.
+"""
+
+import bisect
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from src.analyzers.prefilter import NumericGate
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
+from src.clients.polymarket.market_features import MarketFeatures, days_until
+from src.clients.polymarket.models import Market, MarketPrice
+
+
+@dataclass(frozen=True)
+class PatternRule:
+    """
+    One pricing pattern.
+    
+    Edge is fair_value - price for BUY_YES and price - fair_value for
+    BUY_NO. The reason is a format string receiving price, days_left and
+    fair_value.
+    """
+    pattern_type: str
+    action: str
+    fair_value: float
+    confidence: float
+    reason: str
+    price_band: Tuple[float, float] = (0.0, 1.0)  # Exclusive bounds on the YES price
+    days_band: Optional[Tuple[int, int]] = None  # Inclusive whole days left; None if no end date needed
+    keywords: Tuple[Tuple[str, ...], ...] = ()  # Every group needs at least one keyword
+    excluded: Tuple[str, ...] = ()  # None of these may appear
+    group: Optional[str] = None  # Only the first matching rule of a group counts
+    require_min_edge: bool = False
+    
+    def edge(self, yes_price: float) -> float:
+        """
+        Calculate the edge this rule claims at a price.
+        
+        Args:
+            yes_price: Current YES price
+            
+        Returns:
+            float: Edge
+        """
+        if self.action == "BUY_YES":
+            return self.fair_value - yes_price
+        return yes_price - self.fair_value
+        
+    def bound(self, yes_price: float) -> Optional[float]:
+        """
+        Bound the score (edge x confidence) the rule can reach at a price.
+        
+        Args:
+            yes_price: Current YES price
+            
+        Returns:
+            Optional[float]: The score if the rule matches, None outside its price band
+        """
+        low, high = self.price_band
+        if not low < yes_price < high:
+            return None
+        return self.edge(yes_price) * self.confidence
+        
+    @property
+    def anchor(self) -> Tuple[str, ...]:
+        """
+        Get the keyword group that triggers the rule.
+        
+        Returns:
+            Tuple[str, ...]: Smallest keyword group (empty if none)
+        """
+        if not self.keywords:
+            return ()
+        return min(self.keywords, key=len)
+
+    def matches(self, question: str) -> bool:
+        """
+        Check the keyword conditions against a lowered question.
+        
+        Args:
+            question: Lowercase question text
+            
+        Returns:
+            bool: True if every keyword group hits and no excluded keyword does
+        """
+        for group in self.keywords:
+            if not any(word in question for word in group):
+                return False
+        return not any(word in question for word in self.excluded)
+
+
+@dataclass
+class PruneStats:
+    """Counts of pattern checks run and skipped."""
+    markets: int = 0
+    evaluated: int = 0
+    pruned: int = 0  # Skipped because the bound could not beat the best so far
+    infeasible: int = 0  # Skipped because the pattern cannot match at the price
+    untriggered: int = 0  # Skipped because none of its trigger keywords appear
+    
+    @property
+    def considered(self) -> int:
+        """
+        Get the number of pattern checks a full evaluation would run.
+        
+        Returns:
+            int: Evaluated plus skipped checks
+        """
+        return self.evaluated + self.skipped
+        
+    @property
+    def prune_rate(self) -> float:
+        """
+        Get the share of pattern checks skipped.
+        
+        Returns:
+            float: Skipped checks over all checks (0 when nothing ran)
+        """
+        if not self.considered:
+            return 0.0
+        return self.skipped / self.considered
+        
+    @property
+    def skipped(self) -> int:
+        """
+        Get the number of pattern checks skipped.
+        
+        Returns:
+            int: Pruned, infeasible and untriggered checks
+        """
+        return self.pruned + self.infeasible + self.untriggered
+        
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.markets = self.evaluated = self.pruned = self.infeasible = self.untriggered = 0
+        
+    def summary(self) -> str:
+        """
+        Describe the counters in one line.
+        
+        Returns:
+            str: Human-readable summary
+        """
+        per_market = self.evaluated / self.markets if self.markets else 0.0
+        return (
+            f"{self.markets} markets, {per_market:.2f} checks/market, "
+            f"{self.prune_rate:.0%} of checks skipped "
+            f"({self.pruned} pruned by bound, {self.infeasible} out of price range, "
+            f"{self.untriggered} without trigger keywords)"
+        )
+
+
+# Rules evaluated as one step: a single rule, or every rule of a group in order
+_Unit = Tuple[int, Tuple[PatternRule, ...]]
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """Units and trigger keywords for one stretch of the price axis."""
+    units: Tuple[_Unit, ...]
+    keywords: Tuple[str, ...]  # Anchor keywords of the units' rules
+    triggers: Dict[str, FrozenSet[int]]  # Anchor keyword -> positions in units
+    unconditional: FrozenSet[int]  # Units with a rule that needs no keywords
+
+
+class RuleSet:
+    """
+    Ordered pattern rules compiled for branch-and-bound evaluation.
+    """
+    
+    def __init__(self, rules: Sequence[PatternRule]):
+        """
+        Compile rules.
+        
+        Args:
+            rules: Rules in priority order (earlier rules win ties)
+        """
+        self.rules = tuple(rules)
+        units: Dict[object, List[PatternRule]] = {}
+        first: Dict[object, int] = {}
+        for order, rule in enumerate(self.rules):
+            key = rule.group if rule.group is not None else order
+            units.setdefault(key, []).append(rule)
+            first.setdefault(key, order)
+        self._units: List[_Unit] = [(first[key], tuple(members)) for key, members in units.items()]
+        self._bounds = sorted({edge for rule in self.rules for edge in rule.price_band})
+        self._segments = [
+            self._compile_segment(low, high)
+            for low, high in zip(self._bounds, [*self._bounds[1:], self._bounds[-1]], strict=True)
+        ]
+        
+    def _compile_segment(self, low: float, high: float) -> _Segment:
+        """Collect the units with a rule whose price band overlaps [low, high)."""
+        units = tuple(
+            (order, members) for order, members in self._units
+            if any(rule.price_band[0] < high and rule.price_band[1] > low for rule in members)
+        )
+        triggers: Dict[str, Set[int]] = {}
+        for position, (_, members) in enumerate(units):
+            for rule in members:
+                for word in rule.anchor:
+                    triggers.setdefault(word, set()).add(position)
+        return _Segment(
+            units=units,
+            keywords=tuple(sorted(triggers)),
+            triggers={word: frozenset(positions) for word, positions in triggers.items()},
+            unconditional=frozenset(
+                position for position, (_, members) in enumerate(units)
+                if any(not rule.keywords for rule in members)
+            )
+        )
+        
+    def _segment(self, yes_price: float) -> Optional[_Segment]:
+        """Look up the segment containing a price."""
+        index = bisect.bisect_right(self._bounds, yes_price) - 1
+        if index < 0:
+            return None
+        return self._segments[index]
+        
+    def evaluate(
+        self,
+        market: Market,
+        price: MarketPrice,
+        min_edge: float = 0.0,
+        features: Optional[MarketFeatures] = None,
+        stats: Optional[PruneStats] = None
+    ) -> Optional[SimpleOpportunity]:
+        """
+        Find the best matching pattern for a market.
+        
+        Args:
+            market: Market to evaluate
+            price: Current market price
+            min_edge: Smallest edge accepted by rules that require one
+            features: Precomputed market features (derived here if omitted)
+            stats: Counters to update with checks run and skipped
+            
+        Returns:
+            Optional[SimpleOpportunity]: Best pattern match, or None
+        """
+        yes_price = price.yes_price
+        segment = self._segment(yes_price)
+        units = segment.units if segment is not None else ()
+        if stats is not None:
+            stats.markets += 1
+            stats.infeasible += len(self._units) - len(units)
+        if not units:
+            return None
+            
+        # One scan for anchor keywords selects the units worth checking
+        question = features.question if features is not None else market.question.lower()
+        positions = set(segment.unconditional)
+        for word in segment.keywords:
+            if word in question:
+                positions |= segment.triggers[word]
+        if stats is not None:
+            stats.untriggered += len(units) - len(positions)
+        if not positions:
+            return None
+            
+        bounded = []
+        for position in positions:
+            order, members = units[position]
+            bounds = [bound for bound in (rule.bound(yes_price) for rule in members) if bound is not None]
+            if bounds:
+                bounded.append((max(bounds), order, members))
+            elif stats is not None:
+                stats.infeasible += 1
+        bounded.sort(key=lambda item: (-item[0], item[1]))
+        
+        days_left = None
+        days_known = False
+        best = None
+        best_score = 0.0
+        best_order = 0
+        for position, (bound, order, members) in enumerate(bounded):
+            if best is not None and (bound < best_score or (bound == best_score and order > best_order)):
+                if stats is not None:
+                    stats.pruned += len(bounded) - position
+                break
+            if stats is not None:
+                stats.evaluated += 1
+            for rule in members:
+                low, high = rule.price_band
+                if not low < yes_price < high:
+                    continue
+                if rule.days_band is not None:
+                    if not days_known:
+                        if features is not None:
+                            days_left = features.days_left
+                        else:
+                            days_left = days_until(market.end_date_iso, datetime.now(timezone.utc))
+                        days_known = True
+                    if days_left is None or not rule.days_band[0] <= days_left <= rule.days_band[1]:
+                        continue
+                if not rule.matches(question):
+                    continue
+                edge = rule.edge(yes_price)
+                if rule.require_min_edge and edge < min_edge:
+                    continue
+                score = edge * rule.confidence
+                if best is None or score > best_score or (score == best_score and order < best_order):
+                    best, best_score, best_order = (rule, edge), score, order
+                # Later rules of a group are shadowed by the first match
+                break
+                
+        if best is None:
+            return None
+        rule, edge = best
+        return SimpleOpportunity(
+            market=market,
+            current_price=yes_price,
+            recommended_action=rule.action,
+            edge=edge,
+            confidence=rule.confidence,
+            reason=rule.reason.format(price=yes_price, days_left=days_left, fair_value=rule.fair_value),
+            pattern_type=rule.pattern_type
+        )
+        
+    def gates(self) -> Tuple[NumericGate, ...]:
+        """
+        Get the price and days gates of every rule, for prefiltering.
+        
+        Returns:
+            Tuple[NumericGate, ...]: One gate per rule
+        """
+        return tuple(NumericGate(*rule.price_band, rule.days_band) for rule in self.rules)
+        
+    def stats(self) -> Dict[str, int]:
+        """
+        Describe the compiled table.
+        
+        Returns:
+            Dict[str, int]: Rule, segment and keyword counts
+        """
+        return {
+            "rules": len(self.rules),
+            "units": len(self._units),
+            "segments": len(self._segments),
+            "keywords": len({
+                word for rule in self.rules
+                for word in (*(w for group in rule.keywords for w in group), *rule.excluded)
+            }),
+            "max_units_per_segment": max((len(segment.units) for segment in self._segments), default=0),
+        }
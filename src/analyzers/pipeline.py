@@ -0,0 +1,565 @@
+"""
+Streaming staged pipeline for an analysis run.
+
+A console run used to be strictly phased: fetch every market, price them,
+fetch news, analyze everything, then log. Here each stage is a task joined
+to the next by a bounded queue:
+
+    ingest -> price -> feature -> pattern -> fair value -> score -> sink
+
+Markets flow through as soon as their page arrives, so the first
+opportunities reach the sink while later pages are still downloading. A
+full queue blocks its producer. A slow stage therefore throttles everything
+upstream, down to page fetching, because the market source is only
+advanced when ingest can enqueue.
+
+The pattern stage takes every market queued for it at once, normally a
+page, and gates them on a MarketTable with the same NumPy masks as
+MarketAnalyzer.analyze_markets; only rows passing them reach per-market
+pattern detection.
+
+In incremental mode the pattern stage looks each market up in the
+analyzer's IncrementalTracker. Unchanged markets skip the remaining work
+and carry their previous opportunity to the sink.
+
+With a time budget, each page is analyzed in priority order, no page or
+stage work starts after the deadline, and the sink stops waiting at it,
+cancelling every stage with whatever was still in flight.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from src.analyzers.budget import AnalysisBudget, prioritize_markets
+from src.analyzers.incremental import MarketFingerprint
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.models import AnalysisResult, MarketOpportunity, OpportunityScore
+from src.analyzers.news_index import NewsKeywordIndex
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
+from src.analyzers.vectorized_scoring import score_pattern_opportunities
+from src.clients.news.models import NewsArticle
+from src.clients.polymarket.market_features import FeatureStore
+from src.clients.polymarket.market_table import MarketTable
+from src.clients.polymarket.models import Market, MarketPrice
+from src.config.settings import settings
+from src.utils.timing import StageTimer
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+PriceFunction = Callable[[Market], Awaitable[Optional[MarketPrice]]]
+NewsSource = Union[List[NewsArticle], Awaitable[List[NewsArticle]]]
+
+
+@dataclass
+class PipelineItem:
+    """A market moving through the pipeline, enriched stage by stage."""
+    seq: int
+    market: Market
+    price: Optional[MarketPrice] = None
+    days_to_end: Optional[int] = None
+    fingerprint: Optional[MarketFingerprint] = None
+    carried: bool = False
+    simple_opportunity: Optional[SimpleOpportunity] = None
+    fair_values: Optional[Tuple[float, float]] = None
+    score: Optional[OpportunityScore] = None
+    opportunity: Optional[MarketOpportunity] = None
+
+
+@dataclass
+class PipelineStats:
+    """Counters for one pipeline run."""
+    markets_ingested: int = 0
+    markets_priced: int = 0
+    candidates: int = 0
+    opportunities: int = 0
+    markets_skipped: int = 0
+    errors: int = 0
+    first_opportunity_seconds: Optional[float] = None
+    stopped_at_deadline: bool = False
+
+
+class AnalysisPipeline:
+    """
+    Runs MarketAnalyzer's stages concurrently over a stream of markets.
+    """
+    
+    def __init__(
+        self,
+        analyzer: MarketAnalyzer,
+        price_fn: PriceFunction,
+        queue_size: Optional[int] = None,
+        score_batch_size: Optional[int] = None
+    ):
+        """
+        Initialize analysis pipeline.
+        
+        Args:
+            analyzer: Analyzer whose pattern, scoring and assembly steps run in the stages
+            price_fn: Coroutine function returning a market's current price
+            queue_size: Capacity of each inter-stage queue (defaults to settings)
+            score_batch_size: Most candidates scored in one vectorized pass (defaults to settings)
+        """
+        self.analyzer = analyzer
+        self.price_fn = price_fn
+        self.queue_size = max(1, queue_size or settings.analysis_pipeline_queue_size)
+        self.score_batch_size = max(1, score_batch_size or settings.analysis_score_batch_size)
+        
+        self.stats = PipelineStats()
+        self.news_articles: List[NewsArticle] = []
+        self._news_future: Optional[asyncio.Future] = None
+        self._news_ready = False
+        self._now = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self._error: Optional[BaseException] = None
+        self._incremental = False
+        self._run_time = time.time()
+        self._budget: Optional[AnalysisBudget] = None
+        self._in_flight: Set[str] = set()
+        self._prior_values: Dict[str, Optional[float]] = {}
+        
+    async def run(
+        self,
+        source: AsyncIterable[List[Market]],
+        news: NewsSource,
+        on_opportunity: Optional[Callable[[MarketOpportunity], None]] = None,
+        incremental: bool = False,
+        timer: Optional[StageTimer] = None,
+        budget: Optional[AnalysisBudget] = None
+    ) -> AnalysisResult:
+        """
+        Run the pipeline to completion.
+        
+        Args:
+            source: Async iterable of market pages
+            news: News articles, or an awaitable resolving to them
+            on_opportunity: Called with each newly found opportunity (not carried-forward ones)
+            incremental: Skip markets unchanged since the analyzer's previous run
+            timer: Stage timer shared with the rest of the run (a fresh one if omitted)
+            budget: Time budget for the run (None for no limit)
+            
+        Returns:
+            AnalysisResult: Analysis results, opportunities in market order
+        """
+        items = []
+        async for item in self._items(source, news, incremental, timer, budget):
+            items.append(item)
+            if on_opportunity and not item.carried:
+                on_opportunity(item.opportunity)
+                
+        items.sort(key=lambda item: item.seq)
+        self.analyzer._log_pattern_stats()
+        
+        return AnalysisResult(
+            opportunities=[item.opportunity for item in items],
+            total_markets_analyzed=self.stats.markets_ingested,
+            analysis_duration_seconds=time.perf_counter() - self._start,
+            news_articles_processed=len(self.news_articles),
+            markets_reanalyzed=(
+                self.stats.markets_ingested - self.stats.markets_skipped if incremental else None
+            ),
+            markets_skipped=self.stats.markets_skipped,
+            timings=self.analyzer.timer.timings(),
+            budget_seconds=budget.seconds if budget is not None else None,
+            partial=self.stats.stopped_at_deadline or (budget is not None and bool(budget.unfinished)),
+            markets_covered=(
+                self.stats.markets_ingested - len(budget.unfinished) if budget is not None else None
+            ),
+            markets_cancelled=budget.cancelled if budget is not None else 0
+        )
+        
+    async def stream(
+        self,
+        source: AsyncIterable[List[Market]],
+        news: NewsSource,
+        incremental: bool = False,
+        budget: Optional[AnalysisBudget] = None
+    ) -> AsyncIterator[MarketOpportunity]:
+        """
+        Yield opportunities in completion order as the stages produce them.
+        
+        Args:
+            source: Async iterable of market pages
+            news: News articles, or an awaitable resolving to them
+            incremental: Skip markets unchanged since the analyzer's previous run
+            budget: Time budget for the run (None for no limit)
+            
+        Yields:
+            MarketOpportunity: Each opportunity found
+        """
+        async for item in self._items(source, news, incremental, budget=budget):
+            yield item.opportunity
+            
+    async def _items(
+        self,
+        source: AsyncIterable[List[Market]],
+        news: NewsSource,
+        incremental: bool = False,
+        timer: Optional[StageTimer] = None,
+        budget: Optional[AnalysisBudget] = None
+    ) -> AsyncIterator[PipelineItem]:
+        """
+        Start the stage tasks and yield finished items from the last queue.
+        
+        Stopping iteration early cancels every stage.
+        """
+        self.stats = PipelineStats()
+        # The analyzer's steps record into the same timer as the stages here
+        self.analyzer.timer = timer or StageTimer()
+        self._start = time.perf_counter()
+        self._now = datetime.now(timezone.utc)
+        # Every stage reads market features computed against the run's now
+        self.analyzer.features = FeatureStore(self._now)
+        self.analyzer._reset_pattern_stats()
+        self._error = None
+        self._news_ready = False
+        self._incremental = incremental
+        self._run_time = time.time()
+        self._budget = budget
+        self._in_flight = set()
+        self.analyzer.incremental_tracker.begin(self.analyzer._analysis_config_key())
+        self._prior_values = (
+            self.analyzer.incremental_tracker.prior_values() if budget is not None else {}
+        )
+        
+        if isinstance(news, list):
+            self._news_future = asyncio.get_running_loop().create_future()
+            self._news_future.set_result(news)
+        else:
+            # Fetch news concurrently with market ingestion
+            self._news_future = asyncio.ensure_future(news)
+            
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(6)]
+        to_price, to_feature, to_pattern, to_fair_value, to_score, to_sink = queues
+        
+        tasks = [
+            asyncio.create_task(self._ingest(source, to_price)),
+            asyncio.create_task(self._stage("price", to_price, to_feature, self._price)),
+            asyncio.create_task(self._stage("feature", to_feature, to_pattern, self._feature)),
+            asyncio.create_task(self._pattern(to_pattern, to_fair_value)),
+            asyncio.create_task(self._stage("fair value", to_fair_value, to_score, self._fair_value)),
+            asyncio.create_task(self._score(to_score, to_sink)),
+        ]
+        
+        cut_off = False
+        try:
+            while True:
+                if self._budget is None:
+                    item = await to_sink.get()
+                else:
+                    try:
+                        item = await asyncio.wait_for(to_sink.get(), self._budget.remaining)
+                    except TimeoutError:
+                        # The finally block cancels the stages mid-flight
+                        self.stats.stopped_at_deadline = cut_off = True
+                        break
+                if item is _DONE:
+                    break
+                self._in_flight.discard(item.market.condition_id)
+                if self.stats.first_opportunity_seconds is None:
+                    self.stats.first_opportunity_seconds = time.perf_counter() - self._start
+                self.stats.opportunities += 1
+                yield item
+                
+            if not cut_off:
+                await asyncio.gather(*tasks)
+            if self._error is not None:
+                raise self._error
+            if self._budget is not None:
+                self._settle_budget()
+            self.analyzer.incremental_tracker.finish(keep_unseen=self.stats.stopped_at_deadline)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if not self._news_future.done():
+                self._news_future.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+    def _settle_budget(self) -> None:
+        """
+        Record markets cut off by the deadline on the budget, and keep
+        their previous incremental results.
+        """
+        for condition_id in self._in_flight:
+            self._budget.cancel(condition_id)
+        self._in_flight = set()
+        for condition_id in self._budget.unfinished:
+            self.analyzer.incremental_tracker.revert(condition_id)
+            
+    def _past_deadline(self, item: PipelineItem) -> bool:
+        """Drop an item without starting its next stage if the deadline has passed."""
+        if self._budget is None or not self._budget.expired:
+            return False
+        self._budget.skip(item.market.condition_id)
+        self._in_flight.discard(item.market.condition_id)
+        return True
+        
+    async def _ingest(self, source: AsyncIterable[List[Market]], outbox: asyncio.Queue) -> None:
+        """Pull market pages from the source and enqueue markets one by one."""
+        try:
+            async for page in source:
+                if self._budget is not None:
+                    if self._budget.expired:
+                        # Leave the remaining pages unfetched
+                        self.stats.stopped_at_deadline = True
+                        break
+                    page = prioritize_markets(page, self._prior_values, self._now)
+                for market in page:
+                    self._in_flight.add(market.condition_id)
+                    await outbox.put(PipelineItem(seq=self.stats.markets_ingested, market=market))
+                    self.stats.markets_ingested += 1
+        except Exception as e:
+            # Let the stages drain what arrived, then surface the error
+            logger.error(f"Market ingestion failed after {self.stats.markets_ingested} markets: {e}")
+            self._error = e
+            
+        await outbox.put(_DONE)
+        
+    async def _stage(
+        self,
+        name: str,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        handler: Callable[[PipelineItem], Awaitable[Optional[PipelineItem]]]
+    ) -> None:
+        """
+        Run a per-item stage.
+        
+        Items the handler returns None for are dropped; a handler error only
+        drops that item.
+        """
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                break
+            if self._past_deadline(item):
+                continue
+            try:
+                result = await handler(item)
+            except Exception as e:
+                self.stats.errors += 1
+                self._in_flight.discard(item.market.condition_id)
+                logger.error(f"Pipeline {name} stage failed for {item.market.condition_id}: {e}")
+                continue
+            if result is not None:
+                await outbox.put(result)
+            else:
+                self._in_flight.discard(item.market.condition_id)
+                
+        await outbox.put(_DONE)
+        
+    async def _price(self, item: PipelineItem) -> Optional[PipelineItem]:
+        """Attach the current price; markets without one stop here."""
+        with self.analyzer.timer.stage("price", item.market.condition_id):
+            item.price = await self.price_fn(item.market)
+        if not item.price:
+            return None
+        self.stats.markets_priced += 1
+        return item
+        
+    async def _feature(self, item: PipelineItem) -> PipelineItem:
+        """Attach per-market features, waiting for news on the first market."""
+        if not self._news_ready:
+            await self._resolve_news()
+        with self.analyzer.timer.stage("filter", item.market.condition_id):
+            item.days_to_end = self.analyzer._market_features(item.market, item.price).days_left
+            item.fingerprint = self.analyzer._fingerprint(item.market, item.price, self.news_articles)
+        return item
+        
+    async def _resolve_news(self) -> None:
+        """Wait for news and index it once for the whole run."""
+        try:
+            if self._budget is None:
+                self.news_articles = await self._news_future
+            else:
+                self.news_articles = await asyncio.wait_for(self._news_future, self._budget.remaining)
+        except Exception as e:
+            logger.warning(f"News unavailable, analyzing without it: {e}")
+            self.news_articles = []
+        with self.analyzer.timer.stage("news"):
+            self.analyzer._news_index = NewsKeywordIndex(self.news_articles)
+        self._news_ready = True
+        
+    async def _pattern(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """
+        Gate whatever markets are queued on table columns in one NumPy pass,
+        then run pattern detection and the minimum-edge gate on the rest.
+        
+        In incremental mode unchanged markets are carried forward first.
+        The gates are the ones MarketAnalyzer applies to a whole batch: the
+        price and volume masks and the pattern analyzer's prefilter.
+        """
+        tracker = self.analyzer.incremental_tracker
+        done = False
+        while not done:
+            batch = [await inbox.get()]
+            while not inbox.empty():
+                batch.append(inbox.get_nowait())
+        
+            done = batch[-1] is _DONE
+            items = []
+            for item in batch:
+                if item is _DONE or self._past_deadline(item):
+                    continue
+                condition_id = item.market.condition_id
+                if self._incremental:
+                    unchanged, previous = tracker.lookup(condition_id, item.fingerprint, self._run_time)
+                    if unchanged:
+                        tracker.carry(condition_id)
+                        self.stats.markets_skipped += 1
+                        if previous is None:
+                            self._in_flight.discard(condition_id)
+                        else:
+                            item.opportunity = previous
+                            item.carried = True
+                            await outbox.put(item)
+                        continue
+                # Record "no opportunity" now; the score stage overwrites it on success
+                tracker.record(condition_id, item.fingerprint, None, self._run_time)
+                items.append(item)
+            if not items:
+                continue
+                
+            for item, passed in zip(items, self._gate(items), strict=True):
+                if passed and not self._past_deadline(item):
+                    item.simple_opportunity = self.analyzer._detect_opportunity(item.market, item.price)
+                    if item.simple_opportunity and item.simple_opportunity.edge >= self.analyzer.min_spread:
+                        self.stats.candidates += 1
+                        await outbox.put(item)
+                        continue
+                self._in_flight.discard(item.market.condition_id)
+        
+            # Let upstream stages refill the queue before the next batch
+            await asyncio.sleep(0)
+            
+        await outbox.put(_DONE)
+        
+    def _gate(self, items: List[PipelineItem]) -> np.ndarray:
+        """
+        Apply the analyzer's column gates to a batch of priced markets.
+        
+        Args:
+            items: Markets to gate
+            
+        Returns:
+            np.ndarray: Boolean mask of markets worth pattern detection
+        """
+        try:
+            with self.analyzer.timer.stage("filter"):
+                table = MarketTable.from_markets(
+                    [item.market for item in items],
+                    {item.market.condition_id: item.price for item in items}
+                )
+                passed = table.priced_mask() & table.volume_mask(self.analyzer.min_volume)
+                # Analyzers without a NumPy prefilter see every row passing the above
+                prefilter = getattr(self.analyzer.pattern_analyzer, "prefilter", None)
+                mask = prefilter(table, self._now) if prefilter is not None and passed.any() else None
+                if isinstance(mask, np.ndarray):
+                    passed &= mask
+                return passed
+        except Exception as e:
+            # Per-market detection applies the price and volume gates itself
+            self.stats.errors += 1
+            logger.error(f"Pipeline pattern gate failed for {len(items)} markets: {e}")
+            return np.ones(len(items), dtype=bool)
+        
+    async def _fair_value(self, item: PipelineItem) -> Optional[PipelineItem]:
+        """
+        Attach fair YES/NO prices.
+        
+        The pattern analyzer's fair value is a few arithmetic operations, so
+        it runs inline on the event loop; the deadline is checked before
+        the stage starts each market.
+        """
+        if item.carried:
+            return item
+            
+        item.fair_values = self.analyzer._calculate_fair_values(item.market, item.simple_opportunity)
+        return item if item.fair_values is not None else None
+        
+    async def _score(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """
+        Score whatever candidates are queued in one vectorized pass, then
+        assemble their opportunities.
+        """
+        done = False
+        while not done:
+            batch = [await inbox.get()]
+            while len(batch) < self.score_batch_size and not inbox.empty():
+                batch.append(inbox.get_nowait())
+                
+            done = batch[-1] is _DONE
+            items = []
+            for item in batch:
+                if item is _DONE:
+                    continue
+                if item.carried:
+                    await outbox.put(item)
+                elif not self._past_deadline(item):
+                    items.append(item)
+            if not items:
+                continue
+                
+            try:
+                with self.analyzer.timer.stage("score"):
+                    scores = score_pattern_opportunities(
+                        edge=[item.simple_opportunity.edge for item in items],
+                        confidence=[item.simple_opportunity.confidence for item in items],
+                        volume=[item.market.volume for item in items],
+                        days_to_end=[item.days_to_end for item in items],
+                        news_counts=[len(self.news_articles)] * len(items),
+                        news_driven=[
+                            item.simple_opportunity.pattern_type == "NEWS_OVERREACTION"
+                            for item in items
+                        ]
+                    )
+            except Exception as e:
+                self.stats.errors += len(items)
+                self._in_flight.difference_update(item.market.condition_id for item in items)
+                logger.error(f"Pipeline score stage failed for {len(items)} markets: {e}")
+                continue
+                
+            for index, item in enumerate(items):
+                try:
+                    item.score = scores.to_score(index)
+                    item.opportunity = self.analyzer._assemble_opportunity(
+                        item.market,
+                        item.price,
+                        item.simple_opportunity,
+                        item.fair_values,
+                        item.score,
+                        self.news_articles
+                    )
+                    self.analyzer.incremental_tracker.record(
+                        item.market.condition_id, item.fingerprint, item.opportunity, self._run_time
+                    )
+                except Exception as e:
+                    self.stats.errors += 1
+                    self._in_flight.discard(item.market.condition_id)
+                    logger.error(f"Pipeline score stage failed for {item.market.condition_id}: {e}")
+                    continue
+                await outbox.put(item)
+                
+            # Let upstream stages refill the queue before the next batch
+            await asyncio.sleep(0)
+            
+        await outbox.put(_DONE)
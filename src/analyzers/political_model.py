@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType, ProbabilityDistribution
+from src.utils.reference_data import ReferenceTable, load_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -471,22 +472,9 @@ class PoliticalMarketModel:
         # Simplified analysis - could be much more sophisticated
         return True  # Placeholder
         
-    def _load_pollster_reliability(self) -> Dict[str, float]:
-        """Load pollster reliability ratings."""
-        return {
-            "cnn": 1.2,
-            "abc": 1.1,
-            "cbs": 1.1,
-            "nbc": 1.1,
-            "fox": 1.0,
-            "quinnipiac": 1.3,
-            "marist": 1.2,
-            "monmouth": 1.3,
-            "reuters": 1.1,
-            "ipsos": 1.0,
-            "rasmussen": 0.8,  # Known Republican lean
-            "trafalgar": 0.7,  # Known Republican lean
-        }
+    def _load_pollster_reliability(self) -> ReferenceTable:
+        """Load pollster reliability ratings (weights by lowercase pollster name)."""
+        return load_reference_data().table("pollsters")
         
     def _load_historical_patterns(self) -> Dict[str, float]:
         """Load historical political patterns."""
@@ -0,0 +1,140 @@
+"""
+Vectorized numeric prefilter for pattern analyzers.
+
+Most markets fail a pattern analyzer on numbers alone: volume below its
+minimum, a YES price at the extremes or outside every pattern's price
+band, or too many days left for the patterns that need a short horizon.
+A NumericProfile states those gates for one analyzer: its basic filters
+plus one NumericGate per pattern band. Applied to a MarketTable it gives
+a mask of the markets worth the per-market text stage in one NumPy pass.
+
+Gates are necessary conditions only. A market failing them cannot match,
+so dropping it changes no result; a market passing them may still fail
+on its question text. Bands are widened by a tiny slack and day windows
+by one day, so float rounding in the columnar arithmetic never drops a
+market the analyzer would match.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.clients.polymarket.market_features import FeatureStore
+from src.clients.polymarket.market_table import MarketTable
+from src.clients.polymarket.models import Market, MarketPrice
+
+# Added to price band edges to absorb float rounding
+PRICE_SLACK = 1e-9
+
+# Added to day windows on both sides
+DAYS_SLACK = 1
+
+
+@dataclass(frozen=True)
+class NumericGate:
+    """
+    Price band and optional days-left window in which a pattern can match.
+    """
+    low: float  # Exclusive lower bound on the YES price
+    high: float  # Exclusive upper bound on the YES price
+    days: Optional[Tuple[int, int]] = None  # Inclusive whole days left; None if any
+    
+    def mask(self, yes_price: np.ndarray, days_left: np.ndarray) -> np.ndarray:
+        """
+        Rows inside the gate.
+        
+        Args:
+            yes_price: YES price per row (NaN if unpriced)
+            days_left: Whole days left per row (NaN if no end date)
+            
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        inside = (yes_price > self.low - PRICE_SLACK) & (yes_price < self.high + PRICE_SLACK)
+        if self.days is not None:
+            low, high = self.days
+            inside &= (days_left >= low - DAYS_SLACK) & (days_left <= high + DAYS_SLACK)
+        return inside
+
+
+@dataclass(frozen=True)
+class NumericProfile:
+    """
+    Numeric gates of one pattern analyzer.
+    """
+    min_volume: float
+    gates: Tuple[NumericGate, ...]
+    volume_required: bool = True  # False if unknown or zero volume passes the volume gate
+    price_floor: float = 0.01  # Prices at or below are rejected
+    price_ceiling: float = 0.99  # Prices at or above are rejected
+    
+    def mask(self, table: MarketTable, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Markets that pass the basic filters and at least one pattern gate.
+        
+        Args:
+            table: Markets with their prices
+            now: Reference time for days left (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Boolean mask over the table's rows
+        """
+        yes_price = table.yes_price
+        passed = (yes_price > self.price_floor) & (yes_price < self.price_ceiling)
+        if self.volume_required:
+            passed &= (table.volume != 0) & (table.volume >= self.min_volume)
+        else:
+            passed &= table.volume_mask(self.min_volume)
+        if not passed.any():
+            return passed
+            
+        days_left = table.days_to_end(now) if any(gate.days for gate in self.gates) else None
+        matchable = np.zeros(len(table), dtype=bool)
+        for gate in self.gates:
+            matchable |= gate.mask(yes_price, days_left)
+        return passed & matchable
+
+
+def gate_all(*masks: np.ndarray) -> np.ndarray:
+    """
+    Combine analyzer masks where a market needs to pass any of them.
+    
+    Args:
+        *masks: Boolean masks over the same rows
+        
+    Returns:
+        np.ndarray: Union of the masks
+    """
+    return np.logical_or.reduce(masks)
+
+
+def analyze_batch(
+    analyzer,
+    markets: Sequence[Market],
+    prices: Sequence[MarketPrice],
+    now: Optional[datetime] = None,
+    table: Optional[MarketTable] = None
+) -> List[Optional[object]]:
+    """
+    Run a pattern analyzer over a batch, prefiltering on numbers first.
+    
+    Args:
+        analyzer: Pattern analyzer with prefilter() and analyze_market()
+        markets: Markets to analyze
+        prices: Price per market, in the same order
+        now: Reference time for days left (defaults to current UTC time)
+        table: Table already built over the same markets and prices (built here if omitted)
+        
+    Returns:
+        List[Optional[object]]: analyze_market's result per market (None where prefiltered)
+    """
+    features = FeatureStore(now)
+    if table is None:
+        table = MarketTable.from_markets(markets, {price.condition_id: price for price in prices})
+    results: List[Optional[object]] = [None] * len(markets)
+    for row in np.flatnonzero(analyzer.prefilter(table, features.now)):
+        market, price = markets[row], prices[row]
+        results[row] = analyzer.analyze_market(market, price, features=features.get(market, price))
+    return results
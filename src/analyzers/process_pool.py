@@ -0,0 +1,306 @@
+"""
+Process-pool backend for CPU-bound market analysis.
+
+Pattern matching, scoring, reasoning and Kelly sizing are pure Python and
+hold the GIL, so on large universes they serialise on the event-loop thread.
+This backend ships chunks of compact market records to worker processes,
+each of which keeps a warm MarketAnalyzer, and merges the opportunities
+back in input order.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.analyzers.budget import AnalysisBudget
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.models import MarketOpportunity
+from src.clients.news.models import NewsArticle, NewsSource
+from src.clients.polymarket.market_features import FeatureStore
+from src.clients.polymarket.models import Market, MarketPrice, Token
+
+logger = logging.getLogger(__name__)
+
+# Plain tuples pickle far smaller and faster than pydantic models
+MarketRecord = Tuple[Any, ...]
+ArticleRecord = Tuple[str, Optional[str], str, str]
+
+# Per-worker state, populated lazily inside each worker process
+_worker_analyzers: Dict[type, MarketAnalyzer] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def to_market_record(market: Market, price: Optional[MarketPrice]) -> MarketRecord:
+    """
+    Flatten a market and its price into a picklable tuple.
+    
+    Args:
+        market: Market to flatten
+        price: Current market price (None if unavailable)
+        
+    Returns:
+        MarketRecord: Compact record
+    """
+    return (
+        market.condition_id,
+        market.question,
+        market.description,
+        market.category,
+        market.market_slug,
+        market.end_date_iso,
+        market.volume,
+        market.liquidity,
+        market.minimum_order_size,
+        tuple((token.token_id, token.outcome, token.price) for token in market.tokens),
+        (price.yes_price, price.no_price, price.spread) if price else None,
+    )
+
+
+def from_market_record(record: MarketRecord) -> Tuple[Market, Optional[MarketPrice]]:
+    """
+    Rebuild a market and price from a compact record without re-validating.
+    
+    Args:
+        record: Record produced by to_market_record
+        
+    Returns:
+        Tuple[Market, Optional[MarketPrice]]: Market and price
+    """
+    (
+        condition_id, question, description, category, market_slug, end_date_iso,
+        volume, liquidity, minimum_order_size, tokens, price_fields
+    ) = record
+    
+    market = Market.model_construct(
+        condition_id=condition_id,
+        question_id=None,
+        question=question,
+        description=description,
+        market_slug=market_slug,
+        tokens=[
+            Token.model_construct(token_id=token_id, outcome=outcome, price=token_price)
+            for token_id, outcome, token_price in tokens
+        ],
+        rewards=None,
+        minimum_order_size=minimum_order_size,
+        category=category,
+        end_date_iso=end_date_iso,
+        active=True,
+        closed=False,
+        volume=volume,
+        liquidity=liquidity,
+    )
+    
+    price = None
+    if price_fields:
+        yes_price, no_price, spread = price_fields
+        price = MarketPrice.model_construct(
+            condition_id=condition_id,
+            yes_price=yes_price,
+            no_price=no_price,
+            spread=spread,
+        )
+        
+    return market, price
+
+
+def to_article_record(article: NewsArticle) -> ArticleRecord:
+    """
+    Flatten the article fields used by analysis into a tuple.
+    
+    Args:
+        article: News article
+        
+    Returns:
+        ArticleRecord: Compact record
+    """
+    return (article.title, article.description, article.url, article.source.name)
+
+
+def from_article_record(record: ArticleRecord) -> NewsArticle:
+    """
+    Rebuild a news article from a compact record without re-validating.
+    
+    Args:
+        record: Record produced by to_article_record
+        
+    Returns:
+        NewsArticle: Article carrying the fields analysis reads
+    """
+    title, description, url, source_name = record
+    return NewsArticle.model_construct(
+        source=NewsSource.model_construct(id=None, name=source_name),
+        author=None,
+        title=title,
+        description=description,
+        url=url,
+        url_to_image=None,
+        published_at=None,
+        content=None,
+    )
+
+
+def _get_worker_analyzer(pattern_analyzer_cls: type) -> MarketAnalyzer:
+    """
+    Get this worker's warm analyzer for a pattern analyzer class.
+    
+    Construction happens once per worker per class; later chunks reuse it.
+    """
+    analyzer = _worker_analyzers.get(pattern_analyzer_cls)
+    if analyzer is None:
+        analyzer = MarketAnalyzer()
+        analyzer.pattern_analyzer = pattern_analyzer_cls()
+        # The parent records predictions so workers never share a file handle
+        analyzer.record_predictions = False
+        _worker_analyzers[pattern_analyzer_cls] = analyzer
+    return analyzer
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get this worker's long-lived event loop."""
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop
+
+
+def analyze_chunk(
+    pattern_analyzer_cls: type,
+    records: Sequence[MarketRecord],
+    article_records: Sequence[ArticleRecord],
+    now: Optional[datetime] = None,
+    mode: Optional[str] = None
+) -> List[MarketOpportunity]:
+    """
+    Worker entry point: analyze a chunk of markets.
+    
+    Args:
+        pattern_analyzer_cls: Pattern analyzer class the parent is using
+        records: Compact market records
+        article_records: Compact news article records
+        now: Reference time of the parent's run (defaults to current UTC time)
+        mode: The parent's analyzer mode, for analyzers that have one
+        
+    Returns:
+        List[MarketOpportunity]: Opportunities found, in record order
+    """
+    analyzer = _get_worker_analyzer(pattern_analyzer_cls)
+    analyzer.features = FeatureStore(now)
+    if mode is not None:
+        analyzer.pattern_analyzer.mode = mode
+    articles = [from_article_record(record) for record in article_records]
+    
+    markets = []
+    price_lookup = {}
+    for record in records:
+        market, price = from_market_record(record)
+        markets.append(market)
+        if price:
+            price_lookup[market.condition_id] = price
+            
+    return _get_worker_loop().run_until_complete(
+        analyzer._analyze_batch(markets, price_lookup, articles)
+    )
+
+
+class ProcessPoolBackend:
+    """
+    Runs MarketAnalyzer's per-market work across worker processes.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 250):
+        """
+        Initialize process pool backend.
+        
+        Args:
+            max_workers: Worker processes (defaults to CPU count)
+            chunk_size: Markets shipped to a worker per task
+        """
+        self.max_workers = max_workers
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+        
+    async def analyze(
+        self,
+        pattern_analyzer_cls: type,
+        markets: List[Market],
+        price_lookup: Dict[str, MarketPrice],
+        news_articles: List[NewsArticle],
+        budget: Optional[AnalysisBudget] = None,
+        now: Optional[datetime] = None,
+        mode: Optional[str] = None
+    ) -> List[MarketOpportunity]:
+        """
+        Analyze markets in worker processes.
+        
+        Chunks are submitted in market order. At the budget's deadline,
+        chunks not yet started are cancelled, and results of chunks still
+        running are discarded (the worker finishes them in the background).
+        Their markets are recorded on the budget as unfinished.
+        
+        Args:
+            pattern_analyzer_cls: Pattern analyzer class to use in workers
+            markets: Markets to analyze
+            price_lookup: Prices keyed by condition ID
+            news_articles: News articles for scoring and reasoning
+            budget: Time budget for the run (None for no limit)
+            now: Reference time shared by all workers (defaults to current UTC time)
+            mode: Mode of the parent's pattern analyzer, for analyzers that have one
+            
+        Returns:
+            List[MarketOpportunity]: Opportunities in market order
+        """
+        now = now or datetime.now(timezone.utc)
+        records = [
+            to_market_record(market, price_lookup.get(market.condition_id))
+            for market in markets
+        ]
+        article_records = [to_article_record(article) for article in news_articles]
+        
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        chunks = [
+            records[i:i + self.chunk_size]
+            for i in range(0, len(records), self.chunk_size)
+        ]
+        
+        futures = [
+            loop.run_in_executor(
+                executor, analyze_chunk, pattern_analyzer_cls, chunk, article_records, now, mode
+            )
+            for chunk in chunks
+        ]
+        if budget is not None and futures:
+            _, pending = await asyncio.wait(futures, timeout=budget.remaining)
+            for future in pending:
+                future.cancel()
+                
+        chunk_results = await asyncio.gather(*futures, return_exceptions=True)
+        
+        opportunities = []
+        for chunk, result in zip(chunks, chunk_results, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                for record in chunk:
+                    budget.cancel(record[0])
+                continue
+            if isinstance(result, BaseException):
+                # A dead worker only loses its own chunk
+                logger.error(f"Worker failed analyzing {len(chunk)} markets: {result}")
+                continue
+            opportunities.extend(result)
+            
+        return opportunities
+        
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
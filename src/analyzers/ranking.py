@@ -0,0 +1,153 @@
+"""
+Incrementally maintained opportunity ranking.
+
+Opportunities are ranked by cached score keys, so repeated top-K queries
+never re-sort the list or recompute overall_score. Each score component
+gets its own sorted index the first time it is queried; after that, every
+added opportunity is inserted into the existing indexes by bisection.
+
+Each query first compares the ranked opportunities with the source list,
+which is a pointer comparison while they are unchanged. Scores are frozen,
+so a score can only change by replacing its opportunity; any replacement
+that compares unequal, or a removal, rebuilds the indexes.
+"""
+
+from bisect import insort
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.analyzers.models import MarketOpportunity, OpportunityScore
+
+
+# Rankable keys, named like SCORE_WEIGHTS plus "overall"
+SCORE_COMPONENTS: Dict[str, Callable[["OpportunityScore"], float]] = {
+    "overall": attrgetter("overall_score"),
+    "value": attrgetter("value_score"),
+    "confidence": attrgetter("confidence_score"),
+    "volume": attrgetter("volume_score"),
+    "time": attrgetter("time_score"),
+    "news": attrgetter("news_relevance_score"),
+}
+
+
+class OpportunityRanking:
+    """
+    Order-statistics index over a list of opportunities.
+    
+    The ranking follows its source list: opportunities appended to the
+    list are picked up and inserted on the next query, and removed or
+    replaced opportunities rebuild the ranking. Ties keep the
+    order in which opportunities were added, as a stable sort would.
+    """
+    
+    def __init__(self, opportunities: Optional[List["MarketOpportunity"]] = None):
+        """
+        Initialize opportunity ranking.
+        
+        Args:
+            opportunities: List to rank; edits to it are tracked
+        """
+        self.source: List["MarketOpportunity"] = opportunities if opportunities is not None else []
+        self._items: List["MarketOpportunity"] = []
+        self._keys: List[Dict[str, float]] = []
+        self._indexes: Dict[str, List[Tuple[float, int]]] = {"overall": []}
+        self.sync()
+        
+    def __len__(self) -> int:
+        self.sync()
+        return len(self._items)
+        
+    def add(self, opportunity: "MarketOpportunity") -> None:
+        """
+        Add an opportunity to the source list and the ranking.
+        
+        Args:
+            opportunity: Opportunity to add
+        """
+        self.sync()
+        self.source.append(opportunity)
+        self._insert(opportunity)
+        
+    def sync(self) -> None:
+        """Catch up with the source list: insert appends, rebuild on any other edit."""
+        count = len(self._items)
+        if self.source[:count] != self._items:
+            # An opportunity was removed, or replaced by one with other fields or score
+            self._items = []
+            self._keys = []
+            self._indexes = {name: [] for name in self._indexes}
+            count = 0
+        for opportunity in self.source[count:]:
+            self._insert(opportunity)
+            
+    def _insert(self, opportunity: "MarketOpportunity") -> None:
+        """
+        Cache an opportunity's score keys and insert it into each index.
+        
+        Args:
+            opportunity: Opportunity to insert
+        """
+        seq = len(self._items)
+        keys = {name: getter(opportunity.score) for name, getter in SCORE_COMPONENTS.items()}
+        self._items.append(opportunity)
+        self._keys.append(keys)
+        for name, index in self._indexes.items():
+            insort(index, (-keys[name], seq))
+            
+    def _index(self, by: str) -> List[Tuple[float, int]]:
+        """
+        Get the sorted index for a score component, building it on first use.
+        
+        Args:
+            by: Score component name
+            
+        Returns:
+            List[Tuple[float, int]]: (negated score, insertion order) pairs
+        """
+        if by not in SCORE_COMPONENTS:
+            raise ValueError(f"Unknown score component: {by}")
+        index = self._indexes.get(by)
+        if index is None:
+            index = sorted((-keys[by], seq) for seq, keys in enumerate(self._keys))
+            self._indexes[by] = index
+        return index
+        
+    def top(
+        self,
+        k: Optional[int] = 10,
+        by: str = "overall",
+        min_confidence: Optional[float] = None,
+        where: Optional[Callable[["MarketOpportunity"], bool]] = None
+    ) -> List["MarketOpportunity"]:
+        """
+        Get the best opportunities by a score component.
+        
+        Filtered views walk the sorted index and stop after k matches.
+        
+        Args:
+            k: Number of opportunities (None for all)
+            by: Score component ("overall", "value", "confidence", "volume", "time", "news")
+            min_confidence: Only include opportunities with at least this confidence
+            where: Additional predicate on the opportunity
+            
+        Returns:
+            List[MarketOpportunity]: Opportunities, best first
+        """
+        self.sync()
+        index = self._index(by)
+        
+        if min_confidence is None and where is None:
+            return [self.source[seq] for _, seq in index[:k]]
+            
+        selected = []
+        for _, seq in index:
+            if k is not None and len(selected) >= k:
+                break
+            if min_confidence is not None and self._keys[seq]["confidence"] < min_confidence:
+                continue
+            opportunity = self.source[seq]
+            if where is not None and not where(opportunity):
+                continue
+            selected.append(opportunity)
+        return selected
@@ -3,11 +3,16 @@ Refined simple pattern analyzer with better validation.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from src.clients.polymarket.market_features import MarketFeatures
+from src.clients.polymarket.market_table import MarketTable
 from src.clients.polymarket.models import Market, MarketPrice
+from src.analyzers.prefilter import NumericGate, NumericProfile
 from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
 
 logger = logging.getLogger(__name__)
@@ -36,20 +41,29 @@ class RefinedSimpleAnalyzer:
             'season', 'series', 'finals', 'bowl'
         ]
         
+        # Price bands (and days left) in which each pattern can match
+        self.gates = (
+            NumericGate(0.15, 0.35, (1, 7)),  # STABLE_TIME_DECAY
+            NumericGate(0.65, 0.85, (1, 7)),
+            NumericGate(0.10, 1.0),  # EXTREME_MISPRICING
+        )
+        
     def analyze_market(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: Optional[MarketFeatures] = None
     ) -> Optional[SimpleOpportunity]:
         """Analyze with better validation."""
         
         if not self._basic_filters(market, price):
             return None
             
-        question_lower = market.question.lower()
+        features = features or MarketFeatures.from_market(market, price)
+        question_lower = features.question
         
         # Check time decay opportunity
-        days_left = self._get_days_left(market)
+        days_left = self._get_days_left(features)
         if days_left and 1 <= days_left <= 7:
             
             # AVOID volatile markets
@@ -62,7 +76,20 @@ class RefinedSimpleAnalyzer:
                 return self._analyze_stable_time_decay(market, price, days_left)
         
         # Check extreme mispricing (but be conservative)
-        return self._check_extreme_mispricing(market, price)
+        return self._check_extreme_mispricing(market, price, features)
+        
+    def prefilter(self, table: MarketTable, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Mask the markets that can match on price, volume and days left alone.
+        
+        Args:
+            table: Markets with their prices
+            now: Reference time for days left (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Boolean mask over the table's rows
+        """
+        return NumericProfile(self.min_volume, self.gates).mask(table, now)
     
     def _basic_filters(self, market: Market, price: MarketPrice) -> bool:
         """Basic filters."""
@@ -72,12 +99,10 @@ class RefinedSimpleAnalyzer:
             return False
         return True
     
-    def _get_days_left(self, market: Market) -> Optional[int]:
+    def _get_days_left(self, features: MarketFeatures) -> Optional[int]:
         """Get days until resolution."""
-        if not market.end_date_iso:
-            return None
-        days = (market.end_date_iso - datetime.now(timezone.utc)).days
-        return days if days >= 0 else None
+        days = features.days_left
+        return days if days is not None and days >= 0 else None
     
     def _analyze_stable_time_decay(
         self,
@@ -119,11 +144,12 @@ class RefinedSimpleAnalyzer:
     def _check_extreme_mispricing(
         self,
         market: Market,
-        price: MarketPrice
+        price: MarketPrice,
+        features: MarketFeatures
     ) -> Optional[SimpleOpportunity]:
         """Check for obvious mispricings only."""
         
-        question = market.question.lower()
+        question = features.question
         
         # Constitutional impossibilities
         if any(term in question for term in [
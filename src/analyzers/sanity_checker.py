@@ -5,10 +5,10 @@ Validates predictions against common sense and market efficiency principles.
 """
 
 import logging
-from datetime import datetime, timezone
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
 
+from src.clients.polymarket.market_features import MarketFeatures
 from src.clients.polymarket.models import Market
 
 logger = logging.getLogger(__name__)
@@ -66,7 +66,8 @@ class SanityChecker:
         market: Market,
         predicted_probability: float,
         confidence: float,
-        reasoning: str
+        reasoning: str,
+        features: Optional[MarketFeatures] = None
     ) -> SanityCheckResult:
         """
         Perform sanity checks on a prediction.
@@ -76,10 +77,12 @@ class SanityChecker:
             predicted_probability: Model's probability estimate
             confidence: Model's confidence level
             reasoning: Model's reasoning
+            features: Precomputed market features (derived here if omitted)
             
         Returns:
             SanityCheckResult with warnings and adjustments
         """
+        features = features or MarketFeatures.from_market(market)
         warnings = []
         confidence_penalty = 0.0
         adjusted_prob = predicted_probability
@@ -98,8 +101,8 @@ class SanityChecker:
                 confidence_penalty += 0.3
                 
         # Check 2: Merger-specific checks
-        if self._is_merger_market(market):
-            merger_warnings = self._check_merger_plausibility(market, predicted_probability)
+        if self._is_merger_market(features):
+            merger_warnings = self._check_merger_plausibility(features, predicted_probability)
             warnings.extend(merger_warnings)
             if merger_warnings:
                 confidence_penalty += 0.2
@@ -121,7 +124,7 @@ class SanityChecker:
                 confidence_penalty += 0.4
                 
         # Check 4: Time-based reality checks
-        time_warnings = self._check_time_feasibility(market, predicted_probability)
+        time_warnings = self._check_time_feasibility(features, predicted_probability)
         warnings.extend(time_warnings)
         if time_warnings:
             confidence_penalty += 0.2
@@ -150,20 +153,19 @@ class SanityChecker:
                 return token.price or 0.5
         return 0.5
         
-    def _is_merger_market(self, market: Market) -> bool:
+    def _is_merger_market(self, features: MarketFeatures) -> bool:
         """Check if market is about a merger or acquisition."""
         keywords = ["merger", "merge", "acquisition", "acquire", "buyout", "combine"]
-        text = f"{market.question} {market.description or ''}".lower()
+        text = features.text
         return any(keyword in text for keyword in keywords)
         
-    def _check_merger_plausibility(self, market: Market, probability: float) -> List[str]:
+    def _check_merger_plausibility(self, features: MarketFeatures, probability: float) -> List[str]:
         """Check if merger prediction is plausible with comprehensive domain knowledge."""
         warnings = []
         
         # Extract company names and context
-        question = market.question.lower()
-        description = (market.description or "").lower()
-        full_text = f"{question} {description}"
+        question = features.question
+        full_text = features.text
         
         # Enhanced unlikely combinations with reasoning
         unlikely_pairs = [
@@ -205,8 +207,8 @@ class SanityChecker:
             
             # Try to extract timeline
             months = re.search(r'(january|february|march|april|may|june|july|august|september|october|november|december)', question)
-            if months and market.end_date_iso:
-                days_until = (market.end_date_iso - datetime.now(timezone.utc)).days
+            if months and features.days_left is not None:
+                days_until = features.days_left
                 if days_until < 60 and probability > 0.2:
                     warnings.append(
                         f"Only {days_until} days until deadline. "
@@ -224,23 +226,23 @@ class SanityChecker:
         reasoning_lower = reasoning.lower()
         return any(keyword in reasoning_lower for keyword in evidence_keywords)
         
-    def _check_time_feasibility(self, market: Market, probability: float) -> List[str]:
+    def _check_time_feasibility(self, features: MarketFeatures, probability: float) -> List[str]:
         """Check if timeline makes sense for the predicted probability."""
         warnings = []
         
-        if not market.end_date_iso:
+        days_until = features.days_left
+        if days_until is None:
             return warnings
             
-        days_until = (market.end_date_iso - datetime.now(timezone.utc)).days
         
         # Short timeline checks
         if days_until < 30:
-            if self._is_merger_market(market) and probability > 0.15:
+            if self._is_merger_market(features) and probability > 0.15:
                 warnings.append(
                     f"Only {days_until} days remaining. Complex corporate events "
                     f"rarely materialize this quickly without prior announcements."
                 )
-            elif "will reach" in market.question.lower() and probability > 0.8:
+            elif "will reach" in features.question and probability > 0.8:
                 # Price target markets
                 warnings.append(
                     f"High probability ({probability:.1%}) for price target "
@@ -4,12 +4,17 @@ Replaces complex fair value engine with proven heuristics.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from src.clients.polymarket.market_features import MarketFeatures
+from src.clients.polymarket.market_table import MarketTable
 from src.clients.polymarket.models import Market, MarketPrice
 from src.clients.news.models import NewsArticle
+from src.analyzers.prefilter import NumericGate, NumericProfile
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +52,24 @@ class SimplePatternAnalyzer:
             'STRUCTURAL': 0.8,
         }
     
+        # Price bands (and days left) in which each pattern can match
+        self.gates = (
+            NumericGate(0.2, 0.8, (0, self.time_decay_days)),  # TIME_DECAY
+            NumericGate(0.15, 1.0),  # EXTREME_PRICE, long shots
+            NumericGate(0.0, 0.85),  # EXTREME_PRICE, near certainties
+            NumericGate(0.65, 1.0),  # STRUCTURAL, true binaries
+            NumericGate(0.0, 0.35),
+            NumericGate(0.05, 1.0),  # STRUCTURAL, impossibilities
+            NumericGate(0.7, 1.0),  # NEWS_OVERREACTION
+            NumericGate(0.0, 0.3),
+        )
+        
     def analyze_market(
         self,
         market: Market,
         price: MarketPrice,
-        news_articles: List[NewsArticle] = None
+        news_articles: List[NewsArticle] = None,
+        features: Optional[MarketFeatures] = None
     ) -> Optional[SimpleOpportunity]:
         """
         Analyze a single market for opportunities.
@@ -60,6 +78,7 @@ class SimplePatternAnalyzer:
             market: Market to analyze
             price: Current market price
             news_articles: Recent news (optional)
+            features: Precomputed market features (derived here if omitted)
             
         Returns:
             SimpleOpportunity if found, None otherwise
@@ -72,16 +91,18 @@ class SimplePatternAnalyzer:
         if price.yes_price <= 0.01 or price.yes_price >= 0.99:
             return None
         
+        features = features or MarketFeatures.from_market(market, price)
+        
         # Try each pattern
         patterns = [
-            self._check_time_decay(market, price),
-            self._check_extreme_pricing(market, price),
-            self._check_structural_inefficiency(market, price),
+            self._check_time_decay(market, price, features),
+            self._check_extreme_pricing(market, price, features),
+            self._check_structural_inefficiency(market, price, features),
         ]
         
         # Add news pattern if we have articles
         if news_articles:
-            patterns.append(self._check_news_overreaction(market, price, news_articles))
+            patterns.append(self._check_news_overreaction(market, price, news_articles, features))
         
         # Return the best opportunity
         opportunities = [p for p in patterns if p is not None]
@@ -92,15 +113,32 @@ class SimplePatternAnalyzer:
             
         return None
     
-    def _check_time_decay(self, market: Market, price: MarketPrice) -> Optional[SimpleOpportunity]:
+    def prefilter(self, table: MarketTable, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Mask the markets that can match on price, volume and days left alone.
+        
+        Args:
+            table: Markets with their prices
+            now: Reference time for days left (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Boolean mask over the table's rows
+        """
+        return NumericProfile(self.min_volume, self.gates, volume_required=False).mask(table, now)
+        
+    def _check_time_decay(
+        self,
+        market: Market,
+        price: MarketPrice,
+        features: MarketFeatures
+    ) -> Optional[SimpleOpportunity]:
         """
         Check for time decay opportunities.
         Markets close to resolution with prices far from 0 or 1.
         """
-        if not market.end_date_iso:
+        days_left = features.days_left
+        if days_left is None:
             return None
-            
-        days_left = (market.end_date_iso - datetime.now(timezone.utc)).days
         
         # Only interested in markets ending soon
         if days_left > self.time_decay_days or days_left < 0:
@@ -140,12 +178,17 @@ class SimplePatternAnalyzer:
                 
         return None
     
-    def _check_extreme_pricing(self, market: Market, price: MarketPrice) -> Optional[SimpleOpportunity]:
+    def _check_extreme_pricing(
+        self,
+        market: Market,
+        price: MarketPrice,
+        features: MarketFeatures
+    ) -> Optional[SimpleOpportunity]:
         """
         Check for extreme mispricing.
         Long shots too high, sure things too low.
         """
-        question = market.question.lower()
+        question = features.question
         
         # Long shot patterns
         longshot_keywords = [
@@ -187,12 +230,17 @@ class SimplePatternAnalyzer:
                 
         return None
     
-    def _check_structural_inefficiency(self, market: Market, price: MarketPrice) -> Optional[SimpleOpportunity]:
+    def _check_structural_inefficiency(
+        self,
+        market: Market,
+        price: MarketPrice,
+        features: MarketFeatures
+    ) -> Optional[SimpleOpportunity]:
         """
         Check for structural market inefficiencies.
         """
         # Binary outcome far from 50/50
-        if self._is_true_binary(market.question):
+        if self._is_true_binary(features.question):
             distance_from_half = abs(price.yes_price - 0.5)
             if distance_from_half > 0.15:  # More than 15% from 50/50
                 if price.yes_price > 0.5:
@@ -213,7 +261,7 @@ class SimplePatternAnalyzer:
                 )
         
         # Constitutional/legal impossibilities
-        if self._is_constitutional_impossibility(market.question):
+        if self._is_constitutional_impossibility(features.question):
             if price.yes_price > 0.05:
                 edge = price.yes_price - 0.02  # These should trade at 2% max
                 return SimpleOpportunity(
@@ -232,14 +280,16 @@ class SimplePatternAnalyzer:
         self,
         market: Market,
         price: MarketPrice,
-        news_articles: List[NewsArticle]
+        news_articles: List[NewsArticle],
+        features: Optional[MarketFeatures] = None
     ) -> Optional[SimpleOpportunity]:
         """
         Check for news-driven overreactions.
         Markets often overreact to headlines.
         """
         # Count relevant news mentions
-        question_keywords = market.question.lower().split()
+        features = features or MarketFeatures.from_market(market, price)
+        question_keywords = features.words
         relevant_articles = 0
         
         for article in news_articles[:20]:  # Check recent 20 articles
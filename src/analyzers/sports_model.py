@@ -2,7 +2,6 @@
 Advanced sports market modeling with performance data, injury reports, and historical patterns.
 """
 
-import re
 import logging
 import statistics
 from datetime import datetime, timedelta
@@ -13,6 +12,16 @@ from enum import Enum
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType, ProbabilityDistribution
+from src.analyzers.text_patterns import (
+    MLB_TEAMS,
+    NBA_TEAMS,
+    NFL_TEAMS,
+    NHL_TEAMS,
+    PLAYER_NAME,
+    Gazetteer,
+    first_match,
+)
+from src.utils.reference_data import ReferenceTable, load_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +49,15 @@ class EventType(Enum):
     DRAFT_PICK = "draft_pick"
 
 
+# Team name lists for the leagues that have one
+TEAMS_BY_SPORT: Dict[SportType, Gazetteer] = {
+    SportType.NFL: NFL_TEAMS,
+    SportType.NBA: NBA_TEAMS,
+    SportType.MLB: MLB_TEAMS,
+    SportType.NHL: NHL_TEAMS,
+}
+
+
 @dataclass
 class TeamPerformance:
     """Team performance metrics."""
@@ -372,39 +390,17 @@ class SportsMarketModel:
             
     def _extract_team_name(self, question: str, sport_type: SportType) -> Optional[str]:
         """Extract team name from market question."""
-        question_lower = question.lower()
-        
-        if sport_type == SportType.NFL:
-            teams = self._get_nfl_teams()
-        elif sport_type == SportType.NBA:
-            teams = self._get_nba_teams()
-        elif sport_type == SportType.MLB:
-            teams = self._get_mlb_teams()
-        elif sport_type == SportType.NHL:
-            teams = self._get_nhl_teams()
-        else:
-            teams = []
-            
-        for team in teams:
-            if team.lower() in question_lower:
-                return team
-                
-        return None
+        teams = TEAMS_BY_SPORT.get(sport_type)
+        if teams is None:
+            return None
+        return teams.find(question.lower())
         
     def _extract_player_name(self, question: str) -> Optional[str]:
         """Extract player name from market question."""
         # Common player name patterns - fixed to handle names like "LeBron James"
-        player_patterns = [
-            r"will ([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+)",  # Matches "LeBron James"
-            r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) retire",
-            r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) will",
-            r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) to",  # "LeBron James to win"
-        ]
-        
-        for pattern in player_patterns:
-            match = re.search(pattern, question)
-            if match:
-                return match.group(1)
+        match = first_match(PLAYER_NAME, question)
+        if match:
+            return match.group(1)
                 
         return None
         
@@ -726,43 +722,21 @@ class SportsMarketModel:
                     
         return statistics.mean(sentiment_scores) if sentiment_scores else 0.0
         
-    def _get_nfl_teams(self) -> List[str]:
+    def _get_nfl_teams(self) -> Tuple[str, ...]:
         """Get list of NFL team names."""
-        return [
-            "Chiefs", "Bills", "Bengals", "Ravens", "Browns", "Steelers", "Titans", "Colts", 
-            "Texans", "Jaguars", "Chargers", "Raiders", "Broncos", "Cowboys", "Giants", 
-            "Eagles", "Commanders", "Packers", "Bears", "Lions", "Vikings", "Falcons", 
-            "Panthers", "Saints", "Buccaneers", "Cardinals", "Rams", "49ers", "Seahawks",
-            "Jets", "Dolphins", "Patriots"
-        ]
+        return NFL_TEAMS.names
         
-    def _get_nba_teams(self) -> List[str]:
+    def _get_nba_teams(self) -> Tuple[str, ...]:
         """Get list of NBA team names."""
-        return [
-            "Lakers", "Warriors", "Celtics", "Heat", "Nets", "Knicks", "76ers", "Bucks",
-            "Bulls", "Cavaliers", "Pistons", "Pacers", "Hawks", "Hornets", "Magic", "Wizards",
-            "Raptors", "Nuggets", "Timberwolves", "Thunder", "Trail Blazers", "Jazz", "Suns",
-            "Kings", "Clippers", "Mavericks", "Rockets", "Grizzlies", "Pelicans", "Spurs"
-        ]
+        return NBA_TEAMS.names
         
-    def _get_mlb_teams(self) -> List[str]:
+    def _get_mlb_teams(self) -> Tuple[str, ...]:
         """Get list of MLB team names."""
-        return [
-            "Yankees", "Red Sox", "Blue Jays", "Orioles", "Rays", "White Sox", "Indians", 
-            "Tigers", "Royals", "Twins", "Astros", "Angels", "Athletics", "Mariners", "Rangers",
-            "Braves", "Marlins", "Mets", "Phillies", "Nationals", "Cubs", "Reds", "Brewers",
-            "Pirates", "Cardinals", "Diamondbacks", "Rockies", "Dodgers", "Padres", "Giants"
-        ]
+        return MLB_TEAMS.names
         
-    def _get_nhl_teams(self) -> List[str]:
+    def _get_nhl_teams(self) -> Tuple[str, ...]:
         """Get list of NHL team names."""
-        return [
-            "Bruins", "Sabres", "Red Wings", "Panthers", "Canadiens", "Senators", "Lightning",
-            "Maple Leafs", "Hurricanes", "Blue Jackets", "Devils", "Islanders", "Rangers",
-            "Flyers", "Penguins", "Capitals", "Blackhawks", "Avalanche", "Stars", "Wild",
-            "Predators", "Blues", "Jets", "Flames", "Oilers", "Canucks", "Ducks", "Kings",
-            "Sharks", "Coyotes", "Golden Knights", "Kraken"
-        ]
+        return NHL_TEAMS.names
         
     # Additional helper methods for other event types
     def _calculate_trade_probability(self, market: Market, news_articles: List[NewsArticle], sport_type: SportType) -> ProbabilityDistribution:
@@ -858,9 +832,9 @@ class SportsMarketModel:
         else:
             return 0.0
             
-    def _load_team_databases(self) -> Dict:
-        """Load team databases."""
-        return {}
+    def _load_team_databases(self) -> ReferenceTable:
+        """Load team databases (records by lowercase team name)."""
+        return load_reference_data().table("teams")
         
     def _load_historical_patterns(self) -> Dict:
         """Load historical sports patterns."""
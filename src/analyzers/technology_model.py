@@ -2,7 +2,6 @@
 Advanced technology markets prediction modeling.
 """
 
-import re
 import logging
 import statistics
 import math
@@ -14,6 +13,15 @@ from enum import Enum
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType, ProbabilityDistribution
+from src.analyzers.text_patterns import (
+    ACQUISITION,
+    ADOPTION_MILESTONE,
+    IPO,
+    PRODUCT_LAUNCH,
+    REGULATORY_DECISIONS,
+    first_match,
+)
+from src.utils.reference_data import ReferenceTable, load_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -690,66 +698,36 @@ class TechnologyMarketModel:
             
     def _extract_product_launch_info(self, question: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract product name and company from market question."""
-        patterns = [
-            r"Will (.+) launch (.+) by",
-            r"(.+) to release (.+) in",
-            r"(.+) announce (.+) before",
-            r"Will (.+)'s (.+) be released"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                company = match.group(1).strip()
-                product = match.group(2).strip()
-                return product, company
+        match = first_match(PRODUCT_LAUNCH, question)
+        if match:
+            company = match.group(1).strip()
+            product = match.group(2).strip()
+            return product, company
                 
         return None, None
         
     def _extract_acquisition_info(self, question: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract acquirer and target from M&A market question."""
-        patterns = [
-            r"Will (.+) acquire (.+)",
-            r"(.+) to buy (.+)",
-            r"(.+) merger with (.+)",
-            r"(.+) acquisition of (.+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                return match.group(1).strip(), match.group(2).strip()
+        match = first_match(ACQUISITION, question)
+        if match:
+            return match.group(1).strip(), match.group(2).strip()
                 
         return None, None
         
     def _extract_ipo_company(self, question: str) -> Optional[str]:
         """Extract company name from IPO market question."""
-        patterns = [
-            r"Will (.+) go public",
-            r"(.+) IPO",
-            r"(.+) to list",
-            r"(.+) direct listing"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        match = first_match(IPO, question)
+        if match:
+            return match.group(1).strip()
                 
         return None
         
     def _extract_regulatory_info(self, question: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Extract regulatory decision details."""
         # Simplified extraction - would be more sophisticated in production
-        decision_types = {
-            "approve": "approval",
-            "ban": "ban",
-            "fine": "fine",
-            "investigate": "investigation"
-        }
-        
-        for keyword, decision_type in decision_types.items():
-            if keyword in question.lower():
+        question_lower = question.lower()
+        for keyword, decision_type in REGULATORY_DECISIONS:
+            if keyword in question_lower:
                 # Extract regulator and target
                 words = question.split()
                 if len(words) >= 3:
@@ -761,8 +739,7 @@ class TechnologyMarketModel:
     def _extract_adoption_milestone_info(self, question: str) -> Tuple[Optional[str], Optional[float]]:
         """Extract technology and milestone from adoption market."""
         # Pattern to find technology and user count
-        pattern = r"Will (.+) reach ([0-9,]+) (?:users|downloads|subscribers)"
-        match = re.search(pattern, question, re.IGNORECASE)
+        match = ADOPTION_MILESTONE.search(question)
         
         if match:
             technology = match.group(1).strip()
@@ -1394,9 +1371,9 @@ class TechnologyMarketModel:
         return self.bayesian_updater._create_distribution_from_point(base_prob, confidence=0.4)
         
     # Placeholder data loading methods
-    def _load_company_databases(self) -> Dict:
-        """Load company data (placeholder)."""
-        return {}
+    def _load_company_databases(self) -> ReferenceTable:
+        """Load company data (records by lowercase company name)."""
+        return load_reference_data().table("companies")
         
     def _load_launch_patterns(self) -> Dict:
         """Load product launch patterns (placeholder)."""
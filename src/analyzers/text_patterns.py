@@ -0,0 +1,271 @@
+"""
+Precompiled regexes and frozen gazetteers shared by the analyzers.
+
+The domain models pull the same facts out of market questions again and
+again: price targets, company and product names, award nominees, team
+names. Their patterns and name lists live here, compiled and frozen once
+at import, so extracting from a question is a scan over ready-made
+objects instead of rebuilding lists and going through the re module's
+pattern cache on every call.
+
+Most patterns open with (.+), so a failed search costs a scan per start
+position. Each TextPattern therefore names a literal every match must
+contain, and the regex only runs on texts containing it. Patterns keep
+the order the models try them in; first_match returns the first one
+that matches, as the models' loops did.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Match, Optional, Pattern, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class TextPattern:
+    """
+    A compiled regex and a literal that every match contains.
+    """
+    regex: Pattern
+    literal: str = ""  # Lowercase if the regex ignores case; '' to always search
+    
+    def search(self, text: str, text_lower: Optional[str] = None) -> Optional[Match]:
+        """
+        Search a text, skipping the regex if the literal is absent.
+        
+        Args:
+            text: Text to search
+            text_lower: text.lower(), if the caller already has it
+            
+        Returns:
+            Optional[Match]: Match, or None
+        """
+        if self.literal:
+            if self.regex.flags & re.IGNORECASE:
+                haystack = text_lower if text_lower is not None else text.lower()
+            else:
+                haystack = text
+            if self.literal not in haystack:
+                return None
+        return self.regex.search(text)
+
+
+def compile_all(*patterns: Tuple[str, str], flags: int = 0) -> Tuple[TextPattern, ...]:
+    """
+    Compile patterns with shared flags.
+    
+    Args:
+        *patterns: (regex source, required literal) in the order they should be tried
+        flags: re flags applied to every pattern
+        
+    Returns:
+        Tuple[TextPattern, ...]: Compiled patterns
+    """
+    return tuple(TextPattern(re.compile(source, flags), literal) for source, literal in patterns)
+
+
+def first_match(patterns: Sequence[TextPattern], text: str) -> Optional[Match]:
+    """
+    Search text with each pattern in turn.
+    
+    Args:
+        patterns: Compiled patterns in priority order
+        text: Text to search
+        
+    Returns:
+        Optional[Match]: Match of the first pattern that matches, or None
+    """
+    text_lower = text.lower()
+    for pattern in patterns:
+        match = pattern.search(text, text_lower)
+        if match:
+            return match
+    return None
+
+
+@dataclass(frozen=True)
+class Gazetteer:
+    """
+    Frozen list of names with their lowercase forms.
+    """
+    names: Tuple[str, ...]
+    lowered: Tuple[str, ...] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "lowered", tuple(name.lower() for name in self.names))
+        
+    def find(self, text_lower: str) -> Optional[str]:
+        """
+        Find the first name that appears in a text, ignoring case.
+        
+        Args:
+            text_lower: Lowercase text to search
+            
+        Returns:
+            Optional[str]: Name as listed, or None
+        """
+        for name, lowered in zip(self.names, self.lowered, strict=True):
+            if lowered in text_lower:
+                return name
+        return None
+        
+    def __iter__(self):
+        return iter(self.names)
+        
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@lru_cache(maxsize=256)
+def template_regex(template: str) -> Pattern:
+    """
+    Compile a question template such as 'Will {candidate} win the {election}?'.
+    
+    Placeholders become capture groups; the rest of the template is used
+    as a regex as written. Compiled templates are cached.
+    
+    Args:
+        template: Template with {candidate}, {election}, {position}, {year} or {party}
+        
+    Returns:
+        Pattern: Case-insensitive pattern
+    """
+    pattern = template.replace('{candidate}', r'(\w+)')
+    pattern = pattern.replace('{election}', r'(.+)')
+    pattern = pattern.replace('{position}', r'(.+)')
+    pattern = pattern.replace('{year}', r'(\d+)')
+    pattern = pattern.replace('{party}', r'(\w+)')
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Multi-outcome (election) markets
+ELECTION_SLUG_SUFFIX = re.compile(r'-(election|primary|nominee|race|contest)$')
+ELECTION_PATTERNS = compile_all(
+    (r'will (\w+) win', ' win'),
+    (r'(\w+) (for|as) (mayor|president|governor)', ''),
+    (r'(democratic|republican) (nominee|primary)', ''),
+    (r'which (candidate|party) will', 'which '),
+)
+QUESTION_TEMPLATES: Tuple[Tuple[TextPattern, str], ...] = tuple(
+    (TextPattern(re.compile(regex, re.IGNORECASE), literal), template)
+    for regex, literal, template in (
+        (r'Will (\w+) win the (.+)\?', ' win the ', 'Will {candidate} win the {election}?'),
+        (r'(\w+) for (.+) in (\d+)', ' for ', '{candidate} for {position} in {year}'),
+        (r'Will (\w+) be the (.+) nominee', ' nominee', 'Will {candidate} be the {party} nominee'),
+    )
+)
+CANDIDATE_NAME = re.compile(r'Will (\w+(?:\s+\w+)?)')
+LEADING_WILL = re.compile(r'Will \w+ ')
+
+# Crypto: asset names in lookup order, price targets with their multipliers
+CRYPTO_ASSETS: Tuple[Tuple[str, str], ...] = (
+    ("bitcoin", "BTC"),
+    ("btc", "BTC"),
+    ("ethereum", "ETH"),
+    ("eth", "ETH"),
+    ("litecoin", "LTC"),
+    ("ltc", "LTC"),
+    ("ripple", "XRP"),
+    ("xrp", "XRP"),
+    ("dogecoin", "DOGE"),
+    ("doge", "DOGE"),
+    ("cardano", "ADA"),
+    ("ada", "ADA"),
+    ("solana", "SOL"),
+    ("sol", "SOL"),
+)
+PRICE_TARGETS: Tuple[Tuple[TextPattern, float], ...] = (
+    (TextPattern(re.compile(r'\$([0-9,]+)'), '$'), 1.0),  # $100,000
+    (TextPattern(re.compile(r'([0-9,]+)\s*k'), 'k'), 1000.0),  # 100k
+    (TextPattern(re.compile(r'([0-9,]+)\s*thousand'), 'thousand'), 1000.0),  # 100 thousand
+)
+# Targets met by trading at the price once, not by ending above it
+TOUCH_TARGET = TextPattern(re.compile(r'\b(?:reach|reaches|hit|hits|touch|touches|at any point)\b'))
+
+# Technology
+PRODUCT_LAUNCH = compile_all(
+    (r"Will (.+) launch (.+) by", " launch "),
+    (r"(.+) to release (.+) in", " to release "),
+    (r"(.+) announce (.+) before", " announce "),
+    (r"Will (.+)'s (.+) be released", " be released"),
+    flags=re.IGNORECASE
+)
+ACQUISITION = compile_all(
+    (r"Will (.+) acquire (.+)", " acquire "),
+    (r"(.+) to buy (.+)", " to buy "),
+    (r"(.+) merger with (.+)", " merger with "),
+    (r"(.+) acquisition of (.+)", " acquisition of "),
+    flags=re.IGNORECASE
+)
+IPO = compile_all(
+    (r"Will (.+) go public", " go public"),
+    (r"(.+) IPO", " ipo"),
+    (r"(.+) to list", " to list"),
+    (r"(.+) direct listing", " direct listing"),
+    flags=re.IGNORECASE
+)
+ADOPTION_MILESTONE = TextPattern(
+    re.compile(r"Will (.+) reach ([0-9,]+) (?:users|downloads|subscribers)", re.IGNORECASE), " reach "
+)
+REGULATORY_DECISIONS: Tuple[Tuple[str, str], ...] = (
+    ("approve", "approval"),
+    ("ban", "ban"),
+    ("fine", "fine"),
+    ("investigate", "investigation"),
+)
+
+# Entertainment
+AWARDS = compile_all(
+    (r"Will (.+) win Best (.+)", " win best "),
+    (r"(.+) to win (.+) award", " award"),
+    (r"(.+) for Best (.+)", " for best "),
+    flags=re.IGNORECASE
+)
+SHOW_RENEWAL = compile_all(
+    (r"Will (.+) be renewed", " be renewed"),
+    (r"(.+) renewal", " renewal"),
+    (r"(.+) cancelled", " cancelled"),
+    (r"(.+) get another season", " get another season"),
+    flags=re.IGNORECASE
+)
+BOX_OFFICE = TextPattern(re.compile(r"Will (.+) gross over \$([0-9,]+)", re.IGNORECASE), " gross over $")
+CELEBRITY_EVENTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("marriage", ("marry", "married", "wedding")),
+    ("divorce", ("divorce", "split", "separate")),
+    ("baby", ("pregnant", "baby", "child")),
+    ("retirement", ("retire", "quit", "leave")),
+)
+
+# Sports
+PLAYER_NAME = compile_all(
+    (r"will ([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+)", "will "),  # Matches "LeBron James"
+    (r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) retire", " retire"),
+    (r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) will", " will"),
+    (r"([A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+) to", " to"),  # "LeBron James to win"
+)
+NFL_TEAMS = Gazetteer((
+    "Chiefs", "Bills", "Bengals", "Ravens", "Browns", "Steelers", "Titans", "Colts",
+    "Texans", "Jaguars", "Chargers", "Raiders", "Broncos", "Cowboys", "Giants",
+    "Eagles", "Commanders", "Packers", "Bears", "Lions", "Vikings", "Falcons",
+    "Panthers", "Saints", "Buccaneers", "Cardinals", "Rams", "49ers", "Seahawks",
+    "Jets", "Dolphins", "Patriots"
+))
+NBA_TEAMS = Gazetteer((
+    "Lakers", "Warriors", "Celtics", "Heat", "Nets", "Knicks", "76ers", "Bucks",
+    "Bulls", "Cavaliers", "Pistons", "Pacers", "Hawks", "Hornets", "Magic", "Wizards",
+    "Raptors", "Nuggets", "Timberwolves", "Thunder", "Trail Blazers", "Jazz", "Suns",
+    "Kings", "Clippers", "Mavericks", "Rockets", "Grizzlies", "Pelicans", "Spurs"
+))
+MLB_TEAMS = Gazetteer((
+    "Yankees", "Red Sox", "Blue Jays", "Orioles", "Rays", "White Sox", "Indians",
+    "Tigers", "Royals", "Twins", "Astros", "Angels", "Athletics", "Mariners", "Rangers",
+    "Braves", "Marlins", "Mets", "Phillies", "Nationals", "Cubs", "Reds", "Brewers",
+    "Pirates", "Cardinals", "Diamondbacks", "Rockies", "Dodgers", "Padres", "Giants"
+))
+NHL_TEAMS = Gazetteer((
+    "Bruins", "Sabres", "Red Wings", "Panthers", "Canadiens", "Senators", "Lightning",
+    "Maple Leafs", "Hurricanes", "Blue Jackets", "Devils", "Islanders", "Rangers",
+    "Flyers", "Penguins", "Capitals", "Blackhawks", "Avalanche", "Stars", "Wild",
+    "Predators", "Blues", "Jets", "Flames", "Oilers", "Canucks", "Ducks", "Kings",
+    "Sharks", "Coyotes", "Golden Knights", "Kraken"
+))
@@ -0,0 +1,196 @@
+"""
+Vectorized opportunity scoring.
+
+Computes every OpportunityScore component for a whole batch of markets in
+one NumPy pass. OpportunityScore objects, which weight the components into
+overall_score, are only built for the rows a caller asks for.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from src.analyzers.models import OpportunityScore
+
+# Normalisation constants shared with the scalar scoring code
+VALUE_EDGE_SCALE = 0.3  # Edge that earns a full value score
+VOLUME_SCALE = 50000.0  # Volume that earns a full volume score
+VOLUME_CONFIDENCE_SCALE = 10000.0  # Volume that earns full volume confidence
+NEWS_RELEVANCE_SCALE = 5.0  # Related articles that earn full news relevance
+NEWS_CONFIDENCE_SCALE = 10.0  # Articles that earn full news confidence
+
+
+@dataclass
+class ScoreArrays:
+    """Score components for a batch of markets, one row per market."""
+    value: np.ndarray
+    confidence: np.ndarray
+    volume: np.ndarray
+    time: np.ndarray
+    news: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.value)
+        
+    def to_score(self, index: int) -> OpportunityScore:
+        """
+        Materialise one row as an OpportunityScore.
+        
+        Args:
+            index: Row index
+            
+        Returns:
+            OpportunityScore: Score for that market
+        """
+        return OpportunityScore(
+            value_score=float(self.value[index]),
+            confidence_score=float(self.confidence[index]),
+            volume_score=float(self.volume[index]),
+            time_score=float(self.time[index]),
+            news_relevance_score=float(self.news[index])
+        )
+        
+    def to_scores(self, indices: Optional[Iterable[int]] = None) -> List[OpportunityScore]:
+        """
+        Materialise the given rows (all rows by default).
+        
+        Args:
+            indices: Row indices to materialise
+            
+        Returns:
+            List[OpportunityScore]: Scores in index order
+        """
+        if indices is None:
+            indices = range(len(self))
+        return [self.to_score(int(index)) for index in indices]
+
+
+def _as_float_array(values: Iterable[Optional[float]]) -> np.ndarray:
+    """Convert values to a float array, mapping None to NaN."""
+    if isinstance(values, np.ndarray):
+        return values.astype(float, copy=False)
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def time_scores(days_to_end: np.ndarray) -> np.ndarray:
+    """
+    Score time until resolution.
+    
+    Mirrors MarketAnalyzer._calculate_time_score_from_days, with NaN
+    (unknown end date) scoring 0.5.
+    
+    Args:
+        days_to_end: Whole days until resolution (NaN if unknown)
+        
+    Returns:
+        np.ndarray: Time scores (0-1)
+    """
+    days = np.asarray(days_to_end, dtype=float)
+    scores = np.select(
+        [days <= 0, days <= 7, days <= 30, days <= 90],
+        [0.0, 1.0, 0.8, 0.6],
+        default=0.3
+    )
+    return np.where(np.isnan(days), 0.5, scores)
+
+
+def volume_scores(volume: np.ndarray) -> np.ndarray:
+    """
+    Score market volume, with missing or zero volume scoring 0.5.
+    
+    Args:
+        volume: Market volumes (NaN if unknown)
+        
+    Returns:
+        np.ndarray: Volume scores (0-1)
+    """
+    volume = np.asarray(volume, dtype=float)
+    known = ~np.isnan(volume) & (volume != 0)
+    return np.where(known, np.clip(np.nan_to_num(volume) / VOLUME_SCALE, 0.0, 1.0), 0.5)
+
+
+def score_pattern_opportunities(
+    edge: Iterable[float],
+    confidence: Iterable[float],
+    volume: Iterable[Optional[float]],
+    days_to_end: Iterable[Optional[float]],
+    news_counts: Iterable[int],
+    news_driven: Iterable[bool]
+) -> ScoreArrays:
+    """
+    Score pattern-analyzer opportunities in one pass.
+    
+    Vectorized form of MarketAnalyzer._calculate_simple_opportunity_score.
+    
+    Args:
+        edge: Pattern edge per market
+        confidence: Pattern confidence per market
+        volume: Market volume per market (None if unknown)
+        days_to_end: Whole days until resolution (None if unknown)
+        news_counts: News articles available per market
+        news_driven: Whether the pattern is news-driven (NEWS_OVERREACTION)
+        
+    Returns:
+        ScoreArrays: Score components per market
+    """
+    edge = np.asarray(edge, dtype=float)
+    news_counts = np.asarray(news_counts, dtype=float)
+    news_driven = np.asarray(news_driven, dtype=bool)
+    
+    value = np.clip(edge / VALUE_EDGE_SCALE, 0.0, 1.0)
+    news = np.where(news_driven & (news_counts > 0), 0.8, 0.3)
+    
+    return ScoreArrays(
+        value=value,
+        confidence=np.clip(np.asarray(confidence, dtype=float), 0.0, 1.0),
+        volume=volume_scores(_as_float_array(volume)),
+        time=time_scores(_as_float_array(days_to_end)),
+        news=news
+    )
+
+
+def score_fair_value_opportunities(
+    value_diff: Iterable[float],
+    volume: Iterable[Optional[float]],
+    days_to_end: Iterable[Optional[float]],
+    news_counts: Iterable[int],
+    related_news_counts: Iterable[int]
+) -> ScoreArrays:
+    """
+    Score fair-value opportunities in one pass.
+    
+    Vectorized form of MarketAnalyzer._calculate_opportunity_score, where
+    confidence is the mean of news coverage, time and volume maturity.
+    
+    Args:
+        value_diff: Largest |fair - current| price gap per market
+        volume: Market volume per market (None if unknown)
+        days_to_end: Whole days until resolution (None if unknown)
+        news_counts: News articles considered per market
+        related_news_counts: Articles related to each market
+        
+    Returns:
+        ScoreArrays: Score components per market
+    """
+    volume = _as_float_array(volume)
+    news_counts = np.asarray(news_counts, dtype=float)
+    related_news_counts = np.asarray(related_news_counts, dtype=float)
+    
+    value = np.clip(np.asarray(value_diff, dtype=float) / VALUE_EDGE_SCALE, 0.0, 1.0)
+    time = time_scores(_as_float_array(days_to_end))
+    
+    # Confidence averages whichever factors are available for each market
+    has_news = news_counts > 0
+    has_volume = ~np.isnan(volume) & (volume != 0)
+    factor_sum = (
+        np.where(has_news, np.minimum(1.0, news_counts / NEWS_CONFIDENCE_SCALE), 0.0) +
+        time +
+        np.where(has_volume, np.clip(np.nan_to_num(volume) / VOLUME_CONFIDENCE_SCALE, 0.0, 1.0), 0.0)
+    )
+    factor_count = 1 + has_news.astype(float) + has_volume.astype(float)
+    confidence = factor_sum / factor_count
+    
+    news = np.minimum(1.0, related_news_counts / NEWS_RELEVANCE_SCALE)
+    
+    return ScoreArrays(value=value, confidence=confidence, volume=volume_scores(volume), time=time, news=news)
@@ -14,6 +14,7 @@ from enum import Enum
 from src.clients.polymarket.models import Market
 from src.clients.news.models import NewsArticle
 from src.analyzers.bayesian_updater import BayesianUpdater, Evidence, EvidenceType, ProbabilityDistribution
+from src.utils.reference_data import ReferenceTable, load_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +115,7 @@ class WeatherClimateModel:
         self.hurricane_models = self._load_hurricane_models()
         self.climate_models = self._load_climate_models()
         self.historical_patterns = self._load_historical_weather_patterns()
+        self.climatology = self._load_climatology()
         
     def calculate_weather_probability(
         self, 
@@ -1008,6 +1010,10 @@ class WeatherClimateModel:
         """Load historical weather patterns."""
         return {}
         
+    def _load_climatology(self) -> ReferenceTable:
+        """Load climate normals and records (by lowercase location)."""
+        return load_reference_data().table("climatology")
+        
     def _get_hurricane_data(self, name: Optional[str]) -> Optional[HurricaneData]:
         """Get current hurricane data (placeholder)."""
         # In production, would fetch from NHC API
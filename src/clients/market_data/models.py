@@ -0,0 +1,19 @@
+"""
+Market data models for crypto assets.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CryptoMarketData:
+    """Crypto market data for analysis."""
+    symbol: str
+    current_price: float
+    market_cap: float
+    volume_24h: float
+    price_change_7d: float
+    price_change_30d: float
+    volatility_30d: float  # Annualized, from 30 days of returns
+    all_time_high: float
+    distance_from_ath: float
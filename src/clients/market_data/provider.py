@@ -0,0 +1,239 @@
+"""
+Crypto market data providers.
+
+A provider keeps one AssetSeries per symbol. Each price tick updates the
+asset's close buffer, rolling log-return moments and all-time high in O(1)
+and rebuilds its CryptoMarketData snapshot, so readers get precomputed
+values. Windows count ticks; the file-backed provider is fed daily
+closes, so a 30-tick window is 30 days.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from src.clients.market_data.models import CryptoMarketData
+from src.clients.market_data.rolling import RingBuffer, RollingMoments
+
+logger = logging.getLogger(__name__)
+
+VOLATILITY_WINDOW = 30  # Returns behind volatility_30d
+SHORT_RETURN_PERIODS = 7
+LONG_RETURN_PERIODS = 30
+PERIODS_PER_YEAR = 365  # Daily ticks, crypto trades every day
+
+
+class AssetSeries:
+    """
+    Rolling state of one asset's price stream.
+    
+    Until enough ticks have arrived, statistics fall back to the seed
+    snapshot's values, if one was given.
+    """
+    
+    def __init__(
+        self,
+        symbol: str,
+        seed: Optional[CryptoMarketData] = None,
+        window: int = VOLATILITY_WINDOW
+    ):
+        """
+        Initialize the series.
+        
+        Args:
+            symbol: Asset symbol
+            seed: Snapshot whose statistics stand in until the windows fill
+            window: Returns behind the volatility estimate
+        """
+        self.symbol = symbol
+        self.seed = seed
+        self.window = window
+        self.closes = RingBuffer(max(window, LONG_RETURN_PERIODS) + 1)
+        self.log_returns = RollingMoments(window)
+        self.all_time_high = seed.all_time_high if seed else 0.0
+        self.market_cap = seed.market_cap if seed else 0.0
+        self.volume_24h = seed.volume_24h if seed else 0.0
+        self.snapshot: Optional[CryptoMarketData] = None
+        
+    def push(
+        self,
+        price: float,
+        market_cap: Optional[float] = None,
+        volume_24h: Optional[float] = None
+    ) -> CryptoMarketData:
+        """
+        Add a price tick and refresh the snapshot.
+        
+        Args:
+            price: Latest price
+            market_cap: Latest market cap (unchanged if omitted)
+            volume_24h: Latest 24h volume (unchanged if omitted)
+            
+        Returns:
+            CryptoMarketData: Refreshed snapshot
+        """
+        if len(self.closes):
+            self.log_returns.push(math.log(price / self.closes.ago(0)))
+        self.closes.push(price)
+        self.all_time_high = max(self.all_time_high, price)
+        if market_cap is not None:
+            self.market_cap = market_cap
+        if volume_24h is not None:
+            self.volume_24h = volume_24h
+            
+        self.snapshot = CryptoMarketData(
+            symbol=self.symbol,
+            current_price=price,
+            market_cap=self.market_cap,
+            volume_24h=self.volume_24h,
+            price_change_7d=self._change(SHORT_RETURN_PERIODS, "price_change_7d"),
+            price_change_30d=self._change(LONG_RETURN_PERIODS, "price_change_30d"),
+            volatility_30d=self._volatility(),
+            all_time_high=self.all_time_high,
+            distance_from_ath=price / self.all_time_high - 1
+        )
+        return self.snapshot
+        
+    def _change(self, periods: int, seed_field: str) -> float:
+        """Return over the last `periods` ticks, or the seed's value before then."""
+        if len(self.closes) > periods:
+            return self.closes.ago(0) / self.closes.ago(periods) - 1
+        return getattr(self.seed, seed_field) if self.seed else 0.0
+        
+    def _volatility(self) -> float:
+        """Annualized volatility of log returns, or the seed's value before the window fills."""
+        if self.seed and not self.log_returns.full:
+            return self.seed.volatility_30d
+        return self.log_returns.std() * math.sqrt(PERIODS_PER_YEAR)
+
+
+class MarketDataProvider:
+    """
+    In-memory source of crypto market data, fed by price ticks.
+    
+    Live feeds call update() per tick; subclasses load their own history.
+    """
+    
+    def __init__(self, window: int = VOLATILITY_WINDOW):
+        """
+        Initialize an empty provider.
+        
+        Args:
+            window: Returns behind each asset's volatility estimate
+        """
+        self.window = window
+        self._series: Dict[str, AssetSeries] = {}
+        
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._series
+        
+    def seed(self, snapshot: CryptoMarketData, closes: Iterable[float] = ()) -> None:
+        """
+        Start an asset from a snapshot and optional price history.
+        
+        Args:
+            snapshot: Current values; its statistics stand in until the windows fill
+            closes: Past closes, oldest first (the snapshot's price if empty)
+        """
+        series = AssetSeries(snapshot.symbol, seed=snapshot, window=self.window)
+        self._series[snapshot.symbol] = series
+        
+        closes = list(closes) or [snapshot.current_price]
+        for close in closes:
+            series.push(close)
+            
+    def update(
+        self,
+        symbol: str,
+        price: float,
+        market_cap: Optional[float] = None,
+        volume_24h: Optional[float] = None
+    ) -> CryptoMarketData:
+        """
+        Record a price tick.
+        
+        Args:
+            symbol: Asset symbol
+            price: Latest price
+            market_cap: Latest market cap
+            volume_24h: Latest 24h volume
+            
+        Returns:
+            CryptoMarketData: The asset's refreshed snapshot
+        """
+        series = self._series.get(symbol)
+        if series is None:
+            series = AssetSeries(symbol, window=self.window)
+            self._series[symbol] = series
+        return series.push(price, market_cap, volume_24h)
+        
+    def get(self, symbol: str) -> Optional[CryptoMarketData]:
+        """
+        Get an asset's latest snapshot.
+        
+        Args:
+            symbol: Asset symbol
+            
+        Returns:
+            Optional[CryptoMarketData]: Snapshot, None for unknown assets
+        """
+        series = self._series.get(symbol)
+        return series.snapshot if series is not None else None
+
+
+class FileMarketDataProvider(MarketDataProvider):
+    """
+    Provider loaded from a local JSON file, standing in for a market data API.
+    
+    The file maps each symbol to its latest values (the CryptoMarketData
+    fields, with `price` for current_price) and optional `closes`, daily
+    closes oldest first.
+    """
+    
+    def __init__(self, path: str, window: int = VOLATILITY_WINDOW):
+        """
+        Initialize the provider and load the file.
+        
+        Args:
+            path: JSON file with market data
+            window: Returns behind each asset's volatility estimate
+        """
+        super().__init__(window)
+        self.path = Path(path)
+        self.reload()
+        
+    def reload(self) -> None:
+        """Replace all series with the file's contents."""
+        self._series = {}
+        if not self.path.exists():
+            logger.warning(f"Market data file {self.path} not found - no crypto market data available")
+            return
+            
+        try:
+            with open(self.path, "r") as f:
+                assets = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read market data file {self.path}: {e}")
+            return
+            
+        for symbol, values in assets.items():
+            try:
+                price = float(values["price"])
+                all_time_high = float(values.get("all_time_high", price))
+                snapshot = CryptoMarketData(
+                    symbol=symbol,
+                    current_price=price,
+                    market_cap=float(values.get("market_cap", 0.0)),
+                    volume_24h=float(values.get("volume_24h", 0.0)),
+                    price_change_7d=float(values.get("price_change_7d", 0.0)),
+                    price_change_30d=float(values.get("price_change_30d", 0.0)),
+                    volatility_30d=float(values.get("volatility_30d", 0.0)),
+                    all_time_high=all_time_high,
+                    distance_from_ath=price / all_time_high - 1
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping malformed market data for {symbol}: {e}")
+                continue
+            self.seed(snapshot, values.get("closes", []))
@@ -0,0 +1,125 @@
+"""
+Fixed-size windows over a stream of observations, updated in O(1).
+"""
+
+import math
+from typing import List, Optional
+
+
+class RingBuffer:
+    """
+    Last `capacity` values of a stream; each push overwrites the oldest.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty buffer.
+        
+        Args:
+            capacity: Values kept
+        """
+        self.capacity = capacity
+        self._values: List[float] = [0.0] * capacity
+        self._next = 0
+        self._size = 0
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def push(self, value: float) -> Optional[float]:
+        """
+        Append a value.
+        
+        Args:
+            value: New value
+            
+        Returns:
+            Optional[float]: Value dropped to make room, if the buffer was full
+        """
+        evicted = self._values[self._next] if self._size == self.capacity else None
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return evicted
+        
+    def ago(self, periods: int) -> float:
+        """
+        Get a value by its age.
+        
+        Args:
+            periods: Pushes since the value (0 for the latest)
+            
+        Returns:
+            float: The value
+        """
+        if not 0 <= periods < self._size:
+            raise IndexError(f"{periods} periods ago is outside a buffer of {self._size}")
+        return self._values[(self._next - 1 - periods) % self.capacity]
+        
+    def values(self) -> List[float]:
+        """Buffered values, oldest first."""
+        return [self.ago(periods) for periods in range(self._size - 1, -1, -1)]
+
+
+class RollingMoments:
+    """
+    Mean and sample standard deviation over the last `window` values.
+    
+    Running sums are updated per push. They are recomputed from the buffer
+    once per `window` pushes, so rounding error cannot accumulate; that
+    keeps the amortized cost O(1).
+    """
+    
+    def __init__(self, window: int):
+        """
+        Initialize an empty window.
+        
+        Args:
+            window: Values the moments cover
+        """
+        self._buffer = RingBuffer(window)
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._pushes = 0
+        
+    def __len__(self) -> int:
+        return len(self._buffer)
+        
+    @property
+    def full(self) -> bool:
+        """Whether the window holds `window` values."""
+        return len(self._buffer) == self._buffer.capacity
+        
+    def push(self, value: float) -> None:
+        """
+        Add a value, dropping the oldest once the window is full.
+        
+        Args:
+            value: New value
+        """
+        evicted = self._buffer.push(value)
+        self._pushes += 1
+        if self._pushes % self._buffer.capacity == 0:
+            values = self._buffer.values()
+            self._sum = math.fsum(values)
+            self._sum_squares = math.fsum(v * v for v in values)
+            return
+            
+        self._sum += value
+        self._sum_squares += value * value
+        if evicted is not None:
+            self._sum -= evicted
+            self._sum_squares -= evicted * evicted
+            
+    def mean(self) -> float:
+        """Mean of the window (0.0 when empty)."""
+        size = len(self._buffer)
+        return self._sum / size if size else 0.0
+        
+    def std(self) -> float:
+        """Sample standard deviation of the window (0.0 below two values)."""
+        size = len(self._buffer)
+        if size < 2:
+            return 0.0
+        variance = (self._sum_squares - self._sum * self._sum / size) / (size - 1)
+        return math.sqrt(max(variance, 0.0))
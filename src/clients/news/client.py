@@ -14,6 +14,7 @@ from httpx import AsyncClient
 
 from src.config.settings import settings
 from src.clients.news.models import NewsArticle, NewsResponse
+from src.utils.quota_ledger import QueryPriority, QuotaLedger, news_quota_ledger
 from src.utils.rate_limiter import rate_limiters
 
 logger = logging.getLogger(__name__)
@@ -24,16 +25,23 @@ class NewsClient:
     Client for interacting with NewsAPI.
     """
     
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        quota_ledger: Optional[QuotaLedger] = None
+    ):
         """
         Initialize NewsAPI client.
         
         Args:
             base_url: API base URL (defaults to settings)
             api_key: API key (defaults to settings)
+            quota_ledger: Daily quota ledger (defaults to the shared ledger)
         """
         self.base_url = base_url or settings.news_api_url
         self.api_key = api_key or settings.news_api_key
+        self.quota_ledger = quota_ledger or news_quota_ledger
         self._client: Optional[AsyncClient] = None
         # Simple in-memory cache with TTL
         self._cache: Dict[str, Tuple[NewsResponse, datetime]] = {}
@@ -65,6 +73,15 @@ class NewsClient:
             "X-API-Key": self.api_key,
         }
         
+    def remaining_quota(self) -> int:
+        """
+        Get NewsAPI requests left today for this client's key.
+        
+        Returns:
+            int: Remaining daily requests
+        """
+        return self.quota_ledger.remaining(self.api_key)
+        
     async def get_everything(
         self,
         query: Optional[str] = None,
@@ -75,7 +92,8 @@ class NewsClient:
         page_size: int = 100,
         page: int = 1,
         from_date: Optional[datetime] = None,
-        to_date: Optional[datetime] = None
+        to_date: Optional[datetime] = None,
+        priority: QueryPriority = QueryPriority.NORMAL
     ) -> NewsResponse:
         """
         Get news articles from NewsAPI everything endpoint.
@@ -90,9 +108,10 @@ class NewsClient:
             page: Page number
             from_date: Articles published after this date
             to_date: Articles published before this date
+            priority: Query priority used to shed requests when quota is low
             
         Returns:
-            NewsResponse: News articles response
+            NewsResponse: News articles response (empty if the query was shed)
         """
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
@@ -127,6 +146,14 @@ class NewsClient:
             else:
                 # Remove expired cache entry
                 del self._cache[cache_key]
+                
+        # Cache hits are free; anything that reaches the API spends quota
+        if not self.quota_ledger.debit(self.api_key, priority):
+            logger.warning(
+                f"NewsAPI daily quota too low for {priority.name.lower()}-priority query; "
+                f"skipping request ({self.remaining_quota()} left today)"
+            )
+            return NewsResponse(status="error", total_results=0, articles=[])
             
         try:
             # Apply rate limiting
@@ -144,6 +171,8 @@ class NewsClient:
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 logger.warning(f"NewsAPI rate limit exceeded. Consider upgrading API plan or reducing request frequency.")
+                # The provider has cut us off for the day; stop spending on this key
+                self.quota_ledger.mark_exhausted(self.api_key)
                 # Return empty response instead of failing
                 return NewsResponse(
                     status="error",
@@ -177,16 +206,19 @@ class NewsClient:
         """
         from_date = datetime.now() - timedelta(hours=hours_back)
         
-        # Reduced queries to avoid rate limiting
+        # Reduced queries to avoid rate limiting, ranked by how much they feed analysis
         queries = [
-            "election OR vote OR poll OR candidate OR president",
-            "cryptocurrency OR bitcoin OR crypto OR economy", 
-            "AI OR technology OR policy OR regulation"
+            ("election OR vote OR poll OR candidate OR president", QueryPriority.HIGH),
+            ("cryptocurrency OR bitcoin OR crypto OR economy", QueryPriority.NORMAL),
+            ("AI OR technology OR policy OR regulation", QueryPriority.LOW)
         ]
         
+        # Drop queries today's quota cannot cover before spending anything
+        planned_queries = self.quota_ledger.plan_queries(self.api_key, queries)
+        
         all_articles = []
         
-        for query in queries:
+        for query, priority in planned_queries:
             if len(all_articles) >= max_articles:
                 break
                 
@@ -195,9 +227,14 @@ class NewsClient:
                     query=query,
                     from_date=from_date,
                     sort_by="publishedAt",
-                    page_size=min(50, max_articles - len(all_articles))
+                    page_size=min(50, max_articles - len(all_articles)),
+                    priority=priority
                 )
                 
+                if response.status == "error":
+                    # Shed or rate limited; later queries would fare no better
+                    break
+                    
                 # Filter for relevant articles
                 relevant_articles = response.relevant_articles
                 all_articles.extend(relevant_articles)
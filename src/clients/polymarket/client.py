@@ -3,20 +3,26 @@ Polymarket CLOB API client.
 """
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 from httpx import AsyncClient
 
 from src.config.settings import settings
 from src.clients.polymarket.models import Market, MarketsResponse, MarketPrice
+from src.clients.polymarket.market_table import MarketTable
 from src.clients.polymarket.gamma_models import GammaMarket
 from src.utils.rate_limiter import rate_limiters
+from src.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
+# Markets requested per CLOB API page
+MARKETS_PAGE_SIZE = 100
+
 
 class PolymarketClient:
     """
@@ -34,6 +40,8 @@ class PolymarketClient:
         self.base_url = base_url or settings.polymarket_clob_api_url
         self.api_key = api_key or settings.polymarket_api_key
         self._client: Optional[AsyncClient] = None
+        # Replaced per run by callers that collect stage timings
+        self.timer = StageTimer()
         
     async def __aenter__(self) -> "PolymarketClient":
         """Async context manager entry."""
@@ -93,6 +101,45 @@ class PolymarketClient:
         Returns:
             MarketsResponse: Markets data
         """
+        data = await self._fetch_markets_page(next_cursor, limit)
+        return MarketsResponse(**data)
+        
+    async def get_market_table(
+        self,
+        next_cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[MarketTable, Optional[str]]:
+        """
+        Get one page of markets as a columnar table, without validating each market.
+        
+        Args:
+            next_cursor: Pagination cursor
+            limit: Number of results to return
+            
+        Returns:
+            Tuple[MarketTable, Optional[str]]: Markets and the next page cursor
+        """
+        with self.timer.stage("fetch"):
+            data = await self._fetch_markets_page(next_cursor, limit)
+        with self.timer.stage("decode"):
+            table = MarketTable.from_api_rows(data.get("data") or [])
+        return table, data.get("next_cursor")
+        
+    async def _fetch_markets_page(
+        self,
+        next_cursor: Optional[str],
+        limit: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch one raw page from the markets endpoint.
+        
+        Args:
+            next_cursor: Pagination cursor
+            limit: Number of results to return
+            
+        Returns:
+            Dict[str, Any]: Response JSON
+        """
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
             
@@ -108,8 +155,7 @@ class PolymarketClient:
             
             response = await self._client.get("/markets", params=params)
             response.raise_for_status()
-            data = response.json()
-            return MarketsResponse(**data)
+            return response.json()
         except httpx.HTTPError as e:
             logger.error(f"HTTP error getting markets: {e}")
             raise
@@ -132,7 +178,8 @@ class PolymarketClient:
         
         # Use Gamma API if base URL is gamma-api
         if "gamma-api" in self.base_url:
-            return await self._get_gamma_markets(max_markets)
+            with self.timer.stage("fetch"):
+                return await self._get_gamma_markets(max_markets)
         
         # Original CLOB API logic
         next_cursor = None
@@ -141,34 +188,15 @@ class PolymarketClient:
         fetch_limit = max_markets * 3  # Fetch 3x more to account for filtering
         
         while len(all_markets) < fetch_limit:
-            response = await self.get_markets(next_cursor=next_cursor, limit=100)
+            table, next_cursor = await self.get_market_table(next_cursor=next_cursor, limit=100)
             
             # Filter active markets and ensure they haven't ended
-            now = datetime.now(timezone.utc)
-            active_markets = []
-            for m in response.data:
-                if m.active and not m.closed:
-                    # Check if market has ended
-                    if m.end_date_iso:
-                        # Make datetime comparison timezone-aware
-                        end_date = m.end_date_iso
-                        # If end_date is timezone-naive, assume UTC
-                        if end_date.tzinfo is None:
-                            end_date = end_date.replace(tzinfo=timezone.utc)
-                        
-                        # Only include if end date is in the future
-                        if end_date > now:
-                            active_markets.append(m)
-                    else:
-                        # No end date, include it
-                        active_markets.append(m)
-            
-            all_markets.extend(active_markets)
+            with self.timer.stage("decode"):
+                all_markets.extend(self._open_markets(table))
             
             # Check if we have more pages
-            if not response.next_cursor:
+            if not next_cursor:
                 break
-            next_cursor = response.next_cursor
             
             # Small delay to respect rate limits
             await asyncio.sleep(0.1)
@@ -177,7 +205,8 @@ class PolymarketClient:
         
         # Apply advanced filtering
         from src.utils.market_filters import market_filter
-        filtered_markets = market_filter.filter_markets(all_markets)
+        with self.timer.stage("filter"):
+            filtered_markets = market_filter.filter_markets(all_markets)
         
         # Return up to max_markets after filtering
         final_markets = filtered_markets[:max_markets]
@@ -186,6 +215,125 @@ class PolymarketClient:
         logger.debug(f"Filter summary: {market_filter.get_filter_summary()}")
         
         return final_markets
+        
+    async def iter_active_markets(
+        self,
+        max_markets: Optional[int] = None
+    ) -> AsyncIterator[List[Market]]:
+        """
+        Stream filtered active markets page by page.
+        
+        When the market filter sorts by volume, the same markets as
+        get_all_active_markets are selected: about three times max_markets
+        open markets are fetched, the highest-volume ones are kept and then
+        yielded, highest first, in pages. Otherwise each page is filtered and
+        yielded as soon as it arrives, so callers can start analyzing while
+        later pages download; the next page is only requested once the
+        caller asks for it, which lets a slow consumer throttle fetching.
+        
+        Args:
+            max_markets: Maximum number of markets to yield
+            
+        Yields:
+            List[Market]: Filtered markets from one page
+        """
+        max_markets = max_markets or settings.max_markets_to_analyze
+        
+        # Gamma API returns everything in a single response
+        if "gamma-api" in self.base_url:
+            with self.timer.stage("fetch"):
+                markets = await self._get_gamma_markets(max_markets)
+            if markets:
+                yield markets
+            return
+            
+        from src.utils.market_filters import market_filter
+        
+        if market_filter.sort_by_volume:
+            markets = await self._top_markets_by_volume(market_filter, max_markets)
+            for start in range(0, len(markets), MARKETS_PAGE_SIZE):
+                yield markets[start:start + MARKETS_PAGE_SIZE]
+            return
+            
+        next_cursor = None
+        yielded = 0
+        
+        while yielded < max_markets:
+            table, next_cursor = await self.get_market_table(next_cursor=next_cursor, limit=MARKETS_PAGE_SIZE)
+            with self.timer.stage("decode"):
+                page = self._open_markets(table)
+            with self.timer.stage("filter"):
+                page = market_filter.filter_markets(page)
+            page = page[:max_markets - yielded]
+            
+            if page:
+                yielded += len(page)
+                yield page
+                
+            if not next_cursor:
+                break
+            
+            # Small delay to respect rate limits
+            await asyncio.sleep(0.1)
+            
+    async def _top_markets_by_volume(self, market_filter, max_markets: int) -> List[Market]:
+        """
+        Fetch about three times max_markets open markets and keep the highest-volume ones.
+        
+        Pages are filtered as they arrive and folded into a heap bounded at
+        max_markets, so only the current leaders are held.
+        
+        Args:
+            market_filter: Filter applied to each page
+            max_markets: Number of markets to keep
+            
+        Returns:
+            List[Market]: Highest-volume filtered markets, highest first
+        """
+        leaders: List[Tuple[float, int, Market]] = []
+        fetched = 0
+        kept = 0
+        next_cursor = None
+        
+        while fetched < max_markets * 3:
+            table, next_cursor = await self.get_market_table(next_cursor=next_cursor, limit=MARKETS_PAGE_SIZE)
+            with self.timer.stage("decode"):
+                page = self._open_markets(table)
+            fetched += len(page)
+            with self.timer.stage("filter"):
+                for market in market_filter.filter_markets(page):
+                    # Equal volumes keep fetch order, as the stable sort did
+                    entry = (market.volume or 0, -kept, market)
+                    kept += 1
+                    if len(leaders) < max_markets:
+                        heapq.heappush(leaders, entry)
+                    else:
+                        heapq.heappushpop(leaders, entry)
+                        
+            if not next_cursor:
+                break
+                
+            # Small delay to respect rate limits
+            await asyncio.sleep(0.1)
+            
+        logger.debug(f"Kept {len(leaders)} highest-volume markets of {kept} after filtering")
+        return [market for _, _, market in sorted(leaders, reverse=True)]
+            
+    @staticmethod
+    def _open_markets(table: MarketTable) -> List[Market]:
+        """
+        Keep markets that are active, not closed and not yet ended.
+        
+        The check runs on the table's columns; only open markets are
+        validated into Market objects.
+        
+        Args:
+            table: Markets from one API page
+            
+        Returns:
+            List[Market]: Open markets
+        """
+        return table.markets(table.open_mask())
     
     async def _get_gamma_markets(self, max_markets: int) -> List[Market]:
         """
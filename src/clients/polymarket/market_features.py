@@ -0,0 +1,181 @@
+"""
+Derived per-market facts shared across one analysis run.
+
+Filters, pattern analyzers, the fair value engine and the sanity checker
+all need the same facts about a market: the lowered question, its words,
+the whole days left until resolution and where the YES price sits.
+MarketFeatures computes them once. A FeatureStore caches them per market
+for a run and fixes the run's "now", so every consumer agrees on days
+left even when the run straddles a day boundary.
+
+Days left follow timedelta.days, as MarketTable.days_to_end does. Naive
+end dates are read as UTC and the market itself is never modified.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from src.clients.polymarket.models import Market, MarketPrice
+
+# YES prices at or beyond these are treated as already decided
+EXTREME_LOW_PRICE = 0.01
+EXTREME_HIGH_PRICE = 0.99
+
+
+def days_until(end_date: Optional[datetime], now: datetime) -> Optional[int]:
+    """
+    Get whole days from a reference time until an end date.
+    
+    Args:
+        end_date: End date (naive dates are read as UTC)
+        now: Timezone-aware reference time
+        
+    Returns:
+        Optional[int]: Days until end_date, or None if it is unknown
+    """
+    if not end_date:
+        return None
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+    return (end_date - now).days
+
+
+@dataclass(frozen=True)
+class MarketFeatures:
+    """
+    Facts derived from a market at a fixed reference time.
+    """
+    condition_id: str
+    question: str  # Lowercase question
+    description: str  # Lowercase description ('' if none)
+    words: Tuple[str, ...]  # Whitespace-separated words of the lowercase question
+    now: datetime
+    end_date: Optional[datetime]  # Timezone-aware end date
+    days_left: Optional[int]  # Whole days until end_date (negative once ended)
+    yes_price: Optional[float] = None
+    
+    @classmethod
+    def from_market(
+        cls,
+        market: Market,
+        price: Optional[MarketPrice] = None,
+        now: Optional[datetime] = None
+    ) -> "MarketFeatures":
+        """
+        Derive features for a market.
+        
+        Args:
+            market: Market to describe
+            price: Current market price (optional)
+            now: Reference time (defaults to current UTC time)
+            
+        Returns:
+            MarketFeatures: Features of the market
+        """
+        now = now or datetime.now(timezone.utc)
+        end_date = market.end_date_iso
+        if end_date and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=timezone.utc)
+        question = market.question.lower()
+        return cls(
+            condition_id=market.condition_id,
+            question=question,
+            description=(market.description or "").lower(),
+            words=tuple(question.split()),
+            now=now,
+            end_date=end_date,
+            days_left=days_until(end_date, now),
+            yes_price=price.yes_price if price is not None else None
+        )
+        
+    @property
+    def text(self) -> str:
+        """
+        Get the lowercase question and description.
+        
+        Returns:
+            str: Question and description separated by a space
+        """
+        return f"{self.question} {self.description}"
+        
+    @property
+    def at_extreme(self) -> bool:
+        """
+        Check whether the YES price is at 0 or 1 for practical purposes.
+        
+        Returns:
+            bool: True if the price is known and at or beyond the extremes
+        """
+        if self.yes_price is None:
+            return False
+        return self.yes_price <= EXTREME_LOW_PRICE or self.yes_price >= EXTREME_HIGH_PRICE
+        
+    def in_band(self, low: float, high: float) -> bool:
+        """
+        Check whether the YES price lies strictly inside a band.
+        
+        Args:
+            low: Exclusive lower bound
+            high: Exclusive upper bound
+            
+        Returns:
+            bool: True if the price is known and inside the band
+        """
+        return self.yes_price is not None and low < self.yes_price < high
+        
+    def ends_within(self, low: int, high: int) -> bool:
+        """
+        Check whether the whole days left lie inside an inclusive range.
+        
+        Args:
+            low: Fewest days left
+            high: Most days left
+            
+        Returns:
+            bool: True if the end date is known and in range
+        """
+        return self.days_left is not None and low <= self.days_left <= high
+
+
+class FeatureStore:
+    """
+    Per-run cache of market features with one reference time.
+    """
+    
+    def __init__(self, now: Optional[datetime] = None):
+        """
+        Initialize an empty store.
+        
+        Args:
+            now: Reference time for the run (defaults to current UTC time)
+        """
+        self.now = now or datetime.now(timezone.utc)
+        self._features: Dict[str, Tuple[Market, MarketFeatures]] = {}
+        
+    def get(self, market: Market, price: Optional[MarketPrice] = None) -> MarketFeatures:
+        """
+        Get the features of a market, computing them on first use.
+        
+        Args:
+            market: Market to describe
+            price: Current market price (updates the cached YES price if it changed)
+            
+        Returns:
+            MarketFeatures: Features at the store's reference time
+        """
+        entry = self._features.get(market.condition_id)
+        if entry is None or entry[0] is not market:
+            features = MarketFeatures.from_market(market, price, self.now)
+            self._features[market.condition_id] = (market, features)
+            return features
+            
+        features = entry[1]
+        if price is not None and features.yes_price != price.yes_price:
+            features = replace(features, yes_price=price.yes_price)
+            self._features[market.condition_id] = (market, features)
+        return features
+        
+    def __len__(self) -> int:
+        """Number of markets with cached features."""
+        return len(self._features)
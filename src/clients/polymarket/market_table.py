@@ -0,0 +1,372 @@
+"""
+Columnar market table for scanning large market universes.
+
+A MarketTable stores one NumPy column per numeric field (prices, volume,
+liquidity, end timestamp, flags). Strings are kept in plain lists, and
+categories and token outcomes are interned. Gates that used to walk
+pydantic objects one by one, like open/closed, priced, volume and
+days-to-end, become array expressions. Pydantic Market and MarketPrice
+objects are only built for the rows a caller materializes.
+"""
+
+import logging
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.clients.polymarket.models import Market, MarketPrice
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400.0
+
+# Outcome keywords, as matched by PolymarketClient.get_market_prices
+YES_OUTCOME_KEYWORDS = ("yes", "true", "will happen", "win")
+NO_OUTCOME_KEYWORDS = ("no", "false", "will not happen", "lose")
+
+# Side per interned outcome label: "YES", "NO" or None
+_outcome_sides: Dict[str, Optional[str]] = {}
+
+
+def outcome_side(outcome: str) -> Optional[str]:
+    """
+    Classify a token outcome label, memoized per distinct label.
+    
+    Args:
+        outcome: Token outcome label
+        
+    Returns:
+        Optional[str]: "YES", "NO", or None if the label matches neither
+    """
+    side = _outcome_sides.get(outcome, "")
+    if side == "":
+        outcome_lower = outcome.lower()
+        if any(keyword in outcome_lower for keyword in YES_OUTCOME_KEYWORDS):
+            side = "YES"
+        elif any(keyword in outcome_lower for keyword in NO_OUTCOME_KEYWORDS):
+            side = "NO"
+        else:
+            side = None
+        _outcome_sides[sys.intern(outcome)] = side
+    return side
+
+
+def split_token_prices(tokens: Sequence[Tuple[str, Optional[float]]]) -> Tuple[float, float]:
+    """
+    Pick YES and NO prices from (outcome, price) pairs.
+    
+    Follows PolymarketClient.get_market_prices: the last token matching
+    each side wins, and a two-token market without recognisable labels
+    is read as (YES, NO).
+    
+    Args:
+        tokens: (outcome, price) pairs
+        
+    Returns:
+        Tuple[float, float]: YES and NO price (NaN if unavailable)
+    """
+    if len(tokens) < 2:
+        return np.nan, np.nan
+        
+    yes_price = no_price = None
+    yes_found = no_found = False
+    for outcome, price in tokens:
+        side = outcome_side(outcome)
+        if side == "YES":
+            yes_price, yes_found = price, True
+        elif side == "NO":
+            no_price, no_found = price, True
+            
+    if not yes_found or not no_found:
+        if len(tokens) != 2:
+            return np.nan, np.nan
+        yes_price, no_price = tokens[0][1], tokens[1][1]
+        
+    if yes_price is None or no_price is None:
+        return np.nan, np.nan
+    return float(yes_price), float(no_price)
+
+
+def _to_float(value: Any) -> float:
+    """Convert an API number (possibly a string) to float, NaN if missing or invalid."""
+    if value is None or value == "":
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_timestamp(value: Any) -> float:
+    """Convert an end date (datetime or ISO string) to a UTC timestamp, NaN if missing."""
+    if not value:
+        return np.nan
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return np.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class MarketTable:
+    """
+    Struct-of-arrays view of a list of markets.
+    
+    Rows keep the order of the input. Build with from_api_rows() for raw
+    API dicts (no pydantic validation) or from_markets() for existing
+    Market objects.
+    """
+    
+    __slots__ = (
+        "_markets", "_sources", "active", "categories", "category_codes",
+        "closed", "condition_ids", "end_ts", "liquidity", "no_price",
+        "questions", "volume", "yes_price"
+    )
+    
+    def __init__(self, size: int):
+        """
+        Allocate an empty table.
+        
+        Args:
+            size: Number of rows
+        """
+        self.condition_ids: List[str] = [""] * size
+        self.questions: List[str] = [""] * size
+        self.categories: List[Optional[str]] = [None]  # Code 0 is "no category"
+        self.category_codes = np.zeros(size, dtype=np.int32)
+        self.yes_price = np.full(size, np.nan)
+        self.no_price = np.full(size, np.nan)
+        self.volume = np.full(size, np.nan)
+        self.liquidity = np.full(size, np.nan)
+        self.end_ts = np.full(size, np.nan)
+        self.active = np.zeros(size, dtype=bool)
+        self.closed = np.zeros(size, dtype=bool)
+        self._sources: List[Any] = [None] * size
+        self._markets: List[Optional[Market]] = [None] * size
+        
+    def __len__(self) -> int:
+        return len(self.condition_ids)
+        
+    @classmethod
+    def from_api_rows(cls, rows: Sequence[Mapping[str, Any]]) -> "MarketTable":
+        """
+        Build a table from raw market dicts as returned by the CLOB API.
+        
+        Args:
+            rows: Market dicts
+            
+        Returns:
+            MarketTable: Table over the rows
+        """
+        table = cls(len(rows))
+        codes: Dict[Optional[str], int] = {None: 0}
+        
+        for i, row in enumerate(rows):
+            table.condition_ids[i] = row.get("condition_id") or ""
+            table.questions[i] = row.get("question") or ""
+            table.category_codes[i] = table._category_code(row.get("category"), codes)
+            table.yes_price[i], table.no_price[i] = split_token_prices([
+                (sys.intern(token.get("outcome") or ""), _to_float(token.get("price")))
+                for token in row.get("tokens") or []
+            ])
+            table.volume[i] = _to_float(row.get("volume"))
+            table.liquidity[i] = _to_float(row.get("liquidity"))
+            table.end_ts[i] = _to_timestamp(row.get("end_date_iso"))
+            table.active[i] = bool(row.get("active"))
+            table.closed[i] = bool(row.get("closed"))
+            table._sources[i] = row
+            
+        table._fix_missing_prices()
+        return table
+        
+    @classmethod
+    def from_markets(
+        cls,
+        markets: Sequence[Market],
+        price_lookup: Optional[Mapping[str, MarketPrice]] = None
+    ) -> "MarketTable":
+        """
+        Build a table from Market objects.
+        
+        Args:
+            markets: Markets
+            price_lookup: Prices keyed by condition ID; token prices are used if omitted
+            
+        Returns:
+            MarketTable: Table over the markets
+        """
+        table = cls(len(markets))
+        codes: Dict[Optional[str], int] = {None: 0}
+        
+        for i, market in enumerate(markets):
+            table.condition_ids[i] = market.condition_id
+            table.questions[i] = market.question
+            table.category_codes[i] = table._category_code(market.category, codes)
+            if price_lookup is not None:
+                price = price_lookup.get(market.condition_id)
+                if price is not None:
+                    table.yes_price[i] = price.yes_price
+                    table.no_price[i] = price.no_price
+            else:
+                table.yes_price[i], table.no_price[i] = split_token_prices([
+                    (token.outcome, token.price) for token in market.tokens
+                ])
+            table.volume[i] = np.nan if market.volume is None else market.volume
+            table.liquidity[i] = np.nan if market.liquidity is None else market.liquidity
+            table.end_ts[i] = _to_timestamp(market.end_date_iso)
+            table.active[i] = market.active
+            table.closed[i] = market.closed
+            table._sources[i] = market
+            table._markets[i] = market
+            
+        table._fix_missing_prices()
+        return table
+        
+    def _category_code(self, category: Optional[str], codes: Dict[Optional[str], int]) -> int:
+        """Intern a category and return its code."""
+        code = codes.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(sys.intern(category))
+            codes[category] = code
+        return code
+        
+    def _fix_missing_prices(self) -> None:
+        """Mark a row unpriced unless both sides have a price."""
+        missing = np.isnan(self.yes_price) | np.isnan(self.no_price)
+        self.yes_price[missing] = np.nan
+        self.no_price[missing] = np.nan
+        
+    def open_mask(self, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Rows that are active, not closed and not yet ended.
+        
+        Args:
+            now: Reference time (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        not_ended = np.isnan(self.end_ts) | (self.end_ts > now_ts)
+        return self.active & ~self.closed & not_ended
+        
+    def priced_mask(self) -> np.ndarray:
+        """
+        Rows with both a YES and a NO price.
+        
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        return ~np.isnan(self.yes_price)
+        
+    def volume_mask(self, min_volume: float) -> np.ndarray:
+        """
+        Rows passing the analyzer's volume gate.
+        
+        Unknown or zero volume passes, as in MarketAnalyzer.
+        
+        Args:
+            min_volume: Minimum volume
+            
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        return ~(self.volume < min_volume) | (self.volume == 0)
+        
+    def category_mask(self, categories: Iterable[str]) -> np.ndarray:
+        """
+        Rows whose category contains any of the given lower-case names.
+        
+        Each distinct category is matched once, not once per row.
+        
+        Args:
+            categories: Lower-case category substrings
+            
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        wanted = list(categories)
+        matching = [
+            code for code, category in enumerate(self.categories)
+            if category and any(name in category.lower() for name in wanted)
+        ]
+        return np.isin(self.category_codes, matching)
+        
+    def days_to_end(self, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Whole days until resolution, floored like timedelta.days.
+        
+        Args:
+            now: Reference time (defaults to current UTC time)
+            
+        Returns:
+            np.ndarray: Days per row (NaN if the end date is unknown)
+        """
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        return np.floor((self.end_ts - now_ts) / SECONDS_PER_DAY)
+        
+    def category(self, row: int) -> Optional[str]:
+        """Get the interned category of a row."""
+        return self.categories[self.category_codes[row]]
+        
+    def market(self, row: int) -> Optional[Market]:
+        """
+        Materialize a row as a pydantic Market (cached).
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            Optional[Market]: Market, or None if the raw row fails validation
+        """
+        market = self._markets[row]
+        if market is None:
+            try:
+                market = Market(**self._sources[row])
+            except Exception as e:
+                logger.error(f"Error parsing market data: {e}")
+                return None
+            self._markets[row] = market
+        return market
+        
+    def markets(self, rows: Iterable[int]) -> List[Market]:
+        """
+        Materialize rows as pydantic Markets, skipping invalid ones.
+        
+        Args:
+            rows: Row indices (or a boolean mask)
+            
+        Returns:
+            List[Market]: Markets in row order
+        """
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return [market for market in (self.market(int(row)) for row in rows) if market]
+        
+    def price(self, row: int) -> Optional[MarketPrice]:
+        """
+        Materialize a row's prices as a MarketPrice.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            Optional[MarketPrice]: Price, or None if the row is unpriced
+        """
+        if np.isnan(self.yes_price[row]):
+            return None
+        yes_price = float(self.yes_price[row])
+        no_price = float(self.no_price[row])
+        return MarketPrice(
+            condition_id=self.condition_ids[row],
+            yes_price=yes_price,
+            no_price=no_price,
+            spread=abs(yes_price - no_price)
+        )
@@ -36,12 +36,28 @@ class Settings(BaseSettings):
         default="https://newsapi.org/v2",
         description="NewsAPI base URL"
     )
+    news_api_daily_quota: int = Field(
+        default=100,
+        description="NewsAPI requests allowed per UTC day (free tier: 100)"
+    )
+    news_api_quota_reserve: int = Field(
+        default=20,
+        description="Requests held back from low-priority NewsAPI queries"
+    )
+    news_api_quota_file: str = Field(
+        default="data/newsapi_quota.json",
+        description="File used to persist the NewsAPI daily quota ledger"
+    )
     
     # Claude API Configuration
     claude_api_key: Optional[str] = Field(
         default=None,
         description="Claude API key for LLM-powered news analysis"
     )
+    llm_max_concurrency: int = Field(
+        default=8,
+        description="Maximum LLM article analyses in flight at once"
+    )
     
     # Application Configuration
     log_level: str = Field(
@@ -74,6 +90,94 @@ class Settings(BaseSettings):
         default=500,
         description="Maximum number of markets to analyze (API limit ~500)"
     )
+    analysis_max_concurrency: int = Field(
+        default=16,
+        description="Maximum markets analyzed concurrently (1 = sequential)"
+    )
+    analysis_market_timeout_seconds: Optional[float] = Field(
+        default=30.0,
+        description="Per-market analysis timeout in seconds (None for no limit)"
+    )
+    analysis_backend: str = Field(
+        default="async",
+        description="Analysis backend: 'async' (event loop) or 'process' (worker processes)"
+    )
+    analysis_process_workers: Optional[int] = Field(
+        default=None,
+        description="Worker processes for the 'process' backend (None = CPU count)"
+    )
+    analysis_process_chunk_size: int = Field(
+        default=250,
+        description="Markets sent to a worker process per task"
+    )
+    analysis_pipeline_queue_size: int = Field(
+        default=256,
+        description="Capacity of each queue between streaming pipeline stages"
+    )
+    analysis_score_batch_size: int = Field(
+        default=256,
+        description="Most candidates scored in one vectorized pass by the pipeline"
+    )
+    analysis_ensemble: bool = Field(
+        default=False,
+        description="Run every pattern analyzer in one pass instead of the one the confidence filter selects"
+    )
+    incremental_price_epsilon: float = Field(
+        default=0.005,
+        description="YES/NO price move below which a refresh skips a market"
+    )
+    incremental_volume_epsilon: float = Field(
+        default=0.02,
+        description="Relative volume move below which a refresh skips a market"
+    )
+    incremental_end_date_epsilon_seconds: float = Field(
+        default=3600.0,
+        description="End date shift in seconds below which a refresh skips a market"
+    )
+    incremental_news_epsilon: float = Field(
+        default=0.0,
+        description="Jaccard distance between related-news sets below which a refresh skips a market"
+    )
+    incremental_max_age_seconds: float = Field(
+        default=3600.0,
+        description="Carried-forward results older than this are re-analyzed"
+    )
+    prediction_write_batch_size: int = Field(
+        default=100,
+        description="Prediction records buffered before they are appended to disk"
+    )
+    prediction_write_flush_seconds: float = Field(
+        default=5.0,
+        description="Longest a buffered prediction record waits before it is written"
+    )
+    analysis_timings_file: str = Field(
+        default="data/run_timings.jsonl",
+        description="JSON Lines file receiving per-stage timings for each analysis run"
+    )
+    market_data_file: str = Field(
+        default="data/market_data.json",
+        description="Local crypto market data read by the file-backed market data provider"
+    )
+    monte_carlo_seed: int = Field(
+        default=0,
+        description="Base seed of Monte Carlo path simulations"
+    )
+    monte_carlo_target_standard_error: float = Field(
+        default=0.01,
+        description="Standard error at which a market's Monte Carlo estimate stops"
+    )
+    monte_carlo_max_paths: int = Field(
+        default=20000,
+        description="Most Monte Carlo paths simulated per market"
+    )
+    reference_data_source: str = Field(
+        default="data/reference_data.json",
+        description="Reference data (teams, companies, awards, climatology, pollsters) edited by hand; relative to the project root"
+    )
+    reference_data_file: str = Field(
+        default="data/reference_data.refdb",
+        description="Compiled, memory-mapped form of the reference data, rebuilt when the source changes; relative to the project root"
+    )
     
     # Market Selection Filters
     market_categories: Optional[str] = Field(
@@ -6,19 +6,25 @@ import asyncio
 import logging
 import sys
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import List, Optional, Dict
 
+from src.analyzers.budget import AnalysisBudget
 from src.analyzers.market_analyzer import MarketAnalyzer
 from src.analyzers.models import AnalysisResult
+from src.analyzers.news_index import NewsKeywordIndex
+from src.analyzers.pipeline import AnalysisPipeline
 from src.analyzers.news_correlator import NewsCorrelator
 from src.analyzers.market_researcher import MarketResearcher
 from src.clients.news.client import NewsClient
 from src.clients.polymarket.client import PolymarketClient
 from src.config.settings import settings
 from src.console.display import DisplayManager
+from src.utils.batch_writer import flush_all, get_writer
 from src.utils.cache import api_cache
 from src.utils.rate_limiter import rate_limiters
 from src.utils.prediction_tracker import prediction_tracker
+from src.utils.timing import StageTimer
 from src.console.chat import start_market_chat
 
 logger = logging.getLogger(__name__)
@@ -38,8 +44,38 @@ class PolymarketAnalyzerApp:
         self.last_analysis: Optional[AnalysisResult] = None
         self.auto_reload_enabled = False
         self.high_confidence_only = False
+        self.market_analyzer.pattern_analyzer = self._pattern_analyzer()
         self._setup_logging()
         
+    def _analyzer_mode(self) -> str:
+        """
+        Get the name of the analyzer matching the confidence filter.
+        
+        Returns:
+            str: Analyzer name
+        """
+        return "high_confidence" if self.high_confidence_only else "flexible"
+        
+    def _pattern_analyzer(self) -> object:
+        """
+        Build the pattern analyzer matching the confidence filter.
+        
+        With analysis_ensemble set, every analyzer runs in one pass and the
+        filter only picks the verdict used. Imports are local so that a
+        reload picks up the new classes.
+        
+        Returns:
+            object: Pattern analyzer
+        """
+        if settings.analysis_ensemble:
+            from src.analyzers.ensemble import AnalyzerEnsemble
+            return AnalyzerEnsemble(mode=self._analyzer_mode())
+        if self.high_confidence_only:
+            from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+            return HighConfidenceAnalyzer()
+        from src.analyzers.flexible_analyzer import FlexibleAnalyzer
+        return FlexibleAnalyzer()
+        
     def _setup_logging(self) -> None:
         """Setup logging configuration."""
         logging.basicConfig(
@@ -71,6 +107,9 @@ class PolymarketAnalyzerApp:
         except Exception as e:
             self.display.print_error(f"Unexpected error: {e}")
             logger.exception("Unexpected error in main application")
+        finally:
+            self.market_analyzer.shutdown()
+            flush_all()
             
     def _check_api_keys(self) -> bool:
         """
@@ -121,7 +160,15 @@ class PolymarketAnalyzerApp:
         args = parts[1:] if len(parts) > 1 else []
         
         if cmd == "start":
-            await self._run_analysis()
+            if args:
+                budget_seconds = self._parse_budget(args)
+                if budget_seconds is None:
+                    self.display.print_error("Invalid time budget")
+                    self.display.print_info("Usage: start [--budget <seconds>]")
+                    return
+                await self._run_analysis(budget_seconds=budget_seconds)
+            else:
+                await self._run_analysis()
         elif cmd == "top":
             self._show_top_opportunities()
         elif cmd == "details" and args:
@@ -183,8 +230,37 @@ class PolymarketAnalyzerApp:
             self.display.print_error(f"Unknown command: {cmd}")
             self.display.print_info("Type 'help' for available commands.")
             
-    async def _run_analysis(self) -> None:
-        """Run market analysis."""
+    @staticmethod
+    def _parse_budget(args: List[str]) -> Optional[float]:
+        """
+        Parse '--budget <seconds>' from start command arguments.
+        
+        Args:
+            args: Arguments after the command
+            
+        Returns:
+            Optional[float]: Budget in seconds, or None if the arguments are invalid
+        """
+        if len(args) != 2 or args[0] != "--budget":
+            return None
+        try:
+            seconds = float(args[1])
+        except ValueError:
+            return None
+        return seconds if seconds > 0 else None
+        
+    async def _run_analysis(
+        self,
+        incremental: bool = False,
+        budget_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Run market analysis.
+        
+        Args:
+            incremental: Only re-analyze markets that changed since the last run
+            budget_seconds: Return the best results found within this many seconds
+        """
         # Show current filters
         from src.utils.market_filters import market_filter
         from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
@@ -197,6 +273,13 @@ class PolymarketAnalyzerApp:
         
         self.display.print_info("Starting market analysis...")
         self.display.print_info(f"Filters: {filter_summary}")
+        if budget_seconds is not None:
+            self.display.print_info(f"Time budget: {budget_seconds:g} seconds")
+            
+        logged_predictions = 0
+        timer = StageTimer()
+        # The budget covers the whole run, fetching included
+        budget = AnalysisBudget(budget_seconds) if budget_seconds is not None else None
         
         with Progress(
             SpinnerColumn(),
@@ -207,51 +290,84 @@ class PolymarketAnalyzerApp:
             task = progress.add_task("🔍 Searching for opportunities...", total=None)
             
             try:
-                # Fetch markets
                 progress.update(task, description="📊 Fetching active markets...")
-                await rate_limiters.polymarket.acquire()
+                news_quota_remaining = settings.news_api_daily_quota
                 
-                async with PolymarketClient() as polymarket_client:
-                    markets = await polymarket_client.get_all_active_markets()
-                    
-                if not markets:
-                    self.display.print_warning("No active markets found.")
-                    return
+                async def fetch_news() -> List:
+                    nonlocal news_quota_remaining
+                    with timer.stage("news"):
+                        await rate_limiters.newsapi.acquire()
+                        async with NewsClient() as news_client:
+                            articles = await news_client.get_relevant_news()
+                            news_quota_remaining = news_client.remaining_quota()
+                    return articles
                     
-                # Get market prices
-                progress.update(task, description=f"💹 Analyzing {len(markets)} markets...")
-                market_prices = []
-                for market in markets:
-                    async with PolymarketClient() as polymarket_client:
-                        price = await polymarket_client.get_market_prices(market)
-                        if price:
-                            market_prices.append(price)
-                            
-                # Fetch news
-                progress.update(task, description="📰 Checking latest news...")
-                await rate_limiters.newsapi.acquire()
+                found = 0
                 
-                async with NewsClient() as news_client:
-                    news_articles = await news_client.get_relevant_news()
+                def on_opportunity(opportunity) -> None:
+                    # Log high-confidence predictions as soon as they are found
+                    nonlocal found, logged_predictions
+                    found += 1
+                    if opportunity.score.confidence_score >= 0.6 and opportunity.score.overall_score >= 0.5:
+                        with timer.stage("record", opportunity.condition_id):
+                            prediction_tracker.log_prediction(opportunity)
+                        logged_predictions += 1
+                    progress.update(task, description=f"🎯 {found} opportunities found so far...")
                     
-                # Run analysis
-                progress.update(task, description="🎯 Identifying opportunities...")
-                
-                # Use high confidence analyzer if filter is active
-                if self.high_confidence_only:
-                    from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
-                    # Temporarily replace the analyzer
-                    original_analyzer = self.market_analyzer.pattern_analyzer
-                    self.market_analyzer.pattern_analyzer = HighConfidenceAnalyzer()
+                try:
+                    async with PolymarketClient() as polymarket_client:
+                        polymarket_client.timer = timer
+                        if self.market_analyzer.backend == "process":
+                            # Worker processes need the whole batch up front
+                            markets = await polymarket_client.get_all_active_markets()
+                            market_prices = []
+                            for market in markets:
+                                if budget is not None and budget.expired:
+                                    budget.skip(market.condition_id)
+                                    continue
+                                with timer.stage("price", market.condition_id):
+                                    price = await polymarket_client.get_market_prices(market)
+                                if price:
+                                    market_prices.append(price)
+                            progress.update(task, description=f"💹 Analyzing {len(markets)} markets...")
+                            if budget is None:
+                                news_articles = await fetch_news()
+                            else:
+                                try:
+                                    news_articles = await asyncio.wait_for(fetch_news(), budget.remaining)
+                                except TimeoutError:
+                                    logger.warning("News unavailable within the time budget")
+                                    news_articles = []
+                            self.last_analysis = await self.market_analyzer.analyze_markets(
+                                markets, market_prices, news_articles,
+                                news_index=NewsKeywordIndex(news_articles),
+                                incremental=incremental,
+                                timer=timer,
+                                budget=budget
+                            )
+                            for opportunity in self.last_analysis.opportunities:
+                                on_opportunity(opportunity)
+                        else:
+                            # Stream markets through the staged pipeline while news downloads
+                            pipeline = AnalysisPipeline(
+                                self.market_analyzer, polymarket_client.get_market_prices
+                            )
+                            self.last_analysis = await pipeline.run(
+                                polymarket_client.iter_active_markets(),
+                                fetch_news(),
+                                on_opportunity=on_opportunity,
+                                incremental=incremental,
+                                timer=timer,
+                                budget=budget
+                            )
+                finally:
+                    # Persist the predictions batched during this run
+                    flush_all()
+                        
+                if self.last_analysis.total_markets_analyzed == 0:
+                    self.display.print_warning("No active markets found.")
+                    return
                     
-                self.last_analysis = await self.market_analyzer.analyze_markets(
-                    markets, market_prices, news_articles
-                )
-                
-                # Restore original analyzer if needed
-                if self.high_confidence_only:
-                    self.market_analyzer.pattern_analyzer = original_analyzer
-                
                 progress.update(task, description="✅ Analysis complete!", completed=100)
                 
             except Exception as e:
@@ -260,31 +376,67 @@ class PolymarketAnalyzerApp:
                 return
                 
         # Display results
-        self.display.print_success("Analysis complete!")
-        self.display.print_analysis_summary(self.last_analysis)
-        
-        if self.last_analysis.opportunities:
-            # Log high-confidence predictions for tracking
-            high_confidence_opportunities = [
-                opp for opp in self.last_analysis.opportunities
-                if opp.score.confidence_score >= 0.6 and opp.score.overall_score >= 0.5
-            ]
+        with timer.stage("display"):
+            self.display.print_success("Analysis complete!")
+            self.display.print_analysis_summary(self.last_analysis)
             
-            if high_confidence_opportunities:
-                for opportunity in high_confidence_opportunities:
-                    prediction_tracker.log_prediction(opportunity)
+            if self.last_analysis.partial:
+                self.display.print_warning(
+                    f"Time budget reached: results cover the {self.last_analysis.markets_covered} "
+                    "highest-priority markets analyzed."
+                )
+                
+            if news_quota_remaining <= settings.news_api_quota_reserve:
+                self.display.print_warning(
+                    f"NewsAPI quota low: {news_quota_remaining} requests left today. "
+                    "Low-priority news queries are being skipped."
+                )
+                
+            if self.last_analysis.opportunities:
+                if logged_predictions:
+                    self.display.print_success(
+                        f"Logged {logged_predictions} high-confidence predictions for tracking."
+                    )
                     
-                self.display.print_success(
-                    f"Logged {len(high_confidence_opportunities)} high-confidence predictions for tracking."
+                self.display.print_top_opportunities(
+                    self.last_analysis.top_opportunities, 
+                    limit=10
                 )
+            else:
+                self.display.print_warning("No opportunities found with current criteria.")
+                self.display.print_info("Try adjusting the minimum spread or volume thresholds.")
                 
-            self.display.print_top_opportunities(
-                self.last_analysis.top_opportunities, 
-                limit=10
-            )
-        else:
-            self.display.print_warning("No opportunities found with current criteria.")
-            self.display.print_info("Try adjusting the minimum spread or volume thresholds.")
+        # The summary above predates the display stage; the persisted record includes it
+        self.last_analysis.timings = timer.timings()
+        self._record_timings(self.last_analysis, incremental)
+        
+    def _record_timings(self, result: AnalysisResult, incremental: bool) -> None:
+        """
+        Append a run's timings to the timings file.
+        
+        Args:
+            result: Analysis result with timings attached
+            incremental: Whether the run was incremental
+        """
+        path = Path(settings.analysis_timings_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            writer = get_writer(path)
+            writer.write({
+                "analyzed_at": result.analyzed_at.isoformat(),
+                "incremental": incremental,
+                "budget_seconds": result.budget_seconds,
+                "partial": result.partial,
+                "backend": self.market_analyzer.backend,
+                "markets": result.total_markets_analyzed,
+                "opportunities": len(result.opportunities),
+                "duration_seconds": result.analysis_duration_seconds,
+                **result.timings.model_dump()
+            })
+            writer.flush()
+        except OSError as e:
+            logger.warning(f"Failed to record run timings: {e}")
+            
             
     def _show_top_opportunities(self) -> None:
         """Show top opportunities."""
@@ -297,7 +449,7 @@ class PolymarketAnalyzerApp:
             return
             
         self.display.print_top_opportunities(
-            self.last_analysis.top_opportunities,
+            self.last_analysis.top(20),
             limit=20
         )
         
@@ -312,22 +464,8 @@ class PolymarketAnalyzerApp:
             self.display.print_warning("No analysis results available. Run 'start' first.")
             return
             
-        opportunity = None
-        
-        # Try to find by condition ID
-        for opp in self.last_analysis.opportunities:
-            if opp.condition_id == opportunity_id:
-                opportunity = opp
-                break
-                
-        # Try to find by rank number
-        if not opportunity:
-            try:
-                rank = int(opportunity_id)
-                if 1 <= rank <= len(self.last_analysis.top_opportunities):
-                    opportunity = self.last_analysis.top_opportunities[rank - 1]
-            except ValueError:
-                pass
+        # Find by condition ID or rank number
+        opportunity = self.last_analysis.find_opportunity(opportunity_id)
                 
         if not opportunity:
             self.display.print_error(f"Opportunity not found: {opportunity_id}")
@@ -343,8 +481,8 @@ class PolymarketAnalyzerApp:
         # Clear cache
         await api_cache.cleanup()
         
-        # Run fresh analysis
-        await self._run_analysis()
+        # Re-analyze only the markets that moved since the last run
+        await self._run_analysis(incremental=True)
         
     def _show_performance_metrics(self) -> None:
         """Show prediction performance metrics."""
@@ -548,23 +686,8 @@ class PolymarketAnalyzerApp:
             self.display.print_warning("No analysis results available. Run 'start' first.")
             return
             
-        # Find the opportunity
-        opportunity = None
-        
-        # Try to find by condition ID
-        for opp in self.last_analysis.opportunities:
-            if opp.condition_id == opportunity_id:
-                opportunity = opp
-                break
-                
-        # Try to find by rank number
-        if not opportunity:
-            try:
-                rank = int(opportunity_id)
-                if 1 <= rank <= len(self.last_analysis.top_opportunities):
-                    opportunity = self.last_analysis.top_opportunities[rank - 1]
-            except ValueError:
-                pass
+        # Find by condition ID or rank number
+        opportunity = self.last_analysis.find_opportunity(opportunity_id)
                 
         if not opportunity:
             self.display.print_error(f"Opportunity not found: {opportunity_id}")
@@ -911,14 +1034,26 @@ class PolymarketAnalyzerApp:
         Args:
             high_confidence_only: Whether to show only high confidence opportunities
         """
-        # Store the preference
+        # Store the preference; opportunities are only rebuilt by the next run.
+        # An ensemble keeps every analyzer's last verdicts, so it only switches mode
         self.high_confidence_only = high_confidence_only
+        analyzer = self.market_analyzer.pattern_analyzer
+        ensemble = getattr(analyzer, "mode", None) is not None
+        if ensemble:
+            analyzer.mode = self._analyzer_mode()
+        else:
+            self.market_analyzer.pattern_analyzer = self._pattern_analyzer()
         
         if high_confidence_only:
             self.display.print_success("High confidence filter activated - will use specialized analyzer")
         else:
             self.display.print_success("All confidence levels enabled")
-        self.display.print_info("Run 'start' to apply new filter.")
+        if ensemble and analyzer.verdicts:
+            self.display.print_info(
+                f"Last run: {len(analyzer.matches(analyzer.mode))} of {len(analyzer.verdicts)} "
+                "markets matched by this analyzer."
+            )
+        self.display.print_info("Run 'start' or 'refresh' to apply new filter.")
         
     def _clear_all_filters(self) -> None:
         """Clear all active filters."""
@@ -991,6 +1126,8 @@ class PolymarketAnalyzerApp:
                 'src.analyzers.high_confidence_analyzer',
                 'src.analyzers.flexible_analyzer',
                 'src.analyzers.simple_pattern_analyzer',
+                'src.analyzers.refined_simple_analyzer',
+                'src.analyzers.ensemble',
                 'src.analyzers.kelly_criterion',
                 'src.analyzers.backtesting',
                 'src.clients.news.client',
@@ -1025,7 +1162,9 @@ class PolymarketAnalyzerApp:
             from src.console.display import DisplayManager
             
             # Create new instances
+            self.market_analyzer.shutdown()
             self.market_analyzer = MarketAnalyzer()
+            self.market_analyzer.pattern_analyzer = self._pattern_analyzer()
             self.news_correlator = NewsCorrelator()
             self.market_researcher = MarketResearcher()
             self.display = DisplayManager()
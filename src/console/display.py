@@ -52,9 +52,36 @@ class DisplayManager:
         summary_table.add_row("Opportunities Found", str(len(result.opportunities)))
         summary_table.add_row("High Confidence Opportunities", str(len(result.high_confidence_opportunities)))
         summary_table.add_row("News Articles Processed", str(result.news_articles_processed))
+        if result.markets_reanalyzed is not None:
+            summary_table.add_row(
+                "Markets Re-analyzed",
+                f"{result.markets_reanalyzed} changed, {result.markets_skipped} carried forward "
+                f"({result.skipped_work_ratio:.0%} of work skipped)"
+            )
+        if result.markets_covered is not None:
+            coverage = (
+                f"{result.markets_covered}/{result.total_markets_analyzed} markets "
+                f"({result.coverage:.0%}) within {result.budget_seconds:g}s budget"
+            )
+            if result.markets_cancelled:
+                coverage += f", {result.markets_cancelled} cancelled"
+            if result.partial:
+                coverage += " [PARTIAL]"
+            summary_table.add_row("Budget Coverage", coverage)
         summary_table.add_row("Analysis Duration", f"{result.analysis_duration_seconds:.2f} seconds")
         summary_table.add_row("Analysis Time", result.analyzed_at.strftime("%Y-%m-%d %H:%M:%S"))
-        
+        if result.timings and result.timings.stages:
+            summary_table.add_row(
+                "Stage Timings",
+                ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result.timings.stages.items())
+            )
+        if result.timings and result.timings.markets_timed:
+            summary_table.add_row(
+                "Per-Market Latency",
+                f"p50 {result.timings.market_p50_ms:.1f} ms, p95 {result.timings.market_p95_ms:.1f} ms, "
+                f"max {result.timings.market_max_ms:.1f} ms ({result.timings.markets_timed} markets)"
+            )
+            
         self.console.print(summary_table)
         self.console.print()
         
@@ -275,6 +302,7 @@ class DisplayManager:
 
 [bold yellow]Analysis Commands:[/bold yellow]
 [green]start[/green]                - Run market analysis
+[green]start --budget <s>[/green]   - Best results found within <s> seconds
 [green]top[/green]                  - Show top opportunities  
 [green]details <id>[/green]         - Show opportunity details
 [green]chat <id>[/green]            - Interactive chat about a specific market
@@ -0,0 +1,233 @@
+"""
+Buffered JSON Lines writer for append-only prediction logs.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def encode_record(record: Any) -> bytes:
+    """
+    Serialize a record as one JSON line.
+    
+    Dataclasses, dicts and datetimes are handled natively by orjson;
+    pydantic models are dumped first.
+    
+    Args:
+        record: Record to serialize
+        
+    Returns:
+        bytes: JSON line including the trailing newline
+    """
+    if hasattr(record, "model_dump"):
+        record = record.model_dump()
+    return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class BatchWriter:
+    """
+    Buffers JSON lines for one file and appends them in batches.
+    
+    A batch is written when it reaches max_records, when the oldest
+    buffered record is older than flush_interval seconds, or on
+    flush(). Every writer is flushed at interpreter exit.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        max_records: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        """
+        Initialize batch writer.
+        
+        Args:
+            path: JSON Lines file to append to
+            max_records: Records buffered before a flush (defaults to settings)
+            flush_interval: Seconds a record may wait before a flush (defaults to settings)
+        """
+        self.path = Path(path)
+        self.max_records = max_records or settings.prediction_write_batch_size
+        self.flush_interval = (
+            flush_interval if flush_interval is not None
+            else settings.prediction_write_flush_seconds
+        )
+        self._buffer: List[bytes] = []
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self.batches_written = 0
+        
+    def __len__(self) -> int:
+        return len(self._buffer)
+        
+    def write(self, record: Any) -> None:
+        """
+        Buffer a record.
+        
+        The record is serialized immediately, so later mutation of the
+        object does not change what is written.
+        
+        Args:
+            record: Dataclass, dict or pydantic model
+        """
+        line = encode_record(record)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.max_records:
+                self.flush()
+            elif self._timer is None and self.flush_interval > 0:
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+                
+    def flush(self) -> int:
+        """
+        Append buffered records to the file and sync it to disk.
+        
+        Returns:
+            int: Number of records written
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return 0
+                
+            lines = self._buffer
+            self._buffer = []
+            try:
+                with open(self.path, "ab") as f:
+                    f.write(b"".join(lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError:
+                # Keep the records so a later flush can retry
+                self._buffer = lines + self._buffer
+                raise
+                
+            self.batches_written += 1
+            logger.debug(f"Wrote {len(lines)} records to {self.path}")
+            return len(lines)
+            
+    def discard(self) -> int:
+        """
+        Drop buffered records without writing them.
+        
+        Returns:
+            int: Number of records dropped
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dropped = len(self._buffer)
+            self._buffer = []
+            return dropped
+            
+    def _flush_on_timer(self) -> None:
+        """Flush from the timer thread."""
+        try:
+            self.flush()
+        except OSError as e:
+            logger.error(f"Failed to flush {self.path}: {e}")
+
+
+_writers: Dict[Path, BatchWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(path: Path) -> BatchWriter:
+    """
+    Get the shared writer for a file, creating it on first use.
+    
+    Components appending to the same file share one buffer, so their
+    records keep their relative order.
+    
+    Args:
+        path: JSON Lines file
+        
+    Returns:
+        BatchWriter: Shared writer
+    """
+    key = Path(path).resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = BatchWriter(key)
+            _writers[key] = writer
+        return writer
+
+
+def _flush_shared(writer: BatchWriter) -> int:
+    """
+    Flush a shared writer, logging rather than raising on failure.
+    
+    Args:
+        writer: Writer to flush
+        
+    Returns:
+        int: Number of records written
+    """
+    try:
+        return writer.flush()
+    except OSError as e:
+        logger.error(f"Failed to flush {writer.path}: {e}")
+        return 0
+
+
+def flush_all() -> int:
+    """
+    Flush every shared writer.
+    
+    Writers whose directory no longer exists (a removed temporary
+    directory, say) are unregistered and their buffered records dropped.
+    
+    Returns:
+        int: Number of records written
+    """
+    with _writers_lock:
+        for key, writer in list(_writers.items()):
+            if not writer.path.parent.exists():
+                logger.debug(f"Dropping writer for {writer.path}: directory no longer exists")
+                writer.discard()
+                del _writers[key]
+        writers = list(_writers.values())
+        
+    return sum(_flush_shared(writer) for writer in writers)
+
+
+def close_all() -> int:
+    """
+    Flush every shared writer and unregister them all.
+    
+    The next get_writer() call for a file creates a fresh writer.
+    
+    Returns:
+        int: Number of records written
+    """
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+        
+    written = 0
+    for writer in writers:
+        if writer.path.parent.exists():
+            written += _flush_shared(writer)
+        else:
+            writer.discard()
+    return written
+
+
+atexit.register(flush_all)
@@ -0,0 +1,55 @@
+"""
+Attributes built on first access, with their module imported then.
+"""
+
+from importlib import import_module
+from typing import Any, Dict, Optional
+
+
+class LazyComponent:
+    """
+    Class attribute that builds its component on first access.
+    
+    The component's module is imported at that point, not when the owning
+    module loads. The instance is then stored on the owner, so later reads
+    are plain attribute lookups and assigning a replacement (in tests, for
+    example) works as for any attribute.
+    """
+    
+    def __init__(self, module: str, factory: str, **kwargs: Any):
+        """
+        Initialize the attribute.
+        
+        Args:
+            module: Dotted path of the module defining the component
+            factory: Class or function in that module building it
+            **kwargs: Keyword arguments passed to the factory
+        """
+        self.module = module
+        self.factory = factory
+        self.kwargs: Dict[str, Any] = kwargs
+        self.name: Optional[str] = None
+        
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        component = getattr(import_module(self.module), self.factory)(**self.kwargs)
+        instance.__dict__[self.name] = component
+        return component
+        
+    @staticmethod
+    def built(instance: Any, name: str) -> bool:
+        """
+        Check whether a lazy attribute has been built on an instance.
+        
+        Args:
+            instance: Owning object
+            name: Attribute name
+            
+        Returns:
+            bool: True if the component exists
+        """
+        return name in instance.__dict__
@@ -3,9 +3,9 @@ Market filtering utilities for advanced market selection.
 """
 
 import logging
-from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
+from src.clients.polymarket.market_features import FeatureStore
 from src.clients.polymarket.models import Market
 from src.config.settings import settings
 
@@ -40,12 +40,17 @@ class MarketFilter:
             return []
         return [item.strip().lower() for item in value.split(',') if item.strip()]
         
-    def filter_markets(self, markets: List[Market]) -> List[Market]:
+    def filter_markets(
+        self,
+        markets: List[Market],
+        features: Optional[FeatureStore] = None
+    ) -> List[Market]:
         """
         Apply all filters to markets.
         
         Args:
             markets: List of markets to filter
+            features: Feature store of the current run (a fresh one if omitted)
             
         Returns:
             List[Market]: Filtered markets
@@ -54,6 +59,8 @@ class MarketFilter:
         
         # Apply filters
         filtered = markets
+        if features is None:
+            features = FeatureStore()
         
         # Category filter
         if self.categories:
@@ -62,12 +69,12 @@ class MarketFilter:
             
         # Keyword filter
         if self.keywords:
-            filtered = self._filter_by_keywords(filtered)
+            filtered = self._filter_by_keywords(filtered, features)
             logger.debug(f"After keyword filter: {len(filtered)} markets")
             
         # Time horizon filter
         if self.time_horizon_filter or self.max_days_to_resolution or self.min_days_to_resolution:
-            filtered = self._filter_by_time_horizon(filtered)
+            filtered = self._filter_by_time_horizon(filtered, features)
             logger.debug(f"After time filter: {len(filtered)} markets")
             
         # Sort by volume if requested
@@ -96,38 +103,40 @@ class MarketFilter:
                     filtered.append(market)
         return filtered
         
-    def _filter_by_keywords(self, markets: List[Market]) -> List[Market]:
+    def _filter_by_keywords(self, markets: List[Market], features: FeatureStore) -> List[Market]:
         """
         Filter markets by keywords in question or description.
         
         Args:
             markets: Markets to filter
+            features: Feature store of the current run
             
         Returns:
             List[Market]: Filtered markets
         """
         filtered = []
         for market in markets:
-            text_to_search = f"{market.question} {market.description or ''}".lower()
+            text_to_search = features.get(market).text
             if any(keyword in text_to_search for keyword in self.keywords):
                 filtered.append(market)
         return filtered
         
-    def _filter_by_time_horizon(self, markets: List[Market]) -> List[Market]:
+    def _filter_by_time_horizon(self, markets: List[Market], features: FeatureStore) -> List[Market]:
         """
         Filter markets by time horizon.
         
         Args:
             markets: Markets to filter
+            features: Feature store of the current run
             
         Returns:
             List[Market]: Filtered markets
         """
         filtered = []
-        now = datetime.now(timezone.utc)
         
         for market in markets:
-            if not market.end_date_iso:
+            days_to_resolution = features.get(market).days_left
+            if days_to_resolution is None:
                 # If no end date and we have time filters, skip this market
                 if self.time_horizon_filter or self.max_days_to_resolution or self.min_days_to_resolution:
                     continue
@@ -135,17 +144,6 @@ class MarketFilter:
                     filtered.append(market)
                     continue
                     
-            # Calculate days to resolution
-            end_date = market.end_date_iso
-            if end_date.tzinfo is not None:
-                # Already timezone aware
-                pass
-            else:
-                # Make timezone aware
-                end_date = end_date.replace(tzinfo=timezone.utc)
-                
-            days_to_resolution = (end_date - now).days
-            
             # Apply time horizon filter
             if self.time_horizon_filter:
                 if self.time_horizon_filter == "closing_soon" and days_to_resolution > 30:
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from src.analyzers.models import MarketOpportunity
 from src.config.settings import settings
+from src.utils.batch_writer import get_writer
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +99,7 @@ class PredictionTracker:
         
         self.predictions_file = self.data_dir / "predictions.jsonl"
         self.metrics_file = self.data_dir / "performance_metrics.json"
+        self._writer = get_writer(self.predictions_file)
         
     def log_prediction(self, opportunity: MarketOpportunity) -> None:
         """
@@ -137,12 +139,15 @@ class PredictionTracker:
             market_end_date=opportunity.end_date
         )
         
-        # Append to predictions file
-        with open(self.predictions_file, "a") as f:
-            f.write(record.model_dump_json() + "\n")
+        # Buffered; appended to the predictions file in batches
+        self._writer.write(record)
             
         logger.info(f"Logged prediction for {opportunity.condition_id}: {opportunity.recommended_position}")
         
+    def flush(self) -> None:
+        """Write buffered predictions to disk."""
+        self._writer.flush()
+        
     def _generate_market_url(self, condition_id: str, market_slug: Optional[str] = None) -> str:
         """
         Generate Polymarket URL using market slug or condition ID fallback.
@@ -221,6 +226,7 @@ class PredictionTracker:
             List[PredictionRecord]: List of all predictions
         """
         predictions = []
+        self.flush()
         
         if not self.predictions_file.exists():
             return predictions
@@ -244,6 +250,7 @@ class PredictionTracker:
             predictions: List of predictions to save
         """
         try:
+            self.flush()
             with open(self.predictions_file, "w") as f:
                 for prediction in predictions:
                     f.write(prediction.model_dump_json() + "\n")
@@ -0,0 +1,266 @@
+"""
+Persistent daily quota ledger for metered APIs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryPriority(IntEnum):
+    """
+    Relative value of an API query, used to decide what to shed.
+    """
+    
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+
+class QuotaLedger:
+    """
+    Per-key, per-UTC-day request ledger persisted to disk.
+    
+    The token bucket in rate_limiter only smooths bursts and resets whenever
+    the process restarts. The ledger tracks the real daily allowance so that
+    a restart does not hand out a fresh budget.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        daily_limit: int,
+        low_priority_reserve: int = 0
+    ):
+        """
+        Initialize quota ledger.
+        
+        Args:
+            path: JSON file used to persist usage
+            daily_limit: Requests allowed per key per UTC day
+            low_priority_reserve: Requests low-priority queries may not spend
+        """
+        self.path = Path(path)
+        self.daily_limit = daily_limit
+        self.low_priority_reserve = low_priority_reserve
+        
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        """
+        Derive a stable identifier for an API key without storing the key.
+        
+        Args:
+            api_key: API key
+            
+        Returns:
+            str: Short hash of the key
+        """
+        return hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+        
+    @staticmethod
+    def _today() -> str:
+        """Current UTC day as an ISO date string."""
+        return datetime.now(timezone.utc).date().isoformat()
+        
+    def _load(self) -> Dict[str, Dict]:
+        """
+        Load ledger state from disk.
+        
+        Returns:
+            Dict[str, Dict]: Usage entries keyed by key id
+        """
+        if not self.path.exists():
+            return {}
+            
+        try:
+            with open(self.path, "r") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read quota ledger {self.path}: {e}")
+            return {}
+            
+    def _save(self, state: Dict[str, Dict]) -> None:
+        """
+        Write ledger state atomically.
+        
+        Args:
+            state: Usage entries keyed by key id
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(state, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist quota ledger {self.path}: {e}")
+            
+    def _entry(self, state: Dict[str, Dict], api_key: str) -> Dict:
+        """
+        Get today's entry for a key, resetting it on UTC day rollover.
+        
+        Args:
+            state: Loaded ledger state
+            api_key: API key
+            
+        Returns:
+            Dict: Mutable entry with 'day' and 'used'
+        """
+        key_id = self._key_id(api_key)
+        today = self._today()
+        entry = state.get(key_id)
+        
+        if not entry or entry.get("day") != today:
+            entry = {"day": today, "used": 0}
+            state[key_id] = entry
+            
+        return entry
+        
+    def used(self, api_key: str) -> int:
+        """
+        Get requests spent today for a key.
+        
+        Args:
+            api_key: API key
+            
+        Returns:
+            int: Requests used since UTC midnight
+        """
+        return int(self._entry(self._load(), api_key)["used"])
+        
+    def remaining(self, api_key: str) -> int:
+        """
+        Get requests left today for a key.
+        
+        Args:
+            api_key: API key
+            
+        Returns:
+            int: Remaining requests (never negative)
+        """
+        return max(0, self.daily_limit - self.used(api_key))
+        
+    def _allows(self, remaining: int, priority: QueryPriority, cost: int) -> bool:
+        """
+        Check whether a query of the given priority fits in the budget.
+        
+        Low-priority queries may not dip into the reserve, so that the
+        queries that matter still have budget late in the day.
+        """
+        if remaining < cost:
+            return False
+        if priority <= QueryPriority.LOW:
+            return remaining - cost >= self.low_priority_reserve
+        return True
+        
+    def can_spend(
+        self,
+        api_key: str,
+        priority: QueryPriority = QueryPriority.NORMAL,
+        cost: int = 1
+    ) -> bool:
+        """
+        Check whether a query would be admitted without debiting.
+        
+        Args:
+            api_key: API key
+            priority: Query priority
+            cost: Requests the query consumes
+            
+        Returns:
+            bool: True if the query fits in today's budget
+        """
+        return self._allows(self.remaining(api_key), priority, cost)
+        
+    def debit(
+        self,
+        api_key: str,
+        priority: QueryPriority = QueryPriority.NORMAL,
+        cost: int = 1
+    ) -> bool:
+        """
+        Debit the ledger for a query if the budget allows it.
+        
+        Args:
+            api_key: API key
+            priority: Query priority
+            cost: Requests the query consumes
+            
+        Returns:
+            bool: True if debited, False if the query should be shed
+        """
+        # Re-read so concurrent processes sharing the file see each other
+        state = self._load()
+        entry = self._entry(state, api_key)
+        remaining = max(0, self.daily_limit - entry["used"])
+        
+        if not self._allows(remaining, priority, cost):
+            return False
+            
+        entry["used"] += cost
+        self._save(state)
+        return True
+        
+    def mark_exhausted(self, api_key: str) -> None:
+        """
+        Record that the provider rejected a key for the rest of the day.
+        
+        Args:
+            api_key: API key
+        """
+        state = self._load()
+        entry = self._entry(state, api_key)
+        entry["used"] = max(entry["used"], self.daily_limit)
+        self._save(state)
+        
+    def plan_queries(
+        self,
+        api_key: str,
+        queries: Sequence[Tuple[str, QueryPriority]]
+    ) -> List[Tuple[str, QueryPriority]]:
+        """
+        Choose which queries to run within today's remaining budget.
+        
+        Queries are ordered by priority (stable within a priority) and each
+        is admitted only if the budget left after the queries ahead of it
+        still allows it. Shed queries are logged.
+        
+        Args:
+            api_key: API key
+            queries: (query, priority) pairs
+            
+        Returns:
+            List[Tuple[str, QueryPriority]]: Admitted queries, highest priority first
+        """
+        remaining = self.remaining(api_key)
+        planned = []
+        
+        for query, priority in sorted(queries, key=lambda q: q[1], reverse=True):
+            if self._allows(remaining, priority, 1):
+                planned.append((query, priority))
+                remaining -= 1
+            else:
+                logger.info(
+                    f"Shedding {priority.name.lower()}-priority news query '{query}' "
+                    f"({remaining} requests left today)"
+                )
+                
+        return planned
+
+
+# Global instance
+news_quota_ledger = QuotaLedger(
+    path=settings.news_api_quota_file,
+    daily_limit=settings.news_api_daily_quota,
+    low_priority_reserve=settings.news_api_quota_reserve
+)
@@ -0,0 +1,310 @@
+"""
+Memory-mapped reference data shared by the domain models.
+
+Teams, companies, awards, climatology and pollster ratings are edited as
+one JSON file (settings.reference_data_source) mapping each table name to
+its entities. At startup the JSON is compiled, if it changed, into a
+compact file (settings.reference_data_file) that is memory-mapped rather
+than parsed, so every worker process maps the same pages instead of
+building its own dicts. Relative settings paths are taken from the project
+root, so the data is found whatever the working directory.
+
+File layout, little-endian:
+
+    header     MAGIC, then the directory length (uint32)
+    directory  JSON: table name -> [index offset, slot count, entry count]
+    per table  index of slot count (hash uint64, record offset uint32,
+               record length uint32) slots, then the records
+
+Each record is the entity key (uint16 length, UTF-8) followed by its value
+as compact JSON. The index is an open-addressing hash table at most half
+full, so a lookup hashes the key and probes a slot or two. Keys are
+matched case-insensitively.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PMREFDB1"
+_LENGTH = struct.Struct("<I")
+_KEY_LENGTH = struct.Struct("<H")
+_SLOT = struct.Struct("<QII")  # Key hash, record offset, record length (0 if empty)
+
+# Tables the domain models read
+TABLES = ("teams", "companies", "awards", "climatology", "pollsters")
+
+# Directory relative reference data settings are resolved against
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def normalize_key(key: str) -> str:
+    """Normalize an entity key for storage and lookup."""
+    return key.strip().lower()
+
+
+def _key_hash(key: bytes) -> int:
+    """Stable 64-bit hash of a normalized, encoded key."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _slot_count(entries: int) -> int:
+    """Power-of-two slot count keeping the index at most half full."""
+    slots = 1
+    while slots < 2 * entries:
+        slots *= 2
+    return slots
+
+
+def compile_reference_data(tables: Mapping[str, Mapping[str, Any]], path: str) -> None:
+    """
+    Write tables to a compiled reference data file.
+    
+    The file is written next to its destination and renamed into place, so
+    processes mapping the old file keep a consistent view.
+    
+    Args:
+        tables: Entities per table name, keyed by entity name
+        path: Compiled file to write
+    """
+    directory: Dict[str, Tuple[int, int, int]] = {}
+    regions = []
+    for name, entities in tables.items():
+        records = {}
+        for key, value in entities.items():
+            encoded = normalize_key(key).encode()
+            records[encoded] = _KEY_LENGTH.pack(len(encoded)) + encoded + json.dumps(
+                value, separators=(",", ":")
+            ).encode()
+        slots = _slot_count(len(records))
+        regions.append((name, slots, records))
+        directory[name] = (0, slots, len(records))
+        
+    # Offsets depend on the directory's encoded length, which depends on the
+    # offsets' digits; placeholders of the final width settle it in one pass
+    placeholder = json.dumps({name: [2 ** 32 - 1, slots, count] for name, (_, slots, count) in directory.items()})
+    offset = len(MAGIC) + _LENGTH.size + len(placeholder)
+    layout = {}
+    for name, slots, records in regions:
+        layout[name] = offset
+        offset += slots * _SLOT.size + sum(len(record) for record in records.values())
+    directory_bytes = json.dumps(
+        {name: [layout[name], slots, count] for name, (_, slots, count) in directory.items()}
+    ).encode().ljust(len(placeholder))
+    
+    body = bytearray(MAGIC + _LENGTH.pack(len(directory_bytes)) + directory_bytes)
+    for name, slots, records in regions:
+        index = bytearray(slots * _SLOT.size)
+        record_offset = layout[name] + len(index)
+        blob = bytearray()
+        for key, record in records.items():
+            key_hash = _key_hash(key)
+            slot = key_hash & (slots - 1)
+            while _SLOT.unpack_from(index, slot * _SLOT.size)[2]:
+                slot = (slot + 1) & (slots - 1)
+            _SLOT.pack_into(index, slot * _SLOT.size, key_hash, record_offset + len(blob), len(record))
+            blob += record
+        body += index + blob
+        
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+class ReferenceTable(Mapping):
+    """
+    Read-only view of one table in a mapped reference data file.
+    
+    Behaves like a dict keyed by normalized entity name; decoded values are
+    cached per table.
+    """
+    
+    def __init__(self, buffer: Optional[mmap.mmap] = None, offset: int = 0, slots: int = 0, count: int = 0):
+        """
+        Initialize the view.
+        
+        Args:
+            buffer: Mapped file (None for an empty table)
+            offset: Offset of the table's index
+            slots: Index slot count, a power of two
+            count: Entities in the table
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._mask = slots - 1
+        self._count = count
+        self._decoded: Dict[str, Any] = {}
+        
+    def _record(self, key: bytes) -> Optional[Tuple[int, int]]:
+        """Find a key's record as (value offset, value length), or None."""
+        if not self._count:
+            return None
+        key_hash = _key_hash(key)
+        slot = key_hash & self._mask
+        while True:
+            slot_hash, record_offset, record_length = _SLOT.unpack_from(
+                self._buffer, self._offset + slot * _SLOT.size
+            )
+            if not record_length:
+                return None
+            if slot_hash == key_hash:
+                (key_length,) = _KEY_LENGTH.unpack_from(self._buffer, record_offset)
+                key_start = record_offset + _KEY_LENGTH.size
+                if self._buffer[key_start:key_start + key_length] == key:
+                    value_start = key_start + key_length
+                    return value_start, record_offset + record_length - value_start
+            slot = (slot + 1) & self._mask
+            
+    def __getitem__(self, key: str) -> Any:
+        key = normalize_key(key)
+        if key in self._decoded:
+            return self._decoded[key]
+        record = self._record(key.encode())
+        if record is None:
+            raise KeyError(key)
+        value_start, value_length = record
+        value = json.loads(self._buffer[value_start:value_start + value_length])
+        self._decoded[key] = value
+        return value
+        
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._record(normalize_key(key).encode()) is not None
+        
+    def __len__(self) -> int:
+        return self._count
+        
+    def __iter__(self) -> Iterator[str]:
+        for slot in range(self._mask + 1 if self._count else 0):
+            _, record_offset, record_length = _SLOT.unpack_from(self._buffer, self._offset + slot * _SLOT.size)
+            if record_length:
+                (key_length,) = _KEY_LENGTH.unpack_from(self._buffer, record_offset)
+                key_start = record_offset + _KEY_LENGTH.size
+                yield self._buffer[key_start:key_start + key_length].decode()
+
+
+class ReferenceDataStore:
+    """
+    Compiled reference data file, memory-mapped read-only.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Map a compiled file.
+        
+        Args:
+            path: File written by compile_reference_data (None for a store with no tables)
+            
+        Raises:
+            ValueError: If the file is not a compiled reference data file
+        """
+        self._tables: Dict[str, ReferenceTable] = {}
+        self.path = Path(path) if path is not None else None
+        if self.path is None:
+            return
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[:len(MAGIC)] != MAGIC:
+            self._buffer.close()
+            raise ValueError(f"{self.path} is not a compiled reference data file")
+        (directory_length,) = _LENGTH.unpack_from(self._buffer, len(MAGIC))
+        directory_start = len(MAGIC) + _LENGTH.size
+        directory = json.loads(self._buffer[directory_start:directory_start + directory_length])
+        self._tables = {
+            name: ReferenceTable(self._buffer, offset, slots, count)
+            for name, (offset, slots, count) in directory.items()
+        }
+        
+    @property
+    def table_names(self) -> Tuple[str, ...]:
+        """Names of the tables in the file."""
+        return tuple(self._tables)
+        
+    def table(self, name: str) -> ReferenceTable:
+        """
+        Get a table.
+        
+        Args:
+            name: Table name
+            
+        Returns:
+            ReferenceTable: The table, empty if the file has none by that name
+        """
+        table = self._tables.get(name)
+        if table is None:
+            table = ReferenceTable()
+            self._tables[name] = table
+        return table
+
+
+_shared_stores: Dict[Tuple[str, str], ReferenceDataStore] = {}
+_shared_lock = threading.Lock()
+
+
+def _compile_if_stale(source: Path, path: Path) -> bool:
+    """
+    Recompile the source when the compiled file is missing or older.
+    
+    An unreadable source is never compiled, so it cannot replace a good
+    compiled file with empty tables.
+    
+    Args:
+        source: JSON source
+        path: Compiled file
+        
+    Returns:
+        bool: True if a compiled file is available to map
+    """
+    if path.exists() and (not source.exists() or path.stat().st_mtime >= source.stat().st_mtime):
+        return True
+    try:
+        with open(source, "r") as f:
+            tables: Dict[str, Mapping[str, Any]] = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read reference data {source}: {e}")
+        return path.exists()
+    compile_reference_data({name: tables.get(name, {}) for name in {*TABLES, *tables}}, str(path))
+    logger.info(f"Compiled reference data {source} into {path}")
+    return True
+
+
+def load_reference_data(source: Optional[str] = None, path: Optional[str] = None) -> ReferenceDataStore:
+    """
+    Get the process-wide reference data store.
+    
+    The first call compiles the source if the compiled file is stale and
+    maps it; later calls return the same store. With neither a readable
+    source nor a compiled file, the domain models start without reference
+    data: an empty store is returned, and nothing is written or shared, so
+    a later call picks the source up once it exists.
+    
+    Args:
+        source: JSON source (settings.reference_data_source if omitted)
+        path: Compiled file (settings.reference_data_file if omitted)
+        
+    Returns:
+        ReferenceDataStore: Shared store
+    """
+    source = Path(source) if source else PROJECT_ROOT / settings.reference_data_source
+    path = Path(path) if path else PROJECT_ROOT / settings.reference_data_file
+    key = (str(source.resolve()), str(path.resolve()))
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            if not _compile_if_stale(source, path):
+                return ReferenceDataStore()
+            store = ReferenceDataStore(str(path))
+            _shared_stores[key] = store
+        return store
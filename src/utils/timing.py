@@ -0,0 +1,119 @@
+"""
+Per-stage timing for analysis runs.
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# Stages in pipeline order; timings are reported in this order
+STAGES = (
+    "fetch",
+    "decode",
+    "filter",
+    "price",
+    "news",
+    "pattern",
+    "score",
+    "fair_value",
+    "kelly",
+    "record",
+    "display",
+)
+
+
+class StageTimings(BaseModel):
+    """
+    Timing breakdown for one analysis run.
+    """
+    
+    stages: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds spent per stage (concurrent stages may overlap)"
+    )
+    markets_timed: int = Field(default=0, description="Markets with per-market timings")
+    market_p50_ms: Optional[float] = Field(None, description="Median per-market time in ms")
+    market_p95_ms: Optional[float] = Field(None, description="95th percentile per-market time in ms")
+    market_max_ms: Optional[float] = Field(None, description="Slowest market time in ms")
+    
+    @property
+    def total_seconds(self) -> float:
+        """
+        Get the summed stage time.
+        
+        Returns:
+            float: Seconds across all stages
+        """
+        return sum(self.stages.values())
+
+
+class StageTimer:
+    """
+    Accumulates stage durations and per-market totals for one run.
+    
+    Time recorded with a market ID also counts towards that market's
+    total, from which the per-market percentiles are taken.
+    """
+    
+    def __init__(self):
+        """Initialize stage timer."""
+        self._seconds: Dict[str, float] = defaultdict(float)
+        self._market_seconds: Dict[str, float] = defaultdict(float)
+        
+    @contextmanager
+    def stage(self, name: str, market_id: Optional[str] = None) -> Iterator[None]:
+        """
+        Time a block as part of a stage.
+        
+        Args:
+            name: Stage name
+            market_id: Market the work belongs to, if any
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, market_id)
+            
+    def add(self, name: str, seconds: float, market_id: Optional[str] = None) -> None:
+        """
+        Record time spent in a stage.
+        
+        Args:
+            name: Stage name
+            seconds: Duration in seconds
+            market_id: Market the work belongs to, if any
+        """
+        self._seconds[name] += seconds
+        if market_id is not None:
+            self._market_seconds[market_id] += seconds
+            
+    def timings(self) -> StageTimings:
+        """
+        Summarize the recorded timings.
+        
+        Returns:
+            StageTimings: Stage totals and per-market percentiles
+        """
+        order = {name: i for i, name in enumerate(STAGES)}
+        stages = {
+            name: self._seconds[name]
+            for name in sorted(self._seconds, key=lambda name: order.get(name, len(STAGES)))
+        }
+        
+        if not self._market_seconds:
+            return StageTimings(stages=stages)
+            
+        per_market_ms = np.fromiter(self._market_seconds.values(), dtype=float) * 1000
+        p50, p95 = np.percentile(per_market_ms, [50, 95])
+        return StageTimings(
+            stages=stages,
+            markets_timed=len(per_market_ms),
+            market_p50_ms=float(p50),
+            market_p95_ms=float(p95),
+            market_max_ms=float(per_market_ms.max())
+        )
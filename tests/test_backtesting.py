@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, patch, mock_open
 from src.analyzers.backtesting import BacktestingEngine, BacktestPrediction, BacktestMetrics
 from src.analyzers.models import MarketOpportunity, OpportunityScore
 from src.clients.polymarket.models import Market, Token
+from src.utils.batch_writer import close_all
 
 
 class TestBacktestingEngine:
@@ -71,6 +72,7 @@ class TestBacktestingEngine:
         
     def teardown_method(self):
         """Clean up test fixtures."""
+        close_all()
         shutil.rmtree(self.temp_dir)
         
     def test_record_prediction(self):
@@ -82,7 +84,8 @@ class TestBacktestingEngine:
             model_version="v1.0"
         )
         
-        # Check prediction was saved
+        # Check prediction was saved once buffered records are flushed
+        self.engine.flush()
         assert self.engine.predictions_file.exists()
         
         # Load and verify prediction
@@ -0,0 +1,109 @@
+"""
+Unit tests for the buffered prediction writer.
+"""
+
+import json
+import logging
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from src.utils.batch_writer import BatchWriter, close_all, flush_all, get_writer
+
+
+@dataclass
+class _Record:
+    """Minimal dataclass record."""
+    condition_id: str
+    created: datetime
+
+
+class TestBatchWriter:
+    """Test cases for BatchWriter."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "records.jsonl"
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def _lines(self):
+        """Read written records."""
+        if not self.path.exists():
+            return []
+        return [json.loads(line) for line in self.path.read_text().splitlines()]
+        
+    def test_records_are_buffered_until_batch_is_full(self):
+        """Test that nothing is written before max_records."""
+        writer = BatchWriter(self.path, max_records=3, flush_interval=0)
+        
+        writer.write({"n": 1})
+        writer.write({"n": 2})
+        assert self._lines() == []
+        assert len(writer) == 2
+        
+        writer.write({"n": 3})
+        assert [line["n"] for line in self._lines()] == [1, 2, 3]
+        assert writer.batches_written == 1
+        
+    def test_flush_interval_writes_idle_records(self):
+        """Test that a partial batch is written after the flush interval."""
+        writer = BatchWriter(self.path, max_records=100, flush_interval=0.05)
+        writer.write({"n": 1})
+        
+        deadline = time.monotonic() + 2
+        while not self._lines() and time.monotonic() < deadline:
+            time.sleep(0.01)
+            
+        assert self._lines() == [{"n": 1}]
+        
+    def test_dataclasses_and_datetimes_serialize(self):
+        """Test that records round-trip through the orjson codec."""
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        writer = BatchWriter(self.path, max_records=10, flush_interval=0)
+        writer.write(_Record("m1", created))
+        writer.flush()
+        
+        line = self._lines()[0]
+        assert line["condition_id"] == "m1"
+        assert datetime.fromisoformat(line["created"]) == created
+        
+    def test_shared_writer_and_flush_all(self):
+        """Test that one file has one shared writer, flushed on shutdown."""
+        writer = get_writer(self.path)
+        assert get_writer(Path(self.temp_dir) / "." / "records.jsonl") is writer
+        
+        writer.write({"n": 1})
+        flush_all()
+        
+        assert self._lines() == [{"n": 1}]
+        assert len(writer) == 0
+
+    def test_close_all_unregisters_writers(self):
+        """Test that close_all flushes and the next lookup builds a new writer."""
+        writer = get_writer(self.path)
+        writer.write({"n": 1})
+        
+        assert close_all() == 1
+        assert self._lines() == [{"n": 1}]
+        assert get_writer(self.path) is not writer
+        
+    def test_flush_all_drops_writers_of_removed_directories(self, caplog):
+        """Test that a writer whose directory is gone is dropped without errors."""
+        writer = get_writer(self.path)
+        writer.write({"n": 1})
+        shutil.rmtree(self.temp_dir)
+        
+        with caplog.at_level(logging.ERROR, logger="src.utils.batch_writer"):
+            assert flush_all() == 0
+            
+        assert not caplog.records
+        assert len(writer) == 0
+        assert get_writer(self.path) is not writer
@@ -0,0 +1,206 @@
+"""
+Unit tests for deadline-bounded analysis.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.budget import AnalysisBudget, prioritize_markets
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.pipeline import AnalysisPipeline
+from src.clients.polymarket.models import Market, MarketPrice, Token
+from src.utils.batch_writer import close_all
+
+
+def _market(i: int, volume: float = 20000.0, days: int = 60) -> Market:
+    """Build a market; every market is an opportunity."""
+    return Market(
+        condition_id=f"m{i}",
+        question=f"Will Bitcoin reach $200,000 by market {i}?",
+        active=True,
+        closed=False,
+        volume=volume,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=days, hours=1),
+        tokens=[
+            Token(token_id=f"{i}-yes", outcome="Yes", price=0.81),
+            Token(token_id=f"{i}-no", outcome="No", price=0.19),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+async def _price(market: Market) -> MarketPrice:
+    """Price function reading token prices."""
+    yes, no = market.tokens
+    return MarketPrice(
+        condition_id=market.condition_id,
+        yes_price=yes.price,
+        no_price=no.price,
+        spread=abs(yes.price - no.price)
+    )
+
+
+async def _pages(markets, page_size=10):
+    """Yield markets in pages."""
+    for start in range(0, len(markets), page_size):
+        yield markets[start:start + page_size]
+
+
+class TestAnalysisBudget:
+    """Test cases for AnalysisBudget and market prioritization."""
+    
+    def test_deadline(self):
+        """Test remaining time, expiry and timeout clamping on a fake clock."""
+        now = [100.0]
+        budget = AnalysisBudget(10, clock=lambda: now[0])
+        
+        assert budget.remaining == 10
+        assert budget.clamp(3) == 3
+        assert budget.clamp(None) == 10
+        assert not budget.detection_expired
+        
+        now[0] = 108.0
+        assert budget.detection_expired
+        assert not budget.expired
+        assert budget.clamp(3) == pytest.approx(2)
+        
+        now[0] = 111.0
+        assert budget.expired
+        assert budget.remaining == 0
+        
+    def test_priority_order(self):
+        """Test volume, closing soon and prior edge all raise priority."""
+        markets = [
+            _market(0, volume=1000, days=200),
+            _market(1, volume=50000, days=200),
+            _market(2, volume=1000, days=3),
+            _market(3, volume=1000, days=200),
+        ]
+        prior_values = {"m0": None, "m3": 0.9}
+        
+        ordered = prioritize_markets(markets, prior_values)
+        
+        assert [market.condition_id for market in ordered] == ["m1", "m2", "m3", "m0"]
+        assert prioritize_markets([]) == []
+
+
+class TestBudgetedAnalysis:
+    """Test cases for budgeted analyzer and pipeline runs."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = MarketAnalyzer()
+        self.analyzer.backtesting_engine = BacktestingEngine(data_dir=self.temp_dir)
+        self.markets = [_market(i) for i in range(20)]
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    @pytest.mark.asyncio
+    async def test_unlimited_budget_covers_everything(self):
+        """Test that a generous budget gives the same result as no budget."""
+        prices = [await _price(market) for market in self.markets]
+        full = await self.analyzer.analyze_markets(self.markets, prices, [])
+        budgeted = await self.analyzer.analyze_markets(
+            self.markets, prices, [], budget=AnalysisBudget(60)
+        )
+        
+        assert full.markets_covered is None
+        assert full.coverage == 1.0
+        assert not budgeted.partial
+        assert budgeted.markets_covered == len(self.markets)
+        assert [opp.condition_id for opp in budgeted.opportunities] == [
+            opp.condition_id for opp in full.opportunities
+        ]
+        
+    @pytest.mark.asyncio
+    async def test_stragglers_cancelled_at_deadline(self):
+        """Test that slow markets are cancelled and the rest still returned."""
+        prices = [await _price(market) for market in self.markets]
+        build = self.analyzer._build_opportunity
+        
+        async def slow_build(market, *args):
+            if market.condition_id in ("m3", "m7"):
+                await asyncio.sleep(30)
+            return await build(market, *args)
+            
+        self.analyzer._build_opportunity = slow_build
+        start = time.perf_counter()
+        
+        result = await self.analyzer.analyze_markets(
+            self.markets, prices, [], max_concurrency=20, budget=AnalysisBudget(0.5)
+        )
+        
+        assert time.perf_counter() - start < 5
+        assert result.partial
+        assert result.markets_cancelled == 2
+        assert result.markets_covered == 18
+        assert result.coverage == pytest.approx(0.9)
+        assert len(result.opportunities) == 18
+        
+    @pytest.mark.asyncio
+    async def test_slow_detection_leaves_time_for_builds(self):
+        """Test that matched markets are built when detection uses up its share."""
+        prices = [await _price(market) for market in self.markets]
+        match = self.analyzer._match_pattern
+        now = [0.0]
+        
+        def slow_match(market, price):
+            now[0] += 1.0
+            return match(market, price)
+            
+        self.analyzer._match_pattern = slow_match
+        
+        result = await self.analyzer.analyze_markets(
+            self.markets, prices, [], budget=AnalysisBudget(10, clock=lambda: now[0])
+        )
+        
+        assert result.partial
+        assert result.markets_covered == 8
+        assert len(result.opportunities) == 8
+        
+    @pytest.mark.asyncio
+    async def test_expired_budget_keeps_previous_results(self):
+        """Test that unfinished markets keep their incremental entries."""
+        prices = [await _price(market) for market in self.markets]
+        await self.analyzer.analyze_markets(self.markets, prices, [])
+        
+        expired = await self.analyzer.analyze_markets(
+            self.markets, prices, [], budget=AnalysisBudget(0)
+        )
+        refreshed = await self.analyzer.analyze_markets(self.markets, prices, [], incremental=True)
+        
+        assert expired.partial
+        assert expired.markets_covered == 0
+        assert not expired.opportunities
+        assert refreshed.markets_skipped == len(self.markets)
+        assert len(refreshed.opportunities) == len(self.markets)
+        
+    @pytest.mark.asyncio
+    async def test_pipeline_stops_at_deadline(self):
+        """Test that a streaming run returns what finished before the deadline."""
+        markets = [_market(i) for i in range(200)]
+        
+        async def slow_price(market):
+            await asyncio.sleep(0.01)
+            return await _price(market)
+            
+        pipeline = AnalysisPipeline(self.analyzer, slow_price)
+        start = time.perf_counter()
+        
+        result = await pipeline.run(_pages(markets), [], budget=AnalysisBudget(0.3))
+        
+        assert time.perf_counter() - start < 2
+        assert result.partial
+        assert 0 < result.markets_covered < len(markets)
+        assert len(result.opportunities) == result.markets_covered
+        assert pipeline.stats.stopped_at_deadline
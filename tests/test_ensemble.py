@@ -0,0 +1,222 @@
+"""
+Unit tests for the single-pass analyzer ensemble.
+"""
+
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.ensemble import COMBINED, AnalyzerEnsemble, combine
+from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
+from src.clients.polymarket.models import Market, MarketPrice, Token
+from src.utils.batch_writer import close_all
+
+# Questions that trip different patterns across the analyzers
+QUESTIONS = [
+    "Will the coin flip land heads or tails?",
+    "Will Bitcoin reach $1 million and go viral?",
+    "Will the sun rise and the earth continue?",
+    "Will the Fed maintain the interest rate and keep inflation stable?",
+    "Will someone set a perfect record, 1000x, reach $10 million?",
+    "Will the CEO remain president until the season finals game?",
+]
+
+
+def _market(condition_id: str, question: str, yes_price: float, days: int) -> Market:
+    """Build a liquid market."""
+    return Market(
+        condition_id=condition_id,
+        question=question,
+        active=True,
+        closed=False,
+        volume=50000,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=days, hours=12),
+        tokens=[
+            Token(token_id=f"{condition_id}-yes", outcome="Yes", price=yes_price),
+            Token(token_id=f"{condition_id}-no", outcome="No", price=1 - yes_price),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _price(condition_id: str, yes_price: float) -> MarketPrice:
+    """Build a market price."""
+    return MarketPrice(condition_id=condition_id, yes_price=yes_price, no_price=1 - yes_price, spread=0.01)
+
+
+def _opportunity(action: str, edge: float, confidence: float) -> SimpleOpportunity:
+    """Build a verdict with a given side and score."""
+    return SimpleOpportunity(
+        market=_market("m", "Q?", 0.5, 10),
+        current_price=0.5,
+        recommended_action=action,
+        edge=edge,
+        confidence=confidence,
+        reason="test",
+        pattern_type="TEST"
+    )
+
+
+def _cases():
+    """Build markets across questions, prices and horizons."""
+    cases = []
+    for q, question in enumerate(QUESTIONS):
+        for yes_price in (0.03, 0.12, 0.5, 0.82, 0.93):
+            for days in (3, 20, 60):
+                condition_id = f"{q}-{yes_price}-{days}"
+                cases.append((_market(condition_id, question, yes_price, days), _price(condition_id, yes_price)))
+    return cases
+
+
+class TestCombine:
+    """Test cases for combining verdicts."""
+    
+    def test_majority_side_wins(self):
+        """Test that the side backed by more analyzers is picked."""
+        strong_no = _opportunity("BUY_NO", 0.3, 0.9)
+        weak_yes = _opportunity("BUY_YES", 0.05, 0.5)
+        other_yes = _opportunity("SELL_NO", 0.1, 0.6)
+        
+        verdict = combine({"a": strong_no, "b": weak_yes, "c": other_yes, "d": None})
+        
+        assert verdict.pick is other_yes
+        assert verdict.pick_analyzer == "c"
+        assert verdict.agreement == 2
+        
+    def test_even_split_gives_no_pick(self):
+        """Test that analyzers split evenly between sides give no pick."""
+        assert combine({"a": _opportunity("BUY_NO", 0.3, 0.9), "b": _opportunity("BUY_YES", 0.1, 0.5)}).pick is None
+        assert combine({"a": None, "b": None}).pick is None
+        
+    def test_earlier_analyzer_wins_ties(self):
+        """Test that equal scores go to the analyzer listed first."""
+        first = _opportunity("BUY_NO", 0.2, 0.5)
+        second = _opportunity("BUY_NO", 0.1, 1.0)
+        
+        verdict = combine({"a": first, "b": second})
+        
+        assert verdict.pick is first
+        assert verdict.view("b") is second
+        assert verdict.view(COMBINED) is first
+
+
+class TestAnalyzerEnsemble:
+    """Test cases for AnalyzerEnsemble."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.ensemble = AnalyzerEnsemble()
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_verdicts_match_individual_analyzers(self):
+        """Test that each verdict equals running that analyzer alone."""
+        for market, price in _cases():
+            verdict = self.ensemble.evaluate(market, price)
+            for name, analyzer in self.ensemble.analyzers.items():
+                assert verdict.verdicts[name] == type(analyzer)().analyze_market(market, price), (
+                    name, market.question, price.yes_price
+                )
+                
+    def test_mode_is_a_view(self):
+        """Test that switching mode reads stored verdicts without re-analyzing."""
+        cases = _cases()
+        for market, price in cases:
+            self.ensemble.analyze_market(market, price)
+        calls = {name: latency.calls for name, latency in self.ensemble.latency.items()}
+        
+        high_confidence = self.ensemble.matches("high_confidence")
+        flexible = self.ensemble.matches("flexible")
+        
+        assert {name: latency.calls for name, latency in self.ensemble.latency.items()} == calls
+        assert all(calls[name] == len(cases) for name in calls)
+        assert len(high_confidence) == self.ensemble.latency["high_confidence"].matches
+        assert len(flexible) == self.ensemble.latency["flexible"].matches
+        assert high_confidence and flexible
+        
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            self.ensemble.mode = "psychic"
+        with pytest.raises(ValueError):
+            AnalyzerEnsemble(mode="psychic")
+            
+    def test_reset_and_summary(self):
+        """Test that reset clears verdicts and latency counters."""
+        market, price = _cases()[0]
+        self.ensemble.analyze_market(market, price)
+        assert "1 markets" in self.ensemble.summary()
+        
+        self.ensemble.reset()
+        
+        assert not self.ensemble.verdicts
+        assert all(latency.calls == 0 and latency.seconds == 0.0 for latency in self.ensemble.latency.values())
+        
+    def test_fair_value_uses_owning_analyzer(self):
+        """Test that fair values come from the analyzer that produced the verdict."""
+        self.ensemble.mode = "high_confidence"
+        for market, price in _cases():
+            opportunity = self.ensemble.analyze_market(market, price)
+            if opportunity is not None:
+                break
+        else:
+            pytest.fail("No high confidence match")
+            
+        assert self.ensemble.owner(opportunity) == "high_confidence"
+        assert self.ensemble.calculate_fair_value(opportunity) == (
+            HighConfidenceAnalyzer().calculate_fair_value(opportunity)
+        )
+        
+    @pytest.mark.asyncio
+    async def test_market_analyzer_mode_matches_single_analyzer(self):
+        """Test that a run in high confidence mode equals a run with that analyzer."""
+        cases = _cases()
+        markets = [market for market, _ in cases]
+        prices = [price for _, price in cases]
+        
+        results = []
+        for pattern_analyzer in (AnalyzerEnsemble(mode="high_confidence"), HighConfidenceAnalyzer()):
+            analyzer = MarketAnalyzer()
+            analyzer.backtesting_engine = BacktestingEngine(data_dir=self.temp_dir)
+            analyzer.record_predictions = False
+            analyzer.pattern_analyzer = pattern_analyzer
+            result = await analyzer.analyze_markets(markets, prices, [])
+            results.append([
+                (opportunity.condition_id, opportunity.recommended_position, opportunity.fair_yes_price)
+                for opportunity in result.opportunities
+            ])
+            
+        assert results[0]
+        assert results[0] == results[1]
+        
+    @pytest.mark.asyncio
+    async def test_mode_switch_invalidates_incremental_results(self):
+        """Test that an incremental run after a mode switch does not carry old verdicts."""
+        cases = _cases()
+        markets = [market for market, _ in cases]
+        prices = [price for _, price in cases]
+        analyzer = MarketAnalyzer()
+        analyzer.backtesting_engine = BacktestingEngine(data_dir=self.temp_dir)
+        analyzer.record_predictions = False
+        analyzer.pattern_analyzer = self.ensemble
+        
+        self.ensemble.mode = "flexible"
+        await analyzer.analyze_markets(markets, prices, [], incremental=True)
+        self.ensemble.mode = "high_confidence"
+        result = await analyzer.analyze_markets(markets, prices, [], incremental=True)
+        
+        assert result.markets_skipped == 0
+        assert {opportunity.condition_id for opportunity in result.opportunities} == {
+            opportunity.market.condition_id
+            for opportunity in self.ensemble.matches("high_confidence")
+            if opportunity.edge >= analyzer.min_spread
+        }
@@ -0,0 +1,165 @@
+"""
+Unit tests for batch fair value computation with shared LLM news analyses.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.analyzers.fair_value_engine import FairValueEngine
+from src.analyzers.news_index import NewsKeywordIndex
+from src.clients.news.models import NewsArticle, NewsSource
+from src.clients.polymarket.models import Market, Token
+
+
+def _market(condition_id: str, question: str) -> Market:
+    """Build a market that no domain model claims."""
+    return Market(
+        condition_id=condition_id,
+        question=question,
+        description="",
+        active=True,
+        closed=False,
+        volume=50000,
+        end_date_iso=datetime.now() + timedelta(days=60),
+        tokens=[
+            Token(token_id=f"{condition_id}-yes", outcome="Yes", price=0.4),
+            Token(token_id=f"{condition_id}-no", outcome="No", price=0.6),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _article(slug: str, title: str, description: str) -> NewsArticle:
+    """Build a recent article."""
+    return NewsArticle(
+        title=title,
+        description=description,
+        url=f"https://example.com/{slug}",
+        published_at=datetime.now() - timedelta(hours=2),
+        source=NewsSource(name="Reuters")
+    )
+
+
+class FakeClient:
+    """Blocking LLM client that records how many calls overlap."""
+    
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self.create)
+        
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        text = json.dumps({"sentiment_score": 0.6, "relevance_score": 0.9, "confidence_level": 0.8})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+class TestCalculateFairValues:
+    """Test cases for FairValueEngine.calculate_fair_values."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = FairValueEngine()
+        self.markets = [
+            _market("library", "Will Springfield open the new library?"),
+            _market("bridge", "Will Springfield finish the bridge roadwork?"),
+            _market("parade", "Will Shelbyville hold the harvest parade?"),
+        ]
+        self.articles = [
+            _article("library", "Springfield library opening on track", "Builders report strong progress"),
+            _article("bridge", "Springfield bridge roadwork delayed", "Crews face a weak supply decline"),
+            _article("parade", "Shelbyville harvest parade plans", "Organizers see good growth in volunteers"),
+            _article("weather", "Sunny week ahead", "Forecasters expect calm conditions"),
+        ]
+        self.index = NewsKeywordIndex(self.articles)
+        
+    @staticmethod
+    def _use_llm(engine: FairValueEngine, client: FakeClient) -> None:
+        """Route an engine's article analyses through a fake LLM client."""
+        engine.llm_news_analyzer.claude_available = True
+        engine.llm_news_analyzer._client = client
+        
+    @pytest.mark.asyncio
+    async def test_batch_matches_per_market_results(self):
+        """Test that the batch gives each market's sequential fair value, in order."""
+        for market in self.markets:
+            assert self.engine._classify(market).domain_models == ()
+            
+        expected = []
+        for market in self.markets:
+            keywords = self.engine.llm_news_analyzer._extract_market_keywords(market)
+            expected.append(await self.engine.calculate_fair_value(market, self.index.find(keywords)))
+            
+        assert await self.engine.calculate_fair_values(self.markets, self.index) == expected
+        
+    @pytest.mark.asyncio
+    async def test_without_index_uses_no_news(self):
+        """Test that markets get no news evidence without an index."""
+        results = await self.engine.calculate_fair_values(self.markets[:1], None)
+        
+        assert results == [await self.engine.calculate_fair_value(self.markets[0], [])]
+        assert "News analysis" not in results[0][2]
+        
+    @pytest.mark.asyncio
+    async def test_identical_pairs_analyzed_once(self):
+        """Test that repeated markets and republished articles are analyzed once."""
+        single = FakeClient()
+        self._use_llm(self.engine, single)
+        await self.engine.calculate_fair_values(self.markets, self.index)
+        
+        repeated = FakeClient()
+        engine = FairValueEngine()
+        self._use_llm(engine, repeated)
+        markets = [*self.markets, self.markets[0].model_copy(), self.markets[1]]
+        republished = NewsKeywordIndex([*self.articles, self.articles[0].model_copy()])
+        results = await engine.calculate_fair_values(markets, republished)
+        
+        assert len(results) == 5
+        assert results[3] == results[0] and results[4] == results[1]
+        assert repeated.calls == single.calls > 0
+        
+    @pytest.mark.asyncio
+    async def test_markets_sharing_a_question_share_analyses(self):
+        """Test that an article is analyzed once for markets with the same question."""
+        single = FakeClient()
+        self._use_llm(self.engine, single)
+        await self.engine.calculate_fair_values(self.markets[:1], self.index)
+        
+        relisted = FakeClient()
+        engine = FairValueEngine()
+        self._use_llm(engine, relisted)
+        markets = [self.markets[0], _market("library-relisted", self.markets[0].question)]
+        results = await engine.calculate_fair_values(markets, self.index)
+        
+        assert results[0] == results[1]
+        assert relisted.calls == single.calls > 0
+        
+    @pytest.mark.asyncio
+    async def test_llm_calls_respect_concurrency_cap(self):
+        """Test that LLM calls overlap but never exceed the configured cap."""
+        client = FakeClient(latency=0.05)
+        self._use_llm(self.engine, client)
+        markets = [
+            _market(f"library-{i}", f"Will Springfield open library branch {i}?") for i in range(8)
+        ]
+        
+        with patch("src.analyzers.llm_news_analyzer.settings.llm_max_concurrency", 3):
+            await self.engine.calculate_fair_values(markets, self.index)
+            
+        assert client.calls >= 8
+        assert 1 < client.max_in_flight <= 3
@@ -0,0 +1,213 @@
+"""
+Unit tests for change-driven incremental re-analysis.
+"""
+
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+from src.analyzers.incremental import (
+    ChangeEpsilons,
+    IncrementalTracker,
+    MarketFingerprint,
+)
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.pipeline import AnalysisPipeline
+from src.clients.polymarket.models import Market, MarketPrice, Token
+from src.utils.batch_writer import close_all
+
+
+def _market(i: int) -> Market:
+    """Build a market; prices cycle so that some markets are opportunities."""
+    yes_price = round(0.03 + (i % 7) * 0.13, 2)
+    return Market(
+        condition_id=f"m{i}",
+        question=f"Will Bitcoin reach $200,000 by market {i}?",
+        active=True,
+        closed=False,
+        volume=20000.0,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=20 + i % 50),
+        tokens=[
+            Token(token_id=f"{i}-yes", outcome="Yes", price=yes_price),
+            Token(token_id=f"{i}-no", outcome="No", price=round(1 - yes_price, 3)),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _price(market: Market, yes_price: Optional[float] = None) -> MarketPrice:
+    """Price a market from its tokens, optionally overriding the YES price."""
+    yes = yes_price if yes_price is not None else market.tokens[0].price
+    return MarketPrice(
+        condition_id=market.condition_id,
+        yes_price=yes,
+        no_price=round(1 - yes, 3),
+        spread=abs(2 * yes - 1)
+    )
+
+
+class TestMarketFingerprint:
+    """Test cases for fingerprint comparison."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.base = MarketFingerprint(
+            yes_price=0.4,
+            no_price=0.6,
+            volume=10000.0,
+            end_timestamp=1_700_000_000.0,
+            news_urls=frozenset({"a", "b"})
+        )
+        self.epsilons = ChangeEpsilons(price=0.01, volume=0.05, end_date_seconds=60, news=0.4)
+        
+    def _with(self, **changes) -> MarketFingerprint:
+        """Copy the base fingerprint with some fields changed."""
+        fields = dict(self.base.__dict__)
+        fields.update(changes)
+        return MarketFingerprint(**fields)
+        
+    def test_changes_within_epsilons_are_ignored(self):
+        """Test that small moves do not trigger re-analysis."""
+        nudged = self._with(
+            yes_price=0.405,
+            volume=10400.0,
+            end_timestamp=1_700_000_030.0,
+            news_urls=frozenset({"a", "b", "c"})
+        )
+        
+        assert not nudged.differs(self.base, self.epsilons)
+        
+    @pytest.mark.parametrize("changes", [
+        {"yes_price": 0.42},
+        {"no_price": 0.58},
+        {"volume": 11000.0},
+        {"volume": None},
+        {"end_timestamp": 1_700_000_120.0},
+        {"news_urls": frozenset({"c"})},
+    ])
+    def test_changes_beyond_epsilons_are_detected(self, changes):
+        """Test that each input triggers re-analysis past its epsilon."""
+        assert self._with(**changes).differs(self.base, self.epsilons)
+
+
+class TestIncrementalTracker:
+    """Test cases for IncrementalTracker."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tracker = IncrementalTracker(ChangeEpsilons(max_age_seconds=100))
+        self.fingerprint = MarketFingerprint(0.4, 0.6, 1000.0, None, frozenset())
+        
+    def test_lookup_after_record(self):
+        """Test that recorded results are found on the next run only."""
+        self.tracker.begin("config")
+        self.tracker.record("m1", self.fingerprint, None, now=0)
+        assert self.tracker.lookup("m1", self.fingerprint, now=1) == (False, None)
+        
+        self.tracker.finish()
+        self.tracker.begin("config")
+        assert self.tracker.lookup("m1", self.fingerprint, now=1) == (True, None)
+        
+    def test_stale_entries_and_config_changes_invalidate(self):
+        """Test that old results and configuration changes force re-analysis."""
+        self.tracker.begin("config")
+        self.tracker.record("m1", self.fingerprint, None, now=0)
+        self.tracker.finish()
+        
+        self.tracker.begin("config")
+        assert self.tracker.lookup("m1", self.fingerprint, now=101)[0] is False
+        
+        self.tracker.begin("other config")
+        assert len(self.tracker) == 0
+        
+    def test_markets_missing_from_a_run_are_forgotten(self):
+        """Test that only markets seen in the last run are kept."""
+        self.tracker.begin("config")
+        self.tracker.record("m1", self.fingerprint, None, now=0)
+        self.tracker.record("m2", self.fingerprint, None, now=0)
+        self.tracker.finish()
+        
+        self.tracker.begin("config")
+        self.tracker.carry("m1")
+        self.tracker.finish()
+        
+        assert len(self.tracker) == 1
+
+
+class TestIncrementalAnalysis:
+    """Test cases for incremental MarketAnalyzer and pipeline runs."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = MarketAnalyzer()
+        self.analyzer.backtesting_engine = BacktestingEngine(data_dir=self.temp_dir)
+        self.markets = [_market(i) for i in range(30)]
+        self.prices = [_price(market) for market in self.markets]
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    @pytest.mark.asyncio
+    async def test_refresh_reanalyzes_only_changed_markets(self):
+        """Test that unchanged markets are carried forward with their opportunities."""
+        full = await self.analyzer.analyze_markets(self.markets, self.prices, [])
+        assert full.markets_reanalyzed is None
+        
+        # Move one market's price well beyond the epsilon
+        moved = list(self.prices)
+        moved[3] = _price(self.markets[3], yes_price=0.6)
+        refreshed = await self.analyzer.analyze_markets(
+            self.markets, moved, [], incremental=True
+        )
+        
+        assert refreshed.markets_reanalyzed == 1
+        assert refreshed.markets_skipped == 29
+        assert refreshed.skipped_work_ratio == pytest.approx(29 / 30)
+        assert [opp.condition_id for opp in refreshed.opportunities] == [
+            opp.condition_id for opp in full.opportunities
+        ]
+        assert refreshed.opportunities[1].current_yes_price == 0.6
+        
+    @pytest.mark.asyncio
+    async def test_pattern_analyzer_change_forces_full_reanalysis(self):
+        """Test that switching analyzers invalidates carried results."""
+        await self.analyzer.analyze_markets(self.markets, self.prices, [])
+        self.analyzer.pattern_analyzer = HighConfidenceAnalyzer()
+        
+        refreshed = await self.analyzer.analyze_markets(
+            self.markets, self.prices, [], incremental=True
+        )
+        
+        assert refreshed.markets_skipped == 0
+        
+    @pytest.mark.asyncio
+    async def test_pipeline_refresh_carries_forward(self):
+        """Test that the streaming pipeline skips unchanged markets too."""
+        async def source():
+            yield self.markets
+            
+        async def price_fn(market):
+            return _price(market)
+            
+        first = await AnalysisPipeline(self.analyzer, price_fn).run(source(), [])
+        announced = []
+        pipeline = AnalysisPipeline(self.analyzer, price_fn)
+        refreshed = await pipeline.run(
+            source(), [], on_opportunity=announced.append, incremental=True
+        )
+        
+        assert refreshed.markets_reanalyzed == 0
+        assert refreshed.skipped_work_ratio == 1.0
+        assert [opp.condition_id for opp in refreshed.opportunities] == [
+            opp.condition_id for opp in first.opportunities
+        ]
+        # Carried-forward opportunities are not announced again
+        assert announced == []
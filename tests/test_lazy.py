@@ -0,0 +1,90 @@
+"""
+Unit tests for lazily built components.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analyzers.fair_value_engine import FairValueEngine
+from src.analyzers.market_classifier import MarketClassifier
+from src.clients.polymarket.models import Market, Token
+from src.utils.lazy import LazyComponent
+
+SUB_MODELS = (
+    "llm_news_analyzer", "categorizer", "political_model", "crypto_model", "sports_model",
+    "entertainment_model", "weather_model", "technology_model", "sanity_checker",
+    "kelly_criterion", "backtesting_engine"
+)
+
+
+class Holder:
+    """Owner of a lazy attribute."""
+    classifier = LazyComponent("src.analyzers.market_classifier", "MarketClassifier", max_entries=10)
+
+
+class TestLazyComponent:
+    """Test cases for LazyComponent."""
+    
+    def test_built_once_on_first_access(self):
+        """Test that the component is built on first read and then reused."""
+        holder = Holder()
+        assert not LazyComponent.built(holder, "classifier")
+        
+        classifier = holder.classifier
+        
+        assert isinstance(classifier, MarketClassifier)
+        assert classifier.max_entries == 10
+        assert holder.classifier is classifier
+        assert LazyComponent.built(holder, "classifier")
+        assert Holder().classifier is not classifier
+        
+    def test_assignment_replaces_component(self):
+        """Test that assigning skips building."""
+        holder = Holder()
+        holder.classifier = "stand-in"
+        
+        assert holder.classifier == "stand-in"
+        assert isinstance(Holder.classifier, LazyComponent)
+        
+    def test_missing_factory_fails_on_access(self):
+        """Test that a bad factory surfaces when the attribute is read."""
+        class Broken:
+            part = LazyComponent("src.analyzers.market_classifier", "NoSuchThing")
+            
+        with pytest.raises(AttributeError):
+            _ = Broken().part  # Reading the attribute builds the component
+
+
+class TestLazyFairValueEngine:
+    """Test cases for FairValueEngine's lazy sub-models."""
+    
+    def test_construction_builds_no_sub_model(self):
+        """Test that a new engine has built none of its sub-models."""
+        engine = FairValueEngine()
+        
+        assert not any(LazyComponent.built(engine, name) for name in SUB_MODELS)
+        
+    @pytest.mark.asyncio
+    async def test_fair_value_builds_only_what_it_uses(self):
+        """Test that a crypto market builds the crypto model but not the others."""
+        engine = FairValueEngine()
+        market = Market(
+            condition_id="btc",
+            question="Will Bitcoin reach $150,000 by December?",
+            active=True,
+            closed=False,
+            volume=50000,
+            end_date_iso=datetime.now(timezone.utc) + timedelta(days=60),
+            tokens=[
+                Token(token_id="yes", outcome="Yes", price=0.3),
+                Token(token_id="no", outcome="No", price=0.7),
+            ],
+            minimum_order_size=1.0
+        )
+        
+        await engine.calculate_fair_value(market, [])
+        
+        assert LazyComponent.built(engine, "crypto_model")
+        assert not LazyComponent.built(engine, "sports_model")
+        assert not LazyComponent.built(engine, "backtesting_engine")
@@ -2,12 +2,15 @@
 Unit tests for MarketAnalyzer functionality.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, AsyncMock, patch
 
 from src.analyzers.market_analyzer import MarketAnalyzer
 from src.analyzers.models import AnalysisResult, MarketOpportunity, OpportunityScore
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
 from src.clients.polymarket.models import Market, MarketPrice, Token
 from src.clients.news.models import NewsArticle, NewsSource
 
@@ -383,6 +386,148 @@ class TestMarketAnalyzer:
         assert opportunity is not None
         self.analyzer.backtesting_engine.record_prediction.assert_called_once()
         
+    def _make_market(self, condition_id: str) -> Market:
+        """Build a minimal market with the given condition ID."""
+        return Market(
+            condition_id=condition_id,
+            question=f"Question {condition_id}?",
+            active=True,
+            closed=False,
+            volume=10000.0,
+            tokens=[],
+            minimum_order_size=1.0
+        )
+        
+    def _make_opportunity(self, condition_id: str) -> MarketOpportunity:
+        """Build a minimal opportunity for the given condition ID."""
+        return MarketOpportunity(
+            condition_id=condition_id,
+            question=f"Question {condition_id}?",
+            current_yes_price=0.3,
+            current_no_price=0.7,
+            current_spread=0.4,
+            fair_yes_price=0.4,
+            fair_no_price=0.6,
+            expected_return=33.0,
+            recommended_position="YES",
+            score=OpportunityScore(
+                value_score=0.5,
+                confidence_score=0.5,
+                volume_score=0.5,
+                time_score=0.5,
+                news_relevance_score=0.5
+            ),
+            reasoning="Test"
+        )
+        
+    def _make_candidates(self, condition_ids):
+        """Build markets and prices that all pass pattern detection."""
+        markets = [self._make_market(condition_id) for condition_id in condition_ids]
+        prices = [
+            MarketPrice(condition_id=condition_id, yes_price=0.3, no_price=0.7, spread=0.4)
+            for condition_id in condition_ids
+        ]
+        
+        self.analyzer.pattern_analyzer = MagicMock()
+        self.analyzer.pattern_analyzer.analyze_market.side_effect = lambda market, price, features=None: SimpleOpportunity(
+            market=market,
+            current_price=price.yes_price,
+            recommended_action="BUY_YES",
+            edge=0.2,
+            confidence=0.7,
+            reason="Test",
+            pattern_type="EXTREME_PRICE"
+        )
+        return markets, prices
+        
+    @pytest.mark.asyncio
+    async def test_concurrent_analysis_preserves_input_order(self):
+        """Test that concurrent analysis returns opportunities in market order."""
+        markets, prices = self._make_candidates([f"m{i}" for i in range(20)])
+        
+        async def slow_then_fast(market, price, simple_opportunity, score, news_articles):
+            # Earlier markets finish last
+            index = int(market.condition_id[1:])
+            await asyncio.sleep((20 - index) * 0.001)
+            return self._make_opportunity(market.condition_id)
+            
+        self.analyzer._build_opportunity = slow_then_fast
+        
+        result = await self.analyzer.analyze_markets(markets, prices, [], max_concurrency=8)
+        
+        assert [opp.condition_id for opp in result.opportunities] == [
+            market.condition_id for market in markets
+        ]
+        
+    @pytest.mark.asyncio
+    async def test_concurrent_analysis_respects_semaphore(self):
+        """Test that no more than max_concurrency markets are in flight."""
+        in_flight = 0
+        peak = 0
+        
+        async def track(market, price, simple_opportunity, score, news_articles):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return None
+            
+        self.analyzer._build_opportunity = track
+        
+        markets, prices = self._make_candidates([f"m{i}" for i in range(30)])
+        await self.analyzer.analyze_markets(markets, prices, [], max_concurrency=4)
+        
+        assert peak == 4
+        
+    @pytest.mark.asyncio
+    async def test_concurrent_analysis_isolates_failures_and_timeouts(self):
+        """Test that errors and slow markets do not affect other markets."""
+        async def flaky(market, price, simple_opportunity, score, news_articles):
+            if market.condition_id == "error":
+                raise ValueError("boom")
+            if market.condition_id == "slow":
+                await asyncio.sleep(1.0)
+            return None
+            
+        self.analyzer._build_opportunity = flaky
+        
+        markets, prices = self._make_candidates(["ok1", "error", "slow", "ok2"])
+        result = await self.analyzer.analyze_markets(
+            markets,
+            prices,
+            [],
+            max_concurrency=4,
+            market_timeout=0.05
+        )
+        
+        assert result.total_markets_analyzed == 4
+        assert result.analysis_duration_seconds < 1.0
+        
+    @pytest.mark.asyncio
+    async def test_batch_scoring_matches_single_market_scoring(self):
+        """Test that vectorized batch scores equal the per-market scoring path."""
+        markets, prices = self._make_candidates(["a", "b", "c"])
+        markets[1].volume = None
+        markets[2].end_date_iso = datetime.now(timezone.utc) + timedelta(days=3)
+        built = {}
+        
+        async def capture(market, price, simple_opportunity, score, news_articles):
+            built[market.condition_id] = score
+            return None
+            
+        self.analyzer._build_opportunity = capture
+        await self.analyzer.analyze_markets(markets, prices, self.test_news)
+        
+        for market, price in zip(markets, prices, strict=True):
+            expected = self.analyzer._calculate_simple_opportunity_score(
+                market,
+                price,
+                self.analyzer.pattern_analyzer.analyze_market(market, price),
+                self.test_news
+            )
+            assert built[market.condition_id].overall_score == pytest.approx(expected.overall_score)
+            
     def test_get_category_adjustment(self):
         """Test category-specific adjustments."""
         # Crypto category
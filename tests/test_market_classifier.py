@@ -0,0 +1,157 @@
+"""
+Unit tests for single-pass market classification.
+"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+from src.analyzers.fair_value_engine import FairValueEngine
+from src.analyzers.market_classifier import GENERAL, MarketClassifier, MarketFamily, classify
+from src.clients.polymarket.market_features import FeatureStore, MarketFeatures
+from src.clients.polymarket.models import Market, Token
+
+
+def _market(condition_id: str, question: str, description: str = "") -> Market:
+    """Build a market with a question and description."""
+    return Market(
+        condition_id=condition_id,
+        question=question,
+        description=description,
+        active=True,
+        closed=False,
+        volume=50000,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=400),
+        tokens=[
+            Token(token_id=f"{condition_id}-yes", outcome="Yes", price=0.4),
+            Token(token_id=f"{condition_id}-no", outcome="No", price=0.6),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _classify(question: str, description: str = ""):
+    """Classify a question directly."""
+    return classify(MarketFeatures.from_market(_market("m", question, description)))
+
+
+class TestClassify:
+    """Test cases for classify()."""
+    
+    def test_routes(self):
+        """Test subtype, domain models and market type of typical questions."""
+        crypto = _classify("Will Bitcoin ETF be approved by the SEC?")
+        assert crypto.subtype is MarketFamily.CRYPTO
+        assert crypto.domain_models == (MarketFamily.CRYPTO,)
+        assert crypto.market_type == "crypto"
+        
+        both = _classify("Will Trump fire the NFL commissioner?")
+        assert both.subtype is MarketFamily.POLITICAL
+        assert both.domain_models == (MarketFamily.POLITICAL, MarketFamily.SPORTS)
+        
+        general = _classify("Will it happen?")
+        assert general.subtype is None
+        assert general.domain_models == ()
+        assert general.market_type == GENERAL
+        
+    def test_constitutional_skips_political_model(self):
+        """Test that amendments keep political weighting but not the political model."""
+        classification = _classify("Will Trump serve a third term?")
+        
+        assert classification.has(MarketFamily.CONSTITUTIONAL)
+        assert classification.subtype is MarketFamily.CONSTITUTIONAL
+        assert MarketFamily.POLITICAL not in classification.domain_models
+        assert classification.market_type == "political"
+        
+    def test_description_counts_for_amendments(self):
+        """Test that constitutional terms are also read from the description."""
+        classification = _classify(
+            "Will the amendment pass?", "A constitutional amendment to eliminate term limits"
+        )
+        
+        assert classification.has(MarketFamily.CONSTITUTIONAL)
+        
+    def test_multi_party(self):
+        """Test that multi-party elections need a phrase and a party."""
+        assert _classify("Will LDP win the most seats?").subtype is MarketFamily.MULTI_PARTY
+        assert not _classify("Will Sanae win the most seats?").has(MarketFamily.MULTI_PARTY)
+        
+    def test_corporate_and_rare_events(self):
+        """Test families without a domain model."""
+        assert _classify("Will the CEO post earnings?").subtype is MarketFamily.CORPORATE
+        assert _classify("Will an asteroid hit?").subtype is MarketFamily.RARE_EVENT
+
+
+class TestMarketClassifier:
+    """Test cases for the classification cache."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.classifier = MarketClassifier(max_entries=2)
+        
+    def test_cache_hits_until_text_changes(self):
+        """Test that a market is classified once until its question changes."""
+        market = _market("a", "Will Bitcoin reach $100k?")
+        
+        first = self.classifier.classify(market)
+        second = self.classifier.classify(market.model_copy())
+        market.question = "Will the Lakers win the NBA title?"
+        third = self.classifier.classify(market, FeatureStore())
+        
+        assert first is second
+        assert third.subtype is MarketFamily.SPORTS
+        assert (self.classifier.hits, self.classifier.misses) == (1, 2)
+        
+    def test_oldest_entry_is_evicted(self):
+        """Test that the cache stays within max_entries."""
+        for condition_id in ("a", "b", "c"):
+            self.classifier.classify(_market(condition_id, "Will it rain?"))
+            
+        assert len(self.classifier) == 2
+        self.classifier.classify(_market("a", "Will it rain?"))
+        assert self.classifier.misses == 4
+        
+        self.classifier.clear()
+        assert len(self.classifier) == 0 and self.classifier.hits == 0
+
+    def test_key_is_stable_across_processes(self):
+        """Test that keys do not depend on the process's hash seed."""
+        script = (
+            "from tests.test_market_classifier import _market\n"
+            "from src.analyzers.market_classifier import MarketClassifier\n"
+            "print(MarketClassifier.key(_market('a', 'Will it rain?', 'In Seattle'))[1])"
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed}
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        
+        assert digests == {MarketClassifier.key(_market("a", "Will it rain?", "In Seattle"))[1]}
+        assert MarketClassifier.key(_market("a", "Will it rain?")) != MarketClassifier.key(
+            _market("a", "Will it rain?", "In Seattle")
+        )
+
+
+class TestEngineDispatch:
+    """Test cases for the engine's classification-first routing."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = FairValueEngine()
+        
+    def test_engine_routes_share_one_classification(self):
+        """Test that every route of a market comes from one classification."""
+        market = _market("btc", "Will Bitcoin reach $150,000 by December?")
+        
+        base_prob, _ = self.engine._get_base_probability(market)
+        market_type = self.engine._determine_market_type(market)
+        
+        assert (base_prob, market_type) == (0.35, "crypto")
+        assert self.engine._is_crypto_financial(market)
+        assert not self.engine._is_sports_event(market)
+        assert self.engine.classifier.misses == 1
+        assert len(self.engine.classifier) == 1
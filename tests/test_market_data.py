@@ -0,0 +1,160 @@
+"""
+Unit tests for market data providers and rolling windows.
+"""
+
+import json
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.analyzers.crypto_model import CryptoFinancialModel
+from src.clients.market_data.models import CryptoMarketData
+from src.clients.market_data.provider import (
+    PERIODS_PER_YEAR,
+    FileMarketDataProvider,
+    MarketDataProvider,
+)
+from src.clients.market_data.rolling import RingBuffer, RollingMoments
+
+
+def _snapshot(symbol: str = "BTC", price: float = 67000.0) -> CryptoMarketData:
+    """Build a seed snapshot."""
+    return CryptoMarketData(
+        symbol=symbol,
+        current_price=price,
+        market_cap=1.3e12,
+        volume_24h=25e9,
+        price_change_7d=0.05,
+        price_change_30d=0.12,
+        volatility_30d=0.65,
+        all_time_high=73000.0,
+        distance_from_ath=price / 73000.0 - 1
+    )
+
+
+def _random_walk(count: int, start: float = 100.0, seed: int = 7):
+    """Build a reproducible positive price path."""
+    rng = random.Random(seed)
+    prices = [start]
+    for _ in range(count - 1):
+        prices.append(prices[-1] * math.exp(rng.gauss(0.0, 0.04)))
+    return prices
+
+
+class TestRollingWindows:
+    """Test cases for RingBuffer and RollingMoments."""
+    
+    def test_ring_buffer_evicts_oldest(self):
+        """Test eviction and lookups by age."""
+        buffer = RingBuffer(3)
+        evicted = [buffer.push(value) for value in (1.0, 2.0, 3.0, 4.0)]
+        
+        assert evicted == [None, None, None, 1.0]
+        assert buffer.values() == [2.0, 3.0, 4.0]
+        assert (buffer.ago(0), buffer.ago(2)) == (4.0, 2.0)
+        with pytest.raises(IndexError):
+            buffer.ago(3)
+            
+    def test_moments_match_numpy(self):
+        """Test running moments against a full recomputation at every push."""
+        moments = RollingMoments(30)
+        rng = random.Random(3)
+        values = [rng.gauss(0.001, 0.05) for _ in range(200)]
+        
+        for i, value in enumerate(values):
+            moments.push(value)
+            window = values[max(0, i - 29):i + 1]
+            assert abs(moments.mean() - np.mean(window)) < 1e-12
+            if len(window) >= 2:
+                assert abs(moments.std() - np.std(window, ddof=1)) < 1e-12
+        assert moments.full and len(moments) == 30
+
+
+class TestMarketDataProvider:
+    """Test cases for MarketDataProvider."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = MarketDataProvider(window=30)
+        
+    def test_ticks_update_statistics(self):
+        """Test returns, volatility and all-time high against the price history."""
+        prices = _random_walk(60)
+        for price in prices:
+            snapshot = self.provider.update("SOL", price, volume_24h=1e6)
+            
+        log_returns = np.diff(np.log(prices))[-30:]
+        assert snapshot.current_price == prices[-1]
+        assert snapshot.price_change_7d == pytest.approx(prices[-1] / prices[-8] - 1)
+        assert snapshot.price_change_30d == pytest.approx(prices[-1] / prices[-31] - 1)
+        assert snapshot.volatility_30d == pytest.approx(np.std(log_returns, ddof=1) * math.sqrt(PERIODS_PER_YEAR))
+        assert snapshot.all_time_high == max(prices)
+        assert snapshot.distance_from_ath == pytest.approx(prices[-1] / max(prices) - 1)
+        assert snapshot.volume_24h == 1e6
+        assert self.provider.get("SOL") is snapshot
+        
+    def test_seed_stands_in_until_windows_fill(self):
+        """Test that seeded statistics are used until enough ticks arrive."""
+        self.provider.seed(_snapshot())
+        self.provider.update("BTC", 70000.0)
+        
+        snapshot = self.provider.get("BTC")
+        assert (snapshot.price_change_7d, snapshot.volatility_30d) == (0.05, 0.65)
+        assert snapshot.current_price == 70000.0 and snapshot.market_cap == 1.3e12
+        
+        for price in _random_walk(31, start=70000.0)[1:]:
+            snapshot = self.provider.update("BTC", price)
+        assert snapshot.price_change_7d != 0.05 and snapshot.volatility_30d != 0.65
+        assert self.provider.get("DOGE") is None
+
+
+class TestFileMarketDataProvider:
+    """Test cases for FileMarketDataProvider."""
+    
+    def test_loads_snapshots_and_history(self, tmp_path):
+        """Test loading seeds, replaying closes and skipping bad entries."""
+        path = tmp_path / "market_data.json"
+        closes = _random_walk(40, start=3000.0)
+        path.write_text(json.dumps({
+            "BTC": {"price": 67000.0, "volatility_30d": 0.65, "all_time_high": 73000.0},
+            "ETH": {"price": closes[-1], "volatility_30d": 0.7, "closes": closes},
+            "BAD": {"volatility_30d": 0.5},
+        }))
+        
+        provider = FileMarketDataProvider(str(path))
+        
+        assert provider.get("BTC").volatility_30d == 0.65
+        assert provider.get("BTC").distance_from_ath == pytest.approx(67000.0 / 73000.0 - 1)
+        assert provider.get("ETH").price_change_30d == pytest.approx(closes[-1] / closes[-31] - 1)
+        assert "BAD" not in provider
+        
+    def test_missing_file_is_empty(self, tmp_path):
+        """Test that a missing file leaves the provider without data."""
+        provider = FileMarketDataProvider(str(tmp_path / "missing.json"))
+        
+        assert provider.get("BTC") is None
+
+
+class TestCryptoModelProvider:
+    """Test cases for reading market data through the provider."""
+    
+    def test_model_reads_precomputed_snapshots(self):
+        """Test that the model returns the provider's snapshot objects."""
+        provider = MarketDataProvider()
+        provider.seed(_snapshot())
+        model = CryptoFinancialModel(market_data_provider=provider)
+        
+        assert model._get_crypto_market_data("BTC") is provider.get("BTC")
+        assert model._get_crypto_market_data("ETH") is None
+        
+        provider.update("BTC", 80000.0)
+        assert model._get_crypto_market_data("BTC").current_price == 80000.0
+        
+    def test_default_provider_reads_repo_file(self):
+        """Test that the default provider serves the shipped BTC and ETH data."""
+        model = CryptoFinancialModel()
+        
+        assert model._get_crypto_market_data("BTC").current_price == 67000.0
+        assert model._get_crypto_market_data("ETH").volatility_30d == 0.70
@@ -0,0 +1,172 @@
+"""
+Unit tests for shared per-run market features.
+"""
+
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.sanity_checker import SanityChecker
+from src.clients.polymarket.market_features import FeatureStore, MarketFeatures, days_until
+from src.clients.polymarket.models import Market, MarketPrice, Token
+from src.utils.batch_writer import close_all
+from src.utils.market_filters import MarketFilter
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _market(
+    condition_id: str = "m1",
+    question: str = "Will Bitcoin Reach $200,000 this year?",
+    end_date: datetime = NOW + timedelta(days=10, hours=1),
+    description: str = "Crypto MARKET"
+) -> Market:
+    """Build a market."""
+    return Market(
+        condition_id=condition_id,
+        question=question,
+        description=description,
+        active=True,
+        closed=False,
+        volume=20000.0,
+        end_date_iso=end_date,
+        tokens=[
+            Token(token_id=f"{condition_id}-yes", outcome="Yes", price=0.8),
+            Token(token_id=f"{condition_id}-no", outcome="No", price=0.2),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _price(condition_id: str = "m1", yes_price: float = 0.8) -> MarketPrice:
+    """Build a price."""
+    return MarketPrice(
+        condition_id=condition_id,
+        yes_price=yes_price,
+        no_price=1 - yes_price,
+        spread=abs(2 * yes_price - 1)
+    )
+
+
+class TestMarketFeatures:
+    """Test cases for MarketFeatures and FeatureStore."""
+    
+    def test_from_market(self):
+        """Test derived text, days and price flags."""
+        features = MarketFeatures.from_market(_market(), _price(), NOW)
+        
+        assert features.question == "will bitcoin reach $200,000 this year?"
+        assert features.words[:3] == ("will", "bitcoin", "reach")
+        assert features.text == "will bitcoin reach $200,000 this year? crypto market"
+        assert features.days_left == 10
+        assert features.ends_within(10, 30)
+        assert not features.ends_within(11, 30)
+        assert features.in_band(0.6, 0.9)
+        assert not features.in_band(0.8, 0.9)
+        assert not features.at_extreme
+        
+    def test_missing_data(self):
+        """Test markets without an end date, description or price."""
+        features = MarketFeatures.from_market(_market(end_date=None, description=None), now=NOW)
+        
+        assert features.days_left is None
+        assert features.description == ""
+        assert not features.ends_within(0, 1000)
+        assert not features.in_band(0.0, 1.0)
+        assert not features.at_extreme
+        
+    def test_naive_end_date_read_as_utc(self):
+        """Test that naive end dates count as UTC and the market is untouched."""
+        naive_end = (NOW + timedelta(days=3, hours=1)).replace(tzinfo=None)
+        market = _market(end_date=naive_end)
+        
+        features = MarketFeatures.from_market(market, now=NOW)
+        
+        assert features.days_left == 3
+        assert market.end_date_iso.tzinfo is None
+        assert days_until(naive_end, NOW) == 3
+        assert days_until(NOW - timedelta(hours=1), NOW) == -1
+        
+    def test_store_caches_per_run(self):
+        """Test one computation per market, one now, and price refreshes."""
+        store = FeatureStore(NOW)
+        market = _market()
+        
+        first = store.get(market, _price())
+        assert store.get(market) is first
+        assert first.now == NOW
+        
+        repriced = store.get(market, _price(yes_price=0.995))
+        assert repriced.at_extreme
+        assert repriced.question is first.question
+        assert len(store) == 1
+        
+        # A different market object under the same ID is derived afresh
+        renamed = store.get(_market(question="Will it rain?"))
+        assert renamed.question == "will it rain?"
+
+
+class TestFeatureConsumers:
+    """Test cases for components reading shared features."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_filter_uses_store_time(self):
+        """Test that the time horizon filter counts days from the store's now."""
+        market_filter = MarketFilter()
+        market_filter.categories = []
+        market_filter.keywords = ["bitcoin"]
+        market_filter.time_horizon_filter = None
+        market_filter.max_days_to_resolution = 30
+        market_filter.min_days_to_resolution = None
+        markets = [
+            _market("soon", end_date=NOW + timedelta(days=20, hours=1)),
+            _market("late", end_date=NOW + timedelta(days=40, hours=1)),
+            _market("other", question="Will it rain?", description=None),
+        ]
+        store = FeatureStore(NOW)
+        
+        result = market_filter.filter_markets(markets, store)
+        
+        assert [market.condition_id for market in result] == ["soon"]
+        assert len(store) == 3
+        
+    def test_sanity_checker_handles_naive_dates(self):
+        """Test time checks on a naive end date using given features."""
+        market = _market(
+            question="Will the Acme merger close?",
+            end_date=(NOW + timedelta(days=5, hours=1)).replace(tzinfo=None)
+        )
+        features = MarketFeatures.from_market(market, now=NOW)
+        
+        result = SanityChecker().check_prediction(market, 0.5, 0.8, "Talks reported", features=features)
+        
+        assert any("Only 5 days remaining" in warning for warning in result.warnings)
+        
+    @pytest.mark.asyncio
+    async def test_analyzer_run_shares_one_store(self):
+        """Test that a run derives features once against one reference time."""
+        analyzer = MarketAnalyzer()
+        analyzer.backtesting_engine = BacktestingEngine(data_dir=self.temp_dir)
+        now = datetime.now(timezone.utc)
+        markets = [_market(f"m{i}", end_date=now + timedelta(days=60, hours=1)) for i in range(5)]
+        prices = [_price(market.condition_id, 0.81) for market in markets]
+        
+        result = await analyzer.analyze_markets(markets, prices, [])
+        
+        store = analyzer.features
+        assert result.opportunities
+        assert len(store) == len(markets)
+        assert all(store.get(market).now == store.now for market in markets)
+        assert analyzer._days_until_end(markets[0]) == 60
@@ -0,0 +1,107 @@
+"""
+Unit tests for the columnar market table.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.clients.polymarket.market_table import MarketTable, split_token_prices
+from src.clients.polymarket.models import Market, MarketPrice, Token
+
+
+def _row(i, **changes):
+    """Build a raw API market dict."""
+    now = datetime.now(timezone.utc)
+    row = {
+        "condition_id": f"m{i}",
+        "question": f"Question {i}?",
+        "category": "Politics" if i % 2 else "Crypto",
+        "active": True,
+        "closed": False,
+        "volume": "5000.5",
+        "end_date_iso": (now + timedelta(days=10, hours=1)).isoformat(),
+        "tokens": [
+            {"token_id": f"{i}-yes", "outcome": "Yes", "price": 0.3},
+            {"token_id": f"{i}-no", "outcome": "No", "price": 0.7},
+        ],
+        "minimum_order_size": 1.0,
+    }
+    row.update(changes)
+    return row
+
+
+class TestMarketTable:
+    """Test cases for MarketTable."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        self.rows = [
+            _row(0),
+            _row(1, closed=True),
+            _row(2, end_date_iso=past),
+            _row(3, end_date_iso=None, volume=None),
+            _row(4, volume="10", tokens=[{"token_id": "x", "outcome": "Yes", "price": None}]),
+            _row(5, minimum_order_size=None),
+        ]
+        self.table = MarketTable.from_api_rows(self.rows)
+        
+    def test_columns_and_interning(self):
+        """Test that numbers are parsed and categories interned once."""
+        assert len(self.table) == 6
+        assert self.table.volume[0] == 5000.5
+        assert np.isnan(self.table.volume[3])
+        assert self.table.categories == [None, "Crypto", "Politics"]
+        assert self.table.category(1) == "Politics"
+        assert self.table.days_to_end()[0] == 10
+        assert np.isnan(self.table.days_to_end()[3])
+        
+    def test_gates_match_object_checks(self):
+        """Test open, priced, volume and category masks."""
+        assert list(np.flatnonzero(self.table.open_mask())) == [0, 3, 4, 5]
+        assert list(np.flatnonzero(self.table.priced_mask())) == [0, 1, 2, 3, 5]
+        assert list(np.flatnonzero(self.table.volume_mask(1000))) == [0, 1, 2, 3, 5]
+        assert list(np.flatnonzero(self.table.category_mask(["crypto"]))) == [0, 2, 4]
+        
+    def test_only_materialized_rows_are_validated(self):
+        """Test that invalid rows only matter when materialized."""
+        markets = self.table.markets(self.table.open_mask())
+        
+        # Row 5 fails Market validation and is skipped
+        assert [market.condition_id for market in markets] == ["m0", "m3", "m4"]
+        assert self.table.market(0) is markets[0]
+        price = self.table.price(0)
+        assert (price.yes_price, price.no_price) == (0.3, 0.7)
+        assert price.spread == pytest.approx(0.4)
+        assert self.table.price(4) is None
+        
+    def test_from_markets_uses_price_lookup(self):
+        """Test building from Market objects with known prices."""
+        market = Market(
+            condition_id="m",
+            question="Q?",
+            active=True,
+            closed=False,
+            tokens=[Token(token_id="a", outcome="Up", price=0.2), Token(token_id="b", outcome="Down", price=0.8)],
+            minimum_order_size=1.0
+        )
+        table = MarketTable.from_markets([market], {"m": MarketPrice(
+            condition_id="m", yes_price=0.6, no_price=0.4, spread=0.2
+        )})
+        
+        assert table.yes_price[0] == 0.6
+        assert table.market(0) is market
+        assert MarketTable.from_markets([market]).yes_price[0] == 0.2
+        
+    @pytest.mark.parametrize("tokens, expected", [
+        ([("Yes", 0.4), ("No", 0.6)], (0.4, 0.6)),
+        ([("No", 0.6), ("Yes", 0.4)], (0.4, 0.6)),
+        ([("Up", 0.4), ("Down", 0.6)], (0.4, 0.6)),
+        ([("A", 0.2), ("B", 0.3), ("C", 0.5)], (np.nan, np.nan)),
+        ([("Yes", 0.4)], (np.nan, np.nan)),
+    ])
+    def test_split_token_prices(self, tokens, expected):
+        """Test YES/NO selection mirrors PolymarketClient.get_market_prices."""
+        assert split_token_prices(tokens) == pytest.approx(expected, nan_ok=True)
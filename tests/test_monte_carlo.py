@@ -0,0 +1,101 @@
+"""
+Unit tests for the Monte Carlo engine and its simulations.
+"""
+
+import math
+
+import numpy as np
+
+from src.analyzers.monte_carlo import (
+    BarrierTouch,
+    CumulativeTotal,
+    MonteCarloEngine,
+    RunningExtreme,
+    market_key,
+)
+
+
+def _touch_probability(spot: float, barrier: float, days: float, drift: float, volatility: float) -> float:
+    """Continuously monitored GBM barrier-hit probability (reflection principle)."""
+    years = days / 365
+    nu = drift - volatility ** 2 / 2
+    b = math.log(barrier / spot)
+    sign = 1 if barrier > spot else -1
+    scale = volatility * math.sqrt(years)
+    
+    def cdf(x):
+        return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+        
+    return cdf(sign * (nu * years - b) / scale) + math.exp(2 * nu * b / volatility ** 2) * cdf(sign * (-b - nu * years) / scale)
+
+
+class TestMonteCarloEngine:
+    """Test cases for MonteCarloEngine."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = MonteCarloEngine(seed=7, target_standard_error=0.003, max_paths=100000)
+        
+    def test_barrier_touch_matches_closed_form(self):
+        """Test barrier hits against the reflection-principle formula, up and down."""
+        cases = [(100.0, 130.0, 180.0, 0.05, 0.6), (100.0, 80.0, 60.0, 0.1, 0.5)]
+        paths = BarrierTouch(*(np.array(values) for values in zip(*cases, strict=True)))
+        
+        result = self.engine.run(paths)
+        
+        for case, probability, standard_error in zip(cases, result.probabilities, result.standard_errors, strict=True):
+            assert abs(probability - _touch_probability(*case)) < 4 * standard_error + 0.005
+            
+    def test_seeded_and_independent_of_batch(self):
+        """Test that a market's estimate depends only on the seed and its key."""
+        paths = CumulativeTotal(
+            current=[0.0, 5.0, 0.0], first=[1.0, 2.0, 0.5], decay=[1.0, 0.8, 1.0],
+            sigma=0.8, threshold=[10.0, 12.0, 3.0], periods=[10, 6, 4]
+        )
+        keys = [market_key(name) for name in ("rain", "film", "snow")]
+        
+        batch = self.engine.run(paths, keys)
+        again = self.engine.run(paths, keys)
+        alone = self.engine.run(
+            CumulativeTotal(current=5.0, first=2.0, decay=0.8, sigma=0.8, threshold=12.0, periods=6), keys[1:2]
+        )
+        
+        assert np.array_equal(batch.probabilities, again.probabilities)
+        assert batch.probabilities[1] == alone.probabilities[0]
+        assert batch.paths[1] == alone.paths[0]
+        reseeded = MonteCarloEngine(seed=8, target_standard_error=0.003, max_paths=100000).run(paths, keys)
+        assert not np.array_equal(batch.probabilities, reseeded.probabilities)
+        
+    def test_stops_at_target_standard_error(self):
+        """Test that certain rows stop early and uncertain rows run until the target."""
+        paths = RunningExtreme(
+            start=[70.0, 70.0], mean=[70.0, 70.0], sd=[3.0, 3.0], persistence=0.7,
+            threshold=[150.0, 73.0], days=[7, 7], above=True
+        )
+        
+        result = self.engine.run(paths)
+        
+        assert result.probabilities[0] == 0.0
+        assert result.paths[0] == self.engine.min_paths
+        assert result.paths[1] > self.engine.min_paths
+        assert result.standard_errors[1] <= 0.003
+        
+    def test_antithetic_reduces_standard_error(self):
+        """Test that antithetic pairs beat independent paths for the same number of paths."""
+        paths = CumulativeTotal(current=0.0, first=1.0, decay=1.0, sigma=0.5, threshold=28.0, periods=30)
+        
+        antithetic = MonteCarloEngine(min_paths=8000, max_paths=8000).run(paths)
+        independent = MonteCarloEngine(min_paths=8000, max_paths=8000, antithetic=False).run(paths)
+        
+        assert antithetic.paths[0] == independent.paths[0] == 8000
+        assert antithetic.standard_errors[0] < independent.standard_errors[0]
+        
+    def test_floors_are_crossed_downward(self):
+        """Test that cold records count values at or below the threshold."""
+        paths = RunningExtreme(
+            start=30.0, mean=30.0, sd=4.0, persistence=0.5, threshold=[26.0, 26.0], days=10, above=[False, True]
+        )
+        
+        cold, hot = self.engine.run(paths).probabilities
+        
+        assert cold > 0.5 and hot == 1.0
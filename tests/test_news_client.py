@@ -5,13 +5,18 @@ These tests verify the NewsClient behaves correctly according to its API contrac
 not implementation details.
 """
 
+import os
+import shutil
+import tempfile
+
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import httpx
 
 from src.clients.news.client import NewsClient
 from src.clients.news.models import NewsArticle, NewsResponse, NewsSource
+from src.utils.quota_ledger import QueryPriority, QuotaLedger
 
 
 class TestNewsClient:
@@ -19,11 +24,26 @@ class TestNewsClient:
     
     def setup_method(self):
         """Set up test fixtures."""
+        # Keep quota accounting out of the real data directory
+        self.temp_dir = tempfile.mkdtemp()
+        self.ledger = QuotaLedger(
+            path=os.path.join(self.temp_dir, "quota.json"),
+            daily_limit=100,
+            low_priority_reserve=20
+        )
+        self.ledger_patch = patch("src.clients.news.client.news_quota_ledger", self.ledger)
+        self.ledger_patch.start()
+        
         self.client = NewsClient(
             base_url="https://newsapi.org/v2",
             api_key="test_api_key"
         )
         
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.ledger_patch.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
     @pytest.mark.asyncio
     async def test_get_everything_returns_news_response(self):
         """Test that get_everything returns a NewsResponse object."""
@@ -271,6 +291,63 @@ class TestNewsClient:
         # But since we're mocking, we're mainly testing the interface
         assert mock_client.get.call_count == 3
         
+    @pytest.mark.asyncio
+    async def test_requests_debit_daily_quota(self):
+        """Test that API requests spend quota and cache hits do not."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "ok", "totalResults": 0, "articles": []}
+        mock_response.raise_for_status = MagicMock()
+        
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.aclose = AsyncMock()
+        
+        async with NewsClient() as client:
+            client._client = mock_client
+            before = client.remaining_quota()
+            
+            await client.get_everything(query="quota")
+            await client.get_everything(query="quota")  # Served from cache
+            
+            assert client.remaining_quota() == before - 1
+            
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_sheds_requests(self):
+        """Test that no request is sent once today's quota is spent."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+        mock_client.aclose = AsyncMock()
+        
+        async with NewsClient() as client:
+            client._client = mock_client
+            self.ledger.mark_exhausted(client.api_key)
+            
+            response = await client.get_everything(query="test", priority=QueryPriority.HIGH)
+            
+        assert response.articles == []
+        mock_client.get.assert_not_called()
+        
+    @pytest.mark.asyncio
+    async def test_rate_limit_response_exhausts_quota(self):
+        """Test that a 429 from NewsAPI stops further spending for the day."""
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.raise_for_status = MagicMock(
+            side_effect=httpx.HTTPStatusError("Too Many Requests", request=None, response=mock_response)
+        )
+        
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.aclose = AsyncMock()
+        
+        async with NewsClient() as client:
+            client._client = mock_client
+            response = await client.get_everything(query="test")
+            
+            assert response.articles == []
+            assert client.remaining_quota() == 0
+            
     def test_news_article_model_contract(self):
         """Test that NewsArticle model works as expected."""
         # Given: Valid article data
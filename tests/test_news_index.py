@@ -0,0 +1,108 @@
+"""
+Unit tests for the news keyword index.
+"""
+
+import random
+from datetime import datetime
+
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.news_index import NewsKeywordIndex, article_text
+from src.clients.news.models import NewsArticle, NewsSource
+from src.clients.polymarket.models import Market
+
+
+def _article(title, description=None, source="Reuters"):
+    """Build a news article."""
+    return NewsArticle(
+        source=NewsSource(name=source),
+        title=title,
+        description=description,
+        url="https://example.com/article",
+        published_at=datetime.now()
+    )
+
+
+def _market(question):
+    """Build a market with the given question."""
+    return Market(
+        condition_id="m",
+        question=question,
+        active=True,
+        closed=False,
+        tokens=[],
+        minimum_order_size=1.0
+    )
+
+
+class TestNewsKeywordIndex:
+    """Test cases for NewsKeywordIndex."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.articles = [
+            _article("Bitcoin's rally continues", "Crypto markets surge"),
+            _article("Fed holds rates", None, source="Bloomberg"),
+            _article("Election polls tighten", "Trump and Harris neck and neck", source="Local Wire"),
+        ]
+        self.index = NewsKeywordIndex(self.articles)
+        
+    def test_exact_token_lookup(self):
+        """Test that whole tokens hit their postings."""
+        assert self.index.article_ids("rates") == {1}
+        assert self.index.article_ids("missing") == frozenset()
+        
+    def test_partial_token_matches_like_substring_search(self):
+        """Test that keywords still match inside longer tokens."""
+        assert self.index.article_ids("bitcoin") == {0}
+        assert self.index.article_ids("tight") == {2}
+        
+    def test_empty_keyword_matches_everything(self):
+        """Test that an empty keyword matches all articles, as substring search did."""
+        assert self.index.article_ids("") == {0, 1, 2}
+        
+    def test_find_preserves_article_order(self):
+        """Test that related articles come back in original order."""
+        related = self.index.find(["trump", "bitcoin"])
+        
+        assert related == [self.articles[0], self.articles[2]]
+        
+    def test_covers_only_the_source_list(self):
+        """Test that the index only answers for the list it was built from."""
+        assert self.index.covers(self.articles)
+        assert not self.index.covers(list(self.articles))
+        
+    def test_sentiment_and_source_quality(self):
+        """Test memoized sentiment and high-quality source counting."""
+        articles = [_article("Strong growth", "Markets gain"), _article("Sales decline")]
+        index = NewsKeywordIndex(articles)
+        
+        assert index.sentiment(articles) == 0.0
+        assert index.sentiment(articles[:1]) == 1.0
+        assert index.sentiment([_article("Big loss")]) == -1.0
+        assert NewsKeywordIndex.high_quality_count(self.articles) == 2
+        
+    def test_matches_linear_scan(self):
+        """Test that index lookups equal the original keyword-by-article scan."""
+        rng = random.Random(7)
+        vocabulary = [
+            "bitcoin", "bitcoins", "trump's", "election", "fed", "rates", "$100,000",
+            "2024", "ethereum", "rally", "crash", "super", "bowl", "oscars", "ai"
+        ]
+        articles = [
+            _article(
+                " ".join(rng.choices(vocabulary, k=5)).title(),
+                " ".join(rng.choices(vocabulary, k=8)) if i % 3 else None
+            )
+            for i in range(60)
+        ]
+        analyzer = MarketAnalyzer()
+        
+        for _ in range(40):
+            market = _market("Will " + " ".join(rng.choices(vocabulary, k=4)) + "?")
+            keywords = analyzer._extract_market_keywords(market)
+            expected = [
+                article for article in articles
+                if any(keyword in article_text(article) for keyword in keywords)
+            ]
+            
+            assert analyzer._find_related_news(market, articles) == expected
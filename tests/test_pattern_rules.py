@@ -0,0 +1,161 @@
+"""
+Unit tests for compiled pattern rules and the FlexibleAnalyzer rule set.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from src.analyzers.flexible_analyzer import FlexibleAnalyzer
+from src.analyzers.pattern_rules import PatternRule, RuleSet
+from src.clients.polymarket.models import Market, MarketPrice, Token
+
+
+def _market(question: str, yes_price: float, days: int = 60) -> Market:
+    """Build a liquid market."""
+    return Market(
+        condition_id="0xrule",
+        question=question,
+        active=True,
+        closed=False,
+        volume=50000,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=days, hours=12),
+        tokens=[
+            Token(token_id="yes", outcome="Yes", price=yes_price),
+            Token(token_id="no", outcome="No", price=1 - yes_price),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _price(yes_price: float) -> MarketPrice:
+    """Build a market price."""
+    return MarketPrice(
+        condition_id="0xrule",
+        yes_price=yes_price,
+        no_price=1 - yes_price,
+        spread=0.01
+    )
+
+
+class TestFlexibleRules:
+    """Test that each FlexibleAnalyzer pattern fires where it used to."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = FlexibleAnalyzer()
+        
+    def _analyze(self, question, yes_price, days=60):
+        return self.analyzer.analyze_market(_market(question, yes_price, days), _price(yes_price))
+        
+    @pytest.mark.parametrize("question,yes_price,days,pattern_type,action,reason", [
+        ("Will someone set a world record?", 0.10, 60, "EXTREME_LONGSHOT", "BUY_NO",
+         "Extreme longshot overpriced at 10%"),
+        ("Will the Fed maintain rates?", 0.80, 20, "STABLE_CONTINUATION", "BUY_YES",
+         "Stable continuation event underpriced at 80%"),
+        ("Will they abolish the senate?", 0.30, 60, "IMPOSSIBILITY", "BUY_NO",
+         "Near impossibility overpriced (fair value ~2%)"),
+        ("Will the coin flip land heads?", 0.30, 60, "BINARY_MISPRICING", "BUY_YES",
+         "True 50/50 event mispriced at 30%"),
+        ("Will the coin toss land heads?", 0.70, 60, "BINARY_MISPRICING", "BUY_NO",
+         "True 50/50 event mispriced at 70%"),
+        ("Will the minister resign?", 0.20, 60, "OVERPRICED_MODERATE", "BUY_NO",
+         "Dramatic event overpriced at 20%"),
+        ("Will at least one storm form?", 0.65, 60, "UNDERPRICED_HIGH", "BUY_YES",
+         "Near certainty underpriced at 65%"),
+        ("Will they announce a deal?", 0.30, 3, "TIME_SENSITIVE", "BUY_NO",
+         "Unlikely in 3 days"),
+        ("Will Bitcoin reach $200,000?", 0.40, 60, "CRYPTO_OVERPRICED", "BUY_NO",
+         "BTC $200k unlikely in timeframe"),
+        ("Will an NFL team go undefeated?", 0.45, 60, "SPORTS_LONGSHOT", "BUY_NO",
+         "Perfect seasons extremely rare"),
+    ])
+    def test_pattern(self, question, yes_price, days, pattern_type, action, reason):
+        """Test one market per pattern type."""
+        opportunity = self._analyze(question, yes_price, days)
+        
+        assert opportunity is not None
+        assert opportunity.pattern_type == pattern_type
+        assert opportunity.recommended_action == action
+        assert opportunity.reason == reason
+        
+    def test_band_edges_exclusive(self):
+        """Test that prices on a band edge do not match."""
+        assert self._analyze("Will the coin flip land heads?", 0.60) is None
+        assert self._analyze("Will the minister resign?", 0.25) is None
+        assert self._analyze("Will they announce a deal?", 0.30, days=7) is None
+        
+    def test_min_edge(self):
+        """Test that rules requiring an edge respect min_edge."""
+        assert self._analyze("Will the minister resign?", 0.11) is not None
+        self.analyzer.min_edge = 0.10
+        assert self._analyze("Will the minister resign?", 0.11) is None
+        
+    def test_first_impossibility_wins(self):
+        """Test that the first listed impossibility sets the fair value."""
+        opportunity = self._analyze("Will a constitutional amendment abolish the senate?", 0.30)
+        
+        assert opportunity.edge == pytest.approx(0.29)
+        
+    def test_crypto_questions_skip_sports_rule(self):
+        """Test that the sports rule never applies to crypto questions."""
+        assert self._analyze("Will an NFL team go undefeated?", 0.45) is not None
+        assert self._analyze("Will BTC sponsor an undefeated NFL team?", 0.45) is None
+        
+    def test_best_pattern_wins(self):
+        """Test that the highest edge x confidence is returned."""
+        # Longshot: 0.12 * 0.8; dramatic: 0.09 * 0.75
+        opportunity = self._analyze("Will the minister resign with a world record?", 0.14)
+        
+        assert opportunity.pattern_type == "EXTREME_LONGSHOT"
+
+
+class TestRuleSet:
+    """Test cases for RuleSet compilation and evaluation."""
+    
+    def test_ties_go_to_earlier_rule(self):
+        """Test that equal scores keep declaration order."""
+        rules = RuleSet([
+            PatternRule("FIRST", "BUY_NO", 0.1, 0.5, "first", keywords=(("alpha",),)),
+            PatternRule("SECOND", "BUY_NO", 0.1, 0.5, "second", keywords=(("beta",),)),
+        ])
+        
+        opportunity = rules.evaluate(_market("Alpha and beta?", 0.5), _price(0.5))
+        
+        assert opportunity.pattern_type == "FIRST"
+        
+    def test_every_keyword_group_required(self):
+        """Test that rules trigger on their anchor and verify the other groups."""
+        rules = RuleSet([
+            PatternRule(
+                "BOTH", "BUY_NO", 0.1, 0.5, "both",
+                keywords=(("red", "green", "blue"), ("car",))
+            ),
+        ])
+        
+        assert rules.evaluate(_market("A red car?", 0.5), _price(0.5)) is not None
+        assert rules.evaluate(_market("A red bus?", 0.5), _price(0.5)) is None
+        assert rules.evaluate(_market("A car?", 0.5), _price(0.5)) is None
+        
+    def test_days_band_needs_end_date(self):
+        """Test that time-bound rules skip markets without an end date."""
+        rules = RuleSet([
+            PatternRule("SOON", "BUY_NO", 0.1, 0.5, "{days_left} days", days_band=(1, 6)),
+        ])
+        market = _market("Anything?", 0.5, days=3)
+        
+        assert rules.evaluate(market, _price(0.5)).reason == "3 days"
+        market.end_date_iso = None
+        assert rules.evaluate(market, _price(0.5)) is None
+
+    def test_prune_stats_reported(self):
+        """Test that the flexible analyzer counts the checks it skips."""
+        analyzer = FlexibleAnalyzer()
+        questions = ["Will the coin flip land heads?", "Will both teams win and lose?", "Will the CEO remain?"]
+        for question in questions:
+            for cents in (5, 20, 50, 75):
+                analyzer.analyze_market(_market(question, cents / 100, days=5), _price(cents / 100))
+                
+        stats = analyzer.prune_stats
+        assert stats.markets == len(questions) * 4
+        assert 0 < stats.prune_rate < 1
+        assert "checks/market" in stats.summary()
@@ -0,0 +1,218 @@
+"""
+Unit tests for the streaming analysis pipeline.
+"""
+
+import asyncio
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.analyzers.backtesting import BacktestingEngine
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.pipeline import AnalysisPipeline
+from src.clients.news.models import NewsArticle, NewsSource
+from src.clients.polymarket.models import Market, MarketPrice, Token
+from src.utils.batch_writer import close_all
+from src.utils.timing import STAGES, StageTimer
+
+
+def _market(i: int) -> Market:
+    """Build a market; prices cycle so that some markets are opportunities."""
+    yes_price = round(0.03 + (i % 7) * 0.13, 2)
+    return Market(
+        condition_id=f"m{i}",
+        question=f"Will Bitcoin reach $200,000 by market {i}?",
+        active=True,
+        closed=False,
+        volume=20000.0,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=20 + i % 50),
+        tokens=[
+            Token(token_id=f"{i}-yes", outcome="Yes", price=yes_price),
+            Token(token_id=f"{i}-no", outcome="No", price=round(1 - yes_price, 3)),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+async def _price(market: Market) -> MarketPrice:
+    """Price function reading token prices, like PolymarketClient.get_market_prices."""
+    yes, no = market.tokens
+    return MarketPrice(
+        condition_id=market.condition_id,
+        yes_price=yes.price,
+        no_price=no.price,
+        spread=abs(yes.price - no.price)
+    )
+
+
+async def _pages(markets, page_size=10, gate=None):
+    """Yield markets in pages, optionally waiting on an event after the first page."""
+    for start in range(0, len(markets), page_size):
+        if gate is not None and start > 0:
+            await gate.wait()
+        yield markets[start:start + page_size]
+
+
+class TestAnalysisPipeline:
+    """Test cases for AnalysisPipeline."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = MarketAnalyzer()
+        self.analyzer.backtesting_engine = BacktestingEngine(data_dir=self.temp_dir)
+        self.markets = [_market(i) for i in range(40)]
+        self.news = [
+            NewsArticle(
+                source=NewsSource(name="Reuters"),
+                title="Bitcoin rally gathers pace",
+                url="https://example.com/bitcoin",
+                published_at=datetime.now()
+            )
+        ]
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    @pytest.mark.asyncio
+    async def test_results_match_batch_analysis(self):
+        """Test that streaming finds the same opportunities as analyze_markets."""
+        prices = [await _price(market) for market in self.markets]
+        batch = await self.analyzer.analyze_markets(self.markets, prices, self.news)
+        
+        pipeline = AnalysisPipeline(self.analyzer, _price, queue_size=4, score_batch_size=3)
+        streamed = await pipeline.run(_pages(self.markets), self.news)
+        
+        assert batch.opportunities
+        assert [opp.condition_id for opp in streamed.opportunities] == [
+            opp.condition_id for opp in batch.opportunities
+        ]
+        assert [opp.score.overall_score for opp in streamed.opportunities] == pytest.approx(
+            [opp.score.overall_score for opp in batch.opportunities]
+        )
+        assert streamed.total_markets_analyzed == len(self.markets)
+        assert streamed.news_articles_processed == 1
+        
+    @pytest.mark.asyncio
+    async def test_pages_gated_by_prefilter(self):
+        """Test that queued markets are gated in one pass before per-market detection."""
+        gated = []
+        detected = []
+        analyzer = self.analyzer.pattern_analyzer
+        analyze_market = analyzer.analyze_market
+        
+        def prefilter(table, now):
+            gated.append(len(table))
+            return np.array([condition_id != "m3" for condition_id in table.condition_ids])
+            
+        def counting_analyze_market(market, price, features=None):
+            detected.append(market.condition_id)
+            return analyze_market(market, price, features=features)
+            
+        with patch.object(analyzer, "prefilter", prefilter, create=True):
+            with patch.object(analyzer, "analyze_market", counting_analyze_market):
+                pipeline = AnalysisPipeline(self.analyzer, _price)
+                result = await pipeline.run(_pages(self.markets), self.news)
+                
+        assert sum(gated) == len(self.markets) and max(gated) > 1
+        assert "m3" not in detected and len(detected) == len(self.markets) - 1
+        assert "m3" not in {opp.condition_id for opp in result.opportunities}
+        
+    @pytest.mark.asyncio
+    async def test_first_opportunity_arrives_before_later_pages(self):
+        """Test that opportunities stream out while the source is still paging."""
+        gate = asyncio.Event()
+        pipeline = AnalysisPipeline(self.analyzer, _price)
+        
+        async def consume():
+            async for _ in pipeline.stream(_pages(self.markets, gate=gate), self.news):
+                # Only release the remaining pages once something came out
+                gate.set()
+                
+        await asyncio.wait_for(consume(), timeout=5)
+        
+        assert pipeline.stats.markets_ingested == len(self.markets)
+        assert pipeline.stats.first_opportunity_seconds is not None
+        
+    @pytest.mark.asyncio
+    async def test_back_pressure_limits_ingestion(self):
+        """Test that a stalled consumer stops the source from being drained."""
+        markets = [_market(i) for i in range(500)]
+        pipeline = AnalysisPipeline(self.analyzer, _price, queue_size=2)
+        stream = pipeline.stream(_pages(markets, page_size=1), self.news)
+        
+        await stream.__anext__()
+        for _ in range(50):
+            await asyncio.sleep(0)
+        ingested = pipeline.stats.markets_ingested
+        await stream.aclose()
+        
+        # Bounded by queue capacity, not by how many markets the source has
+        assert ingested < 50
+        
+    @pytest.mark.asyncio
+    async def test_news_fetched_concurrently(self):
+        """Test that news can be an awaitable resolved while markets stream."""
+        async def slow_news():
+            await asyncio.sleep(0.01)
+            return self.news
+            
+        pipeline = AnalysisPipeline(self.analyzer, _price)
+        result = await pipeline.run(_pages(self.markets), slow_news())
+        
+        assert result.news_articles_processed == 1
+        assert pipeline.news_articles == self.news
+        
+    @pytest.mark.asyncio
+    async def test_stage_errors_only_drop_their_market(self):
+        """Test that a failing market is dropped without stopping the run."""
+        async def flaky_price(market):
+            if market.condition_id == "m0":
+                raise ValueError("boom")
+            return await _price(market)
+            
+        pipeline = AnalysisPipeline(self.analyzer, flaky_price)
+        result = await pipeline.run(_pages(self.markets), self.news)
+        
+        assert pipeline.stats.errors == 1
+        assert "m0" not in {opp.condition_id for opp in result.opportunities}
+        assert result.opportunities
+        
+    @pytest.mark.asyncio
+    async def test_source_failure_surfaces_after_draining(self):
+        """Test that a failing source raises once the stages have drained."""
+        async def broken_source():
+            yield self.markets[:5]
+            raise RuntimeError("page fetch failed")
+            
+        pipeline = AnalysisPipeline(self.analyzer, _price)
+        
+        with pytest.raises(RuntimeError, match="page fetch failed"):
+            await pipeline.run(broken_source(), self.news)
+            
+        assert pipeline.stats.markets_ingested == 5
+        
+    @pytest.mark.asyncio
+    async def test_timings_attached_to_results(self):
+        """Test that both entry points report stages and per-market latencies."""
+        prices = [await _price(market) for market in self.markets]
+        timer = StageTimer()
+        timer.add("fetch", 0.1)
+        batch = await self.analyzer.analyze_markets(self.markets, prices, self.news, timer=timer)
+        
+        pipeline = AnalysisPipeline(self.analyzer, _price)
+        streamed = await pipeline.run(_pages(self.markets), self.news)
+        
+        assert {"fetch", "filter", "pattern", "score", "fair_value", "kelly", "record"} <= set(batch.timings.stages)
+        assert {"price", "news", "pattern", "fair_value"} <= set(streamed.timings.stages)
+        assert set(batch.timings.stages) | set(streamed.timings.stages) <= set(STAGES)
+        for result in (batch, streamed):
+            timings = result.timings
+            assert timings.markets_timed == len(self.markets)
+            assert 0 < timings.market_p50_ms <= timings.market_p95_ms <= timings.market_max_ms
@@ -4,6 +4,7 @@ Unit tests for political market model functionality.
 
 import pytest
 from datetime import datetime, timedelta
+from typing import Mapping
 from unittest.mock import patch, MagicMock
 
 from src.analyzers.political_model import (
@@ -401,7 +402,7 @@ class TestPoliticalMarketModel:
     def test_load_pollster_reliability(self):
         """Test pollster reliability loading."""
         reliability = self.model._load_pollster_reliability()
-        assert isinstance(reliability, dict)
+        assert isinstance(reliability, Mapping)
         # May have some default values
         
     # Removed test for non-existent _load_fundamentals_data method
@@ -167,6 +167,70 @@ class TestPolymarketClient:
         assert len(markets) == 2
         assert all(isinstance(m, Market) for m in markets)
         
+    @pytest.mark.asyncio
+    async def test_iter_active_markets_streams_pages(self):
+        """Test that pages are yielded as they arrive and fetched on demand."""
+        client = PolymarketClient(base_url="https://clob.polymarket.com")
+        client._client = MagicMock()
+        
+        pages = []
+        for i, market_data in enumerate(self.test_markets_response["data"]):
+            response = MagicMock()
+            response.status_code = 200
+            response.json = MagicMock(return_value={
+                "limit": 100,
+                "count": 1,
+                "data": [market_data],
+                "next_cursor": "cursor_123" if i == 0 else None
+            })
+            response.raise_for_status = MagicMock()
+            pages.append(response)
+            
+        client._client.get = AsyncMock(side_effect=pages)
+        
+        with patch("src.utils.market_filters.market_filter.sort_by_volume", False):
+            stream = client.iter_active_markets(max_markets=10)
+            first_page = await stream.__anext__()
+            
+            # The second page is not requested until the consumer asks for it
+            assert client._client.get.call_count == 1
+            assert [m.condition_id for m in first_page] == ["test_condition_123"]
+            
+            remaining = [page async for page in stream]
+            assert [[m.condition_id for m in page] for page in remaining] == [["test_condition_456"]]
+            
+    @pytest.mark.asyncio
+    async def test_iter_active_markets_keeps_highest_volume(self):
+        """Test that volume sorting ranks across pages, as get_all_active_markets does."""
+        client = PolymarketClient(base_url="https://clob.polymarket.com")
+        client._client = MagicMock()
+        
+        pages = []
+        for i, volumes in enumerate([[5, 50], [500, 1], [40, 60]]):
+            response = MagicMock()
+            response.status_code = 200
+            response.json = MagicMock(return_value={
+                "limit": 100,
+                "count": len(volumes),
+                "data": [
+                    {**self.test_market_data, "condition_id": f"market_{volume}", "volume": str(volume)}
+                    for volume in volumes
+                ],
+                "next_cursor": "cursor_123" if i < 2 else None
+            })
+            response.raise_for_status = MagicMock()
+            pages.append(response)
+            
+        client._client.get = AsyncMock(side_effect=pages)
+        
+        with patch("src.clients.polymarket.client.rate_limiters.polymarket.acquire", AsyncMock()):
+            with patch("src.utils.market_filters.market_filter.sort_by_volume", True):
+                streamed = [page async for page in client.iter_active_markets(max_markets=2)]
+            
+        # Six markets (three times the limit) are fetched before ranking
+        assert client._client.get.call_count == 3
+        assert [[m.condition_id for m in page] for page in streamed] == [["market_500", "market_60"]]
+        
     @pytest.mark.asyncio
     async def test_get_market_prices(self):
         """Test getting market prices."""
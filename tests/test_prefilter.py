@@ -0,0 +1,141 @@
+"""
+Unit tests for the vectorized numeric prefilter.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.analyzers.ensemble import AnalyzerEnsemble
+from src.analyzers.flexible_analyzer import FlexibleAnalyzer
+from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+from src.analyzers.prefilter import NumericGate, NumericProfile, analyze_batch, gate_all
+from src.analyzers.refined_simple_analyzer import RefinedSimpleAnalyzer
+from src.analyzers.simple_pattern_analyzer import SimplePatternAnalyzer
+from src.clients.polymarket.market_features import FeatureStore
+from src.clients.polymarket.market_table import MarketTable
+from src.clients.polymarket.models import Market, MarketPrice, Token
+
+# Questions that trip different patterns across the analyzers
+QUESTIONS = [
+    "Will the coin flip land heads or tails?",
+    "Will Bitcoin reach $1 million and go viral?",
+    "Will the sun rise and the earth continue?",
+    "Will the Fed maintain the interest rate and keep inflation stable?",
+    "Will someone set a perfect record, 1000x, reach $10 million?",
+    "Will the CEO remain president until the season finals game?",
+    "Will the incumbent win the election?",
+]
+
+
+def _market(condition_id: str, question: str, yes_price: float, days: float, volume) -> Market:
+    """Build a market ending a given number of days from now."""
+    return Market(
+        condition_id=condition_id,
+        question=question,
+        active=True,
+        closed=False,
+        volume=volume,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=days),
+        tokens=[
+            Token(token_id=f"{condition_id}-yes", outcome="Yes", price=yes_price),
+            Token(token_id=f"{condition_id}-no", outcome="No", price=1 - yes_price),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+def _cases(count: int = 1500, seed: int = 7):
+    """Build random markets with prices, horizons and volumes around the gates."""
+    rng = random.Random(seed)
+    markets, prices = [], []
+    for i in range(count):
+        yes_price = round(rng.uniform(0.0, 1.0), 3)
+        days = rng.choice((0.5, 1.2, 3.5, 6.9, 7.1, 8.5, 30.0, 89.5, 91.0, 200.0))
+        volume = rng.choice((None, 0, 500, 1000, 5000, 50000))
+        condition_id = f"m{i}"
+        markets.append(_market(condition_id, rng.choice(QUESTIONS), yes_price, days, volume))
+        prices.append(MarketPrice(
+            condition_id=condition_id, yes_price=yes_price, no_price=1 - yes_price, spread=0.01
+        ))
+    return markets, prices
+
+
+class TestNumericProfile:
+    """Test cases for the gate primitives."""
+    
+    def test_gate_bounds(self):
+        """Test price bands and day windows, widened by their slack."""
+        gate = NumericGate(0.2, 0.8, (1, 7))
+        yes_price = np.array([0.19, 0.5, 0.5, 0.5, 0.81])
+        days_left = np.array([3, 0, 8, 9, np.nan])
+        
+        assert gate.mask(yes_price, days_left).tolist() == [False, True, True, False, False]
+        
+    def test_profile_volume_modes(self):
+        """Test strict and lenient volume gates."""
+        markets, prices = [], []
+        for i, volume in enumerate((None, 0, 500, 5000)):
+            markets.append(_market(f"v{i}", "Q?", 0.5, 10, volume))
+            prices.append(MarketPrice(condition_id=f"v{i}", yes_price=0.5, no_price=0.5, spread=0.01))
+        table = MarketTable.from_markets(markets, {price.condition_id: price for price in prices})
+        gates = (NumericGate(0.1, 0.9),)
+        
+        assert NumericProfile(1000, gates).mask(table).tolist() == [False, False, False, True]
+        assert NumericProfile(1000, gates, volume_required=False).mask(table).tolist() == [
+            True, True, False, True
+        ]
+        
+    def test_gate_all(self):
+        """Test that masks combine as a union."""
+        assert gate_all(np.array([True, False, False]), np.array([False, False, True])).tolist() == [
+            True, False, True
+        ]
+
+
+class TestAnalyzerPrefilter:
+    """Test cases for the analyzers' prefilters."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.markets, self.prices = _cases()
+        self.table = MarketTable.from_markets(
+            self.markets, {price.condition_id: price for price in self.prices}
+        )
+        self.features = FeatureStore()
+        
+    def test_prefilter_never_drops_a_match(self):
+        """Test that every market an analyzer matches passes its prefilter."""
+        for analyzer in (FlexibleAnalyzer(), SimplePatternAnalyzer(), HighConfidenceAnalyzer(), RefinedSimpleAnalyzer()):
+            mask = analyzer.prefilter(self.table, self.features.now)
+            matched = 0
+            for row, (market, price) in enumerate(zip(self.markets, self.prices, strict=True)):
+                opportunity = analyzer.analyze_market(market, price, features=self.features.get(market, price))
+                if opportunity is not None:
+                    matched += 1
+                    assert mask[row], (type(analyzer).__name__, market.question, price.yes_price)
+            assert matched
+            assert mask.sum() < len(self.markets)
+            
+    def test_ensemble_prefilter_is_union(self):
+        """Test that the ensemble passes a market if any analyzer does."""
+        ensemble = AnalyzerEnsemble()
+        
+        expected = np.zeros(len(self.markets), dtype=bool)
+        for analyzer in ensemble.analyzers.values():
+            expected |= analyzer.prefilter(self.table, self.features.now)
+            
+        assert ensemble.prefilter(self.table, self.features.now).tolist() == expected.tolist()
+        
+    def test_analyze_batch_matches_per_market(self):
+        """Test that batch results equal analyzing each market."""
+        analyzer = HighConfidenceAnalyzer()
+        
+        results = analyze_batch(analyzer, self.markets, self.prices, self.features.now)
+        
+        assert results == [
+            analyzer.analyze_market(market, price, features=self.features.get(market, price))
+            for market, price in zip(self.markets, self.prices, strict=True)
+        ]
+        assert any(result is not None for result in results)
@@ -0,0 +1,150 @@
+"""
+Unit tests for vectorized price-ladder pricing.
+"""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.analyzers.crypto_model import CryptoFinancialModel
+from src.analyzers.monte_carlo import market_key
+from src.analyzers.price_ladder import (
+    PROBABILITY_CEILING,
+    PROBABILITY_FLOOR,
+    AssetDynamics,
+    PriceLadder,
+    exceed_probabilities,
+    normal_cdf,
+)
+from src.clients.polymarket.models import Market, Token
+
+
+def _market(condition_id: str, question: str) -> Market:
+    """Build a crypto market with a question."""
+    return Market(
+        condition_id=condition_id,
+        question=question,
+        description="",
+        active=True,
+        closed=False,
+        volume=50000,
+        end_date_iso=datetime.now(timezone.utc) + timedelta(days=200),
+        tokens=[
+            Token(token_id=f"{condition_id}-yes", outcome="Yes", price=0.4),
+            Token(token_id=f"{condition_id}-no", outcome="No", price=0.6),
+        ],
+        minimum_order_size=1.0
+    )
+
+
+class TestLognormal:
+    """Test cases for the normal CDF and exceedance probabilities."""
+    
+    def test_normal_cdf_matches_erf(self):
+        """Test the CDF approximation against math.erf."""
+        x = np.linspace(-6, 6, 241)
+        expected = np.array([0.5 * (1 + math.erf(value / math.sqrt(2))) for value in x])
+        
+        assert np.max(np.abs(normal_cdf(x) - expected)) < 1e-7
+        
+    def test_exceed_probability_closed_form(self):
+        """Test one rung against the GBM formula."""
+        spot, strike, days, drift, volatility = 100.0, 120.0, 182.5, 0.1, 0.6
+        years = days / 365
+        d2 = (math.log(spot / strike) + (drift - volatility ** 2 / 2) * years) / (volatility * math.sqrt(years))
+        expected = 0.5 * (1 + math.erf(d2 / math.sqrt(2)))
+        
+        assert abs(float(exceed_probabilities(spot, strike, days, drift, volatility)) - expected) < 1e-7
+        
+    def test_probabilities_are_bounded(self):
+        """Test that far rungs are clipped to the probability bounds."""
+        probabilities = exceed_probabilities(100.0, np.array([1.0, 1e6]), 30, 0.1, 0.5)
+        
+        assert probabilities.tolist() == [PROBABILITY_CEILING, PROBABILITY_FLOOR]
+
+
+class TestPriceLadder:
+    """Test cases for PriceLadder."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.dynamics = {
+            "BTC": AssetDynamics(spot=67000.0, drift=0.2, volatility=0.65),
+            "ETH": AssetDynamics(spot=3500.0, drift=0.2, volatility=0.70),
+        }
+        
+    def test_rungs_priced_per_asset(self):
+        """Test that rungs across assets match pricing each one alone."""
+        ladder = PriceLadder()
+        rungs = [("BTC", 60000.0, 90), ("ETH", 5000.0, 365), ("BTC", 100000.0, 365), ("ETH", 3000.0, 30)]
+        rows = [ladder.add(*rung) for rung in rungs]
+        
+        probabilities = ladder.price(self.dynamics)
+        
+        assert rows == [0, 1, 2, 3] and len(ladder) == 4
+        for (asset, strike, days), probability in zip(rungs, probabilities, strict=True):
+            dynamics = self.dynamics[asset]
+            single = exceed_probabilities(dynamics.spot, strike, days, dynamics.drift, dynamics.volatility)
+            assert probability == float(single)
+            
+    def test_ladder_is_monotone_in_strike(self):
+        """Test that higher strikes are less likely."""
+        ladder = PriceLadder()
+        for strike in (60000.0, 70000.0, 80000.0, 100000.0):
+            ladder.add("BTC", strike, 180)
+            
+        probabilities = ladder.price(self.dynamics)
+        
+        assert np.all(np.diff(probabilities) < 0)
+        
+    def test_unknown_asset_is_nan(self):
+        """Test that rungs without dynamics are left unpriced."""
+        ladder = PriceLadder()
+        ladder.add("DOGE", 1.0, 30)
+        ladder.add("BTC", 70000.0, 30)
+        
+        probabilities = ladder.price(self.dynamics)
+        
+        assert np.isnan(probabilities[0]) and not np.isnan(probabilities[1])
+        assert len(PriceLadder().price(self.dynamics)) == 0
+
+
+class TestCryptoModelLadder:
+    """Test cases for batch pricing in CryptoFinancialModel."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.model = CryptoFinancialModel()
+        
+    def test_batch_matches_single_market(self):
+        """Test batch base probabilities against the per-market calculation."""
+        markets = [
+            _market("btc-80", "Will Bitcoin be above $80,000 by the end of 2025?"),
+            _market("btc-100", "Will Bitcoin reach 100k?"),
+            _market("eth-5", "Will Ethereum hit $5,000?"),
+            _market("doge", "Will Dogecoin reach $1,000?"),
+            _market("none", "Will Bitcoin be approved as legal tender?"),
+        ]
+        
+        batch = self.model.calculate_price_target_base_probabilities(markets)
+        
+        for market, probability in zip(markets[:3], batch[:3], strict=True):
+            asset, target, days = self.model._extract_price_target(market.question, market.description)
+            market_data = self.model._get_crypto_market_data(asset)
+            assert probability == self.model._calculate_price_target_base_probability(
+                market_data, target, days,
+                touch=self.model._is_touch_target(market.question),
+                key=market_key(market.condition_id)
+            )
+        assert batch[3] is None and batch[4] is None
+        
+    def test_touch_targets_are_more_likely(self):
+        """Test that reaching a target at any point beats ending above it."""
+        market_data = self.model._get_crypto_market_data("BTC")
+        
+        assert self.model._is_touch_target("Will Bitcoin reach $100,000?")
+        assert not self.model._is_touch_target("Will Bitcoin be above $100,000?")
+        ending_above = self.model._calculate_price_target_base_probability(market_data, 100000.0, 180)
+        touching = self.model._calculate_price_target_base_probability(market_data, 100000.0, 180, touch=True)
+        assert touching > ending_above
@@ -0,0 +1,147 @@
+"""
+Unit tests for the process-pool analysis backend.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from src.analyzers.high_confidence_analyzer import HighConfidenceAnalyzer
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.process_pool import (
+    ProcessPoolBackend,
+    from_article_record,
+    from_market_record,
+    to_article_record,
+    to_market_record,
+)
+from src.clients.news.models import NewsArticle, NewsSource
+from src.clients.polymarket.models import Market, MarketPrice, Token
+
+
+class TestProcessPoolBackend:
+    """Test cases for ProcessPoolBackend."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        end_date = datetime.now(timezone.utc) + timedelta(days=20)
+        questions = [
+            "Will the CEO resign before March?",
+            "Will Bitcoin reach $200,000 this year?",
+            "Will it rain tomorrow?",
+            "Will the president be impeached?",
+            "Will the company announce layoffs?",
+            "Will a constitutional amendment pass?",
+            "Will there be a coup in the country?",
+        ]
+        prices = [0.20, 0.35, 0.50, 0.18, 0.30, 0.15, 0.12]
+        
+        self.markets = []
+        self.prices = []
+        for i, (question, yes_price) in enumerate(zip(questions, prices, strict=True)):
+            self.markets.append(Market(
+                condition_id=f"market_{i}",
+                question=question,
+                category="Politics",
+                active=True,
+                closed=False,
+                volume=20000.0,
+                end_date_iso=end_date,
+                tokens=[
+                    Token(token_id=f"{i}_yes", outcome="Yes", price=yes_price),
+                    Token(token_id=f"{i}_no", outcome="No", price=1 - yes_price)
+                ],
+                minimum_order_size=1.0
+            ))
+            self.prices.append(MarketPrice(
+                condition_id=f"market_{i}",
+                yes_price=yes_price,
+                no_price=1 - yes_price,
+                spread=0.02
+            ))
+            
+        self.news = [
+            NewsArticle(
+                source=NewsSource(name="Reuters"),
+                title="President faces impeachment calls",
+                description="Congress debates",
+                url="https://example.com/impeach",
+                published_at=datetime.now()
+            )
+        ]
+        
+    def test_market_record_round_trip(self):
+        """Test that compact records rebuild equivalent markets and prices."""
+        market, price = from_market_record(to_market_record(self.markets[0], self.prices[0]))
+        
+        assert market.condition_id == self.markets[0].condition_id
+        assert market.question == self.markets[0].question
+        assert market.end_date_iso == self.markets[0].end_date_iso
+        assert [t.price for t in market.tokens] == [t.price for t in self.markets[0].tokens]
+        assert price.yes_price == self.prices[0].yes_price
+        
+        _, missing_price = from_market_record(to_market_record(self.markets[0], None))
+        assert missing_price is None
+        
+    def test_article_record_round_trip(self):
+        """Test that compact article records keep the fields analysis reads."""
+        article = from_article_record(to_article_record(self.news[0]))
+        
+        assert article.title == self.news[0].title
+        assert article.description == self.news[0].description
+        assert article.source.name == "Reuters"
+        
+    @pytest.mark.asyncio
+    async def test_process_backend_matches_async_backend(self):
+        """Test that worker processes find the same opportunities in the same order."""
+        analyzer = MarketAnalyzer()
+        analyzer.backtesting_engine = MagicMock()
+        analyzer._process_backend = ProcessPoolBackend(max_workers=2, chunk_size=2)
+        
+        try:
+            async_result = await analyzer.analyze_markets(
+                self.markets, self.prices, self.news, backend="async"
+            )
+            process_result = await analyzer.analyze_markets(
+                self.markets, self.prices, self.news, backend="process"
+            )
+        finally:
+            analyzer.shutdown()
+            
+        assert async_result.opportunities
+        assert [o.condition_id for o in process_result.opportunities] == [
+            o.condition_id for o in async_result.opportunities
+        ]
+        assert [o.fair_yes_price for o in process_result.opportunities] == [
+            o.fair_yes_price for o in async_result.opportunities
+        ]
+        assert [o.reasoning for o in process_result.opportunities] == [
+            o.reasoning for o in async_result.opportunities
+        ]
+        
+        # Predictions are recorded once per opportunity, in the parent
+        assert analyzer.backtesting_engine.record_prediction.call_count == (
+            len(async_result.opportunities) + len(process_result.opportunities)
+        )
+        
+    @pytest.mark.asyncio
+    async def test_workers_use_parent_pattern_analyzer(self):
+        """Test that workers analyze with the same pattern analyzer class as the parent."""
+        analyzer = MarketAnalyzer()
+        analyzer.record_predictions = False
+        analyzer.pattern_analyzer = HighConfidenceAnalyzer()
+        analyzer._process_backend = ProcessPoolBackend(max_workers=1, chunk_size=10)
+        
+        try:
+            async_result = await analyzer.analyze_markets(
+                self.markets, self.prices, [], backend="async"
+            )
+            process_result = await analyzer.analyze_markets(
+                self.markets, self.prices, [], backend="process"
+            )
+        finally:
+            analyzer.shutdown()
+            
+        assert [o.condition_id for o in process_result.opportunities] == [
+            o.condition_id for o in async_result.opportunities
+        ]
@@ -0,0 +1,91 @@
+"""
+Unit tests for the persistent daily quota ledger.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from src.utils.quota_ledger import QueryPriority, QuotaLedger
+
+
+class TestQuotaLedger:
+    """Test cases for QuotaLedger."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "quota.json")
+        self.ledger = QuotaLedger(path=self.path, daily_limit=10, low_priority_reserve=3)
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_fresh_key_has_full_budget(self):
+        """Test that an unseen key starts with the full daily limit."""
+        assert self.ledger.remaining("key") == 10
+        assert self.ledger.used("key") == 0
+        
+    def test_debit_persists_across_instances(self):
+        """Test that usage survives a process restart."""
+        assert self.ledger.debit("key")
+        assert self.ledger.debit("key")
+        
+        restarted = QuotaLedger(path=self.path, daily_limit=10, low_priority_reserve=3)
+        assert restarted.remaining("key") == 8
+        
+    def test_keys_are_tracked_separately_and_not_stored(self):
+        """Test per-key accounting without writing raw keys to disk."""
+        self.ledger.debit("key-a")
+        
+        assert self.ledger.remaining("key-a") == 9
+        assert self.ledger.remaining("key-b") == 10
+        
+        with open(self.path) as f:
+            assert "key-a" not in f.read()
+            
+    def test_low_priority_cannot_spend_reserve(self):
+        """Test that low-priority queries are shed before the reserve."""
+        for _ in range(7):
+            assert self.ledger.debit("key", QueryPriority.HIGH)
+            
+        # 3 left == reserve: low priority is refused, normal still allowed
+        assert not self.ledger.debit("key", QueryPriority.LOW)
+        assert self.ledger.debit("key", QueryPriority.NORMAL)
+        
+    def test_debit_refused_when_exhausted(self):
+        """Test that nothing is debited past the daily limit."""
+        self.ledger.mark_exhausted("key")
+        
+        assert self.ledger.remaining("key") == 0
+        assert not self.ledger.debit("key", QueryPriority.HIGH)
+        
+    def test_usage_resets_on_new_utc_day(self):
+        """Test that entries from a previous day are ignored."""
+        self.ledger.debit("key")
+        
+        with open(self.path) as f:
+            state = json.load(f)
+        for entry in state.values():
+            entry["day"] = "2000-01-01"
+        with open(self.path, "w") as f:
+            json.dump(state, f)
+            
+        assert self.ledger.remaining("key") == 10
+        
+    def test_plan_queries_orders_by_priority_and_sheds(self):
+        """Test that planning keeps the most valuable queries within budget."""
+        for _ in range(6):
+            self.ledger.debit("key")
+            
+        queries = [
+            ("tech", QueryPriority.LOW),
+            ("politics", QueryPriority.HIGH),
+            ("crypto", QueryPriority.NORMAL),
+        ]
+        planned = self.ledger.plan_queries("key", queries)
+        
+        # 4 left, reserve 3: both high and normal fit, low would dip into reserve
+        assert [query for query, _ in planned] == ["politics", "crypto"]
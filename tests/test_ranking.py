@@ -0,0 +1,153 @@
+"""
+Unit tests for the opportunity ranking index.
+"""
+
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from src.analyzers.models import AnalysisResult, MarketOpportunity, OpportunityScore
+from src.analyzers.ranking import OpportunityRanking
+
+
+def _opportunity(i: int, rng: random.Random) -> MarketOpportunity:
+    """Build an opportunity with random scores; some scores tie."""
+    return MarketOpportunity(
+        condition_id=f"m{i}",
+        question=f"Question {i}?",
+        current_yes_price=0.4,
+        current_no_price=0.6,
+        current_spread=0.2,
+        fair_yes_price=0.5,
+        fair_no_price=0.5,
+        expected_return=25.0,
+        recommended_position="YES",
+        score=OpportunityScore(
+            value_score=rng.choice([0.2, 0.5, 0.8]),
+            confidence_score=rng.random(),
+            volume_score=rng.random(),
+            time_score=rng.random(),
+            news_relevance_score=rng.random()
+        ),
+        reasoning="Test"
+    )
+
+
+def _ids(opportunities):
+    """Condition IDs in order."""
+    return [opp.condition_id for opp in opportunities]
+
+
+class TestOpportunityRanking:
+    """Test cases for OpportunityRanking and AnalysisResult top-K views."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        rng = random.Random(3)
+        self.opportunities = [_opportunity(i, rng) for i in range(200)]
+        self.result = AnalysisResult(
+            opportunities=list(self.opportunities),
+            total_markets_analyzed=200,
+            analysis_duration_seconds=1.0,
+            news_articles_processed=0
+        )
+        
+    @pytest.mark.parametrize("by, attribute", [
+        ("overall", "overall_score"),
+        ("value", "value_score"),
+        ("time", "time_score"),
+    ])
+    def test_top_matches_stable_sort(self, by, attribute):
+        """Test that top-K equals a stable descending sort, ties included."""
+        expected = sorted(
+            self.opportunities, key=lambda x: getattr(x.score, attribute), reverse=True
+        )[:15]
+        
+        assert _ids(self.result.top(15, by=by)) == _ids(expected)
+        
+    def test_high_confidence_view(self):
+        """Test that the high-confidence view filters the ranked order."""
+        expected = sorted(
+            [opp for opp in self.opportunities if opp.score.confidence_score >= 0.7],
+            key=lambda x: x.score.overall_score,
+            reverse=True
+        )[:10]
+        
+        assert _ids(self.result.top(10, high_confidence=True)) == _ids(expected)
+        
+    def test_appends_are_picked_up_without_rebuild(self):
+        """Test that opportunities added after queries are ranked in place."""
+        self.result.top(5, by="value")
+        ranking = self.result.ranking
+        best = self.opportunities[0].model_copy(
+            update={"condition_id": "best", "score": OpportunityScore(
+                value_score=1, confidence_score=1, volume_score=1, time_score=1, news_relevance_score=1
+            )}
+        )
+        
+        self.result.add_opportunity(best)
+        self.result.opportunities.append(best.model_copy(update={"condition_id": "appended"}))
+        
+        assert self.result.ranking is ranking
+        assert _ids(self.result.top(2)) == ["best", "appended"]
+        assert _ids(self.result.top(2, by="value")) == ["best", "appended"]
+        assert len(ranking) == 202
+        
+    def test_replaced_list_rebuilds_ranking(self):
+        """Test that reassigning or editing the list is detected."""
+        self.result.top(1)
+        self.result.opportunities = self.opportunities[:3]
+        assert len(self.result.top(None)) == 3
+        
+        self.result.opportunities[2] = self.opportunities[10]
+        assert "m10" in _ids(self.result.top(None))
+        
+    def test_replaced_opportunity_rebuilds_ranking(self):
+        """Test that replacing an opportunity before the last one is detected."""
+        self.result.top(5, by="value")
+        ranking = self.result.ranking
+        best = self.opportunities[5].model_copy(
+            update={"condition_id": "best", "score": OpportunityScore(
+                value_score=1, confidence_score=1, volume_score=1, time_score=1, news_relevance_score=1
+            )}
+        )
+        
+        self.result.opportunities[5] = best
+        
+        assert self.result.ranking is ranking
+        assert _ids(self.result.top(1)) == ["best"]
+        assert _ids(self.result.top(1, by="value")) == ["best"]
+        assert "m5" not in _ids(self.result.top(None))
+        
+    def test_rescored_opportunity_rebuilds_ranking(self):
+        """Test that rescoring by copy is detected and in-place score edits are refused."""
+        worst = min(self.opportunities, key=lambda x: x.score.overall_score)
+        self.result.top(1)
+        
+        with pytest.raises(ValidationError):
+            worst.score.value_score = 1.0
+        with pytest.raises(ValidationError):
+            worst.score = worst.score.model_copy(update={"value_score": 1.0})
+            
+        index = self.result.opportunities.index(worst)
+        self.result.opportunities[index] = worst.model_copy(update={"score": OpportunityScore(
+            value_score=1, confidence_score=1, volume_score=1, time_score=1, news_relevance_score=1
+        )})
+        
+        assert _ids(self.result.top(1)) == [worst.condition_id]
+        assert self.result.top(1)[0] is self.result.opportunities[index]
+        
+    def test_find_opportunity_by_id_or_rank(self):
+        """Test lookup by condition ID and by rank beyond the top ten."""
+        ranked = self.result.top(20)
+        
+        assert self.result.find_opportunity("m7").condition_id == "m7"
+        assert self.result.find_opportunity("15") is ranked[14]
+        assert self.result.find_opportunity("0") is None
+        assert self.result.find_opportunity("999") is None
+        
+    def test_unknown_component_rejected(self):
+        """Test that an unknown score component raises."""
+        with pytest.raises(ValueError):
+            OpportunityRanking(self.opportunities).top(by="liquidity")
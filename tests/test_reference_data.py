@@ -0,0 +1,149 @@
+"""
+Unit tests for the memory-mapped reference data store.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.analyzers.political_model import PoliticalMarketModel
+from src.analyzers.sports_model import SportsMarketModel
+from src.analyzers.weather_model import WeatherClimateModel
+from src.utils.reference_data import (
+    TABLES,
+    ReferenceDataStore,
+    compile_reference_data,
+    load_reference_data,
+)
+
+
+class TestReferenceDataStore:
+    """Test cases for compiled reference data files."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tables = {
+            "teams": {f"Team {i}": {"elo": 1500 + i, "league": "nfl" if i % 2 else "nba"} for i in range(500)},
+            "pollsters": {"CNN": 1.2, "Trafalgar": 0.7},
+            "awards": {},
+        }
+        
+    def test_lookups_match_source(self, tmp_path):
+        """Test that every entity reads back, case-insensitively."""
+        path = tmp_path / "reference.refdb"
+        compile_reference_data(self.tables, str(path))
+        store = ReferenceDataStore(str(path))
+        
+        teams = store.table("teams")
+        assert len(teams) == 500
+        assert all(teams[f"TEAM {i}"] == value for i, value in enumerate(self.tables["teams"].values()))
+        assert sorted(teams) == sorted(name.lower() for name in self.tables["teams"])
+        assert store.table("pollsters").get(" cnn ") == 1.2
+        assert store.table("pollsters").get("gallup", 1.0) == 1.0
+        assert "team 7" in teams and "team 500" not in teams
+        
+    def test_empty_and_missing_tables(self, tmp_path):
+        """Test that empty and unknown tables behave as empty mappings."""
+        path = tmp_path / "reference.refdb"
+        compile_reference_data(self.tables, str(path))
+        store = ReferenceDataStore(str(path))
+        
+        assert set(store.table_names) == {"teams", "pollsters", "awards"}
+        for name in ("awards", "climatology"):
+            table = store.table(name)
+            assert len(table) == 0 and list(table) == [] and table.get("anything") is None
+            with pytest.raises(KeyError):
+                table["anything"]
+                
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the header is refused."""
+        path = tmp_path / "reference.refdb"
+        path.write_bytes(b"{}" * 16)
+        
+        with pytest.raises(ValueError):
+            ReferenceDataStore(str(path))
+
+
+class TestLoadReferenceData:
+    """Test cases for the shared, compile-on-change store."""
+    
+    def test_compiles_source_once_per_process(self, tmp_path):
+        """Test that the source is compiled on first load and the store is shared."""
+        source = tmp_path / "reference.json"
+        path = tmp_path / "reference.refdb"
+        source.write_text(json.dumps({"pollsters": {"cnn": 1.2}}))
+        
+        store = load_reference_data(str(source), str(path))
+        
+        assert path.exists()
+        assert store.table("pollsters")["cnn"] == 1.2
+        assert set(TABLES) <= set(store.table_names)
+        assert load_reference_data(str(source), str(path)) is store
+        
+    def test_recompiles_only_when_source_is_newer(self, tmp_path):
+        """Test that a process starting after an edit maps the new data."""
+        source = tmp_path / "reference.json"
+        path = tmp_path / "reference.refdb"
+        source.write_text(json.dumps({"pollsters": {"cnn": 1.2}}))
+        with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+            load_reference_data(str(source), str(path))
+        compiled = path.stat().st_mtime
+        
+        with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+            assert load_reference_data(str(source), str(path)).table("pollsters")["cnn"] == 1.2
+        assert path.stat().st_mtime == compiled
+        
+        source.write_text(json.dumps({"pollsters": {"cnn": 0.9}}))
+        os.utime(source, (compiled + 10, compiled + 10))
+        with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+            assert load_reference_data(str(source), str(path)).table("pollsters")["cnn"] == 0.9
+            
+    def test_missing_source_gives_empty_tables(self, tmp_path):
+        """Test that models still start without a source file, and nothing is compiled or shared."""
+        source = tmp_path / "missing.json"
+        path = tmp_path / "missing.refdb"
+        store = load_reference_data(str(source), str(path))
+        
+        assert all(len(store.table(name)) == 0 for name in TABLES)
+        assert not path.exists()
+        
+        source.write_text(json.dumps({"pollsters": {"cnn": 1.2}}))
+        assert load_reference_data(str(source), str(path)).table("pollsters")["cnn"] == 1.2
+        
+    def test_unreadable_source_keeps_compiled_file(self, tmp_path):
+        """Test that a broken source edit does not replace the compiled tables."""
+        source = tmp_path / "reference.json"
+        path = tmp_path / "reference.refdb"
+        source.write_text(json.dumps({"pollsters": {"cnn": 1.2}}))
+        with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+            load_reference_data(str(source), str(path))
+        compiled = path.stat().st_mtime
+        
+        source.write_text("{not json")
+        os.utime(source, (compiled + 10, compiled + 10))
+        with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+            assert load_reference_data(str(source), str(path)).table("pollsters")["cnn"] == 1.2
+            
+    def test_default_paths_do_not_depend_on_working_directory(self, tmp_path, monkeypatch):
+        """Test that the configured data is found from another working directory."""
+        monkeypatch.chdir(tmp_path)
+        with patch.dict("src.utils.reference_data._shared_stores", clear=True):
+            political = PoliticalMarketModel()
+            
+        assert political.pollster_reliability.get("quinnipiac", 1.0) == 1.3
+        assert not any(tmp_path.iterdir())
+        
+    def test_domain_models_share_one_store(self):
+        """Test that models read their tables from the same mapped store."""
+        political = PoliticalMarketModel()
+        sports = SportsMarketModel()
+        weather = WeatherClimateModel()
+        store = load_reference_data()
+        
+        assert political.pollster_reliability is store.table("pollsters")
+        assert sports.team_databases is store.table("teams")
+        assert weather.climatology is store.table("climatology")
+        assert PoliticalMarketModel().pollster_reliability is political.pollster_reliability
+        assert political.pollster_reliability.get("quinnipiac", 1.0) == 1.3
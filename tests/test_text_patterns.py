@@ -0,0 +1,106 @@
+"""
+Unit tests for the shared regex and gazetteer registry.
+"""
+
+import re
+
+from src.analyzers.crypto_model import CryptoFinancialModel
+from src.analyzers.entertainment_model import EntertainmentMarketModel
+from src.analyzers.multi_outcome_researcher import MultiOutcomeResearcher
+from src.analyzers.sports_model import SportsMarketModel, SportType
+from src.analyzers.technology_model import TechnologyMarketModel
+from src.analyzers.text_patterns import (
+    IPO,
+    NFL_TEAMS,
+    Gazetteer,
+    TextPattern,
+    compile_all,
+    first_match,
+    template_regex,
+)
+
+
+class TestTextPatterns:
+    """Test cases for the registry primitives."""
+    
+    def test_literal_guard(self):
+        """Test that the regex only runs when the literal is present."""
+        pattern = TextPattern(re.compile(r"(.+) IPO", re.IGNORECASE), " ipo")
+        
+        assert pattern.search("Will Stripe IPO?").group(1) == "Will Stripe"
+        assert pattern.search("Will Stripe ipo?") is not None
+        assert pattern.search("IPO season") is None
+        
+    def test_first_match_keeps_order(self):
+        """Test that earlier patterns win and literal-free patterns always run."""
+        patterns = compile_all((r"(\w+) first", "first"), (r"(\w+)", ""))
+        
+        assert first_match(patterns, "Alpha first").group(1) == "Alpha"
+        assert first_match(patterns, "Beta").group(1) == "Beta"
+        assert first_match(IPO, "Will Acme go public or IPO?").group(1) == "Acme"
+        assert first_match(IPO, "Nothing here") is None
+        
+    def test_gazetteer(self):
+        """Test case-insensitive lookup in listed order."""
+        teams = Gazetteer(("Red Sox", "Sox"))
+        
+        assert teams.find("will the red sox win?") == "Red Sox"
+        assert teams.find("go sox") == "Sox"
+        assert teams.find("go cubs") is None
+        assert "Chiefs" in NFL_TEAMS
+        assert len(NFL_TEAMS) == 32
+        
+    def test_template_regex_is_cached(self):
+        """Test that templates compile once."""
+        template = "Will {candidate} win the {election}?"
+        
+        assert template_regex(template) is template_regex(template)
+        assert template_regex(template).search("will adams win the race?")
+
+
+class TestExtractors:
+    """Test cases for model extractors backed by the registry."""
+    
+    def test_domain_extractors(self):
+        """Test extraction through each model."""
+        crypto = CryptoFinancialModel()
+        technology = TechnologyMarketModel()
+        entertainment = EntertainmentMarketModel()
+        
+        assert crypto._extract_price_target("Will Ethereum hit 10k?", "")[:2] == ("ETH", 10000.0)
+        assert crypto._extract_price_target("Will ETH reach $12,500?", None)[:2] == ("ETH", 12500.0)
+        assert technology._extract_product_launch_info("Will Apple launch Vision Pro by June?") == (
+            "Vision Pro", "Apple"
+        )
+        assert technology._extract_ipo_company("Will Stripe go public in 2026?") == "Stripe"
+        assert technology._extract_adoption_milestone_info("Will Threads reach 200,000,000 users?") == (
+            "Threads", 200000000.0
+        )
+        assert entertainment._extract_box_office_info("Will Dune gross over $500,000,000?") == (
+            "Dune", 500000000.0
+        )
+        assert entertainment._extract_show_name("Will Severance be renewed?") == "Severance"
+        assert entertainment._extract_celebrity_event_info("Taylor Swift to marry in 2026?") == (
+            "Taylor Swift", "marriage"
+        )
+        
+    def test_sports_extractors(self):
+        """Test team and player lookup."""
+        model = SportsMarketModel()
+        
+        assert model._extract_team_name("Will the Kansas City chiefs win?", SportType.NFL) == "Chiefs"
+        assert model._extract_team_name("Will the Chiefs win?", SportType.SOCCER) is None
+        assert model._extract_player_name("Will LeBron James retire?") == "LeBron James"
+        assert model._get_nba_teams() is model._get_nba_teams()
+        
+    def test_multi_outcome_patterns(self):
+        """Test election templates and related-market checks."""
+        researcher = MultiOutcomeResearcher()
+        
+        template = researcher._extract_pattern("Will Mamdani win the NYC mayoral election?")
+        
+        assert template == "Will {candidate} win the {election}?"
+        assert researcher._matches_pattern("will Adams win the NYC mayoral election?", template)
+        assert not researcher._matches_pattern("Who leads the polls?", template)
+        assert "nyc mayor" in researcher._extract_base_terms("nyc-mayor-election")
+        assert researcher._is_related_market("nyc-mayor", "", "will adams win the nyc race", ["nyc"])
@@ -0,0 +1,54 @@
+"""
+Unit tests for per-stage run timings.
+"""
+
+import pytest
+
+from src.utils.timing import StageTimer
+
+
+class TestStageTimer:
+    """Test cases for StageTimer."""
+    
+    def test_stage_totals_in_pipeline_order(self):
+        """Test that stages accumulate and are reported in STAGES order."""
+        timer = StageTimer()
+        timer.add("record", 0.5)
+        timer.add("fetch", 1.0)
+        timer.add("fetch", 0.25)
+        with timer.stage("custom"):
+            pass
+            
+        timings = timer.timings()
+        
+        assert list(timings.stages) == ["fetch", "record", "custom"]
+        assert timings.stages["fetch"] == pytest.approx(1.25)
+        assert timings.markets_timed == 0
+        assert timings.market_p50_ms is None
+        
+    def test_per_market_percentiles(self):
+        """Test that per-market totals sum across stages."""
+        timer = StageTimer()
+        for i in range(100):
+            timer.add("pattern", 0.001 * i, market_id=f"m{i}")
+            timer.add("fair_value", 0.001, market_id=f"m{i}")
+        timer.add("news", 5.0)
+        
+        timings = timer.timings()
+        
+        assert timings.markets_timed == 100
+        assert timings.market_max_ms == pytest.approx(100.0)
+        assert timings.market_p50_ms == pytest.approx(50.5)
+        assert timings.market_p95_ms == pytest.approx(95.05)
+        assert timings.total_seconds == pytest.approx(5.0 + 4.95 + 0.1)
+        
+    def test_stage_records_time_on_error(self):
+        """Test that a failing block still counts towards its stage."""
+        timer = StageTimer()
+        with pytest.raises(RuntimeError):
+            with timer.stage("pattern", market_id="m"):
+                raise RuntimeError("boom")
+                
+        assert "pattern" in timer.timings().stages
+        assert timer.timings().markets_timed == 1
+
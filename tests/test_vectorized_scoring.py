@@ -0,0 +1,133 @@
+"""
+Unit tests for vectorized opportunity scoring.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.analyzers.market_analyzer import MarketAnalyzer
+from src.analyzers.simple_pattern_analyzer import SimpleOpportunity
+from src.analyzers.vectorized_scoring import (
+    score_fair_value_opportunities,
+    score_pattern_opportunities,
+    time_scores,
+    volume_scores,
+)
+from src.clients.news.models import NewsArticle, NewsSource
+from src.clients.polymarket.models import Market, MarketPrice
+
+
+class TestVectorizedScoring:
+    """Test cases for vectorized scoring."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = MarketAnalyzer()
+        self.price = MarketPrice(condition_id="m", yes_price=0.3, no_price=0.7, spread=0.4)
+        self.news = [
+            NewsArticle(
+                source=NewsSource(name="Reuters"),
+                title="Bitcoin rallies",
+                url="https://example.com/bitcoin",
+                published_at=datetime.now()
+            )
+        ]
+        
+    def _market(self, volume, days):
+        """Build a market with the given volume and days to resolution."""
+        return Market(
+            condition_id="m",
+            question="Will Bitcoin rally?",
+            active=True,
+            closed=False,
+            volume=volume,
+            end_date_iso=(
+                datetime.now(timezone.utc) + timedelta(days=days, hours=12)
+                if days is not None else None
+            ),
+            tokens=[],
+            minimum_order_size=1.0
+        )
+        
+    def test_time_scores_match_scalar(self):
+        """Test time score buckets against the scalar implementation."""
+        days = [-5, 0, 1, 7, 8, 30, 31, 90, 91, 400]
+        
+        scores = time_scores(np.array(days, dtype=float))
+        
+        for day, score in zip(days, scores, strict=True):
+            assert score == self.analyzer._calculate_time_score_from_days(day)
+        assert time_scores(np.array([np.nan]))[0] == 0.5
+        
+    def test_volume_scores_handle_missing_volume(self):
+        """Test that missing or zero volume gets the neutral score."""
+        scores = volume_scores(np.array([np.nan, 0.0, 25000.0, 1e6]))
+        
+        assert scores.tolist() == [0.5, 0.5, 0.5, 1.0]
+        
+    @pytest.mark.parametrize("volume,days,pattern_type,news", [
+        (25000.0, 3, "NEWS_OVERREACTION", True),
+        (25000.0, 3, "NEWS_OVERREACTION", False),
+        (None, 45, "EXTREME_PRICE", True),
+        (80000.0, None, "TIME_DECAY", False),
+    ])
+    def test_pattern_scores_match_scalar(self, volume, days, pattern_type, news):
+        """Test batch pattern scoring against the per-market path."""
+        market = self._market(volume, days)
+        opportunity = SimpleOpportunity(
+            market=market,
+            current_price=0.3,
+            recommended_action="BUY_YES",
+            edge=0.12,
+            confidence=0.65,
+            reason="Test",
+            pattern_type=pattern_type
+        )
+        articles = self.news if news else []
+        
+        expected = self.analyzer._calculate_simple_opportunity_score(
+            market, self.price, opportunity, articles
+        )
+        scores = score_pattern_opportunities(
+            edge=[opportunity.edge],
+            confidence=[opportunity.confidence],
+            volume=[volume],
+            days_to_end=[self.analyzer._days_until_end(market)],
+            news_counts=[len(articles)],
+            news_driven=[pattern_type == "NEWS_OVERREACTION"]
+        )
+        
+        assert scores.to_score(0) == expected
+        
+    def test_fair_value_scores_confidence_averages_available_factors(self):
+        """Test that confidence only averages factors that are present."""
+        scores = score_fair_value_opportunities(
+            value_diff=[0.15, 0.6],
+            volume=[5000.0, None],
+            days_to_end=[10, None],
+            news_counts=[5, 0],
+            related_news_counts=[2, 0]
+        )
+        
+        assert scores.value.tolist() == pytest.approx([0.5, 1.0])
+        assert scores.confidence[0] == pytest.approx((0.5 + 0.8 + 0.5) / 3)
+        assert scores.confidence[1] == pytest.approx(0.5)
+        assert scores.news.tolist() == pytest.approx([0.4, 0.0])
+        
+    def test_to_scores_materialises_selected_rows(self):
+        """Test that only requested rows become OpportunityScore objects."""
+        scores = score_pattern_opportunities(
+            edge=[0.05, 0.1, 0.3],
+            confidence=[0.5, 0.6, 0.7],
+            volume=[1000.0, 2000.0, 3000.0],
+            days_to_end=[1, 10, 100],
+            news_counts=[0, 0, 0],
+            news_driven=[False, False, False]
+        )
+        
+        selected = scores.to_scores([2, 0])
+        
+        assert len(scores) == 3
+        assert [score.value_score for score in selected] == pytest.approx([1.0, 0.05 / 0.3])